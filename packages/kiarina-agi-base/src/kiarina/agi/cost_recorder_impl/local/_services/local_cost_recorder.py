@@ -1,10 +1,9 @@
-import json
 import logging
-import os
 from typing import Any
 
 from kiarina.agi.cost_record import CostRecord
 from kiarina.agi.cost_recorder import BaseCostRecorder
+from kiarina.agi.log_writer import LogWriter, log_writer_pool
 from kiarina.agi.run_context import RunContext
 from kiarina.utils.app import user_directory
 
@@ -19,25 +18,21 @@ class LocalCostRecorder(BaseCostRecorder):
     def file_path(self) -> str:
         return str(user_directory.get_user_data_dir() / "costs.jsonl")
 
-    async def _save(self, run_context: RunContext) -> None:
-        dir_path = os.path.dirname(self.file_path)
+    @property
+    def writer(self) -> LogWriter:
+        return log_writer_pool.get(self.file_path)
 
-        if not os.path.exists(dir_path):
-            os.makedirs(dir_path)
+    async def _save(self, run_context: RunContext) -> None:
+        # The background writer appends the records in a worker thread, and
+        # waiting for it keeps them on disk when flush() returns
+        writer = self.writer
 
         for record in self.records:
-            line = (
-                json.dumps(
-                    self._to_dict(record, run_context),
-                    ensure_ascii=False,
-                )
-                + "\n"
-            )
-
-            with open(self.file_path, "a", encoding="utf-8") as f:
-                f.write(line)
-
-        logger.info(f"Saved cost records to {self.file_path}")
+            await writer.write(self._to_dict(record, run_context))
+
+        await writer.flush()
+
+        logger.info(f"Saved cost records to {writer.file_path}")
 
     def _to_dict(
         self, cost_record: CostRecord, run_context: RunContext
@@ -0,0 +1,15 @@
+from ._instances.log_writer_pool import log_writer_pool
+from ._services.log_writer import LogWriter
+from ._services.log_writer_pool import LogWriterPool
+from ._settings import LogWriterSettings, settings_manager
+
+__all__ = [
+    # ._instances
+    "log_writer_pool",
+    # ._services
+    "LogWriter",
+    "LogWriterPool",
+    # ._settings
+    "LogWriterSettings",
+    "settings_manager",
+]
@@ -0,0 +1,8 @@
+import atexit
+
+from .._services.log_writer_pool import LogWriterPool
+
+log_writer_pool = LogWriterPool()
+
+# Records still queued when the event loop is gone are written at exit
+atexit.register(log_writer_pool.close_sync)
@@ -0,0 +1,231 @@
+import asyncio
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from io import BufferedWriter
+from typing import Any
+
+from .._settings import settings_manager
+
+logger = logging.getLogger(__name__)
+
+
+class LogWriter:
+    """
+    Append JSON Lines records to a file from a background task.
+
+    `write` only puts the record on a bounded queue. The writer task takes
+    the queued records in batches and appends them in a worker thread, so
+    serialization and file I/O never block the event loop. The file is
+    rotated by size or age and can be written gzip-compressed.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.settings = settings_manager.settings
+
+        self.file_path = file_path + (".gz" if self.settings.compress else "")
+
+        self._queue: asyncio.Queue[dict[str, Any]] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # Guards the file, which worker threads and close_sync both use
+        self._lock = threading.Lock()
+        self._raw: BufferedWriter | None = None
+        self._stream: BufferedWriter | gzip.GzipFile | None = None
+        self._opened_at = 0.0
+        self._synced_at = 0.0
+
+    async def write(self, record: dict[str, Any]) -> None:
+        """
+        Queue a record, waiting only while the queue is full.
+        """
+        await self._get_queue().put(record)
+
+    async def flush(self) -> None:
+        """
+        Wait until the queued records are written and synced to disk.
+        """
+        if self._is_running():
+            assert self._queue is not None
+            await self._queue.join()
+        else:
+            await asyncio.to_thread(lambda: self._write_batch(self._drain()))
+
+        await asyncio.to_thread(self._sync)
+
+    async def close(self) -> None:
+        """
+        Write the queued records, stop the writer task, and close the file.
+        """
+        await self.flush()
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        await asyncio.to_thread(self.close_sync)
+
+    def close_sync(self) -> None:
+        """
+        Write the records left on the queue and close the file without a loop.
+        """
+        self._write_batch(self._drain())
+
+        with self._lock:
+            self._close_file()
+
+    def _is_running(self) -> bool:
+        return (
+            self._queue is not None
+            and self._task is not None
+            and not self._task.done()
+            and self._loop is asyncio.get_running_loop()
+        )
+
+    def _get_queue(self) -> asyncio.Queue[dict[str, Any]]:
+        if not self._is_running():
+            # Records queued on a loop that has gone away are written here
+            self._write_batch(self._drain())
+
+            loop = asyncio.get_running_loop()
+            self._queue = asyncio.Queue(self.settings.queue_max_size)
+            self._loop = loop
+            self._task = loop.create_task(self._run(self._queue))
+
+        assert self._queue is not None
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue[dict[str, Any]]) -> None:
+        while True:
+            batch = [await queue.get()]
+
+            while len(batch) < self.settings.batch_max_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception:
+                logger.exception(f"Failed to write {len(batch)} records")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _drain(self) -> list[dict[str, Any]]:
+        batch: list[dict[str, Any]] = []
+
+        if self._queue is None:
+            return batch
+
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+            self._queue.task_done()
+
+        return batch
+
+    def _write_batch(self, batch: list[dict[str, Any]]) -> None:
+        if not batch:
+            return
+
+        data = "".join(
+            json.dumps(record, ensure_ascii=False, default=str) + "\n"
+            for record in batch
+        ).encode("utf-8")
+
+        with self._lock:
+            if self._should_rotate():
+                self._rotate()
+
+            stream = self._open_file()
+            stream.write(data)
+            stream.flush()
+
+            if time.monotonic() - self._synced_at >= self.settings.fsync_interval:
+                self._sync_file()
+
+    def _sync(self) -> None:
+        with self._lock:
+            if self._stream is not None:
+                self._stream.flush()
+                self._sync_file()
+
+    def _should_rotate(self) -> bool:
+        if self._raw is None and not os.path.exists(self.file_path):
+            return False
+
+        max_bytes = self.settings.rotate_max_bytes
+
+        if max_bytes > 0:
+            size = (
+                self._raw.tell()
+                if self._raw is not None
+                else os.path.getsize(self.file_path)
+            )
+
+            if size >= max_bytes:
+                return True
+
+        interval = self.settings.rotate_interval
+
+        # Files are aged from when this writer opened them, so a file left by a
+        # previous process is kept for another interval
+        return (
+            interval > 0
+            and self._raw is not None
+            and time.monotonic() - self._opened_at >= interval
+        )
+
+    def _rotate(self) -> None:
+        self._close_file()
+
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        root, ext = _split_ext(self.file_path)
+        os.replace(self.file_path, f"{root}.{timestamp}{ext}")
+
+    def _open_file(self) -> BufferedWriter | gzip.GzipFile:
+        if self._stream is None:
+            os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
+
+            raw = self._raw = open(self.file_path, "ab")
+            stream = self._stream = (
+                gzip.GzipFile(fileobj=raw, mode="ab") if self.settings.compress else raw
+            )
+            self._opened_at = time.monotonic()
+
+            return stream
+
+        return self._stream
+
+    def _sync_file(self) -> None:
+        if self._raw is not None:
+            self._raw.flush()
+            os.fsync(self._raw.fileno())
+
+        self._synced_at = time.monotonic()
+
+    def _close_file(self) -> None:
+        if self._stream is None or self._raw is None:
+            return
+
+        if self._stream is not self._raw:
+            self._stream.close()
+
+        self._sync_file()
+        self._raw.close()
+
+        self._raw = None
+        self._stream = None
+
+
+def _split_ext(file_path: str) -> tuple[str, str]:
+    # Keeps compound extensions such as .jsonl.gz together
+    directory, name = os.path.split(file_path)
+    stem, dot, ext = name.partition(".")
+    return os.path.join(directory, stem), dot + ext
@@ -0,0 +1,49 @@
+import asyncio
+import os
+import threading
+
+from .log_writer import LogWriter
+
+
+class LogWriterPool:
+    """
+    One log writer per file path, shared by every recorder and logger.
+    """
+
+    def __init__(self) -> None:
+        self._writers: dict[str, LogWriter] = {}
+        self._lock = threading.Lock()
+
+    def get(self, file_path: str) -> LogWriter:
+        file_path = os.path.abspath(file_path)
+
+        with self._lock:
+            if (writer := self._writers.get(file_path)) is None:
+                writer = self._writers[file_path] = LogWriter(file_path)
+
+        return writer
+
+    async def flush(self) -> None:
+        await asyncio.gather(*(writer.flush() for writer in self._get_writers()))
+
+    async def close(self) -> None:
+        """
+        Write all queued records and close the files, for application shutdown.
+        """
+        with self._lock:
+            writers = list(self._writers.values())
+            self._writers.clear()
+
+        await asyncio.gather(*(writer.close() for writer in writers))
+
+    def close_sync(self) -> None:
+        with self._lock:
+            writers = list(self._writers.values())
+            self._writers.clear()
+
+        for writer in writers:
+            writer.close_sync()
+
+    def _get_writers(self) -> list[LogWriter]:
+        with self._lock:
+            return list(self._writers.values())
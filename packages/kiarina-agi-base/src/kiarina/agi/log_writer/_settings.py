@@ -0,0 +1,30 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings_manager import SettingsManager
+
+
+class LogWriterSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="KIARINA_AGI_LOG_WRITER_",
+        extra="ignore",
+    )
+
+    queue_max_size: int = 10_000
+    """Maximum number of queued records before writes wait for the writer"""
+
+    batch_max_size: int = 500
+    """Maximum number of records appended to the file at once"""
+
+    fsync_interval: float = 5.0
+    """Minimum number of seconds between fsync calls, or 0 to fsync every batch"""
+
+    rotate_max_bytes: int = 64 * 1024 * 1024
+    """File size that triggers rotation, or 0 to disable"""
+
+    rotate_interval: float = 0.0
+    """Seconds a file is kept open by the writer before rotation, or 0 to disable"""
+
+    compress: bool = False
+    """Whether files are written as gzip-compressed JSON Lines with a `.gz` suffix"""
+
+
+settings_manager = SettingsManager(LogWriterSettings)
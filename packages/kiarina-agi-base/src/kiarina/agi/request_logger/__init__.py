@@ -1,3 +1,4 @@
+from ._helpers.log_request import log_request
 from ._instances.request_logger_registry import request_logger_registry
 from ._schemas.request_log_entry import RequestLogEntry
 from ._services.base_request_logger import BaseRequestLogger
@@ -7,6 +8,8 @@ from ._types.request_logger_name import RequestLoggerName
 from ._types.request_logger_specifier import RequestLoggerSpecifier
 
 __all__ = [
+    # ._helpers
+    "log_request",
     # ._instances
     "request_logger_registry",
     # ._schemas
@@ -0,0 +1,59 @@
+import asyncio
+import random
+from collections.abc import Callable
+
+from kiarina.agi.run_context import RunContext
+
+from .._schemas.request_log_entry import RequestLogEntry
+from .._settings import settings_manager
+from .._types.request_logger import RequestLogger
+
+
+async def log_request(
+    request_logger: RequestLogger,
+    create_log_entry: Callable[[], RequestLogEntry],
+    *,
+    error: Exception | None = None,
+    run_context: RunContext,
+) -> None:
+    """
+    Build a log entry only when it will be logged, and log it.
+
+    Nothing is built for a disabled logger or a request left out by the
+    sample rate. Building reads the given exception rather than the one
+    being handled, so it may run in a worker thread.
+    """
+    # Loggers that do not derive from BaseRequestLogger are assumed to be enabled
+    if not getattr(request_logger, "enabled", True):
+        return
+
+    settings = settings_manager.settings
+    sample_rate = (
+        settings.success_sample_rate if error is None else settings.error_sample_rate
+    )
+
+    if sample_rate < 1.0 and random.random() >= sample_rate:
+        return
+
+    if settings.format_in_thread:
+        log_entry = await asyncio.to_thread(create_log_entry)
+    else:
+        log_entry = create_log_entry()
+
+    max_length = settings.max_content_length
+
+    if max_length > 0 and len(log_entry.content) > max_length:
+        omitted = len(log_entry.content) - max_length
+        log_entry = log_entry.model_copy(
+            update={
+                "content": log_entry.content[:max_length]
+                + f"\n\n... ({omitted} characters omitted)"
+            }
+        )
+
+    if error is None:
+        await request_logger.log_request_success(log_entry, run_context=run_context)
+    else:
+        await request_logger.log_request_error(
+            log_entry, error, run_context=run_context
+        )
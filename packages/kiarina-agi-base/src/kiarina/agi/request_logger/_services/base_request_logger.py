@@ -23,6 +23,13 @@ class BaseRequestLogger(RequestLogger):
     def name(self, value: RequestLoggerName) -> None:
         self._name = value
 
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether the logger consumes entries, so callers can skip building them.
+        """
+        return True
+
     async def log_request_success(
         self,
         log_entry: RequestLogEntry,
@@ -26,5 +26,17 @@ class RequestLoggerSettings(BaseSettings):
 
     customs: dict[RequestLoggerName, ImportPath] = Field(default_factory=dict)
 
+    success_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
+    """Fraction of successful requests that are logged"""
+
+    error_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
+    """Fraction of failed requests that are logged"""
+
+    max_content_length: int = 0
+    """Maximum number of characters of log entry content, or 0 for no limit"""
+
+    format_in_thread: bool = True
+    """Whether log entries are built in a worker thread instead of the event loop"""
+
 
 settings_manager = SettingsManager(RequestLoggerSettings)
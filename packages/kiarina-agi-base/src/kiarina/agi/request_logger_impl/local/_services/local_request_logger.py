@@ -1,9 +1,11 @@
 import logging
 import os
 from datetime import datetime
+from typing import Any, Literal
 
 import yaml
 
+from kiarina.agi.log_writer import LogWriter, log_writer_pool
 from kiarina.agi.request_logger import BaseRequestLogger, RequestLogEntry
 from kiarina.agi.run_context import RunContext
 from kiarina.utils.app import user_directory
@@ -15,8 +17,31 @@ logger = logging.getLogger(__name__)
 class LocalRequestLogger(BaseRequestLogger):
     """
     Write request logs to the local file system.
+
+    By default, each request is written to its own Markdown file with YAML
+    front matter. With `log_format="jsonl"`, each request is appended as a
+    record to `requests.jsonl` by a background writer instead.
     """
 
+    def __init__(
+        self,
+        *,
+        log_format: Literal["markdown", "jsonl"] = "markdown",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(log_format=log_format, **kwargs)
+        self.log_format = log_format
+
+    @property
+    def file_path(self) -> str:
+        return os.path.join(
+            user_directory.get_user_cache_dir(), "logs", "requests.jsonl"
+        )
+
+    @property
+    def writer(self) -> LogWriter:
+        return log_writer_pool.get(self.file_path)
+
     async def log_request_success(
         self,
         log_entry: RequestLogEntry,
@@ -48,6 +73,32 @@ class LocalRequestLogger(BaseRequestLogger):
         *,
         phase: str,
         run_context: RunContext,
+    ) -> None:
+        if self.log_format == "markdown":
+            await self._write_markdown(log_entry, phase=phase, run_context=run_context)
+            return
+
+        await self.writer.write(
+            {
+                "organization_id": run_context.organization_id,
+                "user_id": run_context.user_id,
+                "agent_id": run_context.agent_id,
+                "kind": log_entry.kind,
+                "source": log_entry.source,
+                "phase": phase,
+                "metadata": dict(log_entry.metadata),
+                "created_at": log_entry.created_at.isoformat(),
+                "logged_at": datetime.now(run_context.zone_info).isoformat(),
+                "content": log_entry.content,
+            }
+        )
+
+    async def _write_markdown(
+        self,
+        log_entry: RequestLogEntry,
+        *,
+        phase: str,
+        run_context: RunContext,
     ) -> None:
         kind = log_entry.kind
         source = log_entry.source
@@ -2,4 +2,6 @@ from kiarina.agi.request_logger import BaseRequestLogger
 
 
 class NullRequestLogger(BaseRequestLogger):
-    pass
+    @property
+    def enabled(self) -> bool:
+        return False
@@ -4,6 +4,8 @@ The exact token count varies depending on the model being used.
 """
 
 from ._helpers.calc_text_token import calc_text_token
+from ._helpers.calc_text_token_batch import calc_text_token_batch
+from ._services.token_counter import TokenCounter, TokenCounterStats, token_counter
 from ._settings import TokenUtilsSettings, settings_manager
 from ._types.image_size import ImageSize
 from ._types.token_count import TokenCount
@@ -15,6 +17,11 @@ from ._utils.calc_video_token import calc_video_token
 __all__ = [
     # ._helpers
     "calc_text_token",
+    "calc_text_token_batch",
+    # ._services
+    "TokenCounter",
+    "TokenCounterStats",
+    "token_counter",
     # ._settings
     "TokenUtilsSettings",
     "settings_manager",
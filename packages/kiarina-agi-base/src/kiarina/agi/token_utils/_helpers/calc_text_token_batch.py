@@ -0,0 +1,10 @@
+from collections.abc import Sequence
+
+from .._services.token_counter import token_counter
+from .._types.token_count import TokenCount
+
+
+def calc_text_token_batch(
+    texts: Sequence[str], *, use_cache: bool = True
+) -> list[TokenCount]:
+    return token_counter.count_batch(texts, use_cache=use_cache)
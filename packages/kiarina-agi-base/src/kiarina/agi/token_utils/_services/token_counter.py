@@ -0,0 +1,170 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+import tiktoken
+
+from .._settings import settings_manager
+from .._types.token_count import TokenCount
+
+PARALLEL_MIN_CHARS = 64 * 1024
+
+
+class TokenCounterStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class TokenCounter:
+    """Thread-safe text token counter with cached encodings and counts."""
+
+    def __init__(self) -> None:
+        self._encodings: dict[str, tiktoken.Encoding] = {}
+        self._entries: OrderedDict[tuple[str, bytes], TokenCount] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def count(self, text: str) -> TokenCount:
+        return self.count_batch([text])[0]
+
+    def count_batch(
+        self, texts: Sequence[str], *, use_cache: bool = True
+    ) -> list[TokenCount]:
+        """
+        Count the tokens of each text.
+
+        Pass `use_cache=False` for many texts that are unlikely to be counted
+        again, such as the lines of a file, so they do not evict the cache.
+        """
+        settings = settings_manager.settings
+        model_name = settings.tiktoken_model_name
+        cache_enabled = (
+            use_cache and settings.cache_enabled and settings.cache_max_entries > 0
+        )
+
+        counts: list[TokenCount | None] = [None] * len(texts)
+        keys: list[tuple[str, bytes] | None] = [None] * len(texts)
+
+        if cache_enabled:
+            with self._lock:
+                for i, text in enumerate(texts):
+                    key = keys[i] = (model_name, _digest(text))
+
+                    if (count := self._entries.get(key)) is not None:
+                        self._entries.move_to_end(key)
+                        self._hits += 1
+                        counts[i] = count
+                    else:
+                        self._misses += 1
+
+        # Texts repeated within the batch are encoded once
+        missing: dict[str, list[int]] = {}
+
+        for i, count in enumerate(counts):
+            if count is None:
+                missing.setdefault(texts[i], []).append(i)
+
+        if missing:
+            encoding = self._get_encoding(model_name)
+            missing_texts = list(missing)
+
+            missing_counts = _encode_counts(
+                encoding, missing_texts, settings.batch_num_threads
+            )
+
+            for text, count in zip(missing_texts, missing_counts, strict=True):
+                for i in missing[text]:
+                    counts[i] = count
+
+            if cache_enabled:
+                self._store(
+                    {
+                        keys[positions[0]]: count
+                        for positions, count in zip(
+                            missing.values(), missing_counts, strict=True
+                        )
+                    },
+                    settings.cache_max_entries,
+                )
+
+        return [count or 0 for count in counts]
+
+    def stats(self) -> TokenCounterStats:
+        with self._lock:
+            return TokenCounterStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def _get_encoding(self, model_name: str) -> tiktoken.Encoding:
+        if (encoding := self._encodings.get(model_name)) is None:
+            encoding = tiktoken.encoding_for_model(model_name)
+
+            with self._lock:
+                self._encodings[model_name] = encoding
+
+        return encoding
+
+    def _store(
+        self,
+        entries: dict[tuple[str, bytes] | None, TokenCount],
+        max_entries: int,
+    ) -> None:
+        with self._lock:
+            for key, count in entries.items():
+                if key is None:  # pragma: no cover
+                    continue
+
+                self._entries[key] = count
+                self._entries.move_to_end(key)
+
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+
+def _encode_counts(
+    encoding: tiktoken.Encoding, texts: list[str], num_threads: int
+) -> list[TokenCount]:
+    num_chunks = min(num_threads, len(texts))
+
+    if num_chunks <= 1 or sum(map(len, texts)) < PARALLEL_MIN_CHARS:
+        return [len(encoding.encode_ordinary(text)) for text in texts]
+
+    # Contiguous chunks per thread, since a task per text costs more than
+    # encoding a short text
+    chunk_size = -(-len(texts) // num_chunks)
+    chunks = [texts[i : i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+    with ThreadPoolExecutor(num_chunks) as executor:
+        return [
+            count
+            for chunk_counts in executor.map(
+                lambda chunk: [len(encoding.encode_ordinary(t)) for t in chunk],
+                chunks,
+            )
+            for count in chunk_counts
+        ]
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+token_counter = TokenCounter()
@@ -10,5 +10,14 @@ class TokenUtilsSettings(BaseSettings):
 
     tiktoken_model_name: str = "gpt-4o"
 
+    cache_enabled: bool = True
+    """Whether text token counts are cached by content digest"""
+
+    cache_max_entries: int = 4096
+    """Maximum number of cached token counts, evicted least recently used first"""
+
+    batch_num_threads: int = 8
+    """Number of threads used to encode a large batch of texts"""
+
 
 settings_manager = SettingsManager(TokenUtilsSettings)
@@ -0,0 +1,77 @@
+import gzip
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from kiarina.agi.log_writer import LogWriter, settings_manager
+
+
+@pytest.fixture(autouse=True)
+def reset_settings() -> Iterator[None]:
+    yield
+    settings_manager.cli_args = {}
+
+
+async def test_write(tmp_path: Path) -> None:
+    writer = LogWriter(str(tmp_path / "logs" / "records.jsonl"))
+
+    for index in range(10):
+        await writer.write({"index": index, "text": "こんにちは"})
+
+    await writer.flush()
+
+    with open(writer.file_path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+
+    assert [record["index"] for record in records] == list(range(10))
+    assert records[0]["text"] == "こんにちは"
+
+    await writer.close()
+
+
+async def test_rotate_by_size(tmp_path: Path) -> None:
+    settings_manager.cli_args = {"rotate_max_bytes": 100, "batch_max_size": 1}
+    writer = LogWriter(str(tmp_path / "records.jsonl"))
+
+    for index in range(10):
+        await writer.write({"index": index, "padding": "x" * 40})
+
+    await writer.close()
+
+    file_names = sorted(os.listdir(tmp_path))
+    assert "records.jsonl" in file_names
+    assert len(file_names) > 1
+    assert all(name.endswith(".jsonl") for name in file_names)
+
+    indexes: list[int] = []
+
+    for file_name in file_names:
+        with open(tmp_path / file_name, encoding="utf-8") as f:
+            indexes.extend(json.loads(line)["index"] for line in f)
+
+    assert sorted(indexes) == list(range(10))
+
+
+async def test_compress(tmp_path: Path) -> None:
+    settings_manager.cli_args = {"compress": True}
+    writer = LogWriter(str(tmp_path / "records.jsonl"))
+    assert writer.file_path.endswith(".jsonl.gz")
+
+    await writer.write({"index": 0})
+    await writer.close()
+
+    # Appending after closing adds another gzip member to the same file
+    await writer.write({"index": 1})
+    await writer.close()
+
+    with gzip.open(writer.file_path, "rt", encoding="utf-8") as f:
+        assert [json.loads(line)["index"] for line in f] == [0, 1]
+
+
+def test_close_sync(tmp_path: Path) -> None:
+    writer = LogWriter(str(tmp_path / "records.jsonl"))
+    writer.close_sync()
+    assert not os.path.exists(writer.file_path)
@@ -0,0 +1,21 @@
+import json
+from pathlib import Path
+
+from kiarina.agi.log_writer import LogWriterPool
+
+
+async def test_log_writer_pool(tmp_path: Path) -> None:
+    pool = LogWriterPool()
+    file_path = str(tmp_path / "records.jsonl")
+
+    writer = pool.get(file_path)
+    assert pool.get(file_path) is writer
+
+    await writer.write({"index": 0})
+    await pool.flush()
+
+    with open(file_path, encoding="utf-8") as f:
+        assert [json.loads(line) for line in f] == [{"index": 0}]
+
+    await pool.close()
+    assert pool.get(file_path) is not writer
@@ -0,0 +1,88 @@
+from collections.abc import Iterator
+
+import pytest
+
+from kiarina.agi.request_logger import (
+    BaseRequestLogger,
+    RequestLogEntry,
+    log_request,
+    settings_manager,
+)
+from kiarina.agi.request_logger_impl.null import NullRequestLogger
+from kiarina.agi.run_context import RunContext
+
+
+class MyRequestLogger(BaseRequestLogger):
+    def __init__(self) -> None:
+        super().__init__()
+        self.successes: list[RequestLogEntry] = []
+        self.errors: list[tuple[RequestLogEntry, Exception]] = []
+
+    async def log_request_success(
+        self,
+        log_entry: RequestLogEntry,
+        *,
+        run_context: RunContext,
+    ) -> None:
+        self.successes.append(log_entry)
+
+    async def log_request_error(
+        self,
+        log_entry: RequestLogEntry,
+        error: Exception,
+        *,
+        run_context: RunContext,
+    ) -> None:
+        self.errors.append((log_entry, error))
+
+
+@pytest.fixture(autouse=True)
+def reset_settings() -> Iterator[None]:
+    yield
+    settings_manager.cli_args = {}
+
+
+def create_log_entry(content: str = "Hello") -> RequestLogEntry:
+    return RequestLogEntry(kind="test", source="test", content=content)
+
+
+async def test_log_request(run_context: RunContext) -> None:
+    logger = MyRequestLogger()
+    error = ValueError("test")
+
+    await log_request(logger, create_log_entry, run_context=run_context)
+    await log_request(logger, create_log_entry, error=error, run_context=run_context)
+
+    assert [entry.content for entry in logger.successes] == ["Hello"]
+    assert logger.errors[0][1] is error
+
+
+async def test_log_request_disabled(run_context: RunContext) -> None:
+    def fail() -> RequestLogEntry:
+        raise AssertionError("The log entry must not be built")
+
+    await log_request(NullRequestLogger(), fail, run_context=run_context)
+
+
+async def test_log_request_sampled_out(run_context: RunContext) -> None:
+    settings_manager.cli_args = {"success_sample_rate": 0.0}
+    logger = MyRequestLogger()
+
+    await log_request(logger, create_log_entry, run_context=run_context)
+    await log_request(
+        logger, create_log_entry, error=ValueError("test"), run_context=run_context
+    )
+
+    assert not logger.successes
+    assert len(logger.errors) == 1
+
+
+async def test_log_request_max_content_length(run_context: RunContext) -> None:
+    settings_manager.cli_args = {"max_content_length": 5, "format_in_thread": False}
+    logger = MyRequestLogger()
+
+    await log_request(
+        logger, lambda: create_log_entry("Hello, world!"), run_context=run_context
+    )
+
+    assert logger.successes[0].content == "Hello\n\n... (8 characters omitted)"
@@ -1,3 +1,4 @@
+import json
 import traceback
 
 from kiarina.agi.request_logger import RequestLogEntry
@@ -38,5 +39,28 @@ async def test_log_request_error(run_context: RunContext) -> None:
         )
 
 
+async def test_log_request_jsonl(run_context: RunContext) -> None:
+    logger = LocalRequestLogger(log_format="jsonl")
+
+    await logger.log_request_success(
+        RequestLogEntry(
+            kind="test",
+            source="test",
+            content="Hello",
+            metadata={"test_key": "test_value"},
+        ),
+        run_context=run_context,
+    )
+
+    await logger.writer.flush()
+
+    with open(logger.writer.file_path, encoding="utf-8") as f:
+        record = json.loads(f.readlines()[-1])
+
+    assert record["phase"] == "completed"
+    assert record["metadata"] == {"test_key": "test_value"}
+    assert record["content"] == "Hello"
+
+
 def _raise_test_exception() -> None:
     raise ValueError("This is a test exception for logging.")
@@ -0,0 +1,8 @@
+from kiarina.agi.token_utils import calc_text_token, calc_text_token_batch
+
+
+def test_calc_text_token_batch() -> None:
+    texts = ["Hello, world!", "", "Hello, world!", "The quick brown fox"]
+    token_counts = calc_text_token_batch(texts)
+    assert token_counts == [calc_text_token(text) for text in texts]
+    assert token_counts[1] == 0
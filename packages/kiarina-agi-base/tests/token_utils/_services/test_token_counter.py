@@ -0,0 +1,69 @@
+from collections.abc import Iterator
+
+import pytest
+
+from kiarina.agi.token_utils import TokenCounter, settings_manager
+
+
+@pytest.fixture
+def counter() -> Iterator[TokenCounter]:
+    yield TokenCounter()
+    settings_manager.cli_args = {}
+
+
+def test_count(counter: TokenCounter) -> None:
+    token_count = counter.count("Hello, world!")
+    assert token_count > 0
+    assert counter.count("Hello, world!") == token_count
+
+    stats = counter.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size == 1
+
+
+def test_count_batch(counter: TokenCounter) -> None:
+    texts = ["a b c", "Hello, world!", "a b c"]
+    counts = counter.count_batch(texts)
+    assert counts == [TokenCounter().count(text) for text in texts]
+
+    stats = counter.stats()
+    assert stats.misses == 3
+    assert stats.size == 2
+
+
+def test_count_batch_without_cache(counter: TokenCounter) -> None:
+    counts = counter.count_batch(["a b c", "Hello, world!"], use_cache=False)
+    assert counts == [TokenCounter().count(text) for text in ["a b c", "Hello, world!"]]
+    assert counter.stats() == (0, 0, 0, 0)
+
+
+def test_count_special_token_text(counter: TokenCounter) -> None:
+    assert counter.count("<|endoftext|>") > 1
+
+
+def test_eviction(counter: TokenCounter) -> None:
+    settings_manager.cli_args = {"cache_max_entries": 2}
+
+    counter.count_batch(["one", "two", "three"])
+
+    stats = counter.stats()
+    assert stats.evictions == 1
+    assert stats.size == 2
+
+
+def test_cache_disabled(counter: TokenCounter) -> None:
+    settings_manager.cli_args = {"cache_enabled": False}
+
+    counter.count("Hello, world!")
+    counter.count("Hello, world!")
+
+    stats = counter.stats()
+    assert stats.hits == 0
+    assert stats.size == 0
+
+
+def test_clear(counter: TokenCounter) -> None:
+    counter.count("Hello, world!")
+    counter.clear()
+    assert counter.stats() == (0, 0, 0, 0)
@@ -0,0 +1,3 @@
+from .._models.pdf_page_renderer import PDFPageRenderer
+
+pdf_page_renderer = PDFPageRenderer()
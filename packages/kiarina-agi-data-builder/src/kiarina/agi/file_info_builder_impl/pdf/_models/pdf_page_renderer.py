@@ -0,0 +1,204 @@
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+
+try:
+    import pypdfium2 as pdfium  # type: ignore[import-untyped]
+except ImportError as exc:
+    raise ImportError(
+        "pypdfium2 is required to render PDF pages. Install it with: "
+        "pip install 'kiarina-agi-data-builder[file-info-builder-pdf]'"
+    ) from exc
+
+try:
+    from PIL import Image
+except ImportError as exc:
+    raise ImportError(
+        "Pillow is required to encode PDF page images. Install it with: "
+        "pip install 'kiarina-agi-data-builder[file-info-builder-pdf]'"
+    ) from exc
+
+from .._types.pdf_bytes import PDFBytes
+
+
+class PDFPageRenderer:
+    """
+    Renders PDF pages to JPEG images, in a thread or across worker processes.
+
+    Pages render in a thread by default. PDFium is not thread-safe, so pages
+    run in parallel only in separate processes, which `max_workers` above 1
+    opts into. The document is then written to a temporary file that every
+    worker opens, and each task renders a chunk of consecutive pages. At most
+    `max_in_flight_pages // chunk_size` chunks, and at least one, are
+    submitted to the pool at once. This bounds the work queued in the pool,
+    not the rendered images, which are all kept until the document is done.
+    """
+
+    def __init__(self) -> None:
+        self._executor: ProcessPoolExecutor | None = None
+        self._max_workers = 0
+        self._lock = threading.Lock()
+
+    async def render(
+        self,
+        raw_data: PDFBytes,
+        *,
+        scale: float,
+        page_count: int | None = None,
+        max_workers: int | None = 1,
+        chunk_size: int = 4,
+        max_in_flight_pages: int = 32,
+    ) -> list[bytes]:
+        """
+        Render every page and return the JPEG images in page order.
+
+        Pass `page_count` when it is already known, so the document is not
+        opened just to count its pages. `max_workers` of None uses the CPU
+        count. A single worker, or a document of a single chunk, renders in a
+        thread. If a chunk fails, the remaining chunks are cancelled, and the
+        chunks already running are waited for before the error is raised.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        chunk_size = max(1, chunk_size)
+
+        if page_count is None:
+            page_count = await asyncio.to_thread(_count_pages, raw_data)
+
+        if max_workers <= 1 or page_count <= chunk_size:
+            return await asyncio.to_thread(
+                _render_pages, raw_data, 0, page_count, scale
+            )
+
+        executor = self._get_executor(max_workers)
+        semaphore = asyncio.Semaphore(max(1, max_in_flight_pages // chunk_size))
+        futures: list[Future[list[bytes]]] = []
+
+        with tempfile.TemporaryDirectory(prefix="pdf_page_renderer_") as temp_dir:
+            file_path = os.path.join(temp_dir, "document.pdf")
+            await asyncio.to_thread(_write_file, file_path, raw_data)
+
+            async def _render_chunk(start_index: int) -> list[bytes]:
+                end_index = min(start_index + chunk_size, page_count)
+
+                async with semaphore:
+                    future = executor.submit(
+                        _render_pages, file_path, start_index, end_index, scale
+                    )
+                    futures.append(future)
+                    return await asyncio.wrap_future(future)
+
+            tasks = [
+                asyncio.create_task(_render_chunk(start_index))
+                for start_index in range(0, page_count, chunk_size)
+            ]
+
+            try:
+                chunks = await asyncio.gather(*tasks)
+            except BrokenProcessPool:
+                # A crashed worker breaks the pool, so the next call starts a new one
+                self._discard_executor(executor)
+                raise
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+                # Chunks already running cannot be cancelled and still read
+                # the temporary file, so wait for them before removing it
+                await asyncio.to_thread(wait, futures)
+
+        return [image for chunk in chunks for image in chunk]
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker processes, for application shutdown.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _get_executor(self, max_workers: int) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is not None and self._max_workers == max_workers:
+                return self._executor
+
+            previous, self._max_workers = self._executor, max_workers
+
+            # Spawned workers do not inherit the threads and locks of the parent
+            self._executor = ProcessPoolExecutor(
+                max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        if previous is not None:
+            previous.shutdown(wait=False)
+
+        return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _count_pages(raw_data: PDFBytes) -> int:
+    document = pdfium.PdfDocument(raw_data)
+
+    try:
+        return len(document)
+    finally:
+        document.close()
+
+
+def _write_file(file_path: str, raw_data: PDFBytes) -> None:
+    with open(file_path, "wb") as f:
+        f.write(raw_data)
+
+
+def _render_pages(
+    source: PDFBytes | str,
+    start_index: int,
+    end_index: int,
+    scale: float,
+) -> list[bytes]:
+    document = pdfium.PdfDocument(source)
+
+    try:
+        return [
+            _render_page(document, page_index, scale)
+            for page_index in range(start_index, end_index)
+        ]
+    finally:
+        document.close()
+
+
+def _render_page(document: pdfium.PdfDocument, page_index: int, scale: float) -> bytes:
+    page = document[page_index]
+
+    try:
+        bitmap = page.render(scale=scale)
+
+        try:
+            image: Image.Image = bitmap.to_pil().convert("RGB")
+
+            try:
+                buffer = BytesIO()
+                image.save(buffer, "JPEG", quality=85, optimize=True)
+            finally:
+                image.close()
+        finally:
+            bitmap.close()
+    finally:
+        page.close()
+
+    return buffer.getvalue()
@@ -9,6 +9,7 @@ from kiarina.agi.token_utils import calc_pdf_token
 from kiarina.utils.file import FileBlob
 
 from .build_intermediate_pdf import build_intermediate_pdf
+from .load_pdf import load_pdf
 from .read_pdf import read_pdf
 from .read_pdf_metadata import read_pdf_metadata
 
@@ -19,7 +20,9 @@ async def build_analysis_disabled(
     *,
     run_context: RunContext,
 ) -> BuildResult:
-    pdf_metadata = await read_pdf_metadata(file_blob.raw_data)
+    # The parsed document is shared by every pypdf operation below
+    reader = await load_pdf(file_blob.raw_data)
+    pdf_metadata = await read_pdf_metadata(reader)
     page_count = pdf_metadata.page_count
     analysis_dpi = file_info_spec.get("analysis_dpi", 144)
 
@@ -48,7 +51,7 @@ async def build_analysis_disabled(
 
         if intermediate_file_blob is None:
             raw_data = await build_intermediate_pdf(
-                file_blob.raw_data,
+                reader,
                 start_page=start_page,
                 end_page=end_page,
             )
@@ -60,7 +63,7 @@ async def build_analysis_disabled(
             await kfa.write_file(intermediate_file_blob)
 
     target_blob = intermediate_file_blob or file_blob
-    pdf = await read_pdf(target_blob.raw_data)
+    pdf = await read_pdf(reader, start_page=start_page, end_page=end_page)
     token_count = calc_pdf_token(
         pdf.content.text,
         [pdf_image_info.size for pdf_image_info in pdf.content.images],
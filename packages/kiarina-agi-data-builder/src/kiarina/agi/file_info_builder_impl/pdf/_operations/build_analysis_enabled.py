@@ -1,3 +1,4 @@
+import asyncio
 import os
 from hashlib import sha1
 
@@ -18,11 +19,18 @@ from kiarina.utils.file import FileBlob
 from .._settings import PDFFileInfoBuilderSettings
 from .build_intermediate_pdf import build_intermediate_pdf
 from .build_page_image_bundle import build_page_image_bundle
+from .load_pdf import load_pdf
 from .read_pdf import read_pdf
 from .read_pdf_metadata import read_pdf_metadata
 
 BUNDLE_VERSION = 2
 
+RENDER_SETTING_FIELDS = {
+    "render_max_workers",
+    "render_chunk_size",
+    "render_max_in_flight_pages",
+}
+
 
 async def build_analysis_enabled(
     file_info_spec: FileInfoSpec,
@@ -31,7 +39,9 @@ async def build_analysis_enabled(
     run_context: RunContext,
     settings: PDFFileInfoBuilderSettings,
 ) -> BuildResult:
-    source_metadata = await read_pdf_metadata(file_blob.raw_data)
+    # The parsed document is shared by every pypdf operation below
+    reader = await load_pdf(file_blob.raw_data)
+    source_metadata = await read_pdf_metadata(reader)
     page_count = source_metadata.page_count
     start_page = normalize_page(file_info_spec.get("start_page", 1), page_count)
     end_page = normalize_page(file_info_spec.get("end_page", -1), page_count)
@@ -48,12 +58,11 @@ async def build_analysis_enabled(
 
     if start_page != 1 or end_page != page_count:
         target_raw_data = await build_intermediate_pdf(
-            file_blob.raw_data,
+            reader,
             start_page=start_page,
             end_page=end_page,
         )
 
-    pdf = await read_pdf(target_raw_data)
     output_base_path = create_local_repository(run_context).generate_cache_path(
         os.path.join("intermediate", "pdf", file_blob.hash_string)
     )
@@ -67,13 +76,21 @@ async def build_analysis_enabled(
     bundle_file_blob = await kfa.read_file(bundle_file_path)
 
     if bundle_file_blob is None:
-        bundle = _build_pdf_bundle(target_raw_data)
-        bundle += await build_page_image_bundle(
-            target_raw_data,
-            analysis_dpi=analysis_dpi,
-            start_page_number=start_page,
+        # Pages are rendered while the text is extracted
+        page_image_bundle, pdf = await asyncio.gather(
+            build_page_image_bundle(
+                target_raw_data,
+                analysis_dpi=analysis_dpi,
+                start_page_number=start_page,
+                page_count=end_page - start_page + 1,
+                settings=settings,
+            ),
+            read_pdf(reader, start_page=start_page, end_page=end_page),
         )
 
+        bundle = _build_pdf_bundle(target_raw_data)
+        bundle += page_image_bundle
+
         if pdf.content.text.strip():
             bundle += FileBundle.create(
                 manifest_contents=[
@@ -91,6 +108,8 @@ async def build_analysis_enabled(
             mime_type=FileBundle.MIME_TYPE,
             raw_data=bundle_raw_data,
         )
+    else:
+        pdf = await read_pdf(reader, start_page=start_page, end_page=end_page)
 
     token_count = calc_pdf_token(
         pdf.content.text,
@@ -144,7 +163,8 @@ def _get_bundle_file_path(
         "start_page": start_page,
         "end_page": end_page,
         "analysis_dpi": analysis_dpi,
-        "settings": settings.model_dump(mode="json"),
+        # How pages are rendered does not change the bundle
+        "settings": settings.model_dump(mode="json", exclude=RENDER_SETTING_FIELDS),
     }
     signature = sha1(
         repr(sorted(signature_source.items())).encode("utf-8")
@@ -12,27 +12,29 @@ except ImportError as exc:
         "pip install 'kiarina-agi-data-builder[file-info-builder-pdf]'"
     ) from exc
 
+from .load_pdf import get_pdf_reader
+
 PDFBytes: TypeAlias = bytes
 
 
 async def build_intermediate_pdf(
-    raw_data: PDFBytes,
+    pdf: PDFBytes | PdfReader,
     *,
     start_page: int = 1,
     end_page: int = -1,
 ) -> PDFBytes:
     return await asyncio.to_thread(
-        _build_intermediate_pdf, raw_data, start_page=start_page, end_page=end_page
+        _build_intermediate_pdf, pdf, start_page=start_page, end_page=end_page
     )
 
 
 def _build_intermediate_pdf(
-    raw_data: PDFBytes,
+    pdf: PDFBytes | PdfReader,
     *,
     start_page: int = 1,
     end_page: int = -1,
 ) -> PDFBytes:
-    reader = PdfReader(BytesIO(raw_data))
+    reader = get_pdf_reader(pdf)
 
     start_page = normalize_page(start_page, len(reader.pages))
     end_page = normalize_page(end_page, len(reader.pages))
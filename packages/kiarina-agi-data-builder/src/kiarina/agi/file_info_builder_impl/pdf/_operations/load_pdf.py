@@ -0,0 +1,29 @@
+import asyncio
+from io import BytesIO
+
+try:
+    from pypdf import PdfReader
+except ImportError as exc:
+    raise ImportError(
+        "pypdf is required to use PDFFileInfoBuilder. Install it with: "
+        "pip install 'kiarina-agi-data-builder[file-info-builder-pdf]'"
+    ) from exc
+
+from .._types.pdf_bytes import PDFBytes
+
+
+async def load_pdf(raw_data: PDFBytes) -> PdfReader:
+    """
+    Parse a PDF once, to share between the operations that accept a reader.
+
+    The reader is not thread-safe, so operations on it must not run at the
+    same time.
+    """
+    return await asyncio.to_thread(get_pdf_reader, raw_data)
+
+
+def get_pdf_reader(pdf: PDFBytes | PdfReader) -> PdfReader:
+    if isinstance(pdf, PdfReader):
+        return pdf
+
+    return PdfReader(BytesIO(pdf))
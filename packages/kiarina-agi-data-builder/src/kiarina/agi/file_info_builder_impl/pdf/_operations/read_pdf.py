@@ -1,35 +1,61 @@
 import asyncio
 import logging
-from io import BytesIO
 
 try:
-    from pypdf import PdfReader
+    from pypdf import PageObject, PdfReader
 except ImportError as exc:
     raise ImportError(
         "pypdf is required to use PDFFileInfoBuilder. Install it with: "
         "pip install 'kiarina-agi-data-builder[file-info-builder-pdf]'"
     ) from exc
 
+from kiarina.agi.file_utils import normalize_page
+
 from .._schemas.pdf import PDF
 from .._schemas.pdf_content import PDFContent
 from .._schemas.pdf_image_info import PDFImageInfo
 from .._schemas.pdf_metadata import PDFMetadata
 from .._types.pdf_bytes import PDFBytes
+from .load_pdf import get_pdf_reader
 
 logger = logging.getLogger(__name__)
 
 
-async def read_pdf(raw_data: PDFBytes) -> PDF:
-    return await asyncio.to_thread(_read_pdf, raw_data)
+async def read_pdf(
+    pdf: PDFBytes | PdfReader,
+    *,
+    start_page: int = 1,
+    end_page: int = -1,
+) -> PDF:
+    """
+    Extract the text and image sizes of a page range.
+
+    Pages are numbered from the start of the range, as if it were a document
+    of its own.
+    """
+    return await asyncio.to_thread(
+        _read_pdf, pdf, start_page=start_page, end_page=end_page
+    )
+
 
+def _read_pdf(
+    pdf: PDFBytes | PdfReader,
+    *,
+    start_page: int = 1,
+    end_page: int = -1,
+) -> PDF:
+    reader = get_pdf_reader(pdf)
+    pages: list[PageObject] = []
 
-def _read_pdf(raw_data: PDFBytes) -> PDF:
-    reader = PdfReader(BytesIO(raw_data))
+    if page_count := len(reader.pages):
+        start_page = normalize_page(start_page, page_count)
+        end_page = normalize_page(end_page, page_count)
+        pages = [reader.pages[index] for index in range(start_page - 1, end_page)]
 
     texts: list[str] = []
     images: list[PDFImageInfo] = []
 
-    for page_index, page in enumerate(reader.pages):
+    for page_index, page in enumerate(pages):
         if text := page.extract_text():
             texts.append(text)
 
@@ -39,7 +65,7 @@ def _read_pdf(raw_data: PDFBytes) -> PDF:
             logger.warning(f"Failed to extract images from page {page_index + 1}: {e}")
 
     return PDF(
-        metadata=PDFMetadata(page_count=len(reader.pages)),
+        metadata=PDFMetadata(page_count=len(pages)),
         content=PDFContent(text="\n".join(texts), images=images),
     )
 
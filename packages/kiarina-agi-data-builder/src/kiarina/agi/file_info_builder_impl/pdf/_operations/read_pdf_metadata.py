@@ -1,5 +1,4 @@
 import asyncio
-from io import BytesIO
 
 try:
     from pypdf import PdfReader
@@ -11,12 +10,13 @@ except ImportError as exc:
 
 from .._schemas.pdf_metadata import PDFMetadata
 from .._types.pdf_bytes import PDFBytes
+from .load_pdf import get_pdf_reader
 
 
-async def read_pdf_metadata(raw_data: PDFBytes) -> PDFMetadata:
-    return await asyncio.to_thread(_read_pdf_metadata, raw_data)
+async def read_pdf_metadata(pdf: PDFBytes | PdfReader) -> PDFMetadata:
+    return await asyncio.to_thread(_read_pdf_metadata, pdf)
 
 
-def _read_pdf_metadata(raw_data: PDFBytes) -> PDFMetadata:
-    reader = PdfReader(BytesIO(raw_data))
+def _read_pdf_metadata(pdf: PDFBytes | PdfReader) -> PDFMetadata:
+    reader = get_pdf_reader(pdf)
     return PDFMetadata(page_count=len(reader.pages))
@@ -15,5 +15,29 @@ class PDFFileInfoBuilderSettings(BaseSettings):
         description="Whether to build capability-aware PDF analysis bundles.",
     )
 
+    render_max_workers: int | None = Field(
+        default=1,
+        title="Render Max Workers",
+        description=(
+            "Maximum number of processes rendering page images. "
+            "1 renders in a thread, and None uses the CPU count."
+        ),
+    )
+
+    render_chunk_size: int = Field(
+        default=4,
+        title="Render Chunk Size",
+        description="Number of consecutive pages rendered by each task.",
+    )
+
+    render_max_in_flight_pages: int = Field(
+        default=32,
+        title="Render Max In-Flight Pages",
+        description=(
+            "Maximum number of pages submitted to the worker processes at once. "
+            "At least one chunk is submitted."
+        ),
+    )
+
 
 settings_manager = SettingsManager(PDFFileInfoBuilderSettings)
@@ -0,0 +1,86 @@
+import asyncio
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from pypdf import PdfWriter
+
+from kiarina.agi.file_info_builder_impl.pdf._models.pdf_page_renderer import (
+    PDFPageRenderer,
+)
+
+
+def _create_pdf(page_count: int) -> bytes:
+    buffer = BytesIO()
+    writer = PdfWriter()
+
+    for index in range(page_count):
+        writer.add_blank_page(width=100 + index * 10, height=200)
+
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _image_widths(images: list[bytes]) -> list[int]:
+    widths: list[int] = []
+
+    for image_data in images:
+        with Image.open(BytesIO(image_data)) as image:
+            assert image.format == "JPEG"
+            widths.append(image.size[0])
+
+    return widths
+
+
+async def test_render_in_thread() -> None:
+    renderer = PDFPageRenderer()
+    images = await renderer.render(_create_pdf(3), scale=1.0)
+
+    assert _image_widths(images) == [100, 110, 120]
+    assert renderer._executor is None
+
+
+async def test_render_known_page_count() -> None:
+    renderer = PDFPageRenderer()
+    images = await renderer.render(_create_pdf(3), scale=1.0, page_count=2)
+
+    assert _image_widths(images) == [100, 110]
+
+
+async def test_render_in_processes_keeps_page_order() -> None:
+    raw_data = _create_pdf(7)
+    renderer = PDFPageRenderer()
+
+    try:
+        images = await renderer.render(
+            raw_data,
+            scale=1.0,
+            max_workers=2,
+            chunk_size=2,
+            max_in_flight_pages=4,
+        )
+    finally:
+        renderer.shutdown()
+
+    assert _image_widths(images) == [100 + index * 10 for index in range(7)]
+    assert images == await renderer.render(raw_data, scale=1.0, max_workers=1)
+
+
+async def test_render_in_processes_cancels_remaining_chunks() -> None:
+    renderer = PDFPageRenderer()
+
+    try:
+        # Chunks past the last page fail in the worker
+        with pytest.raises(RuntimeError):
+            await renderer.render(
+                _create_pdf(3),
+                scale=1.0,
+                page_count=12,
+                max_workers=2,
+                chunk_size=2,
+                max_in_flight_pages=4,
+            )
+    finally:
+        renderer.shutdown()
+
+    assert asyncio.all_tasks() == {asyncio.current_task()}
@@ -62,6 +62,31 @@ def test_bundle_cache_signature_includes_analysis_inputs() -> None:
     assert len({base, changed_segment, changed_dpi, changed_settings}) == 4
 
 
+def test_bundle_cache_signature_ignores_render_settings() -> None:
+    output_base_path = "/tmp/document"
+    base = _get_bundle_file_path(
+        output_base_path,
+        start_page=1,
+        end_page=3,
+        analysis_dpi=144,
+        settings=_settings(),
+    )
+    changed_render = _get_bundle_file_path(
+        output_base_path,
+        start_page=1,
+        end_page=3,
+        analysis_dpi=144,
+        settings=PDFFileInfoBuilderSettings(
+            analysis_enabled=True,
+            render_max_workers=2,
+            render_chunk_size=1,
+            render_max_in_flight_pages=8,
+        ),
+    )
+
+    assert base == changed_render
+
+
 async def test_build_analysis_enabled_creates_capability_bundle(
     run_context: RunContext,
     many_page_pdf_file_path: Path,
@@ -1,5 +1,8 @@
+from pathlib import Path
+
 import pytest
 
+from kiarina.agi.file_info_builder_impl.pdf._operations.load_pdf import load_pdf
 from kiarina.agi.file_info_builder_impl.pdf._operations.read_pdf import (
     read_pdf,
 )
@@ -42,3 +45,12 @@ async def test_read_pdf(
     print(f"  Text content: {pdf.content.text}")
     for i, image in enumerate(pdf.content.images):
         print(f"  Image info {i + 1}: {image}")
+
+
+async def test_read_pdf_page_range(many_page_pdf_file_path: Path) -> None:
+    reader = await load_pdf(many_page_pdf_file_path.read_bytes())
+    pdf = await read_pdf(reader, start_page=-1, end_page=-1)
+
+    assert pdf.metadata.page_count == 1
+    assert "まとめ" in pdf.content.text
+    assert "テスト用PDFドキュメント" not in pdf.content.text
@@ -0,0 +1,74 @@
+import time
+
+from kiarina.agi.event import HumanMessageEvent
+from kiarina.agi.file_info import FileInfo, ImageFileInfo
+from kiarina.agi.file_info_pool import FileInfoPool
+from kiarina.agi.history import History
+from kiarina.agi.message import hydrate_messages
+
+EVENT_COUNT = 2000
+
+FILES_PER_EVENT = 5
+
+
+def create_file_info(index: int) -> ImageFileInfo:
+    return ImageFileInfo(
+        uri_or_file_path=f"/tmp/sample-{index}.png",
+        mime_type="image/png",
+        file_hash=f"hash-{index}",
+        file_size=100,
+        token_count=100,
+        intermediate_file_path=None,
+        asset_uri=None,
+        width=640,
+        height=480,
+    )
+
+
+def create_events() -> list[HumanMessageEvent]:
+    events = []
+
+    for index in range(EVENT_COUNT):
+        files: list[FileInfo] = [
+            create_file_info(index * FILES_PER_EVENT + offset)
+            for offset in range(FILES_PER_EVENT)
+        ]
+        events.append(HumanMessageEvent.create(f"Message {index}", files))
+
+    return events
+
+
+def main() -> None:
+    events = create_events()
+    history = History()
+
+    start = time.perf_counter()
+
+    for index, event in enumerate(events, start=1):
+        history.add_event(event)
+
+        if index % (EVENT_COUNT // 4) == 0:
+            elapsed = time.perf_counter() - start
+            print(
+                f"add_event: {index:,} events, {len(history.file_infos):,} files "
+                f"({elapsed:.2f}s)"
+            )
+
+    messages = history.get_messages()
+    messages.reverse()
+
+    for name, pool in [
+        ("list", list(history.file_infos)),
+        ("FileInfoPool", FileInfoPool(history.file_infos)),
+    ]:
+        start = time.perf_counter()
+        _, remaining = hydrate_messages(messages, pool)
+        elapsed = time.perf_counter() - start
+        print(
+            f"hydrate_messages ({name} pool): {len(messages):,} messages, "
+            f"{len(remaining):,} files left ({elapsed:.2f}s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import time
+
+import numpy as np
+
+from kiarina.agi.embedding import Embedding, EmbeddingMatrix, IVFFlatIndex
+
+EMBEDDING_COUNT = 200_000
+
+DIMENSION = 128
+
+CLUSTER_COUNT = 1000
+
+QUERY_COUNT = 100
+
+TOP_K = 10
+
+
+def create_embeddings(count: int, *, seed: int) -> list[Embedding]:
+    # Clustered vectors resemble real embeddings more than uniform noise
+    centers = np.random.default_rng(0).standard_normal(
+        (CLUSTER_COUNT, DIMENSION), dtype=np.float32
+    )
+    rng = np.random.default_rng(seed)
+    labels = rng.integers(0, CLUSTER_COUNT, count)
+    noise = rng.standard_normal((count, DIMENSION), dtype=np.float32)
+    vectors = centers[labels] + noise
+    return [
+        Embedding(kind="text", space_id="text:example", vector=vector)
+        for vector in vectors.tolist()
+    ]
+
+
+def main() -> None:
+    embeddings = create_embeddings(EMBEDDING_COUNT, seed=1)
+    queries = create_embeddings(QUERY_COUNT, seed=2)
+
+    start = time.perf_counter()
+    exact = EmbeddingMatrix(embeddings)
+    print(f"EmbeddingMatrix build: {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    expected = [
+        {r.embedding.id for r in exact.search(query, top_k=TOP_K)} for query in queries
+    ]
+    elapsed = (time.perf_counter() - start) / len(queries)
+    print(f"EmbeddingMatrix.search: {elapsed * 1000:.2f}ms/query, recall@10 1.000")
+
+    start = time.perf_counter()
+    index = IVFFlatIndex(min_train_size=1)
+    index.extend(embeddings)
+    print(f"IVFFlatIndex build: {time.perf_counter() - start:.2f}s")
+
+    for nprobe in [1, 4, 8, 16, 32]:
+        index.nprobe = nprobe
+
+        start = time.perf_counter()
+        actual = [
+            {r.embedding.id for r in index.search(query, top_k=TOP_K)}
+            for query in queries
+        ]
+        elapsed = (time.perf_counter() - start) / len(queries)
+
+        recall = sum(len(e & a) for e, a in zip(expected, actual, strict=True)) / (
+            len(queries) * TOP_K
+        )
+        print(
+            f"IVFFlatIndex.search (nprobe={nprobe}): "
+            f"{elapsed * 1000:.2f}ms/query, recall@10 {recall:.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import time
+
+import numpy as np
+
+from kiarina.agi.embedding import (
+    Embedding,
+    EmbeddingMatrix,
+    calc_cosine_similarity,
+    search_embeddings,
+)
+
+EMBEDDING_COUNT = 100_000
+
+DIMENSION = 768
+
+QUERY_COUNT = 10
+
+
+def create_embeddings() -> list[Embedding]:
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((EMBEDDING_COUNT, DIMENSION), dtype=np.float32)
+    return [
+        Embedding(kind="text", space_id="text:example", vector=vector.tolist())
+        for vector in vectors
+    ]
+
+
+def search_pairwise(query: Embedding, candidates: list[Embedding]) -> list[Embedding]:
+    # The per-pair loop that search_embeddings used before EmbeddingMatrix
+    scored = [(calc_cosine_similarity(query, c), c) for c in candidates]
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [embedding for _, embedding in scored[:10]]
+
+
+def main() -> None:
+    embeddings = create_embeddings()
+    queries = embeddings[:QUERY_COUNT]
+
+    start = time.perf_counter()
+    search_pairwise(queries[0], embeddings)
+    elapsed = time.perf_counter() - start
+    print(f"pairwise loop: {elapsed:.2f}s/query")
+
+    start = time.perf_counter()
+    search_embeddings(queries[0], embeddings)
+    elapsed = time.perf_counter() - start
+    print(f"search_embeddings: {elapsed:.2f}s/query")
+
+    start = time.perf_counter()
+    matrix = EmbeddingMatrix(embeddings)
+    elapsed = time.perf_counter() - start
+    print(f"EmbeddingMatrix build: {len(matrix):,} embeddings ({elapsed:.2f}s)")
+
+    start = time.perf_counter()
+
+    for query in queries:
+        matrix.search(query)
+
+    elapsed = (time.perf_counter() - start) / len(queries)
+    print(f"EmbeddingMatrix.search: {elapsed * 1000:.1f}ms/query")
+
+
+if __name__ == "__main__":
+    main()
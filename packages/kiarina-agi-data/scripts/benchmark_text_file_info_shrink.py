@@ -0,0 +1,50 @@
+import time
+
+from kiarina.agi.file_info import TextFileInfo
+from kiarina.agi.token_utils import calc_text_token
+
+LINE_COUNT = 100_000
+
+
+def create_file_info() -> TextFileInfo:
+    raw_text = "\n".join(
+        f"{index} INFO request handled in {index % 97} ms"
+        for index in range(LINE_COUNT)
+    )
+
+    return TextFileInfo(
+        uri_or_file_path="/tmp/sample.log",
+        mime_type="text/plain",
+        file_hash="hash",
+        file_size=len(raw_text),
+        token_count=calc_text_token(raw_text),
+        intermediate_file_path=None,
+        asset_uri=None,
+        line_count=LINE_COUNT,
+        raw_text=raw_text,
+    )
+
+
+def main() -> None:
+    file_info = create_file_info()
+    print(f"{LINE_COUNT:,} lines, {file_info.token_count:,} tokens")
+
+    for keep_from_end in [False, True]:
+        current = file_info.model_copy(update={"keep_from_end": keep_from_end})
+
+        # Only the first shrink counts the tokens of each line, as copies and
+        # shrunk file infos reuse the line index
+        for step in range(1, 4):
+            start = time.perf_counter()
+            current, reduced = current.shrink(reduce=current.token_count // 2)
+            elapsed = time.perf_counter() - start
+
+            print(
+                f"shrink {step} (keep_from_end={keep_from_end}): "
+                f"{current.segment_line_count:,} lines, {reduced:,} reduced "
+                f"({elapsed:.2f}s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
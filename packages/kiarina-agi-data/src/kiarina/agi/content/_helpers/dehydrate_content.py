@@ -1,12 +1,13 @@
-from kiarina.agi.file_info_pool import FileInfoPool, dehydrate_file_infos
+from kiarina.agi.file_info import FileInfo
+from kiarina.agi.file_info_pool import dehydrate_file_infos
 
 from .._models.content import Content
 
 
 def dehydrate_content(
     content: Content,
-    pool: FileInfoPool,
-) -> tuple[Content, FileInfoPool]:
+    pool: list[FileInfo],
+) -> tuple[Content, list[FileInfo]]:
     new_file_infos, pool = dehydrate_file_infos(content.files, pool)
 
     if new_file_infos is content.files:
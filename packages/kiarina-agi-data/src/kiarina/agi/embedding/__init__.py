@@ -1,8 +1,12 @@
 from ._helpers.calc_cosine_similarity import calc_cosine_similarity
 from ._helpers.search_embeddings import search_embeddings
 from ._models.embedding import Embedding
+from ._models.embedding_matrix import EmbeddingMatrix
+from ._models.ivf_flat_index import IVFFlatIndex
 from ._schemas.embedding_space import EmbeddingSpace
+from ._schemas.ivf_flat_index_state import IVFFlatIndexState
 from ._types.embedding_id import EmbeddingID
+from ._types.embedding_index import EmbeddingIndex
 from ._types.embedding_kind import EmbeddingKind
 from ._types.embedding_space_id import EmbeddingSpaceID
 from ._types.embedding_vector import EmbeddingVector
@@ -15,10 +19,14 @@ __all__ = [
     "search_embeddings",
     # ._models
     "Embedding",
+    "EmbeddingMatrix",
+    "IVFFlatIndex",
     # ._schemas
     "EmbeddingSpace",
+    "IVFFlatIndexState",
     # ._types
     "EmbeddingID",
+    "EmbeddingIndex",
     "EmbeddingKind",
     "EmbeddingSpaceID",
     "EmbeddingVector",
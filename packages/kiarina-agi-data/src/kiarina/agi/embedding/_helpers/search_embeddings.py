@@ -3,8 +3,8 @@ from collections.abc import Iterable
 import numpy as np
 
 from .._models.embedding import Embedding
+from .._models.embedding_matrix import EmbeddingMatrix
 from .._views.embedding_search_result import EmbeddingSearchResult
-from .calc_cosine_similarity import calc_cosine_similarity
 
 
 def search_embeddings(
@@ -17,17 +17,9 @@ def search_embeddings(
     if top_k <= 0:
         return []
 
-    results: list[EmbeddingSearchResult] = []
+    if isinstance(query, Embedding):
+        candidates = (c for c in candidates if c.space_id == query.space_id)
 
-    for candidate in candidates:
-        if isinstance(query, Embedding) and query.space_id != candidate.space_id:
-            continue
-
-        score = calc_cosine_similarity(query, candidate)
-
-        if min_score is not None and score < min_score:
-            continue
-
-        results.append(EmbeddingSearchResult(embedding=candidate, score=score))
-
-    return sorted(results, key=lambda result: result.score, reverse=True)[:top_k]
+    # Build an EmbeddingMatrix once to search the same candidates repeatedly
+    matrix = EmbeddingMatrix(candidates)
+    return matrix.search(query, top_k=top_k, min_score=min_score)
@@ -0,0 +1,77 @@
+import numpy as np
+
+from .._types.embedding_id import EmbeddingID
+from .embedding import Embedding
+
+
+class EmbeddingBlock:
+    """
+    Vectors of one dimension stored as rows of a float32 matrix.
+    """
+
+    def __init__(self, dimension: int) -> None:
+        self.dimension = dimension
+        self.size = 0
+        self.embeddings: list[Embedding] = []
+        self.positions: dict[EmbeddingID, int] = {}
+        self.vectors = np.empty((0, dimension), dtype=np.float32)
+        self.norms = np.empty(0, dtype=np.float32)
+        self.sequences = np.empty(0, dtype=np.int64)
+
+    def extend(
+        self,
+        embeddings: list[Embedding],
+        sequences: list[int] | np.ndarray,
+        vectors: np.ndarray | None = None,
+    ) -> None:
+        if vectors is None:
+            vectors = np.array([e.vector for e in embeddings], dtype=np.float32)
+            vectors = vectors.reshape(len(embeddings), self.dimension)
+        self._reserve(self.size + len(embeddings))
+
+        end = self.size + len(embeddings)
+        self.vectors[self.size : end] = vectors
+        self.norms[self.size : end] = np.linalg.norm(vectors, axis=1)
+        self.sequences[self.size : end] = sequences
+
+        for position, embedding in enumerate(embeddings, start=self.size):
+            self.positions[embedding.id] = position
+
+        self.embeddings.extend(embeddings)
+        self.size = end
+
+    def remove(self, embedding_id: EmbeddingID) -> None:
+        # The last row moves into the gap so that rows stay contiguous
+        position = self.positions.pop(embedding_id)
+        last = self.size - 1
+
+        if position != last:
+            self.vectors[position] = self.vectors[last]
+            self.norms[position] = self.norms[last]
+            self.sequences[position] = self.sequences[last]
+            self.embeddings[position] = self.embeddings[last]
+            self.positions[self.embeddings[position].id] = position
+
+        self.embeddings.pop()
+        self.size = last
+
+    def calc_scores(self, vector: np.ndarray, norm: float) -> np.ndarray:
+        dots = self.vectors[: self.size] @ vector
+        norms = self.norms[: self.size] * np.float32(norm)
+        scores: np.ndarray = np.divide(
+            dots, norms, out=np.zeros_like(dots), where=norms != 0.0
+        )
+        return scores.astype(np.float64)
+
+    def _reserve(self, capacity: int) -> None:
+        if capacity <= len(self.vectors):
+            return
+
+        capacity = max(capacity, len(self.vectors) * 2)
+
+        vectors = np.empty((capacity, self.dimension), dtype=np.float32)
+        vectors[: self.size] = self.vectors[: self.size]
+        self.vectors = vectors
+
+        self.norms = np.resize(self.norms, capacity)
+        self.sequences = np.resize(self.sequences, capacity)
@@ -0,0 +1,122 @@
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+from .._types.embedding_id import EmbeddingID
+from .._types.embedding_space_id import EmbeddingSpaceID
+from .._utils.search_embedding_blocks import search_embedding_blocks
+from .._utils.to_query_vector import to_query_vector
+from .._views.embedding_search_result import EmbeddingSearchResult
+from .embedding import Embedding
+from .embedding_block import EmbeddingBlock
+
+BlockKey = tuple[EmbeddingSpaceID, int]
+
+
+class EmbeddingMatrix:
+    """
+    Embeddings stored as contiguous float32 matrices grouped by space.
+
+    Vectors are converted and their norms are calculated once when they are
+    added, so a search is one matrix product per space. The embeddings
+    themselves are kept as is and are returned by `to_embeddings`.
+    """
+
+    def __init__(self, embeddings: Iterable[Embedding] = ()) -> None:
+        self._blocks: dict[BlockKey, EmbeddingBlock] = {}
+        self._keys: dict[EmbeddingID, BlockKey] = {}
+        self._sequence = 0
+        self.extend(embeddings)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, embedding_id: object) -> bool:
+        return embedding_id in self._keys
+
+    def __iter__(self) -> Iterator[Embedding]:
+        return iter(self.to_embeddings())
+
+    @property
+    def space_ids(self) -> list[EmbeddingSpaceID]:
+        return list(dict.fromkeys(space_id for space_id, _ in self._blocks))
+
+    def get(self, embedding_id: EmbeddingID) -> Embedding | None:
+        if (key := self._keys.get(embedding_id)) is None:
+            return None
+
+        block = self._blocks[key]
+        return block.embeddings[block.positions[embedding_id]]
+
+    def add(self, embedding: Embedding) -> None:
+        self.extend([embedding])
+
+    def extend(self, embeddings: Iterable[Embedding]) -> None:
+        groups: dict[BlockKey, dict[EmbeddingID, Embedding]] = {}
+
+        for embedding in embeddings:
+            # An embedding with the same ID replaces the previous one
+            self.remove(embedding.id)
+
+            for group in groups.values():
+                group.pop(embedding.id, None)
+
+            key = (embedding.space_id, len(embedding.vector))
+            groups.setdefault(key, {})[embedding.id] = embedding
+
+        for key, group in groups.items():
+            if not group:
+                continue
+
+            if (block := self._blocks.get(key)) is None:
+                block = self._blocks[key] = EmbeddingBlock(key[1])
+
+            sequences = list(range(self._sequence, self._sequence + len(group)))
+            block.extend(list(group.values()), sequences)
+            self._sequence += len(group)
+
+            for embedding_id in group:
+                self._keys[embedding_id] = key
+
+    def remove(self, embedding_id: EmbeddingID) -> None:
+        if (key := self._keys.pop(embedding_id, None)) is None:
+            return
+
+        block = self._blocks[key]
+        block.remove(embedding_id)
+
+        if block.size == 0:
+            del self._blocks[key]
+
+    def to_embeddings(self) -> list[Embedding]:
+        """
+        Return the embeddings in the order they were added.
+        """
+        entries = [
+            (int(block.sequences[position]), embedding)
+            for block in self._blocks.values()
+            for position, embedding in enumerate(block.embeddings)
+        ]
+        entries.sort(key=lambda entry: entry[0])
+        return [embedding for _, embedding in entries]
+
+    def clear(self) -> None:
+        self._blocks.clear()
+        self._keys.clear()
+
+    def search(
+        self,
+        query: Embedding | np.ndarray,
+        *,
+        top_k: int = 10,
+        min_score: float | None = None,
+    ) -> list[EmbeddingSearchResult]:
+        vector = to_query_vector(query)
+
+        blocks = [
+            block
+            for (space_id, _), block in self._blocks.items()
+            if not isinstance(query, Embedding) or space_id == query.space_id
+        ]
+
+        return search_embedding_blocks(blocks, vector, top_k=top_k, min_score=min_score)
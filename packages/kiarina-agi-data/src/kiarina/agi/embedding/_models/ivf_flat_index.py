@@ -0,0 +1,290 @@
+import math
+from collections.abc import Iterable
+from typing import Self
+
+import numpy as np
+
+from .._schemas.ivf_flat_index_state import IVFFlatIndexState
+from .._types.embedding_id import EmbeddingID
+from .._types.embedding_space_id import EmbeddingSpaceID
+from .._utils.assign_centroids import assign_centroids
+from .._utils.normalize_rows import normalize_rows
+from .._utils.search_embedding_blocks import search_embedding_blocks
+from .._utils.to_query_vector import to_query_vector
+from .._utils.train_centroids import train_centroids
+from .._views.embedding_search_result import EmbeddingSearchResult
+from .embedding import Embedding
+from .embedding_block import EmbeddingBlock
+
+
+class IVFFlatIndex:
+    """
+    Approximate index of the embeddings of one space (IVF-flat).
+
+    Embeddings are clustered around `nlist` centroids and a search scores
+    only the `nprobe` clusters closest to the query. Until `min_train_size`
+    embeddings are added the index searches exactly. It trains again each
+    time it grows `retrain_growth` times so that the clusters stay balanced.
+    """
+
+    def __init__(
+        self,
+        *,
+        nlist: int | None = None,
+        nprobe: int = 8,
+        min_train_size: int = 10_000,
+        retrain_growth: float = 4.0,
+        seed: int = 0,
+    ) -> None:
+        if nlist is not None and nlist <= 0:
+            raise ValueError("nlist must be positive")
+
+        if nprobe <= 0:
+            raise ValueError("nprobe must be positive")
+
+        if retrain_growth <= 1.0:
+            raise ValueError("retrain_growth must be greater than 1")
+
+        self.nlist: int | None = nlist
+        self.nprobe: int = nprobe
+        self.min_train_size: int = min_train_size
+        self.retrain_growth: float = retrain_growth
+        self.seed: int = seed
+
+        self._space_id: EmbeddingSpaceID | None = None
+        self._centroids: np.ndarray | None = None
+        self._lists: list[EmbeddingBlock] = []
+        self._list_indexes: dict[EmbeddingID, int] = {}
+        self._sequence = 0
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self._list_indexes)
+
+    def __contains__(self, embedding_id: object) -> bool:
+        return embedding_id in self._list_indexes
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def add(self, embedding: Embedding) -> None:
+        self.extend([embedding])
+
+    def extend(self, embeddings: Iterable[Embedding]) -> None:
+        new_embeddings: dict[EmbeddingID, Embedding] = {}
+
+        for embedding in embeddings:
+            self._check_embedding(embedding)
+            self.remove(embedding.id)
+            new_embeddings.pop(embedding.id, None)
+            new_embeddings[embedding.id] = embedding
+
+        if not new_embeddings:
+            return
+
+        self._insert(list(new_embeddings.values()))
+
+        if len(self) >= self.min_train_size and (
+            self._centroids is None
+            or len(self) >= self._trained_size * self.retrain_growth
+        ):
+            self.train()
+
+    def remove(self, embedding_id: EmbeddingID) -> None:
+        if (list_index := self._list_indexes.pop(embedding_id, None)) is not None:
+            self._lists[list_index].remove(embedding_id)
+
+    def clear(self) -> None:
+        self._space_id = None
+        self._centroids = None
+        self._lists = []
+        self._list_indexes = {}
+        self._sequence = 0
+        self._trained_size = 0
+
+    def train(self) -> None:
+        """
+        Cluster the current embeddings again.
+        """
+        if len(self) == 0:
+            return
+
+        # Ordered as added so that ties keep their order after training
+        blocks = [block for block in self._lists if block.size > 0]
+        sequences = np.concatenate([block.sequences[: block.size] for block in blocks])
+        order = np.argsort(sequences, kind="stable")
+
+        embeddings = [embedding for block in blocks for embedding in block.embeddings]
+        embeddings = [embeddings[position] for position in order.tolist()]
+        vectors = np.concatenate([block.vectors[: block.size] for block in blocks])
+        vectors = vectors[order]
+        normalized = normalize_rows(vectors)
+
+        nlist = min(self.nlist or max(1, int(math.sqrt(len(embeddings)))), len(vectors))
+        self._centroids = train_centroids(normalized, nlist, seed=self.seed)
+        self._lists = [EmbeddingBlock(vectors.shape[1]) for _ in range(nlist)]
+        self._list_indexes = {}
+        self._trained_size = len(embeddings)
+
+        assignments = assign_centroids(normalized, self._centroids)
+        self._fill_lists(embeddings, assignments, vectors)
+
+    def search(
+        self,
+        query: Embedding | np.ndarray,
+        *,
+        top_k: int = 10,
+        min_score: float | None = None,
+    ) -> list[EmbeddingSearchResult]:
+        vector = to_query_vector(query)
+
+        if isinstance(query, Embedding) and query.space_id != self._space_id:
+            return []
+
+        blocks = self._lists
+
+        if self._centroids is not None and vector.shape[0] == self._centroids.shape[1]:
+            similarities = self._centroids @ vector
+            nprobe = min(self.nprobe, len(blocks))
+            probes = np.argpartition(-similarities, nprobe - 1)[:nprobe]
+            blocks = [blocks[probe] for probe in probes.tolist()]
+
+        return search_embedding_blocks(blocks, vector, top_k=top_k, min_score=min_score)
+
+    def to_state(self) -> IVFFlatIndexState:
+        """
+        Return the clusters so that they are saved alongside the embeddings.
+        """
+        return IVFFlatIndexState(
+            space_id=self._space_id,
+            nlist=self.nlist,
+            nprobe=self.nprobe,
+            min_train_size=self.min_train_size,
+            retrain_growth=self.retrain_growth,
+            seed=self.seed,
+            trained_size=self._trained_size,
+            centroids=(
+                self._centroids.astype(float).tolist()
+                if self._centroids is not None
+                else None
+            ),
+            lists=[
+                [block.embeddings[position].id for position in _sorted_positions(block)]
+                for block in self._lists
+            ],
+        )
+
+    @classmethod
+    def from_state(
+        cls, state: IVFFlatIndexState, embeddings: Iterable[Embedding]
+    ) -> Self:
+        """
+        Restore an index from its state and the embeddings it was built from.
+
+        Embeddings missing from the state are added, and IDs in the state
+        without an embedding are skipped.
+        """
+        index = cls(
+            nlist=state.nlist,
+            nprobe=state.nprobe,
+            min_train_size=state.min_train_size,
+            retrain_growth=state.retrain_growth,
+            seed=state.seed,
+        )
+
+        embeddings_by_id = {embedding.id: embedding for embedding in embeddings}
+
+        if state.centroids is None:
+            index.extend(
+                embeddings_by_id.pop(embedding_id)
+                for embedding_ids in state.lists
+                for embedding_id in embedding_ids
+                if embedding_id in embeddings_by_id
+            )
+
+        else:
+            index._space_id = state.space_id
+            index._centroids = np.asarray(state.centroids, dtype=np.float32)
+            index._lists = [
+                EmbeddingBlock(index._centroids.shape[1]) for _ in state.lists
+            ]
+            index._trained_size = state.trained_size
+
+            restored: list[Embedding] = []
+            assignments: list[int] = []
+
+            for list_index, embedding_ids in enumerate(state.lists):
+                for embedding_id in embedding_ids:
+                    if (embedding := embeddings_by_id.pop(embedding_id, None)) is None:
+                        continue
+
+                    index._check_embedding(embedding)
+                    restored.append(embedding)
+                    assignments.append(list_index)
+
+            index._fill_lists(restored, np.asarray(assignments, dtype=np.int64))
+
+        index.extend(embeddings_by_id.values())
+        return index
+
+    def _check_embedding(self, embedding: Embedding) -> None:
+        if self._space_id is None:
+            self._space_id = embedding.space_id
+
+        elif embedding.space_id != self._space_id:
+            raise ValueError(
+                "Cannot index embeddings from different spaces: "
+                f"{embedding.space_id!r} != {self._space_id!r}"
+            )
+
+        if (dimension := self._get_dimension()) is None:
+            self._lists = [EmbeddingBlock(len(embedding.vector))]
+
+        elif len(embedding.vector) != dimension:
+            raise ValueError(
+                f"Expected a {dimension}-dimensional vector, "
+                f"got {len(embedding.vector)} dimensions"
+            )
+
+    def _get_dimension(self) -> int | None:
+        if self._centroids is not None:
+            return int(self._centroids.shape[1])
+
+        return self._lists[0].dimension if self._lists else None
+
+    def _insert(self, embeddings: list[Embedding]) -> None:
+        vectors = np.array([e.vector for e in embeddings], dtype=np.float32)
+        vectors = vectors.reshape(len(embeddings), len(embeddings[0].vector))
+
+        if self._centroids is None:
+            assignments = np.zeros(len(embeddings), dtype=np.int64)
+        else:
+            assignments = assign_centroids(normalize_rows(vectors), self._centroids)
+
+        self._fill_lists(embeddings, assignments, vectors)
+
+    def _fill_lists(
+        self,
+        embeddings: list[Embedding],
+        assignments: np.ndarray,
+        vectors: np.ndarray | None = None,
+    ) -> None:
+        sequences = np.arange(self._sequence, self._sequence + len(embeddings))
+        self._sequence += len(embeddings)
+
+        for list_index in np.unique(assignments).tolist():
+            positions = np.flatnonzero(assignments == list_index)
+            self._lists[list_index].extend(
+                [embeddings[position] for position in positions.tolist()],
+                sequences[positions],
+                vectors[positions] if vectors is not None else None,
+            )
+
+            for position in positions.tolist():
+                self._list_indexes[embeddings[position].id] = list_index
+
+
+def _sorted_positions(block: EmbeddingBlock) -> list[int]:
+    positions: list[int] = np.argsort(block.sequences[: block.size]).tolist()
+    return positions
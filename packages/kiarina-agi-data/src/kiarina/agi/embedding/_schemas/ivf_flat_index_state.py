@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+from .._types.embedding_id import EmbeddingID
+from .._types.embedding_space_id import EmbeddingSpaceID
+
+
+class IVFFlatIndexState(BaseModel):
+    space_id: EmbeddingSpaceID | None = None
+    nlist: int | None = None
+    nprobe: int
+    min_train_size: int
+    retrain_growth: float
+    seed: int
+    trained_size: int = 0
+    centroids: list[list[float]] | None = None
+    lists: list[list[EmbeddingID]]
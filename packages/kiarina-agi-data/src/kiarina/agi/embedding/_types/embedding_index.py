@@ -0,0 +1,39 @@
+from collections.abc import Iterable
+from typing import Protocol, runtime_checkable
+
+import numpy as np
+
+from .._models.embedding import Embedding
+from .._views.embedding_search_result import EmbeddingSearchResult
+from .embedding_id import EmbeddingID
+
+
+@runtime_checkable
+class EmbeddingIndex(Protocol):
+    """
+    Index of embeddings that is updated incrementally and searched by cosine
+    similarity.
+
+    `EmbeddingMatrix` is the exact implementation and `IVFFlatIndex` an
+    approximate one.
+    """
+
+    def __len__(self) -> int: ...
+
+    def __contains__(self, embedding_id: object) -> bool: ...
+
+    def add(self, embedding: Embedding) -> None: ...
+
+    def extend(self, embeddings: Iterable[Embedding]) -> None: ...
+
+    def remove(self, embedding_id: EmbeddingID) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def search(
+        self,
+        query: Embedding | np.ndarray,
+        *,
+        top_k: int = 10,
+        min_score: float | None = None,
+    ) -> list[EmbeddingSearchResult]: ...
@@ -0,0 +1,17 @@
+import numpy as np
+
+CHUNK_SIZE = 8192
+
+
+def assign_centroids(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """
+    Return the index of the most similar centroid for each normalized vector.
+    """
+    assignments = np.empty(len(vectors), dtype=np.int64)
+
+    # Chunked so that the similarity matrix stays small for large inputs
+    for start in range(0, len(vectors), CHUNK_SIZE):
+        chunk = vectors[start : start + CHUNK_SIZE]
+        assignments[start : start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+
+    return assignments
@@ -0,0 +1,9 @@
+import numpy as np
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    normalized: np.ndarray = np.divide(
+        vectors, norms, out=np.zeros_like(vectors), where=norms != 0.0
+    )
+    return normalized
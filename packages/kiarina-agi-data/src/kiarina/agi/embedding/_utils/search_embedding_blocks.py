@@ -0,0 +1,57 @@
+import numpy as np
+
+from .._models.embedding_block import EmbeddingBlock
+from .._views.embedding_search_result import EmbeddingSearchResult
+
+
+def search_embedding_blocks(
+    blocks: list[EmbeddingBlock],
+    vector: np.ndarray,
+    *,
+    top_k: int,
+    min_score: float | None,
+) -> list[EmbeddingSearchResult]:
+    blocks = [block for block in blocks if block.size > 0]
+
+    if top_k <= 0 or not blocks:
+        return []
+
+    norm = float(np.linalg.norm(vector))
+    score_parts: list[np.ndarray] = []
+
+    for block in blocks:
+        if block.dimension != vector.shape[0]:
+            # Vectors of another dimension never match, as in calc_cosine_similarity
+            score_parts.append(np.full(block.size, float("-inf")))
+        else:
+            score_parts.append(block.calc_scores(vector, norm))
+
+    scores = np.concatenate(score_parts)
+    sequences = np.concatenate([block.sequences[: block.size] for block in blocks])
+    offsets = np.cumsum([0] + [block.size for block in blocks])
+
+    if min_score is not None:
+        indexes = np.flatnonzero(scores >= min_score)
+    else:
+        indexes = np.arange(len(scores))
+
+    if len(indexes) > top_k:
+        # Everything tied with the k-th score is kept so that ties are
+        # resolved below instead of by the partition
+        kth = len(indexes) - top_k
+        threshold = np.partition(scores[indexes], kth)[kth]
+        indexes = indexes[scores[indexes] >= threshold]
+
+    # Ties keep the order in which the embeddings were added
+    indexes = indexes[np.lexsort((sequences[indexes], -scores[indexes]))][:top_k]
+
+    results: list[EmbeddingSearchResult] = []
+
+    for index in indexes.tolist():
+        block_index = int(np.searchsorted(offsets, index, side="right")) - 1
+        embedding = blocks[block_index].embeddings[index - offsets[block_index]]
+        results.append(
+            EmbeddingSearchResult(embedding=embedding, score=float(scores[index]))
+        )
+
+    return results
@@ -0,0 +1,15 @@
+import numpy as np
+
+from .._models.embedding import Embedding
+
+
+def to_query_vector(query: Embedding | np.ndarray) -> np.ndarray:
+    if isinstance(query, Embedding):
+        vector = np.asarray(query.vector, dtype=np.float32)
+    else:
+        vector = np.asarray(query, dtype=np.float32)
+
+    if vector.ndim != 1:
+        raise ValueError(f"Expected query to be a 1D vector, got shape {vector.shape}")
+
+    return vector
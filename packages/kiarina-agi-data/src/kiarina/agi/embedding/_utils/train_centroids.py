@@ -0,0 +1,43 @@
+import numpy as np
+
+from .assign_centroids import assign_centroids
+from .normalize_rows import normalize_rows
+
+
+def train_centroids(
+    vectors: np.ndarray,
+    nlist: int,
+    *,
+    seed: int = 0,
+    iterations: int = 10,
+    samples_per_centroid: int = 64,
+) -> np.ndarray:
+    """
+    Train centroids of normalized vectors with spherical k-means.
+    """
+    rng = np.random.default_rng(seed)
+
+    if len(vectors) > nlist * samples_per_centroid:
+        sample = rng.choice(len(vectors), nlist * samples_per_centroid, replace=False)
+        vectors = vectors[sample]
+
+    centroids = vectors[rng.choice(len(vectors), nlist, replace=False)].copy()
+
+    for _ in range(iterations):
+        assignments = assign_centroids(vectors, centroids)
+        counts = np.bincount(assignments, minlength=nlist)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        filled = counts > 0
+
+        sums = np.empty_like(centroids)
+        sums[filled] = np.add.reduceat(
+            vectors[np.argsort(assignments, kind="stable")], starts[filled], axis=0
+        )
+
+        # Empty clusters start over from random vectors
+        if (empty := int((~filled).sum())) > 0:
+            sums[~filled] = vectors[rng.choice(len(vectors), empty)]
+
+        centroids = normalize_rows(sums)
+
+    return centroids
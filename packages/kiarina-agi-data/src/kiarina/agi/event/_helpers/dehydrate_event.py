@@ -1,4 +1,4 @@
-from kiarina.agi.file_info_pool import FileInfoPool
+from kiarina.agi.file_info import FileInfo
 from kiarina.agi.message import dehydrate_message
 
 from .._types.event import Event
@@ -6,8 +6,8 @@ from .._types.event import Event
 
 def dehydrate_event(
     event: Event,
-    pool: FileInfoPool,
-) -> tuple[Event, FileInfoPool]:
+    pool: list[FileInfo],
+) -> tuple[Event, list[FileInfo]]:
     if event.type == "custom":
         return event, pool
     elif event.type == "ai_message_chunk":  # pragma: no cover
@@ -1,4 +1,4 @@
-from kiarina.agi.file_info_pool import FileInfoPool
+from kiarina.agi.file_info import FileInfo
 
 from .._types.event import Event
 from .dehydrate_event import dehydrate_event
@@ -6,8 +6,8 @@ from .dehydrate_event import dehydrate_event
 
 def dehydrate_events(
     events: list[Event],
-    pool: FileInfoPool,
-) -> tuple[list[Event], FileInfoPool]:
+    pool: list[FileInfo],
+) -> tuple[list[Event], list[FileInfo]]:
     dehydrated = False
     new_events: list[Event] = []
 
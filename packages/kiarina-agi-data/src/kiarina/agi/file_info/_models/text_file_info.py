@@ -1,15 +1,17 @@
 from typing import Any, Literal, Self
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from kiarina.agi.chat_estimates import ChatEstimates
 from kiarina.agi.file_utils import normalize_line_number
+from kiarina.agi.model_utils import PrivateCacheModel
 from kiarina.agi.token_utils import TokenCount, calc_text_token
 
 from .base_file_info import BaseFileInfo
+from .text_line_index import TextLineIndex
 
 
-class TextFileInfo(BaseFileInfo):
+class TextFileInfo(BaseFileInfo, PrivateCacheModel):
     type: Literal["text"] = Field(default="text", frozen=True)
     tag: str = "text_file"
     default_template: str = "<{tag}{attributes}>{raw_text}</{tag}>"
@@ -18,6 +20,8 @@ class TextFileInfo(BaseFileInfo):
     line_count: int
     raw_text: str | None
 
+    _line_index: TextLineIndex | None = PrivateAttr(default=None)
+
     @property
     def xml_attributes(self) -> dict[str, Any]:
         attrs = super().xml_attributes
@@ -62,32 +66,31 @@ class TextFileInfo(BaseFileInfo):
             return self.as_metadata_only(), self.token_count
 
         target: TokenCount = self.token_count - reduce
+        line_index = self._get_line_index()
+        budget = target
 
-        start_line = self.normalized_start_line
-        end_line = self.normalized_end_line
-        line_count = end_line - start_line + 1
-
-        lines_per_token = line_count / self.token_count
-        target_line_count = max(int(lines_per_token * target) - 1, 1)
+        while True:
+            if self.keep_from_end:
+                keep_line_count = line_index.fit_tail(budget)
+            else:
+                keep_line_count = line_index.fit_head(budget)
 
-        min_lines = 1
-        max_lines = target_line_count
-        best_file_info: Self | None = None
+            if keep_line_count == 0:
+                result_file_info = self.as_metadata_only()
+                break
 
-        while min_lines <= max_lines:
-            mid_lines = (min_lines + max_lines) // 2
-            temp_file_info = self.shrink_by_line(mid_lines)
+            result_file_info = self.shrink_by_line(keep_line_count)
 
-            if temp_file_info.token_count <= target:
-                best_file_info = temp_file_info
-                min_lines = mid_lines + 1
-            else:
-                max_lines = mid_lines - 1
+            if result_file_info.token_count <= target:
+                break
 
-        if best_file_info is not None:
-            result_file_info = best_file_info
-        else:
-            result_file_info = self.as_metadata_only()
+            # Lines can merge into fewer tokens when joined, so the estimate is
+            # corrected by the overshoot, keeping at least one line fewer
+            overshoot = result_file_info.token_count - target
+            budget = min(
+                budget - overshoot,
+                self._estimate_kept_lines(line_index, keep_line_count - 1),
+            )
 
         return result_file_info, self.token_count - result_file_info.token_count
 
@@ -102,16 +105,35 @@ class TextFileInfo(BaseFileInfo):
             new_start_line = start_line
             new_end_line = min(start_line + keep_line_count - 1, end_line)
 
-        lines = (self.raw_text or "").split("\n")
         relative_start = new_start_line - start_line
         relative_end = new_end_line - start_line + 1
-        new_raw_text = "\n".join(lines[relative_start:relative_end])
+        line_index = self._get_line_index().slice(relative_start, relative_end)
 
-        return self.model_copy(
+        file_info = self.model_copy(
             update={
                 "start_line": new_start_line,
                 "end_line": new_end_line,
-                "raw_text": new_raw_text,
-                "token_count": calc_text_token(new_raw_text),
+                "raw_text": line_index.text,
+                "token_count": calc_text_token(line_index.text),
             }
         )
+        file_info._line_index = line_index
+        return file_info
+
+    def _get_line_index(self) -> TextLineIndex:
+        # Copies share the index as long as they share the text
+        raw_text = self.raw_text or ""
+
+        if self._line_index is None or self._line_index.text is not raw_text:
+            self._line_index = TextLineIndex(raw_text)
+
+        return self._line_index
+
+    def _estimate_kept_lines(
+        self, line_index: TextLineIndex, keep_line_count: int
+    ) -> TokenCount:
+        if self.keep_from_end:
+            line_count = line_index.line_count
+            return line_index.estimate(line_count - keep_line_count, line_count)
+
+        return line_index.estimate(0, keep_line_count)
@@ -0,0 +1,89 @@
+import numpy as np
+
+from kiarina.agi.token_utils import TokenCount, calc_text_token_batch
+
+
+class TextLineIndex:
+    """
+    Character offsets and token prefix sums of the lines of a text.
+
+    Each line is counted once together with its line break, so the tokens of
+    any range of lines are estimated by a subtraction instead of encoding
+    the range again.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        offsets: np.ndarray | None = None,
+        tokens: np.ndarray | None = None,
+    ) -> None:
+        self.text = text
+
+        if offsets is None or tokens is None:
+            lines = text.split("\n")
+
+            # Lines of a single file are rarely counted again, so skip the cache
+            counts = calc_text_token_batch(lines, use_cache=False)
+
+            offsets = np.zeros(len(lines) + 1, dtype=np.int64)
+            np.cumsum([len(line) + 1 for line in lines], out=offsets[1:])
+
+            tokens = np.zeros(len(lines) + 1, dtype=np.int64)
+            np.cumsum([count + 1 for count in counts], out=tokens[1:])
+
+        # Start of each line, followed by the end of the text plus one
+        self.offsets = offsets
+
+        # Tokens of the lines before each line, line breaks included
+        self.tokens = tokens
+
+    @property
+    def line_count(self) -> int:
+        return len(self.offsets) - 1
+
+    def get_text(self, start: int, end: int) -> str:
+        if start >= end:
+            return ""
+
+        return self.text[self.offsets[start] : self.offsets[end] - 1]
+
+    def estimate(self, start: int, end: int) -> TokenCount:
+        if start >= end:
+            return 0
+
+        # The line break after the last line is not part of the text
+        return int(self.tokens[end] - self.tokens[start]) - 1
+
+    def fit_head(self, target: TokenCount) -> int:
+        """
+        Return the most leading lines whose estimate fits in the target.
+        """
+        position = np.searchsorted(self.tokens, target + 1, side="right")
+        return min(int(position) - 1, self.line_count)
+
+    def fit_tail(self, target: TokenCount) -> int:
+        """
+        Return the most trailing lines whose estimate fits in the target.
+        """
+        total = self.tokens[-1]
+        position = np.searchsorted(self.tokens, total - target - 1, side="left")
+        return self.line_count - int(position)
+
+    def slice(self, start: int, end: int) -> "TextLineIndex":
+        """
+        Return the index of a range of lines without counting tokens again.
+        """
+        start = min(max(start, 0), self.line_count)
+        end = min(max(end, start), self.line_count)
+
+        if start == end:
+            return TextLineIndex(
+                "", np.array([0, 1], dtype=np.int64), np.array([0, 1], dtype=np.int64)
+            )
+
+        return TextLineIndex(
+            self.get_text(start, end),
+            self.offsets[start : end + 1] - self.offsets[start],
+            self.tokens[start : end + 1] - self.tokens[start],
+        )
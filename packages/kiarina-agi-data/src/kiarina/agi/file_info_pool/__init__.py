@@ -1,13 +1,13 @@
 from ._helpers.dehydrate_file_infos import dehydrate_file_infos
 from ._helpers.find_file_index import find_file_index
 from ._helpers.hydrate_file_infos import hydrate_file_infos
-from ._types.file_info_pool import FileInfoPool
+from ._models.file_info_pool import FileInfoPool
 
 __all__ = [
     # ._helpers
     "dehydrate_file_infos",
     "find_file_index",
     "hydrate_file_infos",
-    # ._types
+    # ._models
     "FileInfoPool",
 ]
@@ -1,36 +1,28 @@
 from kiarina.agi.file_info import FileInfo
 
-from .._types.file_info_pool import FileInfoPool
+from .._models.file_info_pool import FileInfoPool
 
 
 def dehydrate_file_infos(
     file_infos: list[FileInfo],
-    pool: FileInfoPool,
-) -> tuple[list[FileInfo], FileInfoPool]:
-    dehydrated = False
+    pool: list[FileInfo],
+) -> tuple[list[FileInfo], list[FileInfo]]:
+    new_pool: FileInfoPool | None = None
     new_file_infos: list[FileInfo] = []
 
     for file_info in file_infos:
-        new_file_info, pool = _dehydrate_file_info(file_info, pool)
+        if file_info.metadata_only or file_info.inline:
+            new_file_infos.append(file_info)
+            continue
 
-        if new_file_info is not file_info:
-            dehydrated = True
+        # The pool is copied once per call rather than once per file
+        if new_pool is None:
+            new_pool = FileInfoPool(pool)
 
-        new_file_infos.append(new_file_info)
+        new_pool.append(file_info)
+        new_file_infos.append(file_info.as_metadata_only())
 
-    if not dehydrated:
+    if new_pool is None:
         return file_infos, pool
     else:
-        return new_file_infos, pool
-
-
-def _dehydrate_file_info(
-    file_info: FileInfo,
-    pool: FileInfoPool,
-) -> tuple[FileInfo, FileInfoPool]:
-    if file_info.metadata_only or file_info.inline:
-        return file_info, pool
-    else:
-        pool = pool.copy()
-        pool.append(file_info)
-        return file_info.as_metadata_only(), pool
+        return new_file_infos, new_pool
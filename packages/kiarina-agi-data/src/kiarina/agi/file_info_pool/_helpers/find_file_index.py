@@ -1,9 +1,12 @@
-from kiarina.agi.file_info import FileID
+from kiarina.agi.file_info import FileID, FileInfo
 
-from .._types.file_info_pool import FileInfoPool
+from .._models.file_info_pool import FileInfoPool
 
 
-def find_file_index(pool: FileInfoPool, file_id: FileID) -> int | None:
+def find_file_index(pool: list[FileInfo], file_id: FileID) -> int | None:
+    if isinstance(pool, FileInfoPool):
+        return pool.find_index(file_id)
+
     for index, file_info in enumerate(pool):
         if file_info.id == file_id:
             return index
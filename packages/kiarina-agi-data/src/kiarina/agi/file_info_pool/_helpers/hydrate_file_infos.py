@@ -1,44 +1,45 @@
 from kiarina.agi.file_info import FileInfo
 
-from .._types.file_info_pool import FileInfoPool
-from .find_file_index import find_file_index
+from .._models.file_info_pool import FileInfoPool
 
 
 def hydrate_file_infos(
     file_infos: list[FileInfo],
-    pool: FileInfoPool,
-) -> tuple[list[FileInfo], FileInfoPool]:
-    hydrated = False
+    pool: list[FileInfo],
+) -> tuple[list[FileInfo], list[FileInfo]]:
+    indexed = pool if isinstance(pool, FileInfoPool) else FileInfoPool(pool)
+    taken: set[int] = set()
     new_file_infos: list[FileInfo] = []
 
     for file_info in file_infos:
-        new_file_info, pool = _hydrate_file_info(file_info, pool)
-
-        if new_file_info is not file_info:
-            hydrated = True
+        position = _find_position(indexed, file_info, taken)
 
-        new_file_infos.append(new_file_info)
+        if position is None:
+            new_file_infos.append(file_info)
+        else:
+            taken.add(position)
+            new_file_infos.append(indexed[position])
 
-    if not hydrated:
+    if not taken:
         return file_infos, pool
-    else:
-        return new_file_infos, pool
 
+    # The remaining pool shares the index, so hydrating message by message
+    # does not index the pool again for every message
+    return new_file_infos, indexed.without(taken)
 
-def _hydrate_file_info(
-    file_info: FileInfo,
-    pool: FileInfoPool,
-) -> tuple[FileInfo, FileInfoPool]:
-    file_index = find_file_index(pool, file_info.id)
 
-    if file_index is None:
-        return file_info, pool
+def _find_position(
+    pool: FileInfoPool,
+    file_info: FileInfo,
+    taken: set[int],
+) -> int | None:
+    for position in pool.find_indexes(file_info.id):
+        if position in taken:
+            continue
 
-    elif not file_info.metadata_only:
-        return file_info, pool
+        if not file_info.metadata_only:
+            return None
 
-    else:
-        pool = pool.copy()
-        new_file_info = pool.pop(file_index)
+        return position
 
-        return new_file_info, pool
+    return None
@@ -0,0 +1,174 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from typing import Any, Self, SupportsIndex
+
+from kiarina.agi.file_info import BaseFileInfo, FileID, FileInfo
+
+
+class FileInfoPool(list[FileInfo]):
+    """
+    List of file infos indexed by file ID.
+
+    The index is built on the first lookup, extended by append, and dropped
+    by any other mutation, so a pool is used exactly like a list.
+    Pools derived with `without` share the index of their source instead of
+    rebuilding it.
+    """
+
+    def __init__(self, file_infos: Iterable[FileInfo] = ()) -> None:
+        super().__init__(file_infos)
+
+        # Positions in the list the index was built from
+        self._positions: dict[FileID, list[int]] | None = None
+
+        # Sorted positions of the indexed list that are no longer in this pool
+        self._removed: list[int] = []
+
+        # Whether the index is shared with another pool and must not be extended
+        self._shared: bool = False
+
+    def find_index(self, file_id: FileID) -> int | None:
+        indexes = self.find_indexes(file_id)
+        return indexes[0] if indexes else None
+
+    def find_indexes(self, file_id: FileID) -> list[int]:
+        positions = self._get_positions().get(file_id, ())
+        removed = self._removed
+
+        if not removed:
+            return list(positions)
+
+        return [
+            position - bisect_left(removed, position)
+            for position in positions
+            if not _contains(removed, position)
+        ]
+
+    def get(self, file_id: FileID) -> FileInfo | None:
+        index = self.find_index(file_id)
+        return None if index is None else self[index]
+
+    def copy(self) -> "FileInfoPool":
+        return FileInfoPool(self)
+
+    def without(self, indexes: Iterable[int]) -> "FileInfoPool":
+        """
+        Return a new pool without the file infos at the given indexes.
+        """
+        removed = sorted(set(indexes), reverse=True)
+        pool = FileInfoPool(self)
+
+        for index in removed:
+            list.__delitem__(pool, index)
+
+        # A mostly emptied pool is cheaper to index again than to share
+        if (
+            removed
+            and self._positions is not None
+            and len(self._removed) + len(removed) <= len(pool)
+        ):
+            pool._positions = self._positions
+            pool._removed = sorted(
+                self._removed + [self._to_position(index) for index in removed]
+            )
+            pool._shared = self._shared = True
+
+        return pool
+
+    def append(self, file_info: FileInfo) -> None:
+        super().append(file_info)
+
+        if self._shared:
+            self._invalidate()
+
+        elif self._positions is not None:
+            self._positions.setdefault(file_info.id, []).append(
+                len(self) - 1 + len(self._removed)
+            )
+
+    def extend(self, file_infos: Iterable[FileInfo]) -> None:
+        for file_info in file_infos:
+            self.append(file_info)
+
+    def __iadd__(self, file_infos: Iterable[FileInfo]) -> Self:  # type: ignore[override,misc]
+        self.extend(file_infos)
+        return self
+
+    def insert(self, index: SupportsIndex, file_info: FileInfo) -> None:
+        self._invalidate()
+        super().insert(index, file_info)
+
+    def pop(self, index: SupportsIndex = -1) -> FileInfo:
+        self._invalidate()
+        return super().pop(index)
+
+    def remove(self, file_info: FileInfo) -> None:
+        self._invalidate()
+        super().remove(file_info)
+
+    def clear(self) -> None:
+        self._invalidate()
+        super().clear()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self._invalidate()
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        self._invalidate()
+        super().reverse()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        # Replacing a file info with one of the same ID keeps the index valid
+        if not (
+            isinstance(index, int)
+            and isinstance(value, BaseFileInfo)
+            and self[index].id == value.id
+        ):
+            self._invalidate()
+
+        super().__setitem__(index, value)
+
+    def __delitem__(self, *args: Any) -> None:
+        self._invalidate()
+        super().__delitem__(*args)
+
+    def __imul__(self, value: SupportsIndex) -> Self:
+        self._invalidate()
+        return super().__imul__(value)
+
+    def _get_positions(self) -> dict[FileID, list[int]]:
+        if self._positions is None:
+            positions: dict[FileID, list[int]] = {}
+
+            for position, file_info in enumerate(self):
+                positions.setdefault(file_info.id, []).append(position)
+
+            self._positions = positions
+
+        return self._positions
+
+    def _to_position(self, index: int) -> int:
+        # The smallest position with index + 1 file infos left up to it
+        removed = self._removed
+        low, high = index, index + len(removed)
+
+        while low < high:
+            middle = (low + high) // 2
+
+            if middle + 1 - bisect_right(removed, middle) > index:
+                high = middle
+            else:
+                low = middle + 1
+
+        return low
+
+    def _invalidate(self) -> None:
+        self._positions = None
+        self._removed = []
+        self._shared = False
+
+
+def _contains(values: list[int], value: int) -> bool:
+    index = bisect_left(values, value)
+    return index < len(values) and values[index] == value
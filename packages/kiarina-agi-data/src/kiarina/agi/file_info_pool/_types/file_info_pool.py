@@ -1,5 +0,0 @@
-from typing import TypeAlias
-
-from kiarina.agi.file_info import FileInfo
-
-FileInfoPool: TypeAlias = list[FileInfo]
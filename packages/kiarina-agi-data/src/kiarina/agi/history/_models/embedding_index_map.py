@@ -0,0 +1,69 @@
+from kiarina.agi.embedding import (
+    Embedding,
+    EmbeddingID,
+    EmbeddingIndex,
+    EmbeddingMatrix,
+    EmbeddingSpaceID,
+)
+
+
+class EmbeddingIndexMap:
+    def __init__(self, embeddings: dict[EmbeddingID, Embedding]) -> None:
+        self.embeddings = embeddings
+        self.size = len(embeddings)
+        self.stale = False
+        self.by_space: dict[EmbeddingSpaceID, EmbeddingIndex] = {}
+
+    def is_current(self, embeddings: dict[EmbeddingID, Embedding]) -> bool:
+        # Catches reassignment, insertions and removals in O(1). Values
+        # replaced directly in the dict need invalidate().
+        return (
+            not self.stale
+            and self.embeddings is embeddings
+            and self.size == len(embeddings)
+        )
+
+    def invalidate(self) -> None:
+        self.stale = True
+
+    def get(self, space_id: EmbeddingSpaceID) -> EmbeddingIndex:
+        if (index := self.by_space.get(space_id)) is None:
+            index = self.by_space[space_id] = EmbeddingMatrix(
+                self._get_space_embeddings(space_id)
+            )
+
+        return index
+
+    def set(self, space_id: EmbeddingSpaceID, index: EmbeddingIndex) -> None:
+        # A restored index keeps what it has and only receives what it lacks
+        embeddings = self._get_space_embeddings(space_id)
+        index.extend(e for e in embeddings if e.id not in index)
+
+        # IDs that are no longer in the space cannot be listed, so an index
+        # holding any is filled again from scratch
+        if len(index) != len(embeddings):
+            index.clear()
+            index.extend(embeddings)
+
+        self.by_space[space_id] = index
+
+    def replace(self, old: Embedding | None, new: Embedding | None) -> None:
+        if old is not None and old.space_id in self.by_space:
+            self.by_space[old.space_id].remove(old.id)
+
+        if new is not None and new.space_id in self.by_space:
+            self.by_space[new.space_id].add(new)
+
+        self.size = len(self.embeddings)
+
+    def rebuild(self, embeddings: dict[EmbeddingID, Embedding]) -> None:
+        self.embeddings = embeddings
+        self.size = len(embeddings)
+        self.stale = False
+
+        for space_id, index in self.by_space.items():
+            index.clear()
+            index.extend(self._get_space_embeddings(space_id))
+
+    def _get_space_embeddings(self, space_id: EmbeddingSpaceID) -> list[Embedding]:
+        return [e for e in self.embeddings.values() if e.space_id == space_id]
@@ -0,0 +1,101 @@
+from collections import Counter
+
+from kiarina.agi.event import Event, EventType
+from kiarina.agi.file_info import FileID
+from kiarina.agi.message import Message, MessageType
+
+from .._utils.fingerprint import fingerprint
+
+
+class EventIndex:
+    def __init__(self, events: list[Event]) -> None:
+        self.events = events
+        self._rebuild()
+
+    def is_current(self, events: list[Event]) -> bool:
+        return self.events is events and self.fingerprint == fingerprint(events)
+
+    def find(self, event: Event) -> int | None:
+        return self.positions.get(id(event))
+
+    def append(self, event: Event) -> None:
+        self.events.append(event)
+        self._index(len(self.events) - 1, event)
+        self.fingerprint = fingerprint(self.events)
+
+    def replace(self, position: int, replacement: Event) -> None:
+        target = self.events[position]
+        self.events[position] = replacement
+
+        # The event type fixes the message type, so the last positions only
+        # move when the type changes. That and events added more than once
+        # are rare enough to rebuild.
+        if (
+            target.type != replacement.type
+            or self.duplicated
+            or id(replacement) in self.positions
+        ):
+            self._rebuild()
+            return
+
+        del self.positions[id(target)]
+        self.positions[id(replacement)] = position
+
+        if (message_position := self.message_positions.get(position)) is not None:
+            self._unindex_files(self.messages[message_position])
+            self.messages[message_position] = replacement.message  # type: ignore[union-attr]
+            self._index_files(self.messages[message_position])
+
+        self.fingerprint = fingerprint(self.events)
+
+    def get_last_event(self, event_type: EventType) -> Event | None:
+        if (position := self.last_events.get(event_type)) is None:
+            return None
+
+        return self.events[position]
+
+    def get_last_message(self, message_type: MessageType) -> Message | None:
+        if (position := self.last_messages.get(message_type)) is None:
+            return None
+
+        return self.messages[position]
+
+    def in_message(self, file_id: FileID) -> bool:
+        return self.message_file_ids[file_id] > 0
+
+    def _rebuild(self) -> None:
+        self.messages: list[Message] = []
+        self.message_file_ids: Counter[FileID] = Counter()
+        self.positions: dict[int, int] = {}
+        self.duplicated = False
+        self.message_positions: dict[int, int] = {}
+        self.last_events: dict[EventType, int] = {}
+        self.last_messages: dict[MessageType, int] = {}
+
+        for position, event in enumerate(self.events):
+            self._index(position, event)
+
+        self.fingerprint = fingerprint(self.events)
+
+    def _index(self, position: int, event: Event) -> None:
+        # The first position wins, as in a scan from the start
+        if self.positions.setdefault(id(event), position) != position:
+            self.duplicated = True
+
+        self.last_events[event.type] = position
+
+        if (
+            event.type == "ai_message"
+            or event.type == "human_message"
+            or event.type == "tool_message"
+        ):
+            self.message_positions[position] = len(self.messages)
+            self.last_messages[event.message.type] = len(self.messages)
+            self.messages.append(event.message)
+            self._index_files(event.message)
+
+    def _index_files(self, message: Message) -> None:
+        self.message_file_ids.update(fi.id for fi in message.get_file_infos())
+
+    def _unindex_files(self, message: Message) -> None:
+        self.message_file_ids.subtract(fi.id for fi in message.get_file_infos())
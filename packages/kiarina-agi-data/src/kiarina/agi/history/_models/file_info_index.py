@@ -0,0 +1,31 @@
+from kiarina.agi.file_info import FileID, FileInfo, Group, UniqueKey
+
+from .._utils.fingerprint import fingerprint
+
+
+class FileInfoIndex:
+    def __init__(self, file_infos: list[FileInfo]) -> None:
+        self.file_infos = file_infos
+        self.size = 0
+        self.by_id: dict[FileID, FileInfo] = {}
+        self.by_unique_key: dict[UniqueKey, FileInfo] = {}
+        self.by_group: dict[Group | None, list[FileInfo]] = {}
+        self.extend(file_infos)
+
+    def is_current(self, file_infos: list[FileInfo]) -> bool:
+        return self.file_infos is file_infos and self.fingerprint == fingerprint(
+            file_infos
+        )
+
+    def extend(self, file_infos: list[FileInfo]) -> None:
+        # Only valid for a pool that grew at the end, so just the tail is added
+        for fi in file_infos[self.size :]:
+            self.by_id.setdefault(fi.id, fi)
+            self.by_group.setdefault(fi.group, []).append(fi)
+
+            if fi.unique_key is not None:
+                self.by_unique_key.setdefault(fi.unique_key, fi)
+
+        self.file_infos = file_infos
+        self.size = len(file_infos)
+        self.fingerprint = fingerprint(file_infos)
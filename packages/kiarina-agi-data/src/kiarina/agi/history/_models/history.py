@@ -1,11 +1,13 @@
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import Field, PrivateAttr
 
 from kiarina.agi.embedding import (
     Embedding,
     EmbeddingID,
+    EmbeddingIndex,
     EmbeddingKind,
+    EmbeddingSearchResult,
     EmbeddingSpaceID,
 )
 from kiarina.agi.event import (
@@ -16,18 +18,39 @@ from kiarina.agi.event import (
 )
 from kiarina.agi.file import URIOrFilePath
 from kiarina.agi.file_info import FileID, FileInfo, Group, UniqueKey
-from kiarina.agi.file_info_pool import FileInfoPool
 from kiarina.agi.message import Message, MessageType, ToolCall
+from kiarina.agi.model_utils import PrivateCacheModel
 from kiarina.agi.tool_info import ToolInfo, ToolName, ToolState
 
+from .embedding_index_map import EmbeddingIndexMap
+from .event_index import EventIndex
+from .file_info_index import FileInfoIndex
+from .tool_info_index import ToolInfoIndex
+
+
+class History(PrivateCacheModel):
+    """
+    Conversation history of an agent.
+
+    Lookups go through indexes that the methods below keep up to date.
+    Reassigning the lists, or appending or removing their last item directly,
+    is detected and causes a rebuild, as are reassigning `embeddings` and
+    adding or removing its keys. Any other direct change, such as replacing
+    an item or embedding in place or changing key fields of a file info or
+    tool info, must be followed by `invalidate_indexes()`.
+    """
 
-class History(BaseModel):
     events: list[Event] = Field(default_factory=list)
-    file_infos: FileInfoPool = Field(default_factory=list)
+    file_infos: list[FileInfo] = Field(default_factory=list)
     tool_infos: list[ToolInfo] = Field(default_factory=list)
     embeddings: dict[EmbeddingID, Embedding] = Field(default_factory=dict)
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    _event_index: EventIndex | None = PrivateAttr(default=None)
+    _file_info_index: FileInfoIndex | None = PrivateAttr(default=None)
+    _tool_info_index: ToolInfoIndex | None = PrivateAttr(default=None)
+    _embedding_index_map: EmbeddingIndexMap | None = PrivateAttr(default=None)
+
     def clear(self) -> None:
         self.events.clear()
         self.file_infos.clear()
@@ -35,22 +58,30 @@ class History(BaseModel):
         self.embeddings.clear()
         self.metadata.clear()
 
+    def invalidate_indexes(self) -> None:
+        """
+        Rebuild the event, file, tool and embedding indexes on the next
+        lookup. Indexes set with `set_embedding_index` are kept and refilled.
+        """
+        self._event_index = None
+        self._file_info_index = None
+        self._tool_info_index = None
+
+        if self._embedding_index_map is not None:
+            self._embedding_index_map.invalidate()
+
     # --------------------------------------------------
     # Event Management
     # --------------------------------------------------
 
     def get_last_event(self, event_type: EventType) -> Event | None:
-        for event in reversed(self.events):
-            if event.type == event_type:
-                return event
-
-        return None
+        return self._get_event_index().get_last_event(event_type)
 
     def get_pending_tool_calls(self) -> list[ToolCall]:
         pendings: list[ToolCall] = []
         completed_ids: set[str] = set()
 
-        for message in reversed(self.get_messages()):
+        for message in reversed(self._get_event_index().messages):
             if message.type == "tool":
                 completed_ids.add(message.tool_call_id)
                 continue
@@ -67,45 +98,47 @@ class History(BaseModel):
         return pendings
 
     def add_event(self, event: Event) -> None:
-        event, self.file_infos = dehydrate_event(event, self.file_infos)
-        self.events.append(event)
+        event = self._dehydrate_event(event)
+        self._get_event_index().append(event)
 
     def replace_event(self, target: Event, replacement: Event) -> None:
-        replacement, self.file_infos = dehydrate_event(replacement, self.file_infos)
+        replacement = self._dehydrate_event(replacement)
+        index = self._get_event_index()
+
+        if (position := index.find(target)) is not None:
+            index.replace(position, replacement)
+            return
 
         for i, event in enumerate(self.events):
             if event is target:
-                self.events[i] = replacement
+                index.replace(i, replacement)
                 return
 
         raise ValueError("Target event not found in history")
 
+    def _dehydrate_event(self, event: Event) -> Event:
+        index = self._get_file_info_index()
+        event, self.file_infos = dehydrate_event(event, self.file_infos)
+
+        # Dehydration only appends to the pool, so the index takes the tail
+        index.extend(self.file_infos)
+        return event
+
+    def _get_event_index(self) -> EventIndex:
+        if self._event_index is None or not self._event_index.is_current(self.events):
+            self._event_index = EventIndex(self.events)
+
+        return self._event_index
+
     # --------------------------------------------------
     # Message Management
     # --------------------------------------------------
 
     def get_last_message(self, message_type: MessageType) -> Message | None:
-        for event in reversed(self.events):
-            if (
-                event.type == "ai_message"
-                or event.type == "human_message"
-                or event.type == "tool_message"
-            ):
-                if event.message.type == message_type:
-                    return event.message
-
-        return None
+        return self._get_event_index().get_last_message(message_type)
 
     def get_messages(self) -> list[Message]:
-        return [
-            e.message
-            for e in self.events
-            if (
-                e.type == "ai_message"
-                or e.type == "human_message"
-                or e.type == "tool_message"
-            )
-        ]
+        return self._get_event_index().messages.copy()
 
     def add_message(self, message: Message) -> None:
         self.add_event(message_to_event(message))
@@ -117,13 +150,18 @@ class History(BaseModel):
     def get_file_info(
         self,
         *,
-        unique_key: UniqueKey,
+        file_id: FileID | None = None,
+        unique_key: UniqueKey | None = None,
     ) -> FileInfo | None:
-        for fi in self.file_infos:
-            if fi.unique_key == unique_key:
-                return fi
+        index = self._get_file_info_index()
+
+        if file_id is not None and unique_key is None:
+            return index.by_id.get(file_id)
 
-        return None
+        if unique_key is not None and file_id is None:
+            return index.by_unique_key.get(unique_key)
+
+        raise ValueError("Exactly one of file_id or unique_key must be set.")
 
     def get_file_infos(
         self,
@@ -135,16 +173,20 @@ class History(BaseModel):
         ignore_unique_keys: list[UniqueKey] | None = None,
         in_message: bool | None = None,
     ) -> list[FileInfo]:
-        file_infos = self.file_infos.copy()
+        index = self._get_file_info_index()
+
+        if group is not None:
+            file_infos = index.by_group.get(group, []).copy()
+        elif no_group:
+            file_infos = index.by_group.get(None, []).copy()
+        else:
+            file_infos = self.file_infos.copy()
 
         if uri_or_file_path is not None:
             file_infos = [
                 fi for fi in file_infos if fi.uri_or_file_path == uri_or_file_path
             ]
 
-        if group is not None:
-            file_infos = [fi for fi in file_infos if fi.group == group]
-
         if no_group:
             file_infos = [fi for fi in file_infos if fi.group is None]
 
@@ -152,40 +194,40 @@ class History(BaseModel):
             file_infos = [fi for fi in file_infos if fi.unique_key is None]
 
         if ignore_unique_keys:
-            file_infos = [
-                fi for fi in file_infos if fi.unique_key not in ignore_unique_keys
-            ]
+            ignored = set(ignore_unique_keys)
+            file_infos = [fi for fi in file_infos if fi.unique_key not in ignored]
 
         if in_message is not None:
-            message_file_ids = {
-                fi.id
-                for message in self.get_messages()
-                for fi in message.get_file_infos()
-            }
-
-            if in_message:
-                file_infos = [fi for fi in file_infos if fi.id in message_file_ids]
-            else:
-                file_infos = [fi for fi in file_infos if fi.id not in message_file_ids]
+            event_index = self._get_event_index()
+            file_infos = [
+                fi for fi in file_infos if event_index.in_message(fi.id) == in_message
+            ]
 
         return file_infos
 
     def add_file_info(self, file_info: FileInfo) -> None:
+        index = self._get_file_info_index()
         self.file_infos.append(file_info)
+        index.extend(self.file_infos)
 
     def remove_file_info(self, file_id: FileID) -> None:
-        self.file_infos = [fi for fi in self.file_infos if fi.id != file_id]
+        if file_id in self._get_file_info_index().by_id:
+            self.file_infos = [fi for fi in self.file_infos if fi.id != file_id]
+
+    def _get_file_info_index(self) -> FileInfoIndex:
+        if self._file_info_index is None or not self._file_info_index.is_current(
+            self.file_infos
+        ):
+            self._file_info_index = FileInfoIndex(self.file_infos)
+
+        return self._file_info_index
 
     # --------------------------------------------------
     # Tool Info Management
     # --------------------------------------------------
 
     def get_tool_info(self, name: ToolName) -> ToolInfo | None:
-        for tool_info in self.tool_infos:
-            if tool_info.name == name:
-                return tool_info
-
-        return None
+        return self._get_tool_info_index().by_name.get(name)
 
     def get_tool_infos(
         self,
@@ -203,12 +245,21 @@ class History(BaseModel):
 
     def add_tool_info(self, tool_info: ToolInfo) -> None:
         self.remove_tool_info(tool_info.name)
-        self.tool_infos.append(tool_info)
+        self._get_tool_info_index().append(tool_info)
 
     def remove_tool_info(self, name: ToolName) -> None:
-        self.tool_infos = [
-            tool_info for tool_info in self.tool_infos if tool_info.name != name
-        ]
+        if name in self._get_tool_info_index().by_name:
+            self.tool_infos = [
+                tool_info for tool_info in self.tool_infos if tool_info.name != name
+            ]
+
+    def _get_tool_info_index(self) -> ToolInfoIndex:
+        if self._tool_info_index is None or not self._tool_info_index.is_current(
+            self.tool_infos
+        ):
+            self._tool_info_index = ToolInfoIndex(self.tool_infos)
+
+        return self._tool_info_index
 
     # --------------------------------------------------
     # Embedding Management
@@ -218,11 +269,16 @@ class History(BaseModel):
         return self.embeddings.get(embedding_id)
 
     def add_embedding(self, embedding: Embedding) -> None:
+        index_map = self._get_embedding_index_map()
+        previous = self.embeddings.get(embedding.id)
         self.embeddings[embedding.id] = embedding
+        index_map.replace(previous, embedding)
 
     def remove_embedding(self, embedding_id: EmbeddingID) -> None:
-        if embedding_id in self.embeddings:
-            del self.embeddings[embedding_id]
+        index_map = self._get_embedding_index_map()
+
+        if (embedding := self.embeddings.pop(embedding_id, None)) is not None:
+            index_map.replace(embedding, None)
 
     def get_embeddings(
         self,
@@ -239,3 +295,40 @@ class History(BaseModel):
             embeddings = [e for e in embeddings if e.space_id == space_id]
 
         return embeddings
+
+    def search_embeddings(
+        self,
+        query: Embedding,
+        *,
+        top_k: int = 10,
+        min_score: float | None = None,
+    ) -> list[EmbeddingSearchResult]:
+        index = self.get_embedding_index(query.space_id)
+        return index.search(query, top_k=top_k, min_score=min_score)
+
+    def get_embedding_index(self, space_id: EmbeddingSpaceID) -> EmbeddingIndex:
+        """
+        Return the index of a space, creating an exact `EmbeddingMatrix` if
+        none has been set.
+        """
+        return self._get_embedding_index_map().get(space_id)
+
+    def set_embedding_index(
+        self, space_id: EmbeddingSpaceID, index: EmbeddingIndex
+    ) -> None:
+        """
+        Use the index for a space, such as an `IVFFlatIndex` or one restored
+        from its state. Embeddings it does not contain yet are added, and it
+        is filled again if it holds IDs that are no longer in the space.
+        """
+        self._get_embedding_index_map().set(space_id, index)
+
+    def _get_embedding_index_map(self) -> EmbeddingIndexMap:
+        if self._embedding_index_map is None:
+            self._embedding_index_map = EmbeddingIndexMap(self.embeddings)
+
+        elif not self._embedding_index_map.is_current(self.embeddings):
+            # Rebuilt in place so that the indexes set for spaces are kept
+            self._embedding_index_map.rebuild(self.embeddings)
+
+        return self._embedding_index_map
@@ -0,0 +1,24 @@
+from kiarina.agi.tool_info import ToolInfo, ToolName
+
+from .._utils.fingerprint import fingerprint
+
+
+class ToolInfoIndex:
+    def __init__(self, tool_infos: list[ToolInfo]) -> None:
+        self.tool_infos = tool_infos
+        self.by_name: dict[ToolName, ToolInfo] = {}
+
+        for tool_info in tool_infos:
+            self.by_name.setdefault(tool_info.name, tool_info)
+
+        self.fingerprint = fingerprint(tool_infos)
+
+    def is_current(self, tool_infos: list[ToolInfo]) -> bool:
+        return self.tool_infos is tool_infos and self.fingerprint == fingerprint(
+            tool_infos
+        )
+
+    def append(self, tool_info: ToolInfo) -> None:
+        self.tool_infos.append(tool_info)
+        self.by_name.setdefault(tool_info.name, tool_info)
+        self.fingerprint = fingerprint(self.tool_infos)
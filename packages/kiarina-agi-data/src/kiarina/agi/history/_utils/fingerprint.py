@@ -0,0 +1,7 @@
+from collections.abc import Sequence
+from typing import Any
+
+
+def fingerprint(items: Sequence[Any]) -> tuple[int, int, int | None]:
+    # Catches reassignment, appends and removals done outside History in O(1)
+    return id(items), len(items), id(items[-1]) if items else None
@@ -1,13 +1,13 @@
 from kiarina.agi.content import Content, dehydrate_content
-from kiarina.agi.file_info_pool import FileInfoPool
+from kiarina.agi.file_info import FileInfo
 
 from .._types.message import Message
 
 
 def dehydrate_message(
     message: Message,
-    pool: FileInfoPool,
-) -> tuple[Message, FileInfoPool]:
+    pool: list[FileInfo],
+) -> tuple[Message, list[FileInfo]]:
     dehydrated = False
     new_contents: list[Content] = []
 
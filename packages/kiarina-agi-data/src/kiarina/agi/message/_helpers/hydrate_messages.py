@@ -1,13 +1,13 @@
 from kiarina.agi.content import Content, hydrate_content
-from kiarina.agi.file_info_pool import FileInfoPool
+from kiarina.agi.file_info import FileInfo
 
 from .._types.message import Message
 
 
 def hydrate_messages(
     messages: list[Message],
-    pool: FileInfoPool,
-) -> tuple[list[Message], FileInfoPool]:
+    pool: list[FileInfo],
+) -> tuple[list[Message], list[FileInfo]]:
     hydrated = False
     new_messages: list[Message] = []
 
@@ -27,8 +27,8 @@ def hydrate_messages(
 
 def _hydrate_message(
     message: Message,
-    pool: FileInfoPool,
-) -> tuple[Message, FileInfoPool]:
+    pool: list[FileInfo],
+) -> tuple[Message, list[FileInfo]]:
     hydrated = False
     new_contents: list[Content] = []
 
@@ -46,10 +46,10 @@ class BaseMessage(BaseModel):
         return self.model_copy(update={"contents": new_contents})
 
     def shrink(
-        self, pool: FileInfoPool, reduce: TokenCount, reserve: TokenCount = 0
-    ) -> tuple[FileInfoPool, TokenCount]:
+        self, pool: list[FileInfo], reduce: TokenCount, reserve: TokenCount = 0
+    ) -> tuple[list[FileInfo], TokenCount]:
         reduced = 0
-        pool = pool.copy()
+        pool = FileInfoPool(pool)
 
         file_infos = self.get_file_infos()
         file_infos.sort(key=lambda fi: fi.token_count, reverse=True)
@@ -0,0 +1,3 @@
+from ._models.private_cache_model import PrivateCacheModel
+
+__all__ = ["PrivateCacheModel"]
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+
+class PrivateCacheModel(BaseModel):
+    """
+    Model whose private attributes are caches derived from its fields.
+
+    Pydantic compares private attributes in `__eq__`, which would make equal
+    models unequal once one of them has built a cache, so only the fields
+    are compared.
+    """
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+
+        return type(self) is type(other) and self.__dict__ == other.__dict__
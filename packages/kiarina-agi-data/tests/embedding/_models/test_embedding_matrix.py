@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from kiarina.agi.embedding import Embedding, EmbeddingMatrix, calc_cosine_similarity
+
+
+def _embedding(
+    vector: list[float],
+    *,
+    id: str,
+    space_id: str = "text:example",
+) -> Embedding:
+    return Embedding(id=id, kind="text", space_id=space_id, vector=vector)
+
+
+def test_add_and_remove() -> None:
+    matrix = EmbeddingMatrix(
+        [
+            _embedding([1.0, 0.0], id="a"),
+            _embedding([0.0, 1.0], id="b"),
+            _embedding([1.0, 0.0, 0.0], id="c", space_id="image:example"),
+        ]
+    )
+    assert len(matrix) == 3
+    assert matrix.space_ids == ["text:example", "image:example"]
+
+    matrix.remove("a")
+    assert "a" not in matrix
+    assert matrix.get("b") is not None
+    assert [e.id for e in matrix.to_embeddings()] == ["b", "c"]
+
+    matrix.remove("c")
+    assert matrix.space_ids == ["text:example"]
+
+    # An embedding with the same ID replaces the previous one
+    matrix.add(_embedding([1.0, 1.0], id="b"))
+    assert len(matrix) == 1
+    assert matrix.to_embeddings()[0].vector == [1.0, 1.0]
+
+
+def test_search() -> None:
+    matrix = EmbeddingMatrix(
+        [
+            _embedding([0.0, 1.0], id="orthogonal"),
+            _embedding([1.0, 0.0], id="same"),
+            _embedding([0.5, 0.5], id="middle"),
+            _embedding([0.0, 0.0], id="zero"),
+            _embedding([1.0, 0.0], id="other-space", space_id="text:other"),
+        ]
+    )
+
+    results = matrix.search(_embedding([1.0, 0.0], id="query"), top_k=3)
+    assert [r.embedding.id for r in results] == ["same", "middle", "orthogonal"]
+    assert np.isclose(results[0].score, 1.0)
+
+    results = matrix.search(np.array([1.0, 0.0]), top_k=2)
+    assert [r.embedding.id for r in results] == ["same", "other-space"]
+
+    results = matrix.search(np.array([1.0, 0.0, 0.0]), min_score=-1.0)
+    assert results == []
+
+    with pytest.raises(ValueError):
+        matrix.search(np.array([[1.0, 0.0]]))
+
+
+def test_search_matches_pairwise_scores() -> None:
+    rng = np.random.default_rng(0)
+    candidates = [
+        _embedding(rng.standard_normal(8).tolist(), id=str(i)) for i in range(200)
+    ]
+    query = _embedding(rng.standard_normal(8).tolist(), id="query")
+    matrix = EmbeddingMatrix(candidates)
+
+    for top_k, min_score in [(1, None), (10, None), (300, 0.2)]:
+        scored = [(calc_cosine_similarity(query, c), c.id) for c in candidates]
+        expected = [
+            id
+            for score, id in sorted(scored, key=lambda item: -item[0])
+            if min_score is None or score >= min_score
+        ][:top_k]
+
+        results = matrix.search(query, top_k=top_k, min_score=min_score)
+        assert [r.embedding.id for r in results] == expected
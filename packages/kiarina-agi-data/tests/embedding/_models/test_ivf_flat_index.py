@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from kiarina.agi.embedding import (
+    Embedding,
+    EmbeddingIndex,
+    EmbeddingMatrix,
+    IVFFlatIndex,
+    IVFFlatIndexState,
+)
+
+
+def _embeddings(count: int, *, seed: int = 0) -> list[Embedding]:
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((8, 16))
+    return [
+        Embedding(
+            id=str(i),
+            kind="text",
+            space_id="text:example",
+            vector=(centers[i % 8] + 0.1 * rng.standard_normal(16)).tolist(),
+        )
+        for i in range(count)
+    ]
+
+
+def test_protocol() -> None:
+    assert isinstance(IVFFlatIndex(), EmbeddingIndex)
+    assert isinstance(EmbeddingMatrix(), EmbeddingIndex)
+
+
+def test_exact_until_trained() -> None:
+    embeddings = _embeddings(50)
+    index = IVFFlatIndex(min_train_size=100)
+    index.extend(embeddings)
+
+    assert not index.is_trained
+    assert index.search(embeddings[0], top_k=5) == EmbeddingMatrix(embeddings).search(
+        embeddings[0], top_k=5
+    )
+
+
+def test_recall_after_training() -> None:
+    embeddings = _embeddings(2000)
+    index = IVFFlatIndex(nlist=8, nprobe=2, min_train_size=1000)
+    index.extend(embeddings)
+    exact = EmbeddingMatrix(embeddings)
+
+    assert index.is_trained
+    assert len(index) == 2000
+
+    hits = 0
+
+    for query in embeddings[:20]:
+        expected = {r.embedding.id for r in exact.search(query, top_k=10)}
+        actual = {r.embedding.id for r in index.search(query, top_k=10)}
+        hits += len(expected & actual)
+
+    assert hits / 200 >= 0.9
+
+
+def test_add_and_remove_after_training() -> None:
+    embeddings = _embeddings(1200)
+    index = IVFFlatIndex(nlist=8, min_train_size=1000)
+    index.extend(embeddings[:1000])
+    assert index.is_trained
+
+    index.add(embeddings[1000])
+    assert index.search(embeddings[1000], top_k=1)[0].embedding.id == "1000"
+
+    index.remove("1000")
+    assert "1000" not in index
+    assert all(r.embedding.id != "1000" for r in index.search(embeddings[1000]))
+
+
+def test_clear() -> None:
+    embeddings = _embeddings(50)
+    index = IVFFlatIndex(min_train_size=10)
+    index.extend(embeddings)
+
+    index.clear()
+
+    assert len(index) == 0
+    assert not index.is_trained
+    assert index._sequence == 0
+
+    index.extend(embeddings)
+    assert index.search(embeddings[0], top_k=1)[0].embedding.id == "0"
+
+
+def test_rejects_other_spaces_and_dimensions() -> None:
+    index = IVFFlatIndex()
+    index.add(Embedding(kind="text", space_id="a", vector=[1.0, 0.0]))
+
+    with pytest.raises(ValueError, match="different spaces"):
+        index.add(Embedding(kind="text", space_id="b", vector=[1.0, 0.0]))
+
+    with pytest.raises(ValueError, match="2-dimensional"):
+        index.add(Embedding(kind="text", space_id="a", vector=[1.0, 0.0, 0.0]))
+
+    query = Embedding(kind="text", space_id="b", vector=[1.0, 0.0])
+    assert index.search(query) == []
+
+
+def test_state_roundtrip() -> None:
+    embeddings = _embeddings(1200)
+    index = IVFFlatIndex(nlist=8, min_train_size=1000)
+    index.extend(embeddings[:1100])
+
+    state = IVFFlatIndexState.model_validate_json(index.to_state().model_dump_json())
+    restored = IVFFlatIndex.from_state(state, embeddings)
+
+    assert restored.is_trained
+    assert len(restored) == 1200
+    assert restored.to_state().centroids == state.centroids
+
+    # Embeddings missing from the state are added to the nearest clusters
+    index.extend(embeddings[1100:])
+
+    for query in embeddings[:10]:
+        assert index.search(query) == restored.search(query)
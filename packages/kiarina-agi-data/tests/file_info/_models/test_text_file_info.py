@@ -1,4 +1,5 @@
 from kiarina.agi.file_info import TextFileInfo
+from kiarina.agi.token_utils import calc_text_token
 
 
 def test_export() -> None:
@@ -64,3 +65,43 @@ def test_shrink_by_line(text_file_info: TextFileInfo) -> None:
     assert new_file_info.segment_line_count == 2
     print("--- keep_from_end ---")
     print(new_file_info.model_dump_json(indent=2))
+
+
+def test_shrink_fits_most_lines(text_file_info: TextFileInfo) -> None:
+    lines = (text_file_info.raw_text or "").split("\n")
+
+    for keep_from_end in [False, True]:
+        file_info = text_file_info.model_copy(update={"keep_from_end": keep_from_end})
+        target = file_info.token_count // 3
+
+        new_file_info, reduced = file_info.shrink(reduce=file_info.token_count - target)
+        keep_line_count = new_file_info.segment_line_count
+        kept = lines[-keep_line_count:] if keep_from_end else lines[:keep_line_count]
+        more = (
+            lines[-keep_line_count - 1 :]
+            if keep_from_end
+            else lines[: keep_line_count + 1]
+        )
+
+        assert new_file_info.raw_text == "\n".join(kept)
+        assert new_file_info.token_count == calc_text_token("\n".join(kept))
+        assert new_file_info.token_count <= target
+        assert calc_text_token("\n".join(more)) > target
+        assert reduced == file_info.token_count - new_file_info.token_count
+
+
+def test_shrink_twice(text_file_info: TextFileInfo) -> None:
+    new_file_info, _ = text_file_info.shrink(reduce=text_file_info.token_count // 2)
+    new_file_info, _ = new_file_info.shrink(reduce=new_file_info.token_count // 2)
+
+    lines = (text_file_info.raw_text or "").split("\n")
+    assert new_file_info.raw_text == "\n".join(
+        lines[: new_file_info.segment_line_count]
+    )
+    assert new_file_info.token_count == calc_text_token(new_file_info.raw_text or "")
+
+
+def test_eq_ignores_line_index(text_file_info: TextFileInfo) -> None:
+    other = text_file_info.model_copy()
+    text_file_info.shrink(reduce=10)
+    assert text_file_info == other
@@ -0,0 +1,31 @@
+from kiarina.agi.file_info import FileInfo, ImageFileInfo, TextFileInfo
+from kiarina.agi.file_info_pool import dehydrate_file_infos, hydrate_file_infos
+
+
+def test_roundtrip(
+    text_file_info: TextFileInfo, image_file_info: ImageFileInfo
+) -> None:
+    file_infos: list[FileInfo] = [text_file_info, image_file_info, text_file_info]
+
+    dehydrated, pool = dehydrate_file_infos(file_infos, [])
+    assert [fi.metadata_only for fi in dehydrated] == [True, True, True]
+    assert pool == file_infos
+
+    hydrated, pool = hydrate_file_infos(dehydrated, pool)
+    assert hydrated == file_infos
+    assert len(pool) == 0
+
+
+def test_unchanged(text_file_info: TextFileInfo) -> None:
+    pool: list[FileInfo] = [text_file_info]
+    file_infos: list[FileInfo] = [text_file_info]
+
+    # Already hydrated file infos are left in the pool
+    hydrated, new_pool = hydrate_file_infos(file_infos, pool)
+    assert hydrated is file_infos
+    assert new_pool is pool
+
+    metadata_only: list[FileInfo] = [text_file_info.as_metadata_only()]
+    dehydrated, new_pool = dehydrate_file_infos(metadata_only, pool)
+    assert dehydrated is metadata_only
+    assert new_pool is pool
@@ -0,0 +1,106 @@
+from kiarina.agi.file_info import ImageFileInfo, TextFileInfo
+from kiarina.agi.file_info_pool import FileInfoPool
+
+
+def test_find_index(
+    text_file_info: TextFileInfo, image_file_info: ImageFileInfo
+) -> None:
+    pool = FileInfoPool([text_file_info, image_file_info])
+    assert pool.find_index(text_file_info.id) == 0
+    assert pool.find_index(image_file_info.id) == 1
+    assert pool.find_index("unknown") is None
+    assert pool.get(image_file_info.id) is image_file_info
+    assert pool.get("unknown") is None
+
+
+def test_find_indexes(text_file_info: TextFileInfo) -> None:
+    copied = text_file_info.as_metadata_only()
+    pool = FileInfoPool([text_file_info, copied])
+    assert pool.find_indexes(text_file_info.id) == [0, 1]
+    assert pool.find_indexes("unknown") == []
+
+
+def test_append(text_file_info: TextFileInfo, image_file_info: ImageFileInfo) -> None:
+    pool = FileInfoPool([text_file_info])
+    assert pool.find_index(text_file_info.id) == 0
+
+    pool.append(image_file_info)
+    assert pool.find_index(image_file_info.id) == 1
+
+    pool += [text_file_info]
+    assert pool.find_indexes(text_file_info.id) == [0, 2]
+
+
+def test_mutations(
+    text_file_info: TextFileInfo, image_file_info: ImageFileInfo
+) -> None:
+    pool = FileInfoPool([text_file_info, image_file_info])
+    assert pool.find_index(image_file_info.id) == 1
+
+    pool.pop(0)
+    assert pool.find_index(image_file_info.id) == 0
+    assert pool.find_index(text_file_info.id) is None
+
+    pool.insert(0, text_file_info)
+    assert pool.find_index(text_file_info.id) == 0
+    assert pool.find_index(image_file_info.id) == 1
+
+    pool.reverse()
+    assert pool.find_index(text_file_info.id) == 1
+
+    del pool[1]
+    assert pool.find_index(text_file_info.id) is None
+
+    pool[0] = text_file_info
+    assert pool.find_index(text_file_info.id) == 0
+    assert pool.find_index(image_file_info.id) is None
+
+    pool[0] = text_file_info.as_metadata_only()
+    assert pool.find_index(text_file_info.id) == 0
+
+    pool.clear()
+    assert pool.find_index(text_file_info.id) is None
+
+
+def test_copy(text_file_info: TextFileInfo, image_file_info: ImageFileInfo) -> None:
+    pool = FileInfoPool([text_file_info])
+    copied = pool.copy()
+    copied.append(image_file_info)
+
+    assert isinstance(copied, FileInfoPool)
+    assert pool.find_index(image_file_info.id) is None
+    assert copied.find_index(image_file_info.id) == 1
+
+
+def test_without(text_file_info: TextFileInfo, image_file_info: ImageFileInfo) -> None:
+    metadata_only = text_file_info.as_metadata_only()
+    pool = FileInfoPool([text_file_info, image_file_info, metadata_only])
+    assert pool.find_index(image_file_info.id) == 1
+
+    derived = pool.without([0])
+    assert derived == [image_file_info, metadata_only]
+    assert derived.find_index(image_file_info.id) == 0
+    assert derived.find_indexes(text_file_info.id) == [1]
+    assert pool.find_indexes(text_file_info.id) == [0, 2]
+
+    derived = derived.without([0])
+    assert derived.find_index(image_file_info.id) is None
+    assert derived.find_indexes(text_file_info.id) == [0]
+
+    # Appending to a pool that shares its index does not affect the others
+    derived.append(image_file_info)
+    assert derived.find_index(image_file_info.id) == 1
+    assert pool.find_index(image_file_info.id) == 1
+
+
+def test_without_many(text_file_info: TextFileInfo) -> None:
+    pool = FileInfoPool(
+        [text_file_info.model_copy(update={"id": str(index)}) for index in range(20)]
+    )
+    pool.find_index("0")
+
+    for indexes in [[3, 0, 7], [5], [0, 1, 2], [10]]:
+        pool = pool.without(indexes)
+
+        for index, file_info in enumerate(pool):
+            assert pool.find_index(file_info.id) == index
@@ -1,6 +1,6 @@
 import pytest
 
-from kiarina.agi.embedding import Embedding
+from kiarina.agi.embedding import Embedding, IVFFlatIndex
 from kiarina.agi.event import AIMessageEvent, HumanMessageEvent, ToolMessageEvent
 from kiarina.agi.file_info import TextFileInfo
 from kiarina.agi.history import History
@@ -72,11 +72,67 @@ def test_replace_event_not_found() -> None:
         )
 
 
+def test_replace_event_type() -> None:
+    target = HumanMessageEvent.create("before")
+    history = History(events=[target])
+    assert history.get_last_event("human_message") is target
+
+    history.replace_event(target, AIMessageEvent.create("after"))
+
+    assert history.get_last_event("human_message") is None
+    assert history.get_last_message("human") is None
+
+    message = history.get_last_message("ai")
+    assert message is not None
+    assert message.to_text() == "after"
+
+
+def test_direct_event_changes() -> None:
+    history = History(events=[HumanMessageEvent.create("first")])
+    assert len(history.get_messages()) == 1
+
+    history.events.append(AIMessageEvent.create("appended"))
+    assert [m.to_text() for m in history.get_messages()] == ["first", "appended"]
+
+    history.events = [HumanMessageEvent.create("reassigned")]
+    assert [m.to_text() for m in history.get_messages()] == ["reassigned"]
+    assert history.get_last_message("ai") is None
+
+    history.events.insert(0, AIMessageEvent.create("inserted"))
+    history.events[1] = HumanMessageEvent.create("replaced")
+    history.invalidate_indexes()
+    assert [m.to_text() for m in history.get_messages()] == ["inserted", "replaced"]
+    assert (message := history.get_last_message("ai")) is not None
+    assert message.to_text() == "inserted"
+
+
+def test_replace_duplicated_event() -> None:
+    event = HumanMessageEvent.create("twice")
+    history = History(events=[event, AIMessageEvent.create("ai"), event])
+
+    history.replace_event(event, HumanMessageEvent.create("replaced"))
+
+    assert [m.to_text() for m in history.get_messages()] == [
+        "replaced",
+        "ai",
+        "twice",
+    ]
+
+
 # --------------------------------------------------
 # Message Management
 # --------------------------------------------------
 
 
+def test_equality_ignores_indexes() -> None:
+    history1 = History(events=[HumanMessageEvent.create("Hello")])
+    history2 = History(events=[HumanMessageEvent.create("Hello")])
+    history2.events[0] = history1.events[0]
+    history1.get_messages()
+
+    assert history1 == history2
+
+
 def test_get_last_message() -> None:
     history = History(
         events=[
@@ -123,6 +179,16 @@ def test_get_file_info(text_file_info: TextFileInfo) -> None:
     assert history.get_file_info(unique_key="u1") == text_file_info
 
 
+def test_get_file_info_file_id(text_file_info: TextFileInfo) -> None:
+    history = History(file_infos=[text_file_info])
+
+    assert history.get_file_info(file_id=text_file_info.id) == text_file_info
+    assert history.get_file_info(file_id="missing") is None
+
+    with pytest.raises(ValueError, match="Exactly one of file_id or unique_key"):
+        history.get_file_info()
+
+
 def test_get_file_infos(text_file_info: TextFileInfo) -> None:
     history = History(file_infos=[text_file_info, text_file_info])
     assert len(history.get_file_infos()) == 2
@@ -168,6 +234,16 @@ def test_get_file_infos_in_message(
     assert len(history.get_file_infos(in_message=False)) == 0
 
 
+def test_get_file_infos_in_message_replaced(
+    history: History, text_file_info: TextFileInfo
+) -> None:
+    history.add_event(HumanMessageEvent.create("Hello", [text_file_info]))
+    history.replace_event(history.events[0], HumanMessageEvent.create("Hello"))
+
+    assert len(history.get_file_infos(in_message=True)) == 0
+    assert len(history.get_file_infos(in_message=False)) == 1
+
+
 def test_add_file_info(history: History, text_file_info: TextFileInfo) -> None:
     history.add_file_info(text_file_info)
 
@@ -238,6 +314,28 @@ def test_add_tool_info(history: History) -> None:
     assert history.tool_infos[0] == tool_info
 
 
+def test_direct_tool_info_changes(history: History) -> None:
+    history.add_tool_info(ToolInfo(name="tool1", description="first tool"))
+    assert history.get_tool_info("tool1") is not None
+
+    history.tool_infos = [ToolInfo(name="tool2", description="second tool")]
+
+    assert history.get_tool_info("tool1") is None
+    assert history.get_tool_info("tool2") is not None
+
+
+def test_invalidate_indexes_after_replacing_in_place(history: History) -> None:
+    history.add_tool_info(ToolInfo(name="tool1", description="first tool"))
+    history.add_tool_info(ToolInfo(name="tool2", description="second tool"))
+    history.get_tool_info("tool1")
+
+    history.tool_infos[0] = ToolInfo(name="tool3", description="third tool")
+    history.invalidate_indexes()
+
+    assert history.get_tool_info("tool1") is None
+    assert history.get_tool_info("tool3") is history.tool_infos[0]
+
+
 def test_remove_tool_info(history: History) -> None:
     tool_info = ToolInfo(name="tool1", description="first tool")
     history.add_tool_info(tool_info)
@@ -287,3 +385,58 @@ def test_get_embeddings(history: History) -> None:
     assert len(history.get_embeddings()) == 3
     assert len(history.get_embeddings(kind="text")) == 2
     assert len(history.get_embeddings(space_id="s1")) == 2
+
+
+def test_search_embeddings(history: History) -> None:
+    history.add_embedding(Embedding(id="e1", kind="text", space_id="s1", vector=[1, 0]))
+    history.add_embedding(Embedding(id="e2", kind="text", space_id="s1", vector=[0, 1]))
+    history.add_embedding(Embedding(id="e3", kind="text", space_id="s2", vector=[1, 0]))
+
+    query = Embedding(kind="text", space_id="s1", vector=[1.0, 0.1])
+    results = history.search_embeddings(query)
+    assert [r.embedding.id for r in results] == ["e1", "e2"]
+
+    # The index follows additions, removals and direct changes
+    history.add_embedding(Embedding(id="e4", kind="text", space_id="s1", vector=[1, 0]))
+    history.remove_embedding("e1")
+    history.embeddings["e5"] = Embedding(
+        id="e5", kind="text", space_id="s1", vector=[1, 0.1]
+    )
+    results = history.search_embeddings(query, top_k=2)
+    assert [r.embedding.id for r in results] == ["e5", "e4"]
+
+    # Replacing an existing embedding in place needs invalidate_indexes()
+    history.embeddings["e4"] = Embedding(
+        id="e4", kind="text", space_id="s1", vector=[0, 1]
+    )
+    history.invalidate_indexes()
+    results = history.search_embeddings(query, top_k=2)
+    assert [r.embedding.id for r in results] == ["e5", "e2"]
+    assert results[1].score == pytest.approx(0.1 / (1.01**0.5))
+
+
+def test_set_embedding_index(history: History) -> None:
+    history.add_embedding(Embedding(id="e1", kind="text", space_id="s1", vector=[1, 0]))
+
+    index = IVFFlatIndex()
+    history.set_embedding_index("s1", index)
+    assert history.get_embedding_index("s1") is index
+    assert "e1" in index
+
+    history.add_embedding(Embedding(id="e2", kind="text", space_id="s1", vector=[0, 1]))
+    assert "e2" in index
+
+    history.remove_embedding("e1")
+    assert "e1" not in index
+
+
+def test_set_embedding_index_drops_stale_entries(history: History) -> None:
+    history.add_embedding(Embedding(id="e1", kind="text", space_id="s1", vector=[1, 0]))
+
+    index = IVFFlatIndex()
+    index.add(Embedding(id="removed", kind="text", space_id="s1", vector=[0, 1]))
+    history.set_embedding_index("s1", index)
+
+    assert "removed" not in index
+    assert "e1" in index
+    assert len(index) == 1
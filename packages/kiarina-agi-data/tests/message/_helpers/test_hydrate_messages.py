@@ -1,10 +1,9 @@
-from kiarina.agi.file_info import ImageFileInfo, TextFileInfo
-from kiarina.agi.file_info_pool import FileInfoPool
+from kiarina.agi.file_info import FileInfo, ImageFileInfo, TextFileInfo
 from kiarina.agi.message import HumanMessage, hydrate_messages
 
 
 def test_hydrate(text_file_info: TextFileInfo, image_file_info: ImageFileInfo) -> None:
-    pool: FileInfoPool = [text_file_info, image_file_info]
+    pool: list[FileInfo] = [text_file_info, image_file_info]
 
     message = HumanMessage.model_validate(
         {
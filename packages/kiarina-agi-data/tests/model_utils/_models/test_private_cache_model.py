@@ -0,0 +1,22 @@
+from pydantic import PrivateAttr
+
+from kiarina.agi.model_utils import PrivateCacheModel
+
+
+class _Model(PrivateCacheModel):
+    value: int
+    _cache: int | None = PrivateAttr(default=None)
+
+
+class _OtherModel(PrivateCacheModel):
+    value: int
+
+
+def test_eq_ignores_private_attributes() -> None:
+    model = _Model(value=1)
+    model._cache = 2
+
+    assert model == _Model(value=1)
+    assert model != _Model(value=2)
+    assert model != _OtherModel(value=1)
+    assert model != 1
@@ -3,14 +3,28 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ._helpers.create_asset_cache import create_asset_cache
+    from ._instances.asset_cache_metrics import asset_cache_metrics
+    from ._instances.asset_cache_sweeper import asset_cache_sweeper
+    from ._instances.asset_memory_cache import asset_memory_cache
     from ._services.asset_cache import AssetCache
+    from ._services.asset_cache_metrics import AssetCacheMetrics, AssetCacheStats
+    from ._services.asset_cache_sweeper import AssetCacheSweeper
+    from ._services.asset_memory_cache import AssetMemoryCache
     from ._settings import AssetCacheSettings, settings_manager
 
 __all__ = [
     # ._helpers
     "create_asset_cache",
+    # ._instances
+    "asset_cache_metrics",
+    "asset_cache_sweeper",
+    "asset_memory_cache",
     # ._services
     "AssetCache",
+    "AssetCacheMetrics",
+    "AssetCacheStats",
+    "AssetCacheSweeper",
+    "AssetMemoryCache",
     # ._settings
     "AssetCacheSettings",
     "settings_manager",
@@ -24,8 +38,16 @@ def __getattr__(name: str) -> object:
     module_map = {
         # ._helpers
         "create_asset_cache": "._helpers.create_asset_cache",
+        # ._instances
+        "asset_cache_metrics": "._instances.asset_cache_metrics",
+        "asset_cache_sweeper": "._instances.asset_cache_sweeper",
+        "asset_memory_cache": "._instances.asset_memory_cache",
         # ._services
         "AssetCache": "._services.asset_cache",
+        "AssetCacheMetrics": "._services.asset_cache_metrics",
+        "AssetCacheStats": "._services.asset_cache_metrics",
+        "AssetCacheSweeper": "._services.asset_cache_sweeper",
+        "AssetMemoryCache": "._services.asset_memory_cache",
         # ._settings
         "AssetCacheSettings": "._settings",
         "settings_manager": "._settings",
@@ -0,0 +1,3 @@
+from .._services.asset_cache_metrics import AssetCacheMetrics
+
+asset_cache_metrics = AssetCacheMetrics()
@@ -0,0 +1,5 @@
+from .._services.asset_cache_sweeper import AssetCacheSweeper
+from .asset_cache_metrics import asset_cache_metrics
+from .asset_memory_cache import asset_memory_cache
+
+asset_cache_sweeper = AssetCacheSweeper(asset_cache_metrics, asset_memory_cache)
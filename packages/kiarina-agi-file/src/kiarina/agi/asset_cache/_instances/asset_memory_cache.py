@@ -0,0 +1,4 @@
+from .._services.asset_memory_cache import AssetMemoryCache
+from .asset_cache_metrics import asset_cache_metrics
+
+asset_memory_cache = AssetMemoryCache(asset_cache_metrics)
@@ -1,21 +1,37 @@
+import asyncio
 import hashlib
 import os
 import pathlib
 import shutil
 import time
 from typing import cast
+from urllib.parse import quote, unquote
 
-import kiarina.utils.file.asyncio as kfa
+import kiarina.utils.file as kf
 from kiarina.agi.local_repository import LocalRepository, create_local_repository
 from kiarina.agi.run_context import RunContext
 from kiarina.utils.ext import detect_extension
 from kiarina.utils.file import FileBlob
 from kiarina.utils.mime import MIMEBlob
 
+from .._instances.asset_cache_metrics import asset_cache_metrics
+from .._instances.asset_cache_sweeper import asset_cache_sweeper
+from .._instances.asset_memory_cache import asset_memory_cache
 from .._settings import AssetCacheSettings
 
+RAW_DATA_FILE_NAME = "raw_data"
+
 
 class AssetCache:
+    """
+    Two-tier cache of assets, in memory and on disk.
+
+    Each disk entry is a single raw data file, whose name holds the MIME type
+    and whose modification time gives the time it was cached, so a hit reads
+    one file without a lock or content detection. Recently used assets are also kept in an
+    in-process LRU bounded by their total size.
+    """
+
     def __init__(
         self,
         settings: AssetCacheSettings,
@@ -29,22 +45,29 @@ class AssetCache:
     def local_repository(self) -> LocalRepository:
         return create_local_repository(self.run_context)
 
-    async def get(self, uri: str) -> FileBlob | None:
-        metadata = await kfa.read_json_dict(self._get_metadata_path(uri))
+    @property
+    def cache_dir(self) -> str:
+        return self.local_repository.generate_cache_path(
+            pathlib.Path("asset") / "cache"
+        )
 
-        if not metadata:
-            return None
+    async def get(self, uri: str) -> FileBlob | None:
+        entry_dir = self._get_entry_dir(uri)
 
-        if time.time() - metadata["timestamp"] > self.settings.cache_ttl:
-            await self.delete(uri)
-            return None
+        if file_blob := asset_memory_cache.get(entry_dir, ttl=self.settings.cache_ttl):
+            asset_cache_metrics.increment("memory_hits")
+            return file_blob
 
-        extension = detect_extension(metadata["mime_type"])
+        result = await asyncio.to_thread(self._read_entry, entry_dir)
 
-        if not extension:
+        if result is None:
+            asset_cache_metrics.increment("misses")
             return None
 
-        return await kfa.read_file(self._get_raw_data_path(uri, extension))
+        file_blob, timestamp = result
+        asset_cache_metrics.increment("disk_hits")
+        self._set_memory(entry_dir, file_blob, timestamp)
+        return file_blob
 
     async def set(
         self,
@@ -52,41 +75,92 @@ class AssetCache:
         mime_type: str,
         raw_data: bytes,
     ) -> FileBlob:
-        await kfa.write_json_dict(
-            self._get_metadata_path(uri),
-            {
-                "uri": uri,
-                "mime_type": mime_type,
-                "timestamp": time.time(),
-            },
-        )
-
+        entry_dir = self._get_entry_dir(uri)
         mime_blob = MIMEBlob(mime_type, raw_data)
 
         file_blob = FileBlob(
-            self._get_raw_data_path(uri, mime_blob.ext),
+            os.path.join(entry_dir, _to_raw_data_file_name(mime_type, mime_blob.ext)),
             mime_blob,
         )
 
-        await kfa.write_file(file_blob)
+        await asyncio.to_thread(self._write_entry, file_blob)
+        self._set_memory(entry_dir, file_blob, time.time())
+
+        asset_cache_sweeper.schedule(
+            self.cache_dir,
+            ttl=self.settings.cache_ttl,
+            max_size=self.settings.max_size,
+            interval=self.settings.sweep_interval,
+        )
+
         return file_blob
 
     async def delete(self, uri: str) -> None:
-        cache_dir = self._get_cache_dir(uri)
+        entry_dir = self._get_entry_dir(uri)
+        asset_memory_cache.delete(entry_dir)
 
-        if os.path.exists(cache_dir):
-            shutil.rmtree(cache_dir)
+        if os.path.exists(entry_dir):
+            await asyncio.to_thread(shutil.rmtree, entry_dir, ignore_errors=True)
 
-    def _get_cache_dir(self, uri: str) -> str:
-        return self.local_repository.generate_cache_path(
-            pathlib.Path("asset") / "cache" / self._generate_hash_string(uri)
-        )
+    def _read_entry(self, entry_dir: str) -> tuple[FileBlob, float] | None:
+        if (file_path := _find_raw_data_path(entry_dir)) is None:
+            return None
+
+        if (mime_type := _from_raw_data_file_name(os.path.basename(file_path))) is None:
+            return None
 
-    def _get_metadata_path(self, uri: str) -> str:
-        return os.path.join(self._get_cache_dir(uri), "metadata.json")
+        # MIME types without a known extension are misses, as they always were
+        if detect_extension(mime_type) is None:
+            return None
 
-    def _get_raw_data_path(self, uri: str, extension: str) -> str:
-        return os.path.join(self._get_cache_dir(uri), f"raw_data{extension}")
+        try:
+            timestamp = os.stat(file_path).st_mtime
+        except FileNotFoundError:
+            return None
+
+        if time.time() - timestamp > self.settings.cache_ttl:
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return None
+
+        # Writes replace the file atomically, so it is read without a lock
+        if (raw_data := kf.read_binary(file_path, use_lock=False)) is None:
+            return None
+
+        # Mark the entry as recently used for the sweeper
+        try:
+            os.utime(entry_dir)
+        except FileNotFoundError:  # pragma: no cover
+            pass
+
+        return FileBlob(file_path, mime_type=mime_type, raw_data=raw_data), timestamp
+
+    def _write_entry(self, file_blob: FileBlob) -> None:
+        kf.write_file(file_blob)
+
+        # Drop the data of another MIME type and the metadata of older entries
+        entry_dir = os.path.dirname(file_blob.file_path)
+
+        for name in os.listdir(entry_dir):
+            path = os.path.join(entry_dir, name)
+
+            if path != file_blob.file_path and (
+                name.startswith(RAW_DATA_FILE_NAME) or name == "metadata.json"
+            ):
+                os.remove(path)
+
+    def _set_memory(
+        self, entry_dir: str, file_blob: FileBlob, timestamp: float
+    ) -> None:
+        asset_memory_cache.set(
+            entry_dir,
+            file_blob,
+            timestamp=timestamp,
+            max_size=self.settings.memory_max_size,
+            max_entry_size=self.settings.memory_max_entry_size,
+        )
+
+    def _get_entry_dir(self, uri: str) -> str:
+        return os.path.join(self.cache_dir, self._generate_hash_string(uri))
 
     def _generate_hash_string(self, uri: str) -> str:
         hash_algorithm = self.settings.hash_algorithm
@@ -95,3 +169,34 @@ class AssetCache:
             raise ValueError(f"Unsupported hash algorithm: {hash_algorithm}")
 
         return cast(str, h(uri.encode("utf-8")).hexdigest())
+
+
+def _find_raw_data_path(entry_dir: str) -> str | None:
+    try:
+        names = os.listdir(entry_dir)
+    except FileNotFoundError:
+        return None
+
+    for name in names:
+        if name.startswith(RAW_DATA_FILE_NAME):
+            return os.path.join(entry_dir, name)
+
+    return None
+
+
+def _to_raw_data_file_name(mime_type: str, ext: str) -> str:
+    # Dots are escaped too, so the first dot after the MIME type starts the
+    # extension
+    encoded = quote(mime_type, safe="").replace(".", "%2E")
+    return f"{RAW_DATA_FILE_NAME}.{encoded}{ext}"
+
+
+def _from_raw_data_file_name(name: str) -> str | None:
+    encoded = name.removeprefix(f"{RAW_DATA_FILE_NAME}.").partition(".")[0]
+    mime_type = unquote(encoded)
+
+    # Entries of older versions are named after the extension only
+    if "/" not in mime_type:
+        return None
+
+    return mime_type
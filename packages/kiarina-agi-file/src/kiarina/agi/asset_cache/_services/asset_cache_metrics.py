@@ -0,0 +1,34 @@
+import threading
+from typing import Literal, NamedTuple
+
+AssetCacheCounter = Literal[
+    "memory_hits", "disk_hits", "misses", "memory_evictions", "disk_evictions"
+]
+
+
+class AssetCacheStats(NamedTuple):
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    memory_evictions: int
+    disk_evictions: int
+
+
+class AssetCacheMetrics:
+    """Thread-safe counters of the asset cache tiers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(AssetCacheStats._fields, 0)
+
+    def increment(self, counter: AssetCacheCounter, count: int = 1) -> None:
+        with self._lock:
+            self._counts[counter] += count
+
+    def stats(self) -> AssetCacheStats:
+        with self._lock:
+            return AssetCacheStats(**self._counts)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = dict.fromkeys(AssetCacheStats._fields, 0)
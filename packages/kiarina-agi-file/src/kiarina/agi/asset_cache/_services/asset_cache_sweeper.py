@@ -0,0 +1,155 @@
+import logging
+import os
+import shutil
+import threading
+import time
+from typing import NamedTuple
+
+from .asset_cache_metrics import AssetCacheMetrics
+from .asset_memory_cache import AssetMemoryCache
+
+logger = logging.getLogger(__name__)
+
+
+class _DiskEntry(NamedTuple):
+    path: str
+    used_at: float
+    modified_at: float
+    size: int
+
+
+class AssetCacheSweeper:
+    """
+    Sweeps of asset cache directories in a background thread.
+
+    Expired entries are removed first, then the least recently used entries
+    until the total size fits in the limit, judged from the later of the
+    last disk read and the last memory hit. Each directory is swept at most
+    once per interval.
+    """
+
+    def __init__(
+        self,
+        metrics: AssetCacheMetrics,
+        memory_cache: AssetMemoryCache,
+    ) -> None:
+        self.metrics: AssetCacheMetrics = metrics
+        self.memory_cache: AssetMemoryCache = memory_cache
+        self._last_sweeps: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def schedule(
+        self,
+        cache_dir: str,
+        *,
+        ttl: float,
+        max_size: int,
+        interval: float,
+    ) -> bool:
+        """
+        Start a sweep of the directory unless one started within the interval.
+        """
+        if interval <= 0:
+            return False
+
+        now = time.monotonic()
+
+        with self._lock:
+            last = self._last_sweeps.get(cache_dir)
+
+            if last is not None and now - last < interval:
+                return False
+
+            self._last_sweeps[cache_dir] = now
+
+        threading.Thread(
+            target=self._sweep_in_background,
+            args=(cache_dir, ttl, max_size),
+            name="asset-cache-sweeper",
+            daemon=True,
+        ).start()
+
+        return True
+
+    def sweep(self, cache_dir: str, *, ttl: float, max_size: int) -> int:
+        """
+        Remove expired and excess entries and return the number removed.
+        """
+        now = time.time()
+        removed = 0
+        entries: list[_DiskEntry] = []
+
+        for entry in _scan_entries(cache_dir):
+            if now - entry.modified_at > ttl:
+                self._remove(entry.path)
+                removed += 1
+                continue
+
+            # Entries served from memory are not touched on disk
+            if (used_at := self.memory_cache.get_used_at(entry.path)) is not None:
+                entry = entry._replace(used_at=max(entry.used_at, used_at))
+
+            entries.append(entry)
+
+        if max_size > 0:
+            total = sum(entry.size for entry in entries)
+
+            for entry in sorted(entries, key=lambda entry: entry.used_at):
+                if total <= max_size:
+                    break
+
+                self._remove(entry.path)
+                total -= entry.size
+                removed += 1
+
+        if removed:
+            self.metrics.increment("disk_evictions", removed)
+
+        return removed
+
+    def _sweep_in_background(self, cache_dir: str, ttl: float, max_size: int) -> None:
+        try:
+            self.sweep(cache_dir, ttl=ttl, max_size=max_size)
+        except Exception as e:  # pragma: no cover
+            logger.warning(f"Failed to sweep the asset cache {cache_dir}: {e!s}")
+
+    def _remove(self, entry_dir: str) -> None:
+        self.memory_cache.delete(entry_dir)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+
+
+def _scan_entries(cache_dir: str) -> list[_DiskEntry]:
+    entries: list[_DiskEntry] = []
+
+    try:
+        dir_entries = list(os.scandir(cache_dir))
+    except FileNotFoundError:
+        return entries
+
+    for dir_entry in dir_entries:
+        try:
+            if not dir_entry.is_dir(follow_symlinks=False):
+                continue
+
+            # The entry directory is touched whenever the entry is used
+            used_at = dir_entry.stat().st_mtime
+            modified_at = used_at
+            size = 0
+
+            with os.scandir(dir_entry.path) as it:
+                for file_entry in it:
+                    if not file_entry.is_file(follow_symlinks=False):
+                        continue
+
+                    stat = file_entry.stat()
+                    size += stat.st_size
+
+                    if file_entry.name.startswith("raw_data"):
+                        modified_at = stat.st_mtime
+
+        except FileNotFoundError:
+            continue
+
+        entries.append(_DiskEntry(dir_entry.path, used_at, modified_at, size))
+
+    return entries
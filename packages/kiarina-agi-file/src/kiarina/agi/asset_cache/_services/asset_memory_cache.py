@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+from kiarina.utils.file import FileBlob
+
+from .asset_cache_metrics import AssetCacheMetrics
+
+
+class _Entry(NamedTuple):
+    file_blob: FileBlob
+    timestamp: float
+    size: int
+
+
+class AssetMemoryCache:
+    """
+    Thread-safe LRU of cached assets bounded by their total size.
+
+    Entries are keyed by the cache directory of the asset, so the same URI
+    cached for different run contexts is kept apart. Hits are not visible on
+    disk, so the time of the last hit is kept for the sweeper.
+    """
+
+    def __init__(self, metrics: AssetCacheMetrics) -> None:
+        self.metrics: AssetCacheMetrics = metrics
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._used_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, key: str, *, ttl: float) -> FileBlob | None:
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                return None
+
+            if time.time() - entry.timestamp > ttl:
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            self._used_at[key] = time.time()
+            return entry.file_blob
+
+    def get_used_at(self, key: str) -> float | None:
+        """
+        Return the time of the last hit of the entry, if it has had one.
+        """
+        with self._lock:
+            return self._used_at.get(key)
+
+    def set(
+        self,
+        key: str,
+        file_blob: FileBlob,
+        *,
+        timestamp: float,
+        max_size: int,
+        max_entry_size: int,
+    ) -> None:
+        size = len(file_blob.raw_data)
+
+        with self._lock:
+            self._remove(key)
+
+            if size > min(max_size, max_entry_size):
+                return
+
+            self._entries[key] = _Entry(file_blob, timestamp, size)
+            self._size += size
+
+            evictions = 0
+
+            while self._size > max_size:
+                self._remove(next(iter(self._entries)))
+                evictions += 1
+
+        if evictions:
+            self.metrics.increment("memory_evictions", evictions)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._used_at.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        self._used_at.pop(key, None)
+
+        if (entry := self._entries.pop(key, None)) is not None:
+            self._size -= entry.size
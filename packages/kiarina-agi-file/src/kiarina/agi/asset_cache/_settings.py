@@ -21,6 +21,36 @@ class AssetCacheSettings(BaseSettings):
         title="Cache TTL",
         description="Maximum cache lifetime in seconds.",
     )
+    max_size: int = Field(
+        default=1024 * 1024 * 1024,
+        title="Max Size",
+        description=(
+            "Maximum total size in bytes of the disk cache of each cache directory. "
+            "0 means unlimited."
+        ),
+    )
+    memory_max_size: int = Field(
+        default=64 * 1024 * 1024,
+        title="Memory Max Size",
+        description=(
+            "Maximum total size in bytes of the assets kept in memory. "
+            "0 disables the memory tier."
+        ),
+    )
+    memory_max_entry_size: int = Field(
+        default=8 * 1024 * 1024,
+        title="Memory Max Entry Size",
+        description="Maximum size in bytes of an asset kept in memory.",
+    )
+    sweep_interval: float = Field(
+        default=300.0,
+        title="Sweep Interval",
+        description=(
+            "Minimum interval in seconds between background sweeps of a cache "
+            "directory, which remove expired entries and enforce max_size. "
+            "0 disables sweeping."
+        ),
+    )
 
 
 settings_manager = SettingsManager(AssetCacheSettings)
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ._helpers.create_asset_repository import create_asset_repository
     from ._instances.asset_repository_registry import asset_repository_registry
+    from ._models.compiled_uri_policy import CompiledURIPolicy
     from ._schemas.uri_policy import URIPolicy
     from ._services.base_asset_repository import BaseAssetRepository
     from ._settings import AssetRepositorySettings, settings_manager
@@ -18,6 +19,8 @@ __all__ = [
     "create_asset_repository",
     # ._instances
     "asset_repository_registry",
+    # ._models
+    "CompiledURIPolicy",
     # ._services
     "BaseAssetRepository",
     # ._schemas
@@ -43,6 +46,8 @@ def __getattr__(name: str) -> object:
         "create_asset_repository": "._helpers.create_asset_repository",
         # ._instances
         "asset_repository_registry": "._instances.asset_repository_registry",
+        # ._models
+        "CompiledURIPolicy": "._models.compiled_uri_policy",
         # ._services
         "BaseAssetRepository": "._services.base_asset_repository",
         # ._schemas
@@ -1,3 +1,4 @@
+from collections.abc import Hashable
 from typing import Any
 
 from kiarina.agi.run_context import RunContext
@@ -29,6 +30,41 @@ def _factory_wrapper(
     return instance
 
 
+def _get_cache_key(kwargs: dict[str, Any]) -> Hashable | None:
+    # Repositories keep the URI policy and run context they were given, so
+    # they are reused for those same objects. A new settings object, as built
+    # after the settings change, brings a new URI policy and a new instance.
+    settings = settings_manager.settings
+    uri_policy = kwargs.get("uri_policy")
+    run_context = kwargs.get("run_context")
+
+    if not settings.instance_cache_enabled:
+        return None
+
+    if not isinstance(uri_policy, URIPolicy) or not isinstance(run_context, RunContext):
+        return None
+
+    return (_Identity(settings), _Identity(uri_policy), _Identity(run_context))
+
+
+class _Identity:
+    """
+    Key that matches only the same object and keeps it alive, so its id is
+    not reused while the key is cached.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: object) -> None:
+        self.obj = obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Identity) and other.obj is self.obj
+
+
 asset_repository_registry = ComponentRegistry[AssetRepository](
     expected_type=AssetRepository,
     component_label="AssetRepository",
@@ -36,4 +72,5 @@ asset_repository_registry = ComponentRegistry[AssetRepository](
     get_presets=lambda: settings_manager.settings.presets,
     get_customs=lambda: settings_manager.settings.customs,
     factory_wrapper=_factory_wrapper,
+    get_cache_key=_get_cache_key,
 )
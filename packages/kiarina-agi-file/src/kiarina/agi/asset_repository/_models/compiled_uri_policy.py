@@ -0,0 +1,47 @@
+from collections.abc import Mapping
+from functools import cached_property
+from urllib.parse import urlsplit
+
+from kiarina.agi.local_repository import compile_patterns
+
+from .._schemas.uri_policy import URIPolicy
+
+
+class CompiledURIPolicy:
+    """
+    URI policy with its templates expanded and its patterns compiled once.
+
+    The allowed patterns are combined into a single alternation, so checking
+    a URI is one regular expression match however many patterns there are.
+    """
+
+    def __init__(
+        self,
+        uri_policy: URIPolicy,
+        template_variables: Mapping[str, str],
+    ) -> None:
+        self.uri_policy: URIPolicy = uri_policy
+        self.template_variables: dict[str, str] = dict(template_variables)
+        self._patterns = compile_patterns(
+            uri_policy.allowed_uri_patterns, template_variables
+        )
+
+    @cached_property
+    def data_uri(self) -> str:
+        return self.uri_policy.data_dir_uri_template.format(**self.template_variables)
+
+    @cached_property
+    def cache_uri(self) -> str:
+        return self.uri_policy.cache_dir_uri_template.format(**self.template_variables)
+
+    def is_valid_uri(self, uri: str) -> bool:
+        if not self.uri_policy.allowed_uri_patterns:
+            raise ValueError("No allowed URI patterns are configured")
+
+        parsed_uri = urlsplit(uri)
+        if parsed_uri.query or parsed_uri.fragment:
+            return False
+        if any(part in {".", ".."} for part in parsed_uri.path.split("/")):
+            return False
+
+        return any(pattern.match(uri) for pattern in self._patterns)
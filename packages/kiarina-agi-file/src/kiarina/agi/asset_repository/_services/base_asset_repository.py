@@ -1,14 +1,16 @@
+import asyncio
 import logging
 import os
 import posixpath
-import re
+from collections.abc import AsyncIterator, Iterable
 from datetime import datetime
-from urllib.parse import urlsplit
 
+import kiarina.utils.file.asyncio as kfa
 from kiarina.agi.asset_cache import AssetCache, create_asset_cache
 from kiarina.agi.run_context import RunContext
-from kiarina.utils.mime import MIMEBlob
+from kiarina.utils.mime import MIMEBlob, detect_mime_type
 
+from .._models.compiled_uri_policy import CompiledURIPolicy
 from .._schemas.uri_policy import URIPolicy
 from .._types.asset_area import AssetArea
 from .._types.asset_repository import AssetRepository
@@ -21,6 +23,7 @@ class BaseAssetRepository(AssetRepository):
     def __init__(self) -> None:
         self._uri_policy: URIPolicy | None = None
         self._run_context: RunContext | None = None
+        self._compiled_uri_policy: CompiledURIPolicy | None = None
 
     @property
     def uri_policy(self) -> URIPolicy:
@@ -32,6 +35,7 @@ class BaseAssetRepository(AssetRepository):
     @uri_policy.setter
     def uri_policy(self, uri_policy: URIPolicy) -> None:
         self._uri_policy = uri_policy
+        self._compiled_uri_policy = None
 
     @property
     def run_context(self) -> RunContext:
@@ -43,6 +47,7 @@ class BaseAssetRepository(AssetRepository):
     @run_context.setter
     def run_context(self, run_context: RunContext) -> None:
         self._run_context = run_context
+        self._compiled_uri_policy = None
 
     @property
     def template_variables(self) -> dict[str, str]:
@@ -56,13 +61,27 @@ class BaseAssetRepository(AssetRepository):
     def asset_cache(self) -> AssetCache:
         return create_asset_cache(self.run_context)
 
+    @property
+    def compiled_uri_policy(self) -> CompiledURIPolicy:
+        """
+        URI policy compiled with the template variables on first use.
+
+        It is compiled again after the URI policy or run context is replaced.
+        """
+        if self._compiled_uri_policy is None:
+            self._compiled_uri_policy = CompiledURIPolicy(
+                self.uri_policy, self.template_variables
+            )
+
+        return self._compiled_uri_policy
+
     @property
     def data_uri(self) -> str:
-        return self.uri_policy.data_dir_uri_template.format(**self.template_variables)
+        return self.compiled_uri_policy.data_uri
 
     @property
     def cache_uri(self) -> str:
-        return self.uri_policy.cache_dir_uri_template.format(**self.template_variables)
+        return self.compiled_uri_policy.cache_uri
 
     # --------------------------------------------------
     # Methods (File URI)
@@ -106,32 +125,28 @@ class BaseAssetRepository(AssetRepository):
             raise AssertionError("Invalid area value")
 
     def is_valid_uri(self, uri: str) -> bool:
-        if not self.uri_policy.allowed_uri_patterns:
-            raise ValueError("No allowed URI patterns are configured")
-
-        parsed_uri = urlsplit(uri)
-        if parsed_uri.query or parsed_uri.fragment:
-            return False
-        if any(part in {".", ".."} for part in parsed_uri.path.split("/")):
-            return False
-
-        for pattern in self.uri_policy.allowed_uri_patterns:
-            uri_pattern = pattern.format(**self.template_variables)
+        return self.compiled_uri_policy.is_valid_uri(uri)
 
-            try:
-                if re.match(f"^{uri_pattern}$", uri):
-                    return True
-
-            except re.error as e:
-                logger.error(f"Invalid regex pattern: {uri_pattern}, error: {e!s}")
-                continue
-
-        return False
+    def is_valid_uris(self, uris: Iterable[str]) -> list[bool]:
+        is_valid_uri = self.compiled_uri_policy.is_valid_uri
+        return [is_valid_uri(uri) for uri in uris]
 
     def validate_uri(self, uri: str) -> None:
         if not self.is_valid_uri(uri):
             raise PermissionError(f"Access to the asset is not allowed: {uri}")
 
+    def validate_uris(self, uris: Iterable[str]) -> None:
+        uris = list(uris)
+
+        if denied := [
+            uri
+            for uri, is_valid in zip(uris, self.is_valid_uris(uris), strict=True)
+            if not is_valid
+        ]:
+            raise PermissionError(
+                f"Access to the assets is not allowed: {', '.join(denied)}"
+            )
+
     # --------------------------------------------------
     # Methods (File Access)
     # --------------------------------------------------
@@ -196,6 +211,87 @@ class BaseAssetRepository(AssetRepository):
         self.validate_uri(uri)
         return await self._generate_download_url(uri, expire_seconds=expire_seconds)
 
+    # --------------------------------------------------
+    # Methods (Streaming Access)
+    # --------------------------------------------------
+    # These methods bypass the asset cache, so large assets are never held
+    # in memory or copied into the cache directory.
+
+    async def get_range(
+        self,
+        uri: str,
+        start: int,
+        end: int | None = None,
+    ) -> bytes | None:
+        """
+        Read the bytes from `start` up to, but not including, `end`.
+
+        Returns None if the asset does not exist, and fewer bytes than
+        requested if the range extends past the end of the asset.
+        """
+        self.validate_uri(uri)
+
+        if start < 0 or (end is not None and end < start):
+            raise ValueError(f"Invalid byte range: start={start}, end={end}")
+
+        if end == start:
+            return b"" if await self._exists(uri) else None
+
+        return await self._get_range(uri, start, end)
+
+    async def iter_chunks(
+        self,
+        uri: str,
+        *,
+        chunk_size: int = 8 * 1024 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """
+        Read the asset in chunks of at most `chunk_size` bytes.
+
+        Raises FileNotFoundError if the asset does not exist.
+        """
+        self.validate_uri(uri)
+
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size: {chunk_size}")
+
+        async for chunk in self._iter_chunks(uri, chunk_size=chunk_size):
+            yield chunk
+
+    async def download_to_file(
+        self,
+        uri: str,
+        file_path: str | os.PathLike[str],
+    ) -> bool:
+        """
+        Write the asset to a local file, replacing it atomically.
+
+        Returns False if the asset does not exist.
+        """
+        self.validate_uri(uri)
+        return await self._download_to_file(uri, os.fspath(file_path))
+
+    async def upload_from_file(
+        self,
+        uri: str,
+        file_path: str | os.PathLike[str],
+        *,
+        mime_type: str | None = None,
+    ) -> None:
+        """
+        Store a local file as the asset, detecting the MIME type if not given.
+        """
+        self.validate_uri(uri)
+        file_path = os.fspath(file_path)
+
+        if mime_type is None:
+            mime_type = await asyncio.to_thread(_detect_file_mime_type, file_path)
+
+        await self._upload_from_file(uri, file_path, mime_type)
+
+        # The cached copy, if any, no longer matches the asset
+        await self.asset_cache.delete(uri)
+
     # --------------------------------------------------
     # Template Methods
     # --------------------------------------------------
@@ -214,3 +310,44 @@ class BaseAssetRepository(AssetRepository):
 
     async def _generate_download_url(self, uri: str, *, expire_seconds: int) -> str:
         raise NotImplementedError("override me")
+
+    # The streaming methods fall back to whole-asset reads and writes, so
+    # repositories override them to transfer data without buffering it.
+
+    async def _get_range(self, uri: str, start: int, end: int | None) -> bytes | None:
+        if (mime_blob := await self._get(uri)) is None:
+            return None
+
+        return mime_blob.raw_data[start:end]
+
+    async def _iter_chunks(self, uri: str, *, chunk_size: int) -> AsyncIterator[bytes]:
+        if (mime_blob := await self._get(uri)) is None:
+            raise FileNotFoundError(f"Asset not found: {uri}")
+
+        raw_data = mime_blob.raw_data
+
+        for offset in range(0, len(raw_data), chunk_size):
+            yield raw_data[offset : offset + chunk_size]
+
+    async def _download_to_file(self, uri: str, file_path: str) -> bool:
+        if (mime_blob := await self._get(uri)) is None:
+            return False
+
+        await kfa.write_binary(file_path, mime_blob.raw_data)
+        return True
+
+    async def _upload_from_file(self, uri: str, file_path: str, mime_type: str) -> None:
+        if (raw_data := await kfa.read_binary(file_path)) is None:
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        await self._set(uri, mime_type, raw_data)
+
+
+def _detect_file_mime_type(file_path: str) -> str:
+    # Opening and reading the head of the file block, so this runs in a thread
+    with open(file_path, "rb") as stream:
+        return detect_mime_type(
+            file_name_hint=file_path,
+            stream=stream,
+            default="application/octet-stream",
+        )
@@ -40,6 +40,15 @@ class AssetRepositorySettings(BaseSettings):
         description="Custom repository factory import paths.",
     )
 
+    instance_cache_enabled: bool = Field(
+        default=True,
+        title="Instance Cache Enabled",
+        description=(
+            "Whether to reuse repository instances for the same specifier, "
+            "URI policy, and run context."
+        ),
+    )
+
     uri_policy: URIPolicy = Field(
         title="URI Policy",
         description="Rules and templates used for repository URIs.",
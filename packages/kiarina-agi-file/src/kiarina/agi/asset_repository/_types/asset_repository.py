@@ -1,3 +1,5 @@
+import os
+from collections.abc import AsyncIterator, Iterable
 from typing import Protocol, runtime_checkable
 
 from kiarina.agi.asset_cache import AssetCache
@@ -34,8 +36,12 @@ class AssetRepository(Protocol):
 
     def is_valid_uri(self, uri: str) -> bool: ...
 
+    def is_valid_uris(self, uris: Iterable[str]) -> list[bool]: ...
+
     def validate_uri(self, uri: str) -> None: ...
 
+    def validate_uris(self, uris: Iterable[str]) -> None: ...
+
     # --------------------------------------------------
     # Methods (File Access)
     # --------------------------------------------------
@@ -66,3 +72,35 @@ class AssetRepository(Protocol):
         *,
         expire_seconds: int = 86400,
     ) -> str: ...
+
+    # --------------------------------------------------
+    # Methods (Streaming Access)
+    # --------------------------------------------------
+
+    async def get_range(
+        self,
+        uri: str,
+        start: int,
+        end: int | None = None,
+    ) -> bytes | None: ...
+
+    def iter_chunks(
+        self,
+        uri: str,
+        *,
+        chunk_size: int = 8 * 1024 * 1024,
+    ) -> AsyncIterator[bytes]: ...
+
+    async def download_to_file(
+        self,
+        uri: str,
+        file_path: str | os.PathLike[str],
+    ) -> bool: ...
+
+    async def upload_from_file(
+        self,
+        uri: str,
+        file_path: str | os.PathLike[str],
+        *,
+        mime_type: str | None = None,
+    ) -> None: ...
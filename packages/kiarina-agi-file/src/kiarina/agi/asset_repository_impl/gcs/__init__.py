@@ -3,14 +3,19 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ._helpers.create_gcs_asset_repository import create_gcs_asset_repository
+    from ._instances.gcs_client_pool import gcs_client_pool
     from ._services.gcs_asset_repository import GCSAssetRepository
+    from ._services.gcs_client_pool import GCSClientPool
     from ._settings import GCSAssetRepositorySettings, settings_manager
 
 __all__ = [
     # ._helpers
     "create_gcs_asset_repository",
+    # ._instances
+    "gcs_client_pool",
     # ._services
     "GCSAssetRepository",
+    "GCSClientPool",
     # ._settings
     "GCSAssetRepositorySettings",
     "settings_manager",
@@ -24,8 +29,11 @@ def __getattr__(name: str) -> object:
     module_map = {
         # ._helpers
         "create_gcs_asset_repository": "._helpers.create_gcs_asset_repository",
+        # ._instances
+        "gcs_client_pool": "._instances.gcs_client_pool",
         # ._services
         "GCSAssetRepository": "._services.gcs_asset_repository",
+        "GCSClientPool": "._services.gcs_client_pool",
         # ._settings
         "GCSAssetRepositorySettings": "._settings",
         "settings_manager": "._settings",
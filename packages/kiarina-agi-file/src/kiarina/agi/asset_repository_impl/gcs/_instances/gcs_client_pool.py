@@ -0,0 +1,3 @@
+from .._services.gcs_client_pool import GCSClientPool
+
+gcs_client_pool = GCSClientPool()
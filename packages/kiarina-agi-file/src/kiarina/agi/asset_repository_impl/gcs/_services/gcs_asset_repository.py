@@ -1,17 +1,22 @@
 import asyncio
 import logging
+import os
+import tempfile
+from collections.abc import AsyncIterator
 from datetime import timedelta
+from typing import Any
 from urllib.parse import urlparse
 
 from kiarina.agi.asset_repository import BaseAssetRepository
-from kiarina.lib.google import get_cloud_options
 from kiarina.utils.mime import MIMEBlob, detect_mime_type
 
-from .._settings import GCSAssetRepositorySettings
+from .._instances.gcs_client_pool import gcs_client_pool
+from .._settings import GCSAssetRepositorySettings, settings_manager
 
 try:
+    import google.api_core.exceptions
     import google.cloud.exceptions
-    from google.cloud.storage import Blob, Client  # type: ignore
+    from google.cloud.storage import Blob, Client, transfer_manager  # type: ignore
 except ImportError as exc:
     raise ImportError(
         "google-cloud-storage is required to use GCSAssetRepository. "
@@ -25,19 +30,49 @@ logger = logging.getLogger(__name__)
 class GCSAssetRepository(BaseAssetRepository):
     def __init__(
         self,
-        settings: GCSAssetRepositorySettings,
+        settings: GCSAssetRepositorySettings | None = None,
+        **kwargs: Any,
     ) -> None:
         super().__init__()
-        self.settings: GCSAssetRepositorySettings = settings
-        self._client: Client | None = None
+        self._settings = settings
+        self._settings_kwargs = kwargs
+        self._merged_settings: (
+            tuple[GCSAssetRepositorySettings, GCSAssetRepositorySettings] | None
+        ) = None
+
+        # Invalid overrides fail here rather than on first use
+        if settings is None and kwargs:
+            self._merge_settings(settings_manager.get_settings())
 
     @property
-    def client(self) -> Client:
-        if self._client is None:
-            options = get_cloud_options(self.settings.google_auth_settings_key)
-            self._client = Client(**options)
+    def settings(self) -> GCSAssetRepositorySettings:
+        # Without fixed settings the current ones are read on each use, so a
+        # repository reused by the registry follows settings changes
+        if self._settings is not None:
+            return self._settings
+
+        base = settings_manager.get_settings()
+
+        if not self._settings_kwargs:
+            return base
 
-        return self._client
+        if self._merged_settings is not None and self._merged_settings[0] is base:
+            return self._merged_settings[1]
+
+        return self._merge_settings(base)
+
+    def _merge_settings(
+        self, base: GCSAssetRepositorySettings
+    ) -> GCSAssetRepositorySettings:
+        merged = GCSAssetRepositorySettings.model_validate(
+            {**base.model_dump(), **self._settings_kwargs}
+        )
+        self._merged_settings = (base, merged)
+        return merged
+
+    @property
+    def client(self) -> Client:
+        return gcs_client_pool.get(self.settings.google_auth_settings_key)
 
     async def _exists(self, uri: str) -> bool:
         blob = self._get_blob(uri)
@@ -80,6 +115,119 @@ class GCSAssetRepository(BaseAssetRepository):
             expiration=timedelta(seconds=expire_seconds),
         )
 
+    async def _get_range(self, uri: str, start: int, end: int | None) -> bytes | None:
+        blob = self._get_blob(uri)
+
+        try:
+            return await asyncio.to_thread(_download_range, blob, start, end)
+        except google.cloud.exceptions.NotFound:
+            return None
+
+    async def _iter_chunks(self, uri: str, *, chunk_size: int) -> AsyncIterator[bytes]:
+        blob = self._get_blob(uri)
+
+        try:
+            await asyncio.to_thread(blob.reload)
+        except google.cloud.exceptions.NotFound as e:
+            raise FileNotFoundError(f"Asset not found: {uri}") from e
+
+        size: int = blob.size or 0
+        generation: int | None = blob.generation
+        next_read: asyncio.Future[bytes] | None = None
+
+        def _read(offset: int) -> asyncio.Future[bytes]:
+            # Pinned to the generation read above, so a concurrent overwrite
+            # fails the stream instead of mixing two versions of the asset
+            return asyncio.ensure_future(
+                asyncio.to_thread(
+                    _download_range,
+                    blob,
+                    offset,
+                    min(offset + chunk_size, size),
+                    if_generation_match=generation,
+                )
+            )
+
+        try:
+            for offset in range(0, size, chunk_size):
+                read = next_read or _read(offset)
+
+                # The next chunk is downloaded while the caller consumes this one
+                next_offset = offset + chunk_size
+                next_read = _read(next_offset) if next_offset < size else None
+
+                yield await read
+        finally:
+            if next_read is not None:
+                next_read.cancel()
+
+    async def _download_to_file(self, uri: str, file_path: str) -> bool:
+        blob = self._get_blob(uri)
+
+        try:
+            await asyncio.to_thread(self._download_to_file_sync, blob, file_path)
+        except google.cloud.exceptions.NotFound:
+            return False
+
+        return True
+
+    async def _upload_from_file(self, uri: str, file_path: str, mime_type: str) -> None:
+        blob = self._get_blob(uri)
+        await asyncio.to_thread(self._upload_from_file_sync, blob, file_path, mime_type)
+
+    def _download_to_file_sync(self, blob: Blob, file_path: str) -> None:
+        # The size and generation select the transfer and pin every slice
+        blob.reload()
+
+        if dir_path := os.path.dirname(file_path):
+            os.makedirs(dir_path, exist_ok=True)
+
+        fd, temp_file_path = tempfile.mkstemp(
+            dir=dir_path or None,
+            prefix=".download_",
+            suffix=".tmp",
+        )
+        os.close(fd)
+
+        try:
+            if (blob.size or 0) >= self.settings.parallel_threshold:
+                transfer_manager.download_chunks_concurrently(
+                    blob,
+                    temp_file_path,
+                    chunk_size=self.settings.parallel_chunk_size,
+                    worker_type=transfer_manager.THREAD,
+                    max_workers=self.settings.max_workers,
+                )
+            else:
+                blob.download_to_filename(
+                    temp_file_path, if_generation_match=blob.generation
+                )
+
+            os.replace(temp_file_path, file_path)
+
+        except Exception:
+            if os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
+
+            raise
+
+    def _upload_from_file_sync(
+        self, blob: Blob, file_path: str, mime_type: str
+    ) -> None:
+        if os.path.getsize(file_path) >= self.settings.parallel_threshold:
+            # XML API multipart upload, with the parts sent in parallel
+            transfer_manager.upload_chunks_concurrently(
+                file_path,
+                blob,
+                content_type=mime_type,
+                chunk_size=self.settings.parallel_chunk_size,
+                worker_type=transfer_manager.THREAD,
+                max_workers=self.settings.max_workers,
+            )
+        else:
+            # Resumable upload read from the file, for files above 8 MiB
+            blob.upload_from_filename(file_path, content_type=mime_type)
+
     def _get_blob(self, uri: str) -> Blob:
         parsed = urlparse(uri)
 
@@ -91,3 +239,24 @@ class GCSAssetRepository(BaseAssetRepository):
 
         bucket = self.client.bucket(bucket_name)
         return bucket.blob(blob_name)
+
+
+def _download_range(
+    blob: Blob,
+    start: int,
+    end: int | None,
+    *,
+    if_generation_match: int | None = None,
+) -> bytes:
+    # The end of a GCS range is inclusive
+    try:
+        raw_data: bytes = blob.download_as_bytes(
+            start=start,
+            end=None if end is None else end - 1,
+            if_generation_match=if_generation_match,
+        )
+    except google.api_core.exceptions.RequestRangeNotSatisfiable:
+        # The range starts at or past the end of the asset
+        return b""
+
+    return raw_data
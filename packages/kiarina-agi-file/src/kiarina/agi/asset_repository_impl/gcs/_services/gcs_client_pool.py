@@ -0,0 +1,44 @@
+import threading
+
+from kiarina.lib.google import get_cloud_options
+
+try:
+    from google.cloud.storage import Client  # type: ignore
+except ImportError as exc:
+    raise ImportError(
+        "google-cloud-storage is required to use GCSClientPool. "
+        "Install it with: "
+        "pip install 'kiarina-agi-file[asset-repository-gcs]'"
+    ) from exc
+
+
+class GCSClientPool:
+    """
+    One storage client per Google auth settings key, shared by every repository.
+
+    Clients keep their own HTTP connection pool and credentials, so sharing
+    them avoids a new handshake and token refresh for each repository.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[str | None, Client] = {}
+        self._lock = threading.Lock()
+
+    def get(self, google_auth_settings_key: str | None) -> Client:
+        with self._lock:
+            if (client := self._clients.get(google_auth_settings_key)) is None:
+                options = get_cloud_options(google_auth_settings_key)
+                client = self._clients[google_auth_settings_key] = Client(**options)
+
+        return client
+
+    def close(self) -> None:
+        """
+        Close all clients, for application shutdown or after a settings change.
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+
+        for client in clients:
+            client.close()
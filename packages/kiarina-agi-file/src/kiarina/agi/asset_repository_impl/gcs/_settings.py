@@ -17,5 +17,26 @@ class GCSAssetRepositorySettings(BaseSettings):
         description="Key used to resolve Google authentication settings.",
     )
 
+    parallel_threshold: int = Field(
+        default=64 * 1024 * 1024,
+        title="Parallel Threshold",
+        description=(
+            "Size in bytes from which file downloads and uploads are split "
+            "into slices transferred in parallel."
+        ),
+    )
+
+    parallel_chunk_size: int = Field(
+        default=32 * 1024 * 1024,
+        title="Parallel Chunk Size",
+        description="Size in bytes of each slice of a parallel transfer.",
+    )
+
+    max_workers: int = Field(
+        default=8,
+        title="Max Workers",
+        description="Maximum number of threads of a parallel transfer.",
+    )
+
 
 settings_manager = SettingsManager(GCSAssetRepositorySettings)
@@ -1,7 +1,14 @@
+import asyncio
+from collections.abc import AsyncIterator
 from urllib.parse import urlparse
 
+import kiarina.utils.file.asyncio as kfa
 from kiarina.agi.asset_repository import BaseAssetRepository
-from kiarina.agi.local_repository import LocalRepository, create_local_repository
+from kiarina.agi.local_repository import (
+    LocalRepository,
+    create_local_repository,
+    resolve_file_path,
+)
 from kiarina.utils.app import user_directory
 from kiarina.utils.mime import MIMEBlob
 
@@ -36,3 +43,52 @@ class LocalAssetRepository(BaseAssetRepository):
 
     async def _generate_download_url(self, uri: str, *, expire_seconds: int) -> str:
         return f"file://{urlparse(uri).path}"
+
+    async def _get_range(self, uri: str, start: int, end: int | None) -> bytes | None:
+        file_path = self._resolve_file_path(uri)
+
+        try:
+            return await asyncio.to_thread(_read_range, file_path, start, end)
+        except (FileNotFoundError, IsADirectoryError):
+            return None
+
+    async def _iter_chunks(self, uri: str, *, chunk_size: int) -> AsyncIterator[bytes]:
+        file_path = self._resolve_file_path(uri)
+
+        try:
+            stream = await asyncio.to_thread(open, file_path, "rb")
+        except IsADirectoryError as e:
+            raise FileNotFoundError(f"Asset not found: {uri}") from e
+
+        try:
+            while chunk := await asyncio.to_thread(stream.read, chunk_size):
+                yield chunk
+        finally:
+            stream.close()
+
+    async def _download_to_file(self, uri: str, file_path: str) -> bool:
+        source_path = self._resolve_file_path(uri)
+
+        if (file_blob := await kfa.read_lazy_file(source_path)) is None:
+            return False
+
+        # Streamed into a temporary file that replaces the target
+        await kfa.write_file(file_blob, file_path)
+        return True
+
+    async def _upload_from_file(self, uri: str, file_path: str, mime_type: str) -> None:
+        if (file_blob := await kfa.read_lazy_file(file_path)) is None:
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        await kfa.write_file(file_blob, self._resolve_file_path(uri))
+
+    def _resolve_file_path(self, uri: str) -> str:
+        file_path = resolve_file_path(uri)
+        self.local_repository.validate_file_path(file_path)
+        return file_path
+
+
+def _read_range(file_path: str, start: int, end: int | None) -> bytes:
+    with open(file_path, "rb") as stream:
+        stream.seek(start)
+        return stream.read(-1 if end is None else end - start)
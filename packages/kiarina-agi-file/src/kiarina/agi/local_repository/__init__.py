@@ -3,15 +3,19 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ._helpers.create_local_repository import create_local_repository
+    from ._models.compiled_file_path_policy import CompiledFilePathPolicy
     from ._schemas.file_path_policy import FilePathPolicy
     from ._services.local_repository import LocalRepository
     from ._settings import LocalRepositorySettings, settings_manager
     from ._types.local_area import LocalArea
+    from ._utils.compile_patterns import compile_patterns
     from ._utils.resolve_file_path import resolve_file_path
 
 __all__ = [
     # ._helpers
     "create_local_repository",
+    # ._models
+    "CompiledFilePathPolicy",
     # ._services
     "LocalRepository",
     # ._schemas
@@ -22,6 +26,7 @@ __all__ = [
     # ._types
     "LocalArea",
     # ._utils
+    "compile_patterns",
     "resolve_file_path",
 ]
 
@@ -33,6 +38,8 @@ def __getattr__(name: str) -> object:
     module_map = {
         # ._helpers
         "create_local_repository": "._helpers.create_local_repository",
+        # ._models
+        "CompiledFilePathPolicy": "._models.compiled_file_path_policy",
         # ._services
         "LocalRepository": "._services.local_repository",
         # ._schemas
@@ -43,6 +50,7 @@ def __getattr__(name: str) -> object:
         # ._types
         "LocalArea": "._types.local_area",
         # ._utils
+        "compile_patterns": "._utils.compile_patterns",
         "resolve_file_path": "._utils.resolve_file_path",
     }
 
@@ -0,0 +1,59 @@
+import os
+from collections.abc import Mapping
+from functools import cached_property
+from pathlib import Path
+
+from .._schemas.file_path_policy import FilePathPolicy
+from .._utils.compile_patterns import compile_patterns
+from .._utils.resolve_file_path import resolve_file_path
+
+
+class CompiledFilePathPolicy:
+    """
+    File path policy with its templates expanded and its patterns compiled once.
+
+    The allowed patterns are combined into a single alternation, and the
+    repository directories are resolved once, so checking a path resolves
+    only the path itself.
+    """
+
+    def __init__(
+        self,
+        file_path_policy: FilePathPolicy,
+        template_variables: Mapping[str, str],
+    ) -> None:
+        self.file_path_policy: FilePathPolicy = file_path_policy
+        self.template_variables: dict[str, str] = dict(template_variables)
+        self._patterns = compile_patterns(
+            file_path_policy.allowed_file_path_patterns, template_variables
+        )
+
+    @cached_property
+    def data_dir(self) -> str:
+        return self.file_path_policy.data_dir_path_template.format(
+            **self.template_variables
+        )
+
+    @cached_property
+    def cache_dir(self) -> str:
+        return self.file_path_policy.cache_dir_path_template.format(
+            **self.template_variables
+        )
+
+    @cached_property
+    def repository_dirs(self) -> list[Path]:
+        return [Path(self.data_dir).resolve(), Path(self.cache_dir).resolve()]
+
+    def is_valid_file_path(self, file_path: str | os.PathLike[str]) -> bool:
+        file_path = resolve_file_path(file_path)
+
+        if self.file_path_policy.restrict_to_repository_dirs:
+            resolved_path = Path(file_path).resolve()
+
+            if not any(
+                resolved_path.is_relative_to(directory)
+                for directory in self.repository_dirs
+            ):
+                return False
+
+        return any(pattern.match(file_path) for pattern in self._patterns)
@@ -1,6 +1,8 @@
 import logging
 import os
-import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
 from datetime import datetime
 
 import kiarina.utils.file.asyncio as kfa
@@ -8,14 +10,28 @@ from kiarina.agi.run_context import RunContext
 from kiarina.utils.app import user_directory
 from kiarina.utils.file import FileBlob
 
+from .._models.compiled_file_path_policy import CompiledFilePathPolicy
 from .._schemas.file_path_policy import FilePathPolicy
 from .._settings import LocalRepositorySettings
 from .._types.local_area import LocalArea
-from .._utils.is_path_within_directories import is_path_within_directories
 from .._utils.resolve_file_path import resolve_file_path
 
 logger = logging.getLogger(__name__)
 
+COMPILED_FILE_PATH_POLICY_CACHE_SIZE = 128
+
+# Repositories are created per call, so compiled policies are shared by the
+# values of the policy and its template variables. Keying by value rather than
+# identity keeps an access check from using a policy compiled for a run context
+# or policy that has since been changed in place.
+_CompiledFilePathPolicyKey = tuple[
+    tuple[bool, tuple[str, ...], str, str], tuple[tuple[str, str], ...]
+]
+_compiled_file_path_policies: OrderedDict[
+    _CompiledFilePathPolicyKey, CompiledFilePathPolicy
+] = OrderedDict()
+_compiled_file_path_policies_lock = threading.Lock()
+
 
 class LocalRepository:
     def __init__(self, settings: LocalRepositorySettings, *, run_context: RunContext):
@@ -37,16 +53,42 @@ class LocalRepository:
         return self.settings.file_path_policy
 
     @property
-    def data_dir(self) -> str:
-        return self.file_path_policy.data_dir_path_template.format(
-            **self.template_variables
+    def compiled_file_path_policy(self) -> CompiledFilePathPolicy:
+        """
+        File path policy compiled once per policy and template variables.
+        """
+        file_path_policy = self.file_path_policy
+        template_variables = self.template_variables
+        key = _get_cache_key(file_path_policy, template_variables)
+
+        with _compiled_file_path_policies_lock:
+            if (compiled := _compiled_file_path_policies.get(key)) is not None:
+                _compiled_file_path_policies.move_to_end(key)
+                return compiled
+
+        # Compile a copy so that later changes to the settings cannot leak into
+        # a cached entry shared with other repositories
+        compiled = CompiledFilePathPolicy(
+            file_path_policy.model_copy(deep=True), template_variables
         )
 
+        with _compiled_file_path_policies_lock:
+            _compiled_file_path_policies[key] = compiled
+
+            while (
+                len(_compiled_file_path_policies) > COMPILED_FILE_PATH_POLICY_CACHE_SIZE
+            ):
+                _compiled_file_path_policies.popitem(last=False)
+
+        return compiled
+
+    @property
+    def data_dir(self) -> str:
+        return self.compiled_file_path_policy.data_dir
+
     @property
     def cache_dir(self) -> str:
-        return self.file_path_policy.cache_dir_path_template.format(
-            **self.template_variables
-        )
+        return self.compiled_file_path_policy.cache_dir
 
     # ----------------------------------------
     # Methods (File Path)
@@ -97,29 +139,13 @@ class LocalRepository:
         return os.path.join(dir_path, file_name)
 
     def is_valid_file_path(self, file_path: str | os.PathLike[str]) -> bool:
-        file_path = resolve_file_path(file_path)
+        return self.compiled_file_path_policy.is_valid_file_path(file_path)
 
-        if self.file_path_policy.restrict_to_repository_dirs:
-            if not is_path_within_directories(
-                file_path,
-                [self.data_dir, self.cache_dir],
-            ):
-                return False
-
-        for pattern in self.settings.file_path_policy.allowed_file_path_patterns:
-            file_path_pattern = pattern.format(**self.template_variables)
-
-            try:
-                if re.match(f"^{file_path_pattern}$", file_path):
-                    return True
-
-            except re.error as e:
-                logger.error(
-                    f"Invalid regex pattern: {file_path_pattern}, error: {e!s}"
-                )
-                continue
-
-        return False
+    def is_valid_file_paths(
+        self, file_paths: Iterable[str | os.PathLike[str]]
+    ) -> list[bool]:
+        is_valid_file_path = self.compiled_file_path_policy.is_valid_file_path
+        return [is_valid_file_path(file_path) for file_path in file_paths]
 
     def validate_file_path(self, file_path: str | os.PathLike[str]) -> None:
         if not self.is_valid_file_path(file_path):
@@ -127,6 +153,20 @@ class LocalRepository:
                 f"Access to the file path is not allowed: {file_path}"
             )
 
+    def validate_file_paths(self, file_paths: Iterable[str | os.PathLike[str]]) -> None:
+        file_paths = list(file_paths)
+
+        if denied := [
+            os.fspath(file_path)
+            for file_path, is_valid in zip(
+                file_paths, self.is_valid_file_paths(file_paths), strict=True
+            )
+            if not is_valid
+        ]:
+            raise PermissionError(
+                f"Access to the file paths is not allowed: {', '.join(denied)}"
+            )
+
     # ----------------------------------------
     # Methods (File Access)
     # ----------------------------------------
@@ -182,3 +222,17 @@ class LocalRepository:
         file_path = resolve_file_path(file_path)
         self.validate_file_path(file_path)
         return file_path
+
+
+def _get_cache_key(
+    file_path_policy: FilePathPolicy, template_variables: dict[str, str]
+) -> _CompiledFilePathPolicyKey:
+    return (
+        (
+            file_path_policy.restrict_to_repository_dirs,
+            tuple(file_path_policy.allowed_file_path_patterns),
+            file_path_policy.data_dir_path_template,
+            file_path_policy.cache_dir_path_template,
+        ),
+        tuple(sorted(template_variables.items())),
+    )
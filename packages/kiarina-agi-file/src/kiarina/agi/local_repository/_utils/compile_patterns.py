@@ -0,0 +1,38 @@
+import logging
+import re
+from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+
+def compile_patterns(
+    patterns: list[str], template_variables: Mapping[str, str]
+) -> list[re.Pattern[str]]:
+    """
+    Expand the templates of full-match patterns and compile them, combined
+    into one alternation where possible.
+
+    Invalid patterns are logged and skipped.
+    """
+    sources: list[str] = []
+
+    for pattern in patterns:
+        source = pattern.format(**template_variables)
+
+        try:
+            re.compile(source)
+        except re.error as e:
+            logger.error(f"Invalid regex pattern: {source}, error: {e!s}")
+            continue
+
+        sources.append(source)
+
+    # Numbered backreferences would refer to another group once combined
+    if len(sources) > 1 and not any(re.search(r"\\\d", s) for s in sources):
+        try:
+            return [re.compile("^(?:" + "|".join(f"(?:{s})" for s in sources) + ")$")]
+        except re.error:
+            # Group names repeated across patterns cannot be combined
+            pass
+
+    return [re.compile(f"^{source}$") for source in sources]
@@ -1,10 +1,18 @@
 import asyncio
+import os
+import time
 from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
-from kiarina.agi.asset_cache import create_asset_cache, settings_manager
+from kiarina.agi.asset_cache import (
+    asset_cache_metrics,
+    asset_cache_sweeper,
+    asset_memory_cache,
+    create_asset_cache,
+    settings_manager,
+)
 from kiarina.agi.run_context import RunContext
 
 
@@ -12,6 +20,7 @@ from kiarina.agi.run_context import RunContext
 def setup() -> Iterator[None]:
     settings_manager.cli_args = {
         "cache_ttl": 1,
+        "sweep_interval": 0,
     }
     yield
     settings_manager.cli_args = {}
@@ -50,3 +59,69 @@ async def test_uri(uri: str, run_context: RunContext, tmp_path: Path) -> None:
 
     # delete: exists
     await asset_cache.delete(uri)
+
+
+async def test_tiers(run_context: RunContext) -> None:
+    uri = "https://example.com/image.png"
+    asset_cache = create_asset_cache(run_context)
+    await asset_cache.delete(uri)
+
+    stats = asset_cache_metrics.stats()
+    assert await asset_cache.get(uri) is None
+    assert asset_cache_metrics.stats().misses == stats.misses + 1
+
+    file_blob = await asset_cache.set(uri, "image/png", b"png")
+    assert Path(file_blob.file_path).read_bytes() == b"png"
+
+    # memory
+    stats = asset_cache_metrics.stats()
+    assert await asset_cache.get(uri) is file_blob
+    assert asset_cache_metrics.stats().memory_hits == stats.memory_hits + 1
+
+    # disk
+    asset_memory_cache.clear()
+    stats = asset_cache_metrics.stats()
+    cached_file_blob = await asset_cache.get(uri)
+    assert cached_file_blob is not None
+    assert cached_file_blob.mime_type == "image/png"
+    assert cached_file_blob.raw_data == b"png"
+    assert asset_cache_metrics.stats().disk_hits == stats.disk_hits + 1
+
+    # replaced with another MIME type
+    file_blob = await asset_cache.set(uri, "text/plain", b"text")
+    assert os.listdir(os.path.dirname(file_blob.file_path)) == [
+        "raw_data.text%2Fplain.txt"
+    ]
+
+    # The MIME type passed to set() is kept as is
+    await asset_cache.set(uri, "text/xml", b"<a/>")
+    asset_memory_cache.clear()
+    cached_file_blob = await asset_cache.get(uri)
+    assert cached_file_blob is not None
+    assert cached_file_blob.mime_type == "text/xml"
+
+    # MIME types without a known extension are not served
+    await asset_cache.set(uri, "application/x-unknown", b"data")
+    asset_memory_cache.clear()
+    assert await asset_cache.get(uri) is None
+
+    await asset_cache.delete(uri)
+    assert await asset_cache.get(uri) is None
+
+
+async def test_memory_hits_count_as_use(run_context: RunContext) -> None:
+    asset_cache = create_asset_cache(run_context)
+    file_blob_a = await asset_cache.set("https://example.com/a.txt", "text/plain", b"a")
+    file_blob_b = await asset_cache.set("https://example.com/b.txt", "text/plain", b"b")
+
+    # A was last read from disk before B was cached
+    entry_dir_a = os.path.dirname(file_blob_a.file_path)
+    used_at = time.time() - 10
+    os.utime(entry_dir_a, (used_at, used_at))
+
+    await asyncio.sleep(0.01)
+    assert await asset_cache.get("https://example.com/a.txt") is file_blob_a
+
+    asset_cache_sweeper.sweep(asset_cache.cache_dir, ttl=60, max_size=1)
+    assert os.path.exists(file_blob_a.file_path)
+    assert not os.path.exists(file_blob_b.file_path)
@@ -0,0 +1,56 @@
+import os
+import time
+from pathlib import Path
+
+from kiarina.agi.asset_cache import (
+    AssetCacheMetrics,
+    AssetCacheSweeper,
+    AssetMemoryCache,
+)
+from kiarina.utils.file import FileBlob
+
+
+def create_entry(cache_dir: Path, name: str, size: int, age: float) -> str:
+    entry_dir = cache_dir / name
+    entry_dir.mkdir()
+    (entry_dir / "raw_data.bin").write_bytes(b"x" * size)
+
+    timestamp = time.time() - age
+    os.utime(entry_dir / "raw_data.bin", (timestamp, timestamp))
+    os.utime(entry_dir, (timestamp, timestamp))
+    return str(entry_dir)
+
+
+def test_sweep(tmp_path: Path) -> None:
+    metrics = AssetCacheMetrics()
+    memory_cache = AssetMemoryCache(metrics)
+    sweeper = AssetCacheSweeper(metrics, memory_cache)
+
+    expired = create_entry(tmp_path, "expired", 1, 100)
+    oldest = create_entry(tmp_path, "oldest", 4, 30)
+    older = create_entry(tmp_path, "older", 4, 20)
+    newest = create_entry(tmp_path, "newest", 4, 10)
+
+    memory_cache.set(
+        oldest,
+        FileBlob(oldest, mime_type="application/octet-stream", raw_data=b"x"),
+        timestamp=time.time(),
+        max_size=100,
+        max_entry_size=100,
+    )
+
+    assert sweeper.sweep(str(tmp_path), ttl=60, max_size=8) == 2
+    assert sorted(os.listdir(tmp_path)) == ["newest", "older"]
+    assert not os.path.exists(expired)
+    assert os.path.exists(older) and os.path.exists(newest)
+    assert memory_cache.get(oldest, ttl=60) is None
+    assert metrics.stats().disk_evictions == 2
+
+
+def test_schedule(tmp_path: Path) -> None:
+    metrics = AssetCacheMetrics()
+    sweeper = AssetCacheSweeper(metrics, AssetMemoryCache(metrics))
+
+    assert not sweeper.schedule(str(tmp_path), ttl=60, max_size=0, interval=0)
+    assert sweeper.schedule(str(tmp_path), ttl=60, max_size=0, interval=60)
+    assert not sweeper.schedule(str(tmp_path), ttl=60, max_size=0, interval=60)
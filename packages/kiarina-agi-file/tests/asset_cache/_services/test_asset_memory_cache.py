@@ -0,0 +1,36 @@
+from kiarina.agi.asset_cache import AssetCacheMetrics, AssetMemoryCache
+from kiarina.utils.file import FileBlob
+
+
+def create_file_blob(size: int) -> FileBlob:
+    return FileBlob(
+        "/tmp/raw_data.bin", mime_type="application/octet-stream", raw_data=b"x" * size
+    )
+
+
+def test_asset_memory_cache() -> None:
+    metrics = AssetCacheMetrics()
+    memory_cache = AssetMemoryCache(metrics)
+    options = {"max_size": 10, "max_entry_size": 6}
+
+    memory_cache.set("a", create_file_blob(4), timestamp=0, **options)
+    memory_cache.set("b", create_file_blob(4), timestamp=0, **options)
+    assert memory_cache.size == 8
+
+    # a is used, so b is evicted
+    assert memory_cache.get("a", ttl=float("inf")) is not None
+    memory_cache.set("c", create_file_blob(4), timestamp=0, **options)
+    assert memory_cache.get("b", ttl=float("inf")) is None
+    assert memory_cache.size == 8
+    assert metrics.stats().memory_evictions == 1
+
+    # too large
+    memory_cache.set("d", create_file_blob(7), timestamp=0, **options)
+    assert memory_cache.get("d", ttl=float("inf")) is None
+
+    # expired
+    assert memory_cache.get("a", ttl=1) is None
+    assert len(memory_cache) == 1
+
+    memory_cache.delete("c")
+    assert memory_cache.size == 0
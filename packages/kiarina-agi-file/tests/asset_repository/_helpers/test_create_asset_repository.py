@@ -1,6 +1,39 @@
-from kiarina.agi.asset_repository import create_asset_repository
+from kiarina.agi.asset_repository import (
+    asset_repository_registry,
+    create_asset_repository,
+    settings_manager,
+)
 from kiarina.agi.run_context import RunContext
 
 
 def test_create_asset_repository(run_context: RunContext) -> None:
     create_asset_repository(run_context)
+
+
+def test_create_asset_repository_instance_cache(run_context: RunContext) -> None:
+    asset_repository = create_asset_repository(run_context)
+    assert create_asset_repository(run_context) is asset_repository
+
+    other_run_context = run_context.model_copy(update={"node_id": "other"})
+    assert create_asset_repository(other_run_context) is not asset_repository
+
+    asset_repository_registry.clear_instances()
+    assert create_asset_repository(run_context) is not asset_repository
+
+    # Changed settings bring a new URI policy and a new instance
+    asset_repository = create_asset_repository(run_context)
+    settings_manager.cli_args = {"default": "local"}
+
+    try:
+        assert create_asset_repository(run_context) is not asset_repository
+    finally:
+        settings_manager.cli_args = {}
+
+    settings_manager.cli_args = {"instance_cache_enabled": False}
+
+    try:
+        assert create_asset_repository(run_context) is not create_asset_repository(
+            run_context
+        )
+    finally:
+        settings_manager.cli_args = {}
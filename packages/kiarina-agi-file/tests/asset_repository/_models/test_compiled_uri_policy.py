@@ -0,0 +1,59 @@
+import pytest
+
+from kiarina.agi.asset_repository import CompiledURIPolicy, URIPolicy
+
+TEMPLATE_VARIABLES = {"user_id": "user-1", "agent_id": "agent-1"}
+
+
+def test_compiled_uri_policy() -> None:
+    compiled = CompiledURIPolicy(
+        URIPolicy(
+            allowed_uri_patterns=[
+                "gs://bucket/{user_id}/{agent_id}/data/.*",
+                "gs://bucket/{user_id}/uploads/.*",
+                "gs://bucket/[invalid",
+            ],
+            data_dir_uri_template="gs://bucket/{user_id}/{agent_id}/data",
+        ),
+        TEMPLATE_VARIABLES,
+    )
+
+    assert compiled.data_uri == "gs://bucket/user-1/agent-1/data"
+    assert compiled.is_valid_uri("gs://bucket/user-1/agent-1/data/a.txt")
+    assert compiled.is_valid_uri("gs://bucket/user-1/uploads/a.txt")
+    assert not compiled.is_valid_uri("gs://bucket/user-2/uploads/a.txt")
+    assert not compiled.is_valid_uri("gs://bucket/user-1/uploads/a.txt?generation=1")
+    assert not compiled.is_valid_uri("gs://bucket/user-1/uploads/../a.txt")
+    assert not compiled.is_valid_uri("gs://bucket/user-1/uploads")
+
+    # The directory templates are only expanded when used
+    with pytest.raises(KeyError):
+        _ = compiled.cache_uri
+
+
+@pytest.mark.parametrize(
+    "allowed_uri_patterns",
+    [
+        # Numbered backreferences
+        ["gs://(a)\\1/.*", "gs://(b)\\1/.*"],
+        # Repeated group names
+        ["gs://(?P<name>a)(?P=name)/.*", "gs://(?P<name>b)(?P=name)/.*"],
+    ],
+)
+def test_compiled_uri_policy_uncombinable_patterns(
+    allowed_uri_patterns: list[str],
+) -> None:
+    compiled = CompiledURIPolicy(
+        URIPolicy(allowed_uri_patterns=allowed_uri_patterns), TEMPLATE_VARIABLES
+    )
+
+    assert compiled.is_valid_uri("gs://aa/x")
+    assert compiled.is_valid_uri("gs://bb/x")
+    assert not compiled.is_valid_uri("gs://ab/x")
+
+
+def test_compiled_uri_policy_without_patterns() -> None:
+    compiled = CompiledURIPolicy(URIPolicy(), TEMPLATE_VARIABLES)
+
+    with pytest.raises(ValueError):
+        compiled.is_valid_uri("gs://bucket/a.txt")
@@ -1,15 +1,18 @@
+import pathlib
 from collections.abc import Iterator
 
 import pytest
 
 from kiarina.agi.asset_repository import (
     AssetRepository,
+    BaseAssetRepository,
     URIPolicy,
     create_asset_repository,
     settings_manager,
 )
 from kiarina.agi.asset_repository_impl.local import LocalAssetRepository
 from kiarina.agi.run_context import RunContext
+from kiarina.utils.mime import MIMEBlob
 
 
 @pytest.fixture()
@@ -47,6 +50,35 @@ def test_validate_uri(asset_repository: AssetRepository) -> None:
         asset_repository.validate_uri("~/test.txt")
 
 
+def test_validate_uris(asset_repository: AssetRepository) -> None:
+    uris = [
+        asset_repository.generate_data_uri("a.txt"),
+        asset_repository.generate_cache_uri("b.txt"),
+    ]
+
+    assert asset_repository.is_valid_uris([*uris, "~/c.txt"]) == [True, True, False]
+    asset_repository.validate_uris(uris)
+
+    with pytest.raises(PermissionError, match=r"c\.txt"):
+        asset_repository.validate_uris([*uris, "~/c.txt"])
+
+
+def test_compiled_uri_policy_is_reset(run_context: RunContext) -> None:
+    repository = LocalAssetRepository()
+    repository.uri_policy = URIPolicy(
+        allowed_uri_patterns=["gs://bucket/{agent_id}/.*"],
+        data_dir_uri_template="gs://bucket/{agent_id}",
+    )
+    repository.run_context = run_context
+
+    compiled = repository.compiled_uri_policy
+    assert repository.compiled_uri_policy is compiled
+
+    repository.run_context = run_context.model_copy(update={"agent_id": "other"})
+    assert repository.compiled_uri_policy is not compiled
+    assert repository.data_uri == "gs://bucket/other"
+
+
 def test_generate_uri_rejects_parent_traversal(
     asset_repository: AssetRepository,
 ) -> None:
@@ -113,6 +145,101 @@ async def test_crud(asset_repository: AssetRepository) -> None:
     print("Generated Download URL:", download_url)
 
 
+async def test_streaming(
+    asset_repository: AssetRepository, tmp_path: pathlib.Path
+) -> None:
+    uri = asset_repository.generate_cache_uri("hello/stream.bin")
+    raw_data = bytes(range(256)) * 1024
+
+    # upload_from_file
+    source_path = tmp_path / "source.bin"
+    source_path.write_bytes(raw_data)
+    await asset_repository.upload_from_file(uri, source_path)
+    file_blob = await asset_repository.get(uri, ignore_cache=True)
+    assert file_blob is not None
+    assert file_blob.raw_data == raw_data
+
+    # upload_from_file: the cached copy is dropped
+    source_path.write_bytes(b"updated")
+    await asset_repository.upload_from_file(uri, source_path, mime_type="text/plain")
+    assert await asset_repository.asset_cache.get(uri) is None
+    source_path.write_bytes(raw_data)
+    await asset_repository.upload_from_file(uri, source_path)
+
+    # get_range
+    assert await asset_repository.get_range(uri, 10, 20) == raw_data[10:20]
+    assert await asset_repository.get_range(uri, len(raw_data) - 5) == raw_data[-5:]
+    assert (
+        await asset_repository.get_range(uri, len(raw_data), len(raw_data) + 10) == b""
+    )
+    assert await asset_repository.get_range(uri, 10, 10) == b""
+
+    with pytest.raises(ValueError):
+        await asset_repository.get_range(uri, 20, 10)
+
+    # iter_chunks
+    chunks = [
+        chunk async for chunk in asset_repository.iter_chunks(uri, chunk_size=100_000)
+    ]
+    assert [len(chunk) for chunk in chunks] == [100_000, 100_000, 62_144]
+    assert b"".join(chunks) == raw_data
+
+    # download_to_file
+    target_path = tmp_path / "nested" / "target.bin"
+    assert await asset_repository.download_to_file(uri, target_path)
+    assert target_path.read_bytes() == raw_data
+
+    # not exists
+    await asset_repository.delete(uri)
+    assert await asset_repository.get_range(uri, 0, 10) is None
+    assert await asset_repository.get_range(uri, 0, 0) is None
+    assert not await asset_repository.download_to_file(uri, target_path)
+
+    with pytest.raises(FileNotFoundError):
+        async for _ in asset_repository.iter_chunks(uri):
+            pass
+
+
+class _MemoryAssetRepository(BaseAssetRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.mime_blobs: dict[str, MIMEBlob] = {}
+
+    async def _exists(self, uri: str) -> bool:
+        return uri in self.mime_blobs
+
+    async def _get(self, uri: str) -> MIMEBlob | None:
+        return self.mime_blobs.get(uri)
+
+    async def _set(self, uri: str, mime_type: str, raw_data: bytes) -> None:
+        self.mime_blobs[uri] = MIMEBlob(mime_type, raw_data)
+
+
+async def test_streaming_fallback(
+    run_context: RunContext, tmp_path: pathlib.Path
+) -> None:
+    repository = _MemoryAssetRepository()
+    repository.uri_policy = URIPolicy(allowed_uri_patterns=["memory://.*"])
+    repository.run_context = run_context
+    uri = "memory://assets/test.txt"
+
+    source_path = tmp_path / "source.txt"
+    source_path.write_bytes(b"hello world")
+    await repository.upload_from_file(uri, source_path)
+    assert repository.mime_blobs[uri].mime_type == "text/plain"
+
+    assert await repository.get_range(uri, 6) == b"world"
+    assert [chunk async for chunk in repository.iter_chunks(uri, chunk_size=4)] == [
+        b"hell",
+        b"o wo",
+        b"rld",
+    ]
+
+    target_path = tmp_path / "target.txt"
+    assert await repository.download_to_file(uri, target_path)
+    assert target_path.read_bytes() == b"hello world"
+
+
 def test_repositories_reject_another_run_context_uri(
     run_context: RunContext,
 ) -> None:
@@ -3,7 +3,10 @@ import pathlib
 import pytest
 
 from kiarina.agi.asset_repository import AssetRepository, create_asset_repository
-from kiarina.agi.asset_repository_impl.gcs import GCSAssetRepository
+from kiarina.agi.asset_repository_impl.gcs import (
+    GCSAssetRepository,
+    settings_manager,
+)
 from kiarina.agi.run_context import RunContext
 
 
@@ -64,3 +67,70 @@ async def test_crud(asset_repository: AssetRepository) -> None:
     # generate_download_url
     download_url = await asset_repository.generate_download_url(uri)
     print("Generated Download URL:", download_url)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+async def test_streaming(
+    run_context: RunContext, tmp_path: pathlib.Path, parallel: bool
+) -> None:
+    # Parts of an XML API multipart upload are at least 5 MiB, except the last
+    settings_manager.cli_args = {
+        "parallel_threshold": 0 if parallel else 64 * 1024 * 1024,
+        "parallel_chunk_size": 5 * 1024 * 1024,
+    }
+
+    # The repository reads the settings on use, so they are kept until the end
+    try:
+        asset_repository = create_asset_repository(run_context)
+
+        uri = asset_repository.generate_cache_uri("hello/stream.bin")
+        raw_data = bytes(range(256)) * 4096 * 6
+
+        source_path = tmp_path / "source.bin"
+        source_path.write_bytes(raw_data)
+        await asset_repository.upload_from_file(uri, source_path)
+
+        assert await asset_repository.get_range(uri, 10, 20) == raw_data[10:20]
+        assert await asset_repository.get_range(uri, len(raw_data)) == b""
+
+        chunks = [
+            chunk
+            async for chunk in asset_repository.iter_chunks(
+                uri, chunk_size=4 * 1024 * 1024
+            )
+        ]
+        assert b"".join(chunks) == raw_data
+
+        target_path = tmp_path / "target.bin"
+        assert await asset_repository.download_to_file(uri, target_path)
+        assert target_path.read_bytes() == raw_data
+
+        await asset_repository.delete(uri)
+        assert await asset_repository.get_range(uri, 0, 10) is None
+        assert not await asset_repository.download_to_file(uri, target_path)
+    finally:
+        settings_manager.cli_args = {}
+
+
+def test_client_is_shared(run_context: RunContext) -> None:
+    asset_repository = create_asset_repository(run_context)
+    other_run_context = run_context.model_copy(update={"node_id": "other"})
+    other_asset_repository = create_asset_repository(other_run_context)
+
+    assert isinstance(asset_repository, GCSAssetRepository)
+    assert isinstance(other_asset_repository, GCSAssetRepository)
+    assert asset_repository is not other_asset_repository
+    assert asset_repository.client is other_asset_repository.client
+
+
+def test_settings_follow_changes() -> None:
+    asset_repository = GCSAssetRepository(max_workers=2)
+    settings_manager.cli_args = {"parallel_threshold": 1}
+
+    try:
+        assert asset_repository.settings.parallel_threshold == 1
+        assert asset_repository.settings.max_workers == 2
+    finally:
+        settings_manager.cli_args = {}
+
+    assert asset_repository.settings.parallel_threshold == 64 * 1024 * 1024
@@ -0,0 +1,31 @@
+import os
+
+from kiarina.agi.local_repository import CompiledFilePathPolicy, FilePathPolicy
+
+
+def test_compiled_file_path_policy(tmp_path: os.PathLike[str]) -> None:
+    base_dir = os.fspath(tmp_path)
+    compiled = CompiledFilePathPolicy(
+        FilePathPolicy(
+            restrict_to_repository_dirs=True,
+            allowed_file_path_patterns=[
+                "{base_dir}/data/{agent_id}/.*",
+                "{base_dir}/cache/{agent_id}/.*",
+                "{base_dir}/[invalid",
+            ],
+            data_dir_path_template="{base_dir}/data/{agent_id}",
+            cache_dir_path_template="{base_dir}/cache/{agent_id}",
+        ),
+        {"base_dir": base_dir, "agent_id": "agent-1"},
+    )
+
+    assert compiled.data_dir == f"{base_dir}/data/agent-1"
+    assert compiled.is_valid_file_path(f"{base_dir}/data/agent-1/a.txt")
+    assert compiled.is_valid_file_path(f"{base_dir}/cache/agent-1/a/b.txt")
+    assert not compiled.is_valid_file_path(f"{base_dir}/data/agent-2/a.txt")
+    assert not compiled.is_valid_file_path(f"{base_dir}/data/agent-1/../a.txt")
+
+    # Symlinks out of the repository directories are rejected
+    os.makedirs(compiled.data_dir)
+    os.symlink(base_dir, os.path.join(compiled.data_dir, "outside"))
+    assert not compiled.is_valid_file_path(f"{compiled.data_dir}/outside/a.txt")
@@ -47,6 +47,66 @@ def test_validate_file_path(local_repository: LocalRepository) -> None:
         local_repository.validate_file_path("~/test.txt")
 
 
+def test_validate_file_paths(local_repository: LocalRepository) -> None:
+    file_paths = [
+        local_repository.generate_data_path("a.txt"),
+        local_repository.generate_cache_path("b.txt"),
+    ]
+
+    assert local_repository.is_valid_file_paths([*file_paths, "~/c.txt"]) == [
+        True,
+        True,
+        False,
+    ]
+    local_repository.validate_file_paths(file_paths)
+
+    with pytest.raises(PermissionError, match=r"c\.txt"):
+        local_repository.validate_file_paths([*file_paths, "~/c.txt"])
+
+
+def test_compiled_file_path_policy_is_shared(
+    local_repository: LocalRepository, run_context: RunContext
+) -> None:
+    compiled = local_repository.compiled_file_path_policy
+
+    assert create_local_repository(run_context).compiled_file_path_policy is compiled
+
+    other_run_context = run_context.model_copy(update={"agent_id": "other"})
+    other_compiled = create_local_repository(
+        other_run_context
+    ).compiled_file_path_policy
+    assert other_compiled is not compiled
+    assert other_compiled.data_dir != compiled.data_dir
+
+    # Equal values share the compiled policy regardless of identity
+    same_run_context = run_context.model_copy()
+    assert create_local_repository(same_run_context).compiled_file_path_policy is (
+        compiled
+    )
+
+
+def test_compiled_file_path_policy_follows_in_place_changes(
+    local_repository: LocalRepository,
+) -> None:
+    compiled = local_repository.compiled_file_path_policy
+
+    local_repository.run_context.agent_id = "changed"
+    changed = local_repository.compiled_file_path_policy
+    assert changed is not compiled
+    assert changed.data_dir.endswith("changed")
+
+    file_path_policy = local_repository.file_path_policy
+    restrict_to_repository_dirs = file_path_policy.restrict_to_repository_dirs
+    file_path_policy.restrict_to_repository_dirs = not restrict_to_repository_dirs
+    try:
+        assert local_repository.compiled_file_path_policy is not changed
+        assert changed.file_path_policy.restrict_to_repository_dirs is (
+            restrict_to_repository_dirs
+        )
+    finally:
+        file_path_policy.restrict_to_repository_dirs = restrict_to_repository_dirs
+
+
 def test_generate_path_rejects_parent_traversal(
     local_repository: LocalRepository,
 ) -> None:
@@ -0,0 +1,32 @@
+import pytest
+
+from kiarina.agi.local_repository import compile_patterns
+
+
+def test_compile_patterns() -> None:
+    patterns = compile_patterns(["{root}/a/.*", "{root}/b/.*", "("], {"root": "/x"})
+
+    assert len(patterns) == 1
+    assert patterns[0].match("/x/a/1")
+    assert patterns[0].match("/x/b/1")
+    assert not patterns[0].match("/x/c/1")
+    assert not patterns[0].match("/y/x/a/1")
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        pytest.param(["(a)\\1/.*", "(b)\\1/.*"], id="1. numbered backreferences"),
+        pytest.param(
+            ["(?P<name>a)(?P=name)/.*", "(?P<name>b)(?P=name)/.*"],
+            id="2. repeated group names",
+        ),
+    ],
+)
+def test_compile_patterns_uncombinable(patterns: list[str]) -> None:
+    compiled = compile_patterns(patterns, {})
+
+    assert len(compiled) == 2
+    assert any(pattern.match("aa/x") for pattern in compiled)
+    assert any(pattern.match("bb/x") for pattern in compiled)
+    assert not any(pattern.match("ab/x") for pattern in compiled)
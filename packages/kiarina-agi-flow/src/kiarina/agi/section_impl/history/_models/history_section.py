@@ -1,7 +1,7 @@
 from collections.abc import AsyncIterator
 
 from kiarina.agi.event import Event
-from kiarina.agi.file_info import shrink_file_infos
+from kiarina.agi.file_info import FileInfo, shrink_file_infos
 from kiarina.agi.file_info_pool import FileInfoPool
 from kiarina.agi.message import Message, hydrate_messages
 from kiarina.agi.section import BaseSection
@@ -21,11 +21,11 @@ class HistorySection(BaseSection):
         self.reserve_per_file: TokenCount = reserve_per_file
 
         self.messages: list[Message] = []
-        self.pool: FileInfoPool = []
+        self.pool: list[FileInfo] = FileInfoPool()
 
     async def prepare(self) -> AsyncIterator[Event]:
         self.messages = self.ctx.history.get_messages()
-        self.pool = self.ctx.history.get_file_infos(in_message=True)
+        self.pool = FileInfoPool(self.ctx.history.get_file_infos(in_message=True))
 
         if False:  # pragma: no cover
             yield
@@ -75,7 +75,7 @@ class HistorySection(BaseSection):
     def _hydrate_messages(
         self,
         messages: list[Message],
-        pool: FileInfoPool,
+        pool: list[FileInfo],
     ) -> list[Message]:
         messages.reverse()
         messages, _ = hydrate_messages(messages, pool)
@@ -1,7 +1,6 @@
 import pytest
 
 from kiarina.agi.file_info import FileInfo
-from kiarina.agi.file_info_pool import FileInfoPool
 from kiarina.agi.history import History
 from kiarina.agi.message import HumanMessage, Message
 from kiarina.agi.run_context import RunContext
@@ -9,7 +8,7 @@ from kiarina.agi.section import SectionContext
 from kiarina.agi.section_impl.history import HistorySection
 
 
-def dump(title: str, messages: list[Message], pool: FileInfoPool) -> None:
+def dump(title: str, messages: list[Message], pool: list[FileInfo]) -> None:
     print("=" * 20 + f" {title} " + "=" * 20)
     for i, file_info in enumerate(pool):
         print(f"--- pool[{i}] {file_info.type}: {file_info.to_estimates()} ---")
@@ -0,0 +1,103 @@
+import json
+import operator
+import time
+from collections.abc import Callable
+from functools import reduce
+
+from kiarina.agi.langchain_chat_provider import (
+    LCAIMessage,
+    LCAIMessageChunk,
+    LCAIMessageChunkAccumulator,
+)
+
+CHUNK_COUNT = 10_000
+
+
+def create_text_stream() -> list[LCAIMessageChunk]:
+    return [
+        LCAIMessageChunk(content=f"token{index} ", id="lc_run-1")
+        for index in range(CHUNK_COUNT)
+    ]
+
+
+def create_content_block_stream() -> list[LCAIMessageChunk]:
+    return [
+        LCAIMessageChunk(
+            content=[{"type": "text", "text": f"token{index} ", "index": 0}]
+        )
+        for index in range(CHUNK_COUNT)
+    ]
+
+
+def create_tool_call_stream() -> list[LCAIMessageChunk]:
+    # Adding these with `+` parses the arguments so far for every chunk,
+    # so this stream takes a while without the accumulator
+    args = json.dumps({"items": [f"item{index}" for index in range(CHUNK_COUNT)]})
+    size = -(-len(args) // CHUNK_COUNT)
+
+    return [
+        LCAIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                {
+                    "name": "save" if index == 0 else None,
+                    "args": args[index * size : (index + 1) * size],
+                    "id": "call_1" if index == 0 else None,
+                    "index": 0,
+                }
+            ],
+        )
+        for index in range(CHUNK_COUNT)
+    ]
+
+
+def add_chunks(chunks: list[LCAIMessageChunk]) -> LCAIMessage:
+    buffer = reduce(operator.add, chunks)
+    return LCAIMessage(
+        content=buffer.content,
+        tool_calls=buffer.tool_calls,
+        invalid_tool_calls=buffer.invalid_tool_calls,
+    )
+
+
+def accumulate_chunks(chunks: list[LCAIMessageChunk]) -> LCAIMessage:
+    accumulator = LCAIMessageChunkAccumulator()
+
+    for chunk in chunks:
+        accumulator.add(chunk)
+
+    return accumulator.to_message()
+
+
+def measure(
+    func: Callable[[list[LCAIMessageChunk]], LCAIMessage],
+    chunks: list[LCAIMessageChunk],
+) -> tuple[LCAIMessage, float]:
+    start = time.perf_counter()
+    lc_ai_message = func(chunks)
+    return lc_ai_message, time.perf_counter() - start
+
+
+def main() -> None:
+    streams = {
+        "text": create_text_stream(),
+        "content blocks": create_content_block_stream(),
+        "tool call": create_tool_call_stream(),
+    }
+
+    for name, chunks in streams.items():
+        expected, added = measure(add_chunks, chunks)
+        actual, accumulated = measure(accumulate_chunks, chunks)
+
+        assert actual.content == expected.content
+        assert actual.tool_calls == expected.tool_calls
+
+        print(
+            f"{name} ({CHUNK_COUNT:,} chunks): "
+            f"+ {added:.2f}s, accumulator {accumulated:.3f}s "
+            f"({added / accumulated:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
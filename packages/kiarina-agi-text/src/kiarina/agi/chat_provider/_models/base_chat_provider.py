@@ -2,10 +2,15 @@ import json
 import textwrap
 import traceback
 from collections.abc import AsyncIterator
+from functools import partial
 
 from kiarina.agi.cost_recorder import CostRecorder
 from kiarina.agi.message import AIMessage, AIMessageChunk, Message
-from kiarina.agi.request_logger import RequestLogEntry, request_logger_registry
+from kiarina.agi.request_logger import (
+    RequestLogEntry,
+    log_request,
+    request_logger_registry,
+)
 from kiarina.agi.run_context import RunContext
 from kiarina.agi.tool_info import ToolChoice, ToolInfo
 
@@ -63,14 +68,21 @@ class BaseChatProvider(ChatProvider):
                 yield ai_message
 
                 if ai_message.type == "ai":
-                    await request_logger_registry.resolve().log_request_success(
-                        _create_success_request_log_entry(ctx, ai_message, self.name),
+                    await log_request(
+                        request_logger_registry.resolve(),
+                        partial(
+                            _create_success_request_log_entry,
+                            ctx,
+                            ai_message,
+                            self.name,
+                        ),
                         run_context=ctx.run_context,
                     )
 
         except Exception as e:
-            await request_logger_registry.resolve().log_request_error(
-                _create_error_request_log_entry(ctx, e, self.name),
+            await log_request(
+                request_logger_registry.resolve(),
+                partial(_create_error_request_log_entry, ctx, e, self.name),
                 error=e,
                 run_context=ctx.run_context,
             )
@@ -178,6 +190,8 @@ def _format_message(message: Message, offset: int) -> str:
 
 
 def _format_error(error: Exception) -> str:
+    # Formatted from the exception itself, since this may run in a worker thread
     header = "## Error"
-    content = f"{type(error).__name__}: {error}\n\n```\n{traceback.format_exc()}```"
+    formatted = "".join(traceback.format_exception(error))
+    content = f"{type(error).__name__}: {error}\n\n```\n{formatted}```"
     return f"{header}\n\n{content}".strip()
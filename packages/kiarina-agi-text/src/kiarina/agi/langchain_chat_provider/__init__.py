@@ -4,6 +4,7 @@ from ._helpers.to_ai_message import to_ai_message
 from ._helpers.to_ai_message_chunk import to_ai_message_chunk
 from ._models.langchain_chat_provider import LangChainChatProvider
 from ._models.langchain_media_converter import LangChainMediaConverter
+from ._models.lc_ai_message_chunk_accumulator import LCAIMessageChunkAccumulator
 from ._schemas.langchain_chat_provider_context import LangChainChatProviderContext
 from ._types.lc_ai_message import LCAIMessage
 from ._types.lc_ai_message_chunk import LCAIMessageChunk
@@ -29,6 +30,7 @@ __all__ = [
     # ._models
     "LangChainChatProvider",
     "LangChainMediaConverter",
+    "LCAIMessageChunkAccumulator",
     # ._schemas
     "LangChainChatProviderContext",
     # ._types
@@ -2,8 +2,9 @@ import json
 import textwrap
 import traceback
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
-from typing import Any
+from collections.abc import AsyncIterator, Callable
+from functools import partial
+from typing import Any, TypeVar
 
 from kiarina.agi.chat_logger import chat_logger_registry
 from kiarina.agi.chat_provider import (
@@ -18,7 +19,9 @@ from kiarina.agi.message import AIMessage, AIMessageChunk
 from kiarina.agi.request_logger import (
     RequestLogEntry,
     RequestLogger,
+    log_request,
     request_logger_registry,
+    settings_manager as request_logger_settings_manager,
 )
 
 from .._helpers.from_messages import from_messages
@@ -32,6 +35,9 @@ from .._types.lc_message import LCMessage
 from .._types.lc_tool_call import LCToolCall
 from .._types.lc_tool_info import LCToolInfo
 from .langchain_media_converter import LangChainMediaConverter
+from .lc_ai_message_chunk_accumulator import LCAIMessageChunkAccumulator
+
+T = TypeVar("T")
 
 
 class LangChainChatProvider(BaseChatProvider, LangChainMediaConverter, ABC):
@@ -115,7 +121,7 @@ class LangChainChatProvider(BaseChatProvider, LangChainMediaConverter, ABC):
 
         try:
             try:
-                buffer: LCAIMessageChunk | None = None
+                accumulator = LCAIMessageChunkAccumulator()
 
                 with chat_logger.log_chat_stream(ctx.run_context):
                     async for chunk in self._stream(ctx):
@@ -123,21 +129,12 @@ class LangChainChatProvider(BaseChatProvider, LangChainMediaConverter, ABC):
                         chat_logger.log_chat_stream_chunk(ai_message_chunk)
                         yield ai_message_chunk
 
-                        buffer = buffer + chunk if buffer else chunk
+                        accumulator.add(chunk)
 
-                if buffer is None:  # pragma: no cover
+                if not accumulator:  # pragma: no cover
                     raise AssertionError("Empty stream response")
 
-                lc_ai_message = LCAIMessage(
-                    content=buffer.content,
-                    additional_kwargs=buffer.additional_kwargs,
-                    response_metadata=buffer.response_metadata,
-                    name=buffer.name,
-                    id=buffer.id,
-                    tool_calls=buffer.tool_calls,
-                    invalid_tool_calls=buffer.invalid_tool_calls,
-                    usage_metadata=buffer.usage_metadata,
-                )
+                lc_ai_message = accumulator.to_message()
 
             except Exception as e:
                 if token_count := self._extract_overflow_token_count(e):
@@ -242,8 +239,9 @@ class LangChainChatProvider(BaseChatProvider, LangChainMediaConverter, ABC):
         ctx: LangChainChatProviderContext,
         ai_message: LCAIMessage,
     ) -> None:
-        await self.request_logger.log_request_success(
-            _create_success_request_log_entry(ctx, ai_message, self.name),
+        await log_request(
+            self.request_logger,
+            partial(_create_success_request_log_entry, ctx, ai_message, self.name),
             run_context=ctx.run_context,
         )
 
@@ -252,8 +250,9 @@ class LangChainChatProvider(BaseChatProvider, LangChainMediaConverter, ABC):
         ctx: LangChainChatProviderContext,
         error: Exception,
     ) -> None:
-        await self.request_logger.log_request_error(
-            _create_error_request_log_entry(ctx, error, self.name),
+        await log_request(
+            self.request_logger,
+            partial(_create_error_request_log_entry, ctx, error, self.name),
             error=error,
             run_context=ctx.run_context,
         )
@@ -278,10 +277,13 @@ def _create_success_request_log_entry(
         "tool_call": "yes" if ai_message.tool_calls else "no",
     }
 
-    content = (
-        f"{_format_tool_infos(ctx.lc_tool_infos) if ctx.lc_tool_infos else ''}\n\n"
-        f"{_format_messages([*ctx.lc_messages, ai_message])}"
-    ).strip()
+    # Messages are formatted first so that they take precedence over tool infos
+    budget = _Budget(request_logger_settings_manager.settings.max_content_length)
+    messages = _format_messages([*ctx.lc_messages, ai_message], budget)
+    tool_infos = (
+        _format_tool_infos(ctx.lc_tool_infos, budget) if ctx.lc_tool_infos else ""
+    )
+    content = f"{tool_infos}\n\n{messages}".strip()
 
     return RequestLogEntry(
         kind="langchain_chat_provider",
@@ -310,11 +312,15 @@ def _create_error_request_log_entry(
         "error_type": type(error).__name__,
     }
 
-    content = (
-        f"{_format_error(error)}\n\n"
-        f"{_format_tool_infos(ctx.lc_tool_infos) + '\n\n' if ctx.lc_tool_infos else ''}"
-        f"{_format_messages(ctx.lc_messages)}"
-    ).strip()
+    budget = _Budget(request_logger_settings_manager.settings.max_content_length)
+    error_text = budget.take(_format_error(error))
+    messages = _format_messages(ctx.lc_messages, budget)
+    tool_infos = (
+        _format_tool_infos(ctx.lc_tool_infos, budget) + "\n\n"
+        if ctx.lc_tool_infos
+        else ""
+    )
+    content = f"{error_text}\n\n{tool_infos}{messages}".strip()
 
     return RequestLogEntry(
         kind="langchain_chat_provider",
@@ -324,15 +330,67 @@ def _create_error_request_log_entry(
     )
 
 
+class _Budget:
+    """
+    Remaining characters of the log content, or unlimited for a limit of 0.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.remaining = limit if limit > 0 else None
+
+    def take(self, text: str) -> str:
+        if self.remaining is not None:
+            self.remaining = max(self.remaining - len(text), 0)
+
+        return text
+
+    def format_items(
+        self,
+        items: list[T],
+        format_item: Callable[[T, int], str],
+        *,
+        label: str,
+        reverse: bool = False,
+    ) -> str:
+        """
+        Format items until the budget runs out, latest first when reversed.
+        """
+        indexes = range(len(items) - 1, -1, -1) if reverse else range(len(items))
+        texts: list[str] = []
+
+        for count, i in enumerate(indexes):
+            if self.remaining == 0:
+                texts.append(f"... ({len(items) - count} {label} omitted)")
+                break
+
+            text = format_item(items[i], i)
+
+            # The first item is kept even when it alone exceeds the budget
+            if self.remaining is not None and count and len(text) > self.remaining:
+                texts.append(f"... ({len(items) - count} {label} omitted)")
+                self.remaining = 0
+                break
+
+            texts.append(self.take(text))
+
+        return "\n\n".join(reversed(texts) if reverse else texts)
+
+
 def _format_error(error: Exception) -> str:
+    # Formatted from the exception itself, since this may run in a worker thread
     header = "## Error"
-    content = f"{type(error).__name__}: {error}\n\n```\n{traceback.format_exc()}\n```"
+    formatted = "".join(traceback.format_exception(error))
+    content = f"{type(error).__name__}: {error}\n\n```\n{formatted}\n```"
     return f"{header}\n\n{content}".strip()
 
 
-def _format_tool_infos(lc_tool_infos: list[LCToolInfo]) -> str:
+def _format_tool_infos(lc_tool_infos: list[LCToolInfo], budget: _Budget) -> str:
     header = "## Tool Infos"
-    content = "\n\n".join([_format_tool_info(ti) for ti in lc_tool_infos])
+    content = budget.format_items(
+        lc_tool_infos,
+        lambda ti, _: _format_tool_info(ti),
+        label="tool infos",
+    )
     return f"{header}\n\n{content}".strip()
 
 
@@ -342,9 +400,15 @@ def _format_tool_info(lc_tool_info: LCToolInfo) -> str:
     return f"{header}\n\n```json\n{content}\n```".strip()
 
 
-def _format_messages(lc_messages: list[LCMessage]) -> str:
+def _format_messages(lc_messages: list[LCMessage], budget: _Budget) -> str:
+    # The latest messages are kept when the budget runs out
     header = "## Messages"
-    content = "\n\n".join([_format_message(m, i) for i, m in enumerate(lc_messages)])
+    content = budget.format_items(
+        lc_messages,
+        _format_message,
+        label="earlier messages",
+        reverse=True,
+    )
     return f"{header}\n\n{content}".strip()
 
 
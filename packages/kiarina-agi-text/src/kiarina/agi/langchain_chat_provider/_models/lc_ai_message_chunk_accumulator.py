@@ -0,0 +1,352 @@
+from collections.abc import Hashable
+from typing import Any, Literal
+
+from langchain_core.messages.ai import UsageMetadata, add_usage
+from langchain_core.messages.tool import tool_call_chunk as create_tool_call_chunk
+from langchain_core.utils.utils import LC_AUTO_PREFIX, LC_ID_PREFIX
+
+from .._types.lc_ai_message import LCAIMessage
+from .._types.lc_ai_message_chunk import LCAIMessageChunk
+
+# Keys that `merge_dicts` compares before concatenating, kept as plain strings
+_PLAIN_KEYS = {"id", "index", "type", "output_version", "model_provider"}
+
+
+class LCAIMessageChunkAccumulator:
+    """
+    Streamed AI message chunks merged into one AI message.
+
+    The chunks are merged with the same rules as adding them with `+`, but
+    text and tool call argument fragments are collected in lists and joined
+    once, so a stream is merged in linear time instead of copying the
+    message built so far for every chunk.
+    """
+
+    def __init__(self) -> None:
+        self._first: LCAIMessageChunk | None = None
+        self._count = 0
+        self._content: _TextBuilder | _ListBuilder = _TextBuilder("")
+        self._additional_kwargs = _DictBuilder({})
+        self._response_metadata = _DictBuilder({})
+        self._tool_call_chunks = _ListBuilder([])
+        self._usage_metadata: UsageMetadata | None = None
+        self._id: str | None = None
+        self._id_rank = -1
+        self._last = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, chunk: LCAIMessageChunk) -> None:
+        if self._first is None:
+            self._first = chunk
+            self._content = _to_content_builder(chunk.content)
+            self._additional_kwargs = _DictBuilder(chunk.additional_kwargs)
+            self._response_metadata = _DictBuilder(chunk.response_metadata)
+            self._tool_call_chunks = _ListBuilder(list(chunk.tool_call_chunks))
+            self._usage_metadata = chunk.usage_metadata
+        else:
+            self._content = _merge_content(self._content, chunk.content)
+            self._additional_kwargs.merge(chunk.additional_kwargs)
+            self._response_metadata.merge(chunk.response_metadata)
+            self._tool_call_chunks.extend(list(chunk.tool_call_chunks))
+
+            if self._usage_metadata or chunk.usage_metadata is not None:
+                self._usage_metadata = add_usage(
+                    self._usage_metadata, chunk.usage_metadata
+                )
+            else:
+                self._usage_metadata = None
+
+        self._add_id(chunk.id)
+        self._last = self._last or chunk.chunk_position == "last"
+        self._count += 1
+
+    def to_chunk(self) -> LCAIMessageChunk:
+        """
+        Return the chunks merged into one chunk.
+        """
+        if self._first is None:
+            raise ValueError("No chunks have been added")
+
+        if self._count == 1:
+            return self._first
+
+        chunk_position: Literal["last"] | None = "last" if self._last else None
+
+        return self._first.__class__(
+            content=self._content.build(),
+            additional_kwargs=self._additional_kwargs.build(),
+            tool_call_chunks=[
+                create_tool_call_chunk(
+                    name=raw.get("name"),
+                    args=raw.get("args"),
+                    index=raw.get("index"),
+                    id=raw.get("id"),
+                )
+                for raw in self._tool_call_chunks.build()
+            ],
+            response_metadata=self._response_metadata.build(),
+            usage_metadata=self._usage_metadata,
+            id=self._id,
+            chunk_position=chunk_position,
+        )
+
+    def to_message(self) -> LCAIMessage:
+        """
+        Return the chunks merged into one AI message.
+        """
+        chunk = self.to_chunk()
+
+        return LCAIMessage(
+            content=chunk.content,
+            additional_kwargs=chunk.additional_kwargs,
+            response_metadata=chunk.response_metadata,
+            name=chunk.name,
+            id=chunk.id,
+            tool_calls=chunk.tool_calls,
+            invalid_tool_calls=chunk.invalid_tool_calls,
+            usage_metadata=chunk.usage_metadata,
+        )
+
+    def _add_id(self, id_: str | None) -> None:
+        # Provider IDs win over lc_run-* IDs, which win over other IDs
+        if not id_ or self._id_rank == 2:
+            return
+
+        if not id_.startswith(LC_ID_PREFIX) and not id_.startswith(LC_AUTO_PREFIX):
+            rank = 2
+        elif id_.startswith(LC_ID_PREFIX):
+            rank = 1
+        else:
+            rank = 0
+
+        if rank > self._id_rank:
+            self._id_rank = rank
+            self._id = id_
+
+
+class _TextBuilder:
+    def __init__(self, text: str) -> None:
+        self.kind = type(text)
+        self.parts = [text]
+
+    def append(self, text: str) -> None:
+        self.parts.append(text)
+
+    def build(self) -> str:
+        if len(self.parts) > 1:
+            self.parts = ["".join(self.parts)]
+
+        return self.parts[0]
+
+
+class _DictBuilder:
+    """
+    Dict merged like `merge_dicts`.
+    """
+
+    def __init__(self, value: dict[str, Any]) -> None:
+        self.kind = type(value)
+        self.values: dict[str, Any] = {k: _wrap(k, v) for k, v in value.items()}
+
+    def get(self, key: str) -> Any:
+        return _unwrap(self.values.get(key))
+
+    def merge(self, other: dict[str, Any]) -> None:
+        values = self.values
+
+        for key, value in other.items():
+            current = values.get(key, _MISSING)
+
+            if current is _MISSING or (value is not None and current is None):
+                values[key] = _wrap(key, value)
+
+            elif value is None:
+                continue
+
+            elif not _is_same_type(current, value):
+                raise TypeError(
+                    f'additional_kwargs["{key}"] already exists in this message,'
+                    " but with a different type."
+                )
+
+            elif isinstance(current, _TextBuilder):
+                current.append(value)
+
+            elif isinstance(current, str):
+                if (key == "index" and current.startswith("lc_")) or (
+                    key in {"id", "output_version", "model_provider"}
+                    and current == value
+                ):
+                    continue
+
+                values[key] = current + value
+
+            elif isinstance(current, _DictBuilder):
+                current.merge(value)
+
+            elif isinstance(current, _ListBuilder):
+                current.extend(value)
+
+            elif current == value:
+                continue
+
+            elif isinstance(current, int):
+                if key in {"index", "created", "timestamp"}:
+                    values[key] = value
+                else:
+                    values[key] = current + value
+
+            else:
+                raise TypeError(
+                    f"Additional kwargs key {key} already exists in left dict and "
+                    f"value has unsupported type {type(current)}."
+                )
+
+    def build(self) -> dict[str, Any]:
+        return {k: _unwrap(v) for k, v in self.values.items()}
+
+
+class _ListBuilder:
+    """
+    List merged like `merge_lists`.
+    """
+
+    def __init__(self, value: list[Any]) -> None:
+        self.kind = type(value)
+        self.items: list[Any] = []
+
+        # Positions of the dict items by their index, in order
+        self.positions: dict[Hashable, list[int]] = {}
+
+        for item in value:
+            self.append(item)
+
+    def extend(self, other: list[Any]) -> None:
+        for item in other:
+            if not _is_mergeable(item):
+                self.append(item)
+                continue
+
+            for position in self.positions.get(item["index"], ()):
+                left = self.items[position]
+
+                if (
+                    left.get("id") in {None, ""}
+                    or item.get("id") in {None, ""}
+                    or left.get("id") == item.get("id")
+                ):
+                    left.merge(_without_type(left, item))
+                    break
+            else:
+                self.append(item)
+
+    def build(self) -> list[Any]:
+        return [_unwrap(item) for item in self.items]
+
+    def append(self, item: Any) -> None:
+        wrapped = _wrap(None, item)
+
+        if isinstance(wrapped, _DictBuilder):
+            index = wrapped.get("index")
+
+            if "index" in wrapped.values and isinstance(index, Hashable):
+                self.positions.setdefault(index, []).append(len(self.items))
+
+        self.items.append(wrapped)
+
+
+def _to_content_builder(content: Any) -> "_TextBuilder | _ListBuilder":
+    if content is None:
+        return _TextBuilder("")
+
+    if isinstance(content, str):
+        return _TextBuilder(content)
+
+    return _ListBuilder(content)
+
+
+def _merge_content(
+    merged: "_TextBuilder | _ListBuilder", content: Any
+) -> "_TextBuilder | _ListBuilder":
+    # Same as `merge_content`
+    if isinstance(merged, _TextBuilder):
+        if isinstance(content, str):
+            merged.append(content)
+            return merged
+
+        return _ListBuilder([merged.build(), *content])
+
+    if isinstance(content, list):
+        merged.extend(content)
+
+    elif merged.items and isinstance(merged.items[-1], _TextBuilder):
+        merged.items[-1].append(content)
+
+    elif content == "":
+        pass
+
+    elif merged.items:
+        merged.append(content)
+
+    return merged
+
+
+def _is_mergeable(item: Any) -> bool:
+    if not isinstance(item, dict) or "index" not in item:
+        return False
+
+    index = item["index"]
+    return isinstance(index, int) or (
+        isinstance(index, str) and index.startswith("lc_")
+    )
+
+
+def _without_type(left: _DictBuilder, item: dict[str, Any]) -> dict[str, Any]:
+    # Same as the handling of "type" and non-standard blocks in `merge_lists`
+    if (left_type := left.get("type")) and (
+        item.get("type") == "non_standard" and "value" in item
+    ):
+        value = {k: v for k, v in item["value"].items() if k != "type"}
+
+        if left_type != "non_standard":
+            return {"extras": value}
+
+        return {"value": value, "index": item["index"]}
+
+    return {k: v for k, v in item.items() if k != "type"}
+
+
+class _Missing:
+    pass
+
+
+_MISSING = _Missing()
+
+
+def _wrap(key: str | None, value: Any) -> Any:
+    if isinstance(value, str):
+        return value if key in _PLAIN_KEYS else _TextBuilder(value)
+
+    if isinstance(value, dict):
+        return _DictBuilder(value)
+
+    if isinstance(value, list):
+        return _ListBuilder(value)
+
+    return value
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, (_TextBuilder, _DictBuilder, _ListBuilder)):
+        return value.build()
+
+    return value
+
+
+def _is_same_type(current: Any, value: Any) -> bool:
+    if isinstance(current, (_TextBuilder, _DictBuilder, _ListBuilder)):
+        return current.kind is type(value)
+
+    return type(current) is type(value)
@@ -17,7 +17,13 @@ from kiarina.agi.langchain_chat_provider import (
     LCAIMessage,
     LCAIMessageChunk,
 )
-from kiarina.agi.message import AIMessage, Message
+from kiarina.agi.message import AIMessage, HumanMessage, Message
+from kiarina.agi.request_logger import (
+    BaseRequestLogger,
+    RequestLogEntry,
+    RequestLogger,
+    settings_manager as request_logger_settings_manager,
+)
 from kiarina.agi.run_context import RunContext
 
 
@@ -73,6 +79,39 @@ class MyChatProvider(LangChainChatProvider):
         return self._capabilities
 
 
+class MyRequestLogger(BaseRequestLogger):
+    def __init__(self) -> None:
+        super().__init__()
+        self.log_entries: list[RequestLogEntry] = []
+
+    async def log_request_success(
+        self,
+        log_entry: RequestLogEntry,
+        *,
+        run_context: RunContext,
+    ) -> None:
+        self.log_entries.append(log_entry)
+
+    async def log_request_error(
+        self,
+        log_entry: RequestLogEntry,
+        error: Exception,
+        *,
+        run_context: RunContext,
+    ) -> None:
+        self.log_entries.append(log_entry)
+
+
+class MyLoggingChatProvider(MyChatProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.my_request_logger = MyRequestLogger()
+
+    @property
+    def request_logger(self) -> RequestLogger:
+        return self.my_request_logger
+
+
 @pytest.fixture
 def provider(capabilities: ChatCapabilities) -> MyChatProvider:
     provider = MyChatProvider()
@@ -144,6 +183,52 @@ async def test_max_token_error(
         await _invoke(provider, messages, args)
 
 
+async def test_request_log_max_content_length(
+    cost_recorder: CostRecorder, run_context: RunContext
+) -> None:
+    request_logger_settings_manager.cli_args = {"max_content_length": 300}
+
+    try:
+        provider = MyLoggingChatProvider()
+        provider.name = "my"
+        messages: list[Message] = [
+            HumanMessage.create(f"Message {index}\n" + "x" * 100) for index in range(20)
+        ]
+
+        await _invoke(
+            provider,
+            messages,
+            {"cost_recorder": cost_recorder, "run_context": run_context},
+        )
+
+    finally:
+        request_logger_settings_manager.cli_args = {}
+
+    content = provider.my_request_logger.log_entries[0].content
+    assert "earlier messages omitted" in content
+    assert "Message 0\n" not in content
+    assert "default response" in content
+
+
+async def test_request_log_error_traceback(
+    cost_recorder: CostRecorder, run_context: RunContext
+) -> None:
+    provider = MyLoggingChatProvider()
+    provider.name = "my"
+    provider.request_error = RuntimeError("Simulated request error")
+
+    with pytest.raises(RuntimeError):
+        await _invoke(
+            provider,
+            [HumanMessage.create("Hello")],
+            {"cost_recorder": cost_recorder, "run_context": run_context},
+        )
+
+    content = provider.my_request_logger.log_entries[0].content
+    assert "Traceback" in content
+    assert "Simulated request error" in content
+
+
 async def _invoke(
     provider: MyChatProvider,
     messages: list[Message],
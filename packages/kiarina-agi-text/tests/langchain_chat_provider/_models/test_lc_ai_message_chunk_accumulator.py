@@ -0,0 +1,112 @@
+import operator
+from functools import reduce
+
+import pytest
+
+from kiarina.agi.langchain_chat_provider import (
+    LCAIMessageChunk,
+    LCAIMessageChunkAccumulator,
+)
+
+
+def accumulate(chunks: list[LCAIMessageChunk]) -> LCAIMessageChunkAccumulator:
+    accumulator = LCAIMessageChunkAccumulator()
+
+    for chunk in chunks:
+        accumulator.add(chunk)
+
+    return accumulator
+
+
+def test_text() -> None:
+    chunks = [
+        LCAIMessageChunk(content=text, id="lc_run-1")
+        for text in ["Hello", ", ", "world", "!"]
+    ]
+    chunks.append(
+        LCAIMessageChunk(
+            content="",
+            id="msg_1",
+            response_metadata={"model_name": "mock", "finish_reason": "stop"},
+            usage_metadata={"input_tokens": 3, "output_tokens": 4, "total_tokens": 7},
+            chunk_position="last",
+        )
+    )
+
+    accumulator = accumulate(chunks)
+    assert len(accumulator) == 5
+    assert accumulator.to_chunk() == reduce(operator.add, chunks)
+
+    lc_ai_message = accumulator.to_message()
+    assert lc_ai_message.content == "Hello, world!"
+    assert lc_ai_message.id == "msg_1"
+    assert lc_ai_message.usage_metadata is not None
+    assert lc_ai_message.usage_metadata["total_tokens"] == 7
+
+
+def test_content_blocks() -> None:
+    chunks = [
+        LCAIMessageChunk(content=[{"type": "thinking", "thinking": "Hm", "index": 0}]),
+        LCAIMessageChunk(
+            content=[
+                {"type": "thinking", "thinking": "m", "signature": "s", "index": 0}
+            ]
+        ),
+        LCAIMessageChunk(content=[{"type": "text", "text": "Hi", "index": 1}]),
+        LCAIMessageChunk(content=[{"type": "text", "text": " there", "index": 1}]),
+        LCAIMessageChunk(content="!"),
+    ]
+
+    lc_ai_message_chunk = accumulate(chunks).to_chunk()
+    assert lc_ai_message_chunk == reduce(operator.add, chunks)
+    assert lc_ai_message_chunk.content == [
+        {"type": "thinking", "thinking": "Hmm", "index": 0, "signature": "s"},
+        {"type": "text", "text": "Hi there", "index": 1},
+        "!",
+    ]
+
+
+def test_tool_call_chunks() -> None:
+    args = '{"city": "Tokyo", "days": 3}'
+
+    chunks = [
+        LCAIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                {"name": "get_weather", "args": "", "id": "call_1", "index": 0}
+            ],
+        ),
+        *(
+            LCAIMessageChunk(
+                content="",
+                tool_call_chunks=[
+                    {"name": None, "args": args[i : i + 4], "id": None, "index": 0}
+                ],
+            )
+            for i in range(0, len(args), 4)
+        ),
+        LCAIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                {"name": "noop", "args": "{}", "id": "call_2", "index": 1}
+            ],
+            additional_kwargs={"refusal": None},
+        ),
+    ]
+
+    lc_ai_message = accumulate(chunks).to_message()
+    assert lc_ai_message.tool_calls == reduce(operator.add, chunks).tool_calls
+    assert [tool_call["args"] for tool_call in lc_ai_message.tool_calls] == [
+        {"city": "Tokyo", "days": 3},
+        {},
+    ]
+
+
+def test_single_chunk() -> None:
+    chunk = LCAIMessageChunk(content="Hello", name="assistant")
+    assert accumulate([chunk]).to_chunk() is chunk
+
+
+def test_empty() -> None:
+    with pytest.raises(ValueError):
+        LCAIMessageChunkAccumulator().to_chunk()
@@ -1,8 +1,12 @@
-from typing import Any
+from collections.abc import AsyncIterator, Sequence
+from types import TracebackType
+from typing import Any, Self
 
 from kiarina.lib.cloudflare import CloudflareSettings
 
 from ..._core.models.d1_context import D1Context
+from ..._core.operations.batch import batch
+from ..._core.operations.iter_rows import iter_rows
 from ..._core.operations.query import query
 from ..._core.views.result import Result
 from ..._settings import D1Settings
@@ -17,5 +21,33 @@ class D1Client:
             auth_settings=auth_settings,
         )
 
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
     async def query(self, sql: str, params: list[Any] | None = None) -> Result:
         return await query("async", self.ctx, sql, params)
+
+    async def batch(
+        self, statements: Sequence[str | tuple[str, list[Any] | None]]
+    ) -> Result:
+        return await batch("async", self.ctx, statements)
+
+    def iter_rows(
+        self,
+        sql: str,
+        params: list[Any] | None = None,
+        *,
+        page_size: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        return iter_rows("async", self.ctx, sql, params, page_size=page_size)
+
+    async def close(self) -> None:
+        await self.ctx.aclose()
@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+import httpx
 
 from kiarina.lib.cloudflare import CloudflareSettings
 
@@ -11,6 +13,14 @@ class D1Context:
 
     auth_settings: CloudflareSettings
 
+    _client: httpx.Client | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    _async_client: httpx.AsyncClient | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def query_api_url(self) -> str:
         return f"https://api.cloudflare.com/client/v4/accounts/{self.auth_settings.account_id}/d1/database/{self.settings.database_id}/query"
@@ -21,3 +31,44 @@ class D1Context:
             "Authorization": f"Bearer {self.auth_settings.api_token.get_secret_value()}",
             "Content-Type": "application/json",
         }
+
+    @property
+    def client(self) -> httpx.Client:
+        # Created on first use and kept so connections are reused across queries
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.Client(
+                headers=self.headers,
+                http2=self.settings.http2,
+                limits=self._limits,
+                timeout=self.settings.timeout,
+            )
+
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                headers=self.headers,
+                http2=self.settings.http2,
+                limits=self._limits,
+                timeout=self.settings.timeout,
+            )
+
+        return self._async_client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+
+    @property
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.settings.max_connections,
+            max_keepalive_connections=self.settings.max_keepalive_connections,
+            keepalive_expiry=self.settings.keepalive_expiry,
+        )
@@ -0,0 +1,57 @@
+from collections.abc import Awaitable, Sequence
+from typing import Literal, overload
+
+import httpx
+
+from ..models.d1_context import D1Context
+from ..views.result import Result
+
+
+@overload
+def batch(
+    mode: Literal["sync"],
+    ctx: D1Context,
+    statements: Sequence[str | tuple[str, list[object] | None]],
+) -> Result: ...
+
+
+@overload
+def batch(
+    mode: Literal["async"],
+    ctx: D1Context,
+    statements: Sequence[str | tuple[str, list[object] | None]],
+) -> Awaitable[Result]: ...
+
+
+def batch(
+    mode: Literal["sync", "async"],
+    ctx: D1Context,
+    statements: Sequence[str | tuple[str, list[object] | None]],
+) -> Result | Awaitable[Result]:
+    if not statements:
+        raise ValueError("At least one statement is required")
+
+    request_params = {
+        "batch": [
+            {"sql": statement, "params": []}
+            if isinstance(statement, str)
+            else {"sql": statement[0], "params": statement[1] or []}
+            for statement in statements
+        ]
+    }
+
+    def _parse_response(response: httpx.Response) -> Result:
+        return Result(**response.json())
+
+    def _sync() -> Result:
+        response = ctx.client.post(ctx.query_api_url, json=request_params)
+        return _parse_response(response)
+
+    async def _async() -> Result:
+        response = await ctx.async_client.post(ctx.query_api_url, json=request_params)
+        return _parse_response(response)
+
+    if mode == "sync":
+        return _sync()
+    else:
+        return _async()
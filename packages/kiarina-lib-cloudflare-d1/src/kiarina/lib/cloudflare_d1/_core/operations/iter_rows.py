@@ -0,0 +1,86 @@
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, Literal, overload
+
+from ..models.d1_context import D1Context
+from .query import query
+
+
+@overload
+def iter_rows(
+    mode: Literal["sync"],
+    ctx: D1Context,
+    sql: str,
+    params: list[object] | None = None,
+    *,
+    page_size: int | None = None,
+) -> Iterator[dict[str, Any]]: ...
+
+
+@overload
+def iter_rows(
+    mode: Literal["async"],
+    ctx: D1Context,
+    sql: str,
+    params: list[object] | None = None,
+    *,
+    page_size: int | None = None,
+) -> AsyncIterator[dict[str, Any]]: ...
+
+
+def iter_rows(
+    mode: Literal["sync", "async"],
+    ctx: D1Context,
+    sql: str,
+    params: list[object] | None = None,
+    *,
+    page_size: int | None = None,
+) -> Iterator[dict[str, Any]] | AsyncIterator[dict[str, Any]]:
+    if page_size is None:
+        page_size = ctx.settings.page_size
+
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+
+    # The D1 API returns a whole result set per request, so large results are
+    # read in LIMIT/OFFSET pages of the query wrapped as a subquery.
+    paged_sql = f"SELECT * FROM ({sql.strip().rstrip(';')}) LIMIT ? OFFSET ?"
+
+    def _page_params(offset: int) -> list[object]:
+        return [*(params or []), page_size, offset]
+
+    def _sync() -> Iterator[dict[str, Any]]:
+        offset = 0
+
+        while True:
+            result = query("sync", ctx, paged_sql, _page_params(offset))
+            result.raise_for_status()
+
+            rows = result.first.rows
+            yield from rows
+
+            if len(rows) < page_size:
+                break
+
+            offset += len(rows)
+
+    async def _async() -> AsyncIterator[dict[str, Any]]:
+        offset = 0
+
+        while True:
+            result = await query("async", ctx, paged_sql, _page_params(offset))
+            result.raise_for_status()
+
+            rows = result.first.rows
+
+            for row in rows:
+                yield row
+
+            if len(rows) < page_size:
+                break
+
+            offset += len(rows)
+
+    if mode == "sync":
+        return _sync()
+    else:
+        return _async()
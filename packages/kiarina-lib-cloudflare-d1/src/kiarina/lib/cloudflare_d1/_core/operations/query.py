@@ -43,14 +43,12 @@ def query(
         return Result(**response.json())
 
     def _sync() -> Result:
-        with httpx.Client(headers=ctx.headers) as client:
-            response = client.post(ctx.query_api_url, json=request_params)
-            return _parse_response(response)
+        response = ctx.client.post(ctx.query_api_url, json=request_params)
+        return _parse_response(response)
 
     async def _async() -> Result:
-        async with httpx.AsyncClient(headers=ctx.headers) as client:
-            response = await client.post(ctx.query_api_url, json=request_params)
-            return _parse_response(response)
+        response = await ctx.async_client.post(ctx.query_api_url, json=request_params)
+        return _parse_response(response)
 
     if mode == "sync":
         return _sync()
@@ -12,6 +12,41 @@ class D1Settings(BaseSettings):
         title="Database ID",
         description="Cloudflare D1 database ID.",
     )
+    http2: bool = Field(
+        default=True,
+        title="HTTP/2",
+        description="Use HTTP/2 for requests to the D1 API.",
+    )
+    max_connections: int = Field(
+        default=20,
+        gt=0,
+        title="Max Connections",
+        description="Maximum number of concurrent connections held by a client.",
+    )
+    max_keepalive_connections: int = Field(
+        default=10,
+        ge=0,
+        title="Max Keep-Alive Connections",
+        description="Maximum number of idle connections kept open for reuse.",
+    )
+    keepalive_expiry: float = Field(
+        default=30.0,
+        ge=0,
+        title="Keep-Alive Expiry",
+        description="Seconds an idle connection is kept open.",
+    )
+    timeout: float = Field(
+        default=5.0,
+        gt=0,
+        title="Timeout",
+        description="Request timeout in seconds.",
+    )
+    page_size: int = Field(
+        default=1000,
+        gt=0,
+        title="Page Size",
+        description="Number of rows fetched per request by iter_rows.",
+    )
 
 
 settings_manager = SettingsManager(D1Settings, multi=True)
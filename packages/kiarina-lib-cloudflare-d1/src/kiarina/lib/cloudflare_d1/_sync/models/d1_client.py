@@ -1,8 +1,12 @@
-from typing import Any
+from collections.abc import Iterator, Sequence
+from types import TracebackType
+from typing import Any, Self
 
 from kiarina.lib.cloudflare import CloudflareSettings
 
 from ..._core.models.d1_context import D1Context
+from ..._core.operations.batch import batch
+from ..._core.operations.iter_rows import iter_rows
 from ..._core.operations.query import query
 from ..._core.views.result import Result
 from ..._settings import D1Settings
@@ -17,5 +21,31 @@ class D1Client:
             auth_settings=auth_settings,
         )
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
     def query(self, sql: str, params: list[Any] | None = None) -> Result:
         return query("sync", self.ctx, sql, params)
+
+    def batch(self, statements: Sequence[str | tuple[str, list[Any] | None]]) -> Result:
+        return batch("sync", self.ctx, statements)
+
+    def iter_rows(
+        self,
+        sql: str,
+        params: list[Any] | None = None,
+        *,
+        page_size: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        return iter_rows("sync", self.ctx, sql, params, page_size=page_size)
+
+    def close(self) -> None:
+        self.ctx.close()
@@ -22,3 +22,20 @@ def test_error(load_settings: None) -> None:
 
     with pytest.raises(RuntimeError, match="Query failed:"):
         result.raise_for_status()
+
+
+def test_batch(load_settings: None) -> None:
+    with create_d1_client() as client:
+        result = client.batch(["SELECT 1 AS a", ("SELECT ? AS b", [2])])
+        result.raise_for_status()
+        assert [r.rows for r in result.result] == [[{"a": 1}], [{"b": 2}]]
+
+
+def test_iter_rows(load_settings: None) -> None:
+    with create_d1_client() as client:
+        sql = "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 5) SELECT x FROM n"
+        rows = list(client.iter_rows(sql, page_size=2))
+        assert [row["x"] for row in rows] == [1, 2, 3, 4, 5]
+
+        with pytest.raises(ValueError, match="page_size must be positive"):
+            client.iter_rows(sql, page_size=0)
@@ -4,18 +4,25 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
     from ._helpers.get_document import get_document
+    from ._helpers.get_documents import get_documents
+    from ._helpers.iter_documents import iter_documents
     from ._helpers.list_documents import list_documents
     from ._schemas.document_list import DocumentList
     from ._schemas.document_snapshot import DocumentSnapshot
+    from ._services.firestore_client import FirestoreClient
     from ._settings import FirestoreSettings, settings_manager
 
 __all__ = [
     # ._helpers
     "get_document",
+    "get_documents",
+    "iter_documents",
     "list_documents",
     # ._schemas
     "DocumentList",
     "DocumentSnapshot",
+    # ._services
+    "FirestoreClient",
     # ._settings
     "FirestoreSettings",
     "settings_manager",
@@ -31,10 +38,14 @@ def __getattr__(name: str) -> object:
     module_map = {
         # ._helpers
         "get_document": "._helpers.get_document",
+        "get_documents": "._helpers.get_documents",
+        "iter_documents": "._helpers.iter_documents",
         "list_documents": "._helpers.list_documents",
         # ._schemas
         "DocumentList": "._schemas.document_list",
         "DocumentSnapshot": "._schemas.document_snapshot",
+        # ._services
+        "FirestoreClient": "._services.firestore_client",
         # ._settings
         "FirestoreSettings": "._settings",
         "settings_manager": "._settings",
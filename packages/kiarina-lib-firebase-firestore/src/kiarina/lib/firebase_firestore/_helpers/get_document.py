@@ -1,3 +1,5 @@
+from contextlib import AsyncExitStack
+
 import httpx
 
 from kiarina.lib.firebase import Token
@@ -14,6 +16,7 @@ async def get_document(
     project_id: str | None = None,
     database_id: str = "(default)",
     token: Token | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> DocumentSnapshot | None:
     settings = settings_manager.get_settings()
     token = await resolve_token(token)
@@ -24,9 +27,12 @@ async def get_document(
     )
     headers = {"Authorization": f"Bearer {token.id_token}"}
 
-    async with httpx.AsyncClient(
-        timeout=settings.timeout, follow_redirects=True
-    ) as client:
+    async with AsyncExitStack() as stack:
+        if client is None:
+            client = await stack.enter_async_context(
+                httpx.AsyncClient(timeout=settings.timeout, follow_redirects=True)
+            )
+
         response = await client.get(url, headers=headers)
 
         if response.status_code == httpx.codes.NOT_FOUND:
@@ -0,0 +1,71 @@
+import asyncio
+from collections.abc import Sequence
+from contextlib import AsyncExitStack
+from typing import Any
+
+import httpx
+
+from kiarina.lib.firebase import Token
+
+from .._operations.resolve_token import resolve_token
+from .._schemas.document_snapshot import DocumentSnapshot
+from .._settings import settings_manager
+from .._utils.parse_document import parse_document
+
+
+async def get_documents(
+    paths: Sequence[str],
+    *,
+    project_id: str | None = None,
+    database_id: str = "(default)",
+    token: Token | None = None,
+    client: httpx.AsyncClient | None = None,
+) -> list[DocumentSnapshot | None]:
+    settings = settings_manager.get_settings()
+    token = await resolve_token(token)
+
+    database = f"projects/{project_id or token.project_id}/databases/{database_id}"
+    url = f"{settings.base_url.rstrip('/')}/v1/{database}/documents:batchGet"
+    headers = {"Authorization": f"Bearer {token.id_token}"}
+
+    names = [f"{database}/documents/{path.strip('/')}" for path in paths]
+
+    # batchGet rejects a document requested twice in one call
+    unique_names = list(dict.fromkeys(names))
+    size = settings.batch_get_size
+
+    async with AsyncExitStack() as stack:
+        if client is None:
+            client = await stack.enter_async_context(
+                httpx.AsyncClient(timeout=settings.timeout, follow_redirects=True)
+            )
+
+        responses = await asyncio.gather(
+            *(
+                _batch_get(client, url, headers, unique_names[start : start + size])
+                for start in range(0, len(unique_names), size)
+            )
+        )
+
+    # Results arrive in no particular order, so they are matched by name
+    snapshots: dict[str, DocumentSnapshot] = {}
+
+    for results in responses:
+        for result in results:
+            if "found" in result:
+                snapshot = parse_document(result["found"])
+                snapshots[snapshot.name] = snapshot
+
+    return [snapshots.get(name) for name in names]
+
+
+async def _batch_get(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: dict[str, str],
+    names: list[str],
+) -> list[dict[str, Any]]:
+    response = await client.post(url, headers=headers, json={"documents": names})
+    response.raise_for_status()
+    results: list[dict[str, Any]] = response.json()
+    return results
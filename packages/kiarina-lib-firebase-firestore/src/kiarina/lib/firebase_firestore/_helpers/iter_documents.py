@@ -0,0 +1,67 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
+
+import httpx
+
+from kiarina.lib.firebase import Token
+
+from .._operations.resolve_token import resolve_token
+from .._schemas.document_list import DocumentList
+from .._schemas.document_snapshot import DocumentSnapshot
+from .._settings import settings_manager
+from .list_documents import list_documents
+
+
+async def iter_documents(
+    collection_path: str,
+    *,
+    project_id: str | None = None,
+    database_id: str = "(default)",
+    page_size: int | None = None,
+    order_by: str | None = None,
+    token: Token | None = None,
+    client: httpx.AsyncClient | None = None,
+) -> AsyncIterator[DocumentSnapshot]:
+    settings = settings_manager.get_settings()
+    page_size = page_size or settings.page_size
+
+    async with AsyncExitStack() as stack:
+        if client is None:
+            client = await stack.enter_async_context(
+                httpx.AsyncClient(timeout=settings.timeout, follow_redirects=True)
+            )
+
+        async def _fetch(page_token: str | None) -> DocumentList:
+            # Resolved per page so that a long iteration picks up refreshed tokens
+            return await list_documents(
+                collection_path,
+                project_id=project_id,
+                database_id=database_id,
+                page_size=page_size,
+                page_token=page_token,
+                order_by=order_by,
+                token=await resolve_token(token),
+                client=client,
+            )
+
+        task: asyncio.Task[DocumentList] | None = asyncio.create_task(_fetch(None))
+
+        try:
+            while task is not None:
+                page = await task
+
+                # The next page is fetched while the current one is consumed
+                task = (
+                    asyncio.create_task(_fetch(page.next_page_token))
+                    if page.next_page_token
+                    else None
+                )
+
+                for document in page.documents:
+                    yield document
+
+        finally:
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
@@ -1,3 +1,5 @@
+from contextlib import AsyncExitStack
+
 import httpx
 
 from kiarina.lib.firebase import Token
@@ -17,6 +19,7 @@ async def list_documents(
     page_token: str | None = None,
     order_by: str | None = None,
     token: Token | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> DocumentList:
     settings = settings_manager.get_settings()
     token = await resolve_token(token)
@@ -38,9 +41,12 @@ async def list_documents(
     if order_by is not None:
         params["orderBy"] = order_by
 
-    async with httpx.AsyncClient(
-        timeout=settings.timeout, follow_redirects=True
-    ) as client:
+    async with AsyncExitStack() as stack:
+        if client is None:
+            client = await stack.enter_async_context(
+                httpx.AsyncClient(timeout=settings.timeout, follow_redirects=True)
+            )
+
         response = await client.get(url, headers=headers, params=params)
         response.raise_for_status()
         data = response.json()
@@ -0,0 +1,127 @@
+from collections.abc import AsyncIterator, Sequence
+from types import TracebackType
+from typing import Self
+
+import httpx
+
+from kiarina.lib.firebase import Token
+
+from .._helpers.get_document import get_document
+from .._helpers.get_documents import get_documents
+from .._helpers.iter_documents import iter_documents
+from .._helpers.list_documents import list_documents
+from .._schemas.document_list import DocumentList
+from .._schemas.document_snapshot import DocumentSnapshot
+from .._settings import settings_manager
+
+
+class FirestoreClient:
+    """Reads Cloud Firestore documents over one pooled HTTP client.
+
+    The connections are reused across calls, so reading many documents does
+    not pay a TLS handshake per request.
+    """
+
+    def __init__(
+        self,
+        *,
+        project_id: str | None = None,
+        database_id: str = "(default)",
+    ) -> None:
+        self.project_id = project_id
+        self.database_id = database_id
+        self._client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            settings = settings_manager.get_settings()
+
+            self._client = httpx.AsyncClient(
+                timeout=settings.timeout,
+                follow_redirects=True,
+                http2=settings.http2,
+                limits=httpx.Limits(
+                    max_connections=settings.max_connections,
+                    max_keepalive_connections=settings.max_keepalive_connections,
+                    keepalive_expiry=settings.keepalive_expiry,
+                ),
+            )
+
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get_document(
+        self, path: str, *, token: Token | None = None
+    ) -> DocumentSnapshot | None:
+        return await get_document(
+            path,
+            project_id=self.project_id,
+            database_id=self.database_id,
+            token=token,
+            client=self.client,
+        )
+
+    async def get_documents(
+        self, paths: Sequence[str], *, token: Token | None = None
+    ) -> list[DocumentSnapshot | None]:
+        return await get_documents(
+            paths,
+            project_id=self.project_id,
+            database_id=self.database_id,
+            token=token,
+            client=self.client,
+        )
+
+    async def list_documents(
+        self,
+        collection_path: str,
+        *,
+        page_size: int | None = None,
+        page_token: str | None = None,
+        order_by: str | None = None,
+        token: Token | None = None,
+    ) -> DocumentList:
+        return await list_documents(
+            collection_path,
+            project_id=self.project_id,
+            database_id=self.database_id,
+            page_size=page_size,
+            page_token=page_token,
+            order_by=order_by,
+            token=token,
+            client=self.client,
+        )
+
+    def iter_documents(
+        self,
+        collection_path: str,
+        *,
+        page_size: int | None = None,
+        order_by: str | None = None,
+        token: Token | None = None,
+    ) -> AsyncIterator[DocumentSnapshot]:
+        return iter_documents(
+            collection_path,
+            project_id=self.project_id,
+            database_id=self.database_id,
+            page_size=page_size,
+            order_by=order_by,
+            token=token,
+            client=self.client,
+        )
@@ -29,6 +29,41 @@ class FirestoreSettings(BaseSettings):
         title="Request timeout",
         description="HTTP request timeout in seconds.",
     )
+    http2: bool = Field(
+        default=True,
+        title="HTTP/2",
+        description="Use HTTP/2 so that concurrent requests share a connection.",
+    )
+    max_connections: int = Field(
+        default=20,
+        gt=0,
+        title="Maximum connections",
+        description="Maximum number of concurrent connections held by a FirestoreClient.",
+    )
+    max_keepalive_connections: int = Field(
+        default=10,
+        ge=0,
+        title="Maximum keep-alive connections",
+        description="Maximum number of idle connections a FirestoreClient keeps open for reuse.",
+    )
+    keepalive_expiry: float = Field(
+        default=30.0,
+        ge=0,
+        title="Keep-alive expiry",
+        description="Seconds an idle connection is kept open.",
+    )
+    batch_get_size: int = Field(
+        default=100,
+        gt=0,
+        title="Batch get size",
+        description="Maximum number of documents requested in one batchGet call.",
+    )
+    page_size: int = Field(
+        default=300,
+        gt=0,
+        title="Page size",
+        description="Number of documents iter_documents requests per page.",
+    )
 
 
 settings_manager = SettingsManager(FirestoreSettings)
@@ -0,0 +1,17 @@
+from kiarina.lib.firebase import Token
+from kiarina.lib.firebase_firestore import get_documents
+
+
+async def test_happy_path(seed_documents: None, user_id: str, token: Token) -> None:
+    snapshots = await get_documents(
+        [
+            f"users/{user_id}/items/c",
+            f"users/{user_id}/items/missing",
+            f"users/{user_id}/items/a",
+        ],
+        token=token,
+    )
+
+    assert [s.id if s else None for s in snapshots] == ["c", None, "a"]
+    assert snapshots[0] is not None
+    assert snapshots[0].fields.get("label") == "c"
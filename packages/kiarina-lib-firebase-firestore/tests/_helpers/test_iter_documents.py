@@ -0,0 +1,13 @@
+from kiarina.lib.firebase import Token
+from kiarina.lib.firebase_firestore import iter_documents
+
+
+async def test_happy_path(seed_documents: None, user_id: str, token: Token) -> None:
+    ids = [
+        snapshot.id
+        async for snapshot in iter_documents(
+            f"users/{user_id}/items", page_size=2, token=token
+        )
+    ]
+
+    assert ids == ["a", "b", "c"]
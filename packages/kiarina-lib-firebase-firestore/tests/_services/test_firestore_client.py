@@ -0,0 +1,131 @@
+import asyncio
+import base64
+import json
+from typing import Any
+
+import httpx
+
+from kiarina.lib.firebase import Token
+from kiarina.lib.firebase_firestore import FirestoreClient, settings_manager
+
+DATABASE = "projects/project_1/databases/(default)"
+
+
+def make_token() -> Token:
+    payload = {"exp": 4102444800, "sub": "user_1", "aud": "project_1"}
+    segment = (
+        base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8"))
+        .decode("ascii")
+        .rstrip("=")
+    )
+    return Token(refresh_token="refresh-token", id_token=f"header.{segment}.signature")
+
+
+def make_document(path: str) -> dict[str, Any]:
+    return {
+        "name": f"{DATABASE}/documents/{path}",
+        "fields": {"label": {"stringValue": path.rsplit("/", 1)[-1]}},
+        "createTime": "2026-01-01T00:00:00Z",
+        "updateTime": "2026-01-01T00:00:00Z",
+    }
+
+
+def make_client(handler: Any) -> FirestoreClient:
+    client = FirestoreClient()
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+async def test_get_documents() -> None:
+    requested: list[list[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path.endswith("/documents:batchGet")
+        names = json.loads(request.content)["documents"]
+        requested.append(names)
+
+        # Reversed to check that results are matched by name, not position
+        return httpx.Response(
+            200,
+            json=[
+                {"missing": name}
+                if name.endswith("/missing")
+                else {"found": make_document(name.split("/documents/", 1)[1])}
+                for name in reversed(names)
+            ],
+        )
+
+    settings_manager.user_config = {"batch_get_size": 2}
+
+    try:
+        async with make_client(handler) as client:
+            snapshots = await client.get_documents(
+                ["items/a", "items/missing", "/items/b/", "items/a"],
+                token=make_token(),
+            )
+    finally:
+        settings_manager.user_config = {}
+
+    assert [s.id if s else None for s in snapshots] == ["a", None, "b", "a"]
+    assert sorted(len(names) for names in requested) == [1, 2]
+
+
+async def test_iter_documents() -> None:
+    pages = {
+        None: (["a", "b"], "page-2"),
+        "page-2": (["c", "d"], "page-3"),
+        "page-3": (["e"], None),
+    }
+    requested: list[str | None] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page_token = request.url.params.get("pageToken")
+        requested.append(page_token)
+        assert request.url.params["pageSize"] == "2"
+
+        ids, next_page_token = pages[page_token]
+        data: dict[str, Any] = {
+            "documents": [make_document(f"items/{id}") for id in ids]
+        }
+
+        if next_page_token is not None:
+            data["nextPageToken"] = next_page_token
+
+        return httpx.Response(200, json=data)
+
+    async with make_client(handler) as client:
+        ids = [
+            snapshot.id
+            async for snapshot in client.iter_documents(
+                "items", page_size=2, token=make_token()
+            )
+        ]
+
+    assert ids == ["a", "b", "c", "d", "e"]
+    assert requested == [None, "page-2", "page-3"]
+
+
+async def test_iter_documents_prefetches_next_page() -> None:
+    requested: list[str | None] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page_token = request.url.params.get("pageToken")
+        requested.append(page_token)
+
+        return httpx.Response(
+            200,
+            json={
+                "documents": [make_document(f"items/{page_token or 'first'}")],
+                "nextPageToken": f"{page_token or ''}x",
+            },
+        )
+
+    async with make_client(handler) as client:
+        iterator = client.iter_documents("items", token=make_token())
+        assert (await anext(iterator)).id == "first"
+        await asyncio.sleep(0)
+
+        # The second page is requested before the first one is consumed
+        assert requested == [None, "x"]
+
+        await iterator.aclose()  # type: ignore[attr-defined]
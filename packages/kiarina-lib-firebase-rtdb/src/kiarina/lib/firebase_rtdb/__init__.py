@@ -9,6 +9,8 @@ if TYPE_CHECKING:  # pragma: no cover
     from ._helpers.watch_data import watch_data
     from ._schemas.data_change_event import DataChangeEvent
     from ._schemas.rtdb_query import RTDBQuery
+    from ._services.rtdb_subscription import RTDBSubscription
+    from ._services.rtdb_watcher import RTDBWatcher
     from ._settings import RTDBSettings, settings_manager
 
 __all__ = [
@@ -21,6 +23,9 @@ __all__ = [
     # ._schemas
     "DataChangeEvent",
     "RTDBQuery",
+    # ._services
+    "RTDBSubscription",
+    "RTDBWatcher",
     # ._settings
     "RTDBSettings",
     "settings_manager",
@@ -43,6 +48,9 @@ def __getattr__(name: str) -> object:
         # ._schemas
         "DataChangeEvent": "._schemas.data_change_event",
         "RTDBQuery": "._schemas.rtdb_query",
+        # ._services
+        "RTDBSubscription": "._services.rtdb_subscription",
+        "RTDBWatcher": "._services.rtdb_watcher",
         # ._settings
         "RTDBSettings": "._settings",
         "settings_manager": "._settings",
@@ -2,6 +2,7 @@ import asyncio
 import json
 import logging
 from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
 from typing import Any, Literal, cast
 
 import httpx
@@ -15,6 +16,7 @@ from kiarina.lib.firebase import (
 from .._exceptions.rtdb_stream_cancelled_error import RTDBStreamCancelledError
 from .._operations.resolve_token_manager import resolve_token_manager
 from .._schemas.data_change_event import DataChangeEvent
+from .._services.sse_parser import SSEParser
 from .._settings import settings_manager
 
 logger = logging.getLogger(__name__)
@@ -26,6 +28,7 @@ async def watch_data(
     *,
     stop_event: asyncio.Event | None = None,
     token_manager: TokenManager | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> AsyncIterator[DataChangeEvent]:
     logger.debug(f"Starting watch on {path} in {database_url}")
     token_manager = resolve_token_manager(token_manager)
@@ -47,7 +50,7 @@ async def watch_data(
                 refresh_pending = False
 
             async for event in _watch_stream(
-                database_url, path, token_manager, stop_event
+                database_url, path, token_manager, stop_event, client
             ):
                 received_event = True
                 retry_delay = settings.initial_retry_delay
@@ -106,6 +109,7 @@ async def _watch_stream(
     path: str,
     token_manager: TokenManager,
     stop_event: asyncio.Event | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> AsyncIterator[DataChangeEvent]:
     id_token = (await token_manager.get_token()).id_token
 
@@ -113,7 +117,16 @@ async def _watch_stream(
     params = {"auth": id_token}
     headers = {"Accept": "text/event-stream"}
 
-    async with httpx.AsyncClient(timeout=None, follow_redirects=True) as client:
+    async with AsyncExitStack() as stack:
+        if client is None:
+            client = await stack.enter_async_context(
+                httpx.AsyncClient(
+                    timeout=None,
+                    follow_redirects=True,
+                    http2=settings_manager.get_settings().http2,
+                )
+            )
+
         async with client.stream(
             "GET", url, params=params, headers=headers
         ) as response:
@@ -127,42 +140,18 @@ async def _parse_sse_stream(
     response: httpx.Response,
     stop_event: asyncio.Event | None = None,
 ) -> AsyncIterator[DataChangeEvent]:
-    buffer = ""
+    parser = SSEParser(max_event_size=settings_manager.get_settings().max_event_size)
 
     async for chunk in response.aiter_text():
         if stop_event and stop_event.is_set():
             logger.debug("Stop event set during stream parsing")
             return
 
-        buffer += chunk
-        lines = buffer.split("\n")
-
-        buffer = lines[-1]
-        lines = lines[:-1]
-
-        event_type: str | None = None
-        event_data: str | None = None
-
-        for line in lines:
-            line = line.strip()
-
-            if not line:
-                # An empty line terminates an SSE event.
-                if event_type is not None:
-                    event = _handle_sse_event(event_type, event_data)
+        for sse_event in parser.feed(chunk):
+            event = _handle_sse_event(sse_event.event, sse_event.data)
 
-                    if event is not None:
-                        yield event
-
-                    event_type = None
-                    event_data = None
-
-                continue
-
-            if line.startswith("event:"):
-                event_type = line[6:].strip()
-            elif line.startswith("data:"):
-                event_data = line[5:].strip()
+            if event is not None:
+                yield event
 
 
 def _handle_sse_event(
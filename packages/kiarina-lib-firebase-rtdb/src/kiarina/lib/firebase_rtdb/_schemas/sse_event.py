@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class SSEEvent:
+    """A server-sent event before its data is decoded."""
+
+    event: str
+    data: str
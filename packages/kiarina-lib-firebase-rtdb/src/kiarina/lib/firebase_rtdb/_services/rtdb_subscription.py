@@ -0,0 +1,75 @@
+import asyncio
+from collections.abc import Callable
+from typing import Literal, Self
+
+from .._schemas.data_change_event import DataChangeEvent
+
+
+class RTDBSubscription:
+    """Events for one path, delivered by RTDBWatcher to one subscriber."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        queue_size: int,
+        overflow: Literal["block", "drop_oldest"],
+        on_close: Callable[["RTDBSubscription"], None],
+    ) -> None:
+        self.path = path
+        self.dropped_count = 0
+        self._overflow = overflow
+        self._on_close = on_close
+        # None only wakes a waiting consumer, so it may exceed queue_size by one
+        self._queue: asyncio.Queue[DataChangeEvent | None] = asyncio.Queue(queue_size)
+        self._finished = False
+        self._error: Exception | None = None
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> DataChangeEvent:
+        while True:
+            if self._finished and self._queue.empty():
+                if self._error is not None:
+                    raise self._error
+
+                raise StopAsyncIteration
+
+            if (event := await self._queue.get()) is not None:
+                return event
+
+    def close(self) -> None:
+        if self._finished:
+            return
+
+        # Discarding the backlog also releases a stream blocked on a full queue
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+        self._finish(None)
+        self._on_close(self)
+
+    async def _put(self, event: DataChangeEvent) -> None:
+        if self._finished:
+            return
+
+        if self._overflow == "block":
+            await self._queue.put(event)
+            return
+
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped_count += 1
+
+        self._queue.put_nowait(event)
+
+    def _finish(self, error: Exception | None) -> None:
+        if self._finished:
+            return
+
+        self._finished = True
+        self._error = error
+
+        if not self._queue.full():
+            self._queue.put_nowait(None)
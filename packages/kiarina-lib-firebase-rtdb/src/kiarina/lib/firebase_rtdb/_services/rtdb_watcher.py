@@ -0,0 +1,151 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Literal, Self
+
+import httpx
+
+from kiarina.lib.firebase import TokenManager
+
+from .._helpers.watch_data import watch_data
+from .._operations.resolve_token_manager import resolve_token_manager
+from .._settings import settings_manager
+from .rtdb_subscription import RTDBSubscription
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Channel:
+    task: asyncio.Task[None] | None = None
+    subscriptions: list[RTDBSubscription] = field(default_factory=list)
+
+
+class RTDBWatcher:
+    """Shares streams and connections among subscriptions to many paths.
+
+    Each path is streamed once, however many subscriptions it has, and every
+    stream goes through one HTTP client so that HTTP/2 can carry them over a
+    few connections.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        *,
+        token_manager: TokenManager | None = None,
+        queue_size: int | None = None,
+        overflow: Literal["block", "drop_oldest"] | None = None,
+    ) -> None:
+        settings = settings_manager.get_settings()
+
+        self._database_url = database_url
+        self._token_manager = resolve_token_manager(token_manager)
+        self._queue_size = queue_size or settings.subscriber_queue_size
+        self._overflow = overflow or settings.subscriber_overflow
+        self._http2 = settings.http2
+        self._client: httpx.AsyncClient | None = None
+        self._channels: dict[str, _Channel] = {}
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    @property
+    def paths(self) -> list[str]:
+        return list(self._channels)
+
+    def subscribe(self, path: str) -> RTDBSubscription:
+        subscription = RTDBSubscription(
+            path,
+            queue_size=self._queue_size,
+            overflow=self._overflow,
+            on_close=self._unsubscribe,
+        )
+
+        if (channel := self._channels.get(path)) is None:
+            channel = self._channels[path] = _Channel()
+            channel.task = asyncio.create_task(self._run(path, channel))
+            logger.debug(f"Started watching {path}")
+
+        channel.subscriptions.append(subscription)
+        return subscription
+
+    async def close(self) -> None:
+        channels = list(self._channels.values())
+        self._channels.clear()
+
+        for channel in channels:
+            for subscription in channel.subscriptions:
+                subscription._finish(None)
+
+            if channel.task is not None:
+                channel.task.cancel()
+
+        await asyncio.gather(
+            *(channel.task for channel in channels if channel.task is not None),
+            return_exceptions=True,
+        )
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            # Streams stay open indefinitely, so the pool must not cap them
+            self._client = httpx.AsyncClient(
+                timeout=None,
+                follow_redirects=True,
+                http2=self._http2,
+                limits=httpx.Limits(max_connections=None),
+            )
+
+        return self._client
+
+    def _unsubscribe(self, subscription: RTDBSubscription) -> None:
+        channel = self._channels.get(subscription.path)
+
+        if channel is None or subscription not in channel.subscriptions:
+            return
+
+        channel.subscriptions.remove(subscription)
+
+        if not channel.subscriptions:
+            del self._channels[subscription.path]
+
+            if channel.task is not None:
+                channel.task.cancel()
+
+            logger.debug(f"Stopped watching {subscription.path}")
+
+    async def _run(self, path: str, channel: _Channel) -> None:
+        error: Exception | None = None
+
+        try:
+            async for event in watch_data(
+                self._database_url,
+                path,
+                token_manager=self._token_manager,
+                client=self._get_client(),
+            ):
+                for subscription in list(channel.subscriptions):
+                    await subscription._put(event)
+
+        except Exception as e:
+            logger.error(f"Watch on {path} failed: {e}")
+            error = e
+
+        for subscription in channel.subscriptions:
+            subscription._finish(error)
+
+        if self._channels.get(path) is channel:
+            del self._channels[path]
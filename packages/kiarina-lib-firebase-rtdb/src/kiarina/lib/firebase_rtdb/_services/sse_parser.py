@@ -0,0 +1,95 @@
+import re
+
+from .._schemas.sse_event import SSEEvent
+
+_LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+
+class SSEParser:
+    """Incremental parser for a text/event-stream body.
+
+    Each chunk is scanned once, so parsing stays linear in the stream size.
+    Only the unfinished line and the event being assembled are buffered, and
+    ``max_event_size`` caps how large those may grow.
+    """
+
+    def __init__(self, *, max_event_size: int | None = None) -> None:
+        self._max_event_size = max_event_size
+        self._line: list[str] = []
+        self._line_size = 0
+        self._event_type = ""
+        self._data: list[str] = []
+        self._data_size = 0
+        self._pending_cr = False
+
+    def feed(self, chunk: str) -> list[SSEEvent]:
+        if self._pending_cr and chunk.startswith("\n"):
+            # The CRLF was split across chunks and the CR already ended the line
+            chunk = chunk[1:]
+
+        self._pending_cr = chunk.endswith("\r")
+
+        *lines, rest = _LINE_BREAK.split(chunk)
+        events: list[SSEEvent] = []
+
+        for line in lines:
+            if self._line:
+                self._line.append(line)
+                line = "".join(self._line)
+                self._line.clear()
+                self._line_size = 0
+
+            if (event := self._process_line(line)) is not None:
+                events.append(event)
+
+        if rest:
+            self._line.append(rest)
+            self._line_size += len(rest)
+            self._check_size()
+
+        return events
+
+    def _process_line(self, line: str) -> SSEEvent | None:
+        if not line:
+            return self._dispatch()
+
+        if line.startswith(":"):
+            return None
+
+        field, _, value = line.partition(":")
+
+        if value.startswith(" "):
+            value = value[1:]
+
+        if field == "event":
+            self._event_type = value
+
+        elif field == "data":
+            self._data.append(value)
+            self._data_size += len(value) + 1
+            self._check_size()
+
+        return None
+
+    def _dispatch(self) -> SSEEvent | None:
+        if not self._event_type and not self._data:
+            return None
+
+        event = SSEEvent(
+            event=self._event_type or "message",
+            data="\n".join(self._data),
+        )
+
+        self._event_type = ""
+        self._data.clear()
+        self._data_size = 0
+        return event
+
+    def _check_size(self) -> None:
+        if self._max_event_size is None:
+            return
+
+        if self._line_size + self._data_size > self._max_event_size:
+            raise ValueError(
+                f"Server-sent event exceeds max_event_size ({self._max_event_size})"
+            )
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic_settings_manager import SettingsManager
@@ -31,6 +33,28 @@ class RTDBSettings(BaseSettings):
         title="Retry delay multiplier",
         description="Multiplier applied to the retry delay after a network error.",
     )
+    http2: bool = Field(
+        default=True,
+        title="HTTP/2",
+        description="Use HTTP/2 so that concurrent streams share a connection.",
+    )
+    max_event_size: int | None = Field(
+        default=64 * 1024 * 1024,
+        gt=0,
+        title="Maximum event size",
+        description="Maximum number of characters buffered for one server-sent event. None disables the limit.",
+    )
+    subscriber_queue_size: int = Field(
+        default=100,
+        gt=0,
+        title="Subscriber queue size",
+        description="Number of events RTDBWatcher buffers for each subscription.",
+    )
+    subscriber_overflow: Literal["block", "drop_oldest"] = Field(
+        default="block",
+        title="Subscriber overflow",
+        description="What RTDBWatcher does when a subscription queue is full. 'block' pauses reading the stream until the subscriber catches up, and 'drop_oldest' discards the oldest queued event.",
+    )
 
 
 settings_manager = SettingsManager(RTDBSettings)
@@ -76,6 +76,7 @@ def _install_stream(
         path: str,
         token_manager: Any,
         stop_event: Any = None,
+        client: Any = None,
     ) -> AsyncIterator[DataChangeEvent]:
         refresh_counts.append(token_manager.refresh_count)
 
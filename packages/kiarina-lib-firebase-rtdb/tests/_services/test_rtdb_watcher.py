@@ -0,0 +1,131 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+import pytest
+
+from kiarina.lib.firebase import TokenManager
+from kiarina.lib.firebase_rtdb import DataChangeEvent, RTDBWatcher
+from kiarina.lib.firebase_rtdb._services import rtdb_watcher as rtdb_watcher_module
+
+
+class _FakeStreams:
+    """Stands in for watch_data, with one scripted queue per path."""
+
+    def __init__(self) -> None:
+        self.queues: dict[str, asyncio.Queue[DataChangeEvent | Exception | None]] = {}
+        self.started: list[str] = []
+        self.cancelled: list[str] = []
+
+    def queue(self, path: str) -> asyncio.Queue[DataChangeEvent | Exception | None]:
+        return self.queues.setdefault(path, asyncio.Queue())
+
+    async def watch_data(
+        self, database_url: str, path: str, **kwargs: Any
+    ) -> AsyncIterator[DataChangeEvent]:
+        self.started.append(path)
+        queue = self.queue(path)
+
+        try:
+            while (item := await queue.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+
+                yield item
+        except asyncio.CancelledError:
+            self.cancelled.append(path)
+            raise
+
+
+@pytest.fixture
+def streams(monkeypatch: pytest.MonkeyPatch) -> _FakeStreams:
+    streams = _FakeStreams()
+    monkeypatch.setattr(rtdb_watcher_module, "watch_data", streams.watch_data)
+    return streams
+
+
+def _watcher(**kwargs: Any) -> RTDBWatcher:
+    return RTDBWatcher(
+        "https://db.example.com", token_manager=cast(TokenManager, object()), **kwargs
+    )
+
+
+def _event(data: Any) -> DataChangeEvent:
+    return DataChangeEvent(event_type="put", path="/", data=data)
+
+
+async def test_subscriptions_share_a_stream(streams: _FakeStreams) -> None:
+    async with _watcher() as watcher:
+        first = watcher.subscribe("/devices/a")
+        second = watcher.subscribe("/devices/a")
+        other = watcher.subscribe("/devices/b")
+
+        streams.queue("/devices/a").put_nowait(_event(1))
+        streams.queue("/devices/b").put_nowait(_event(2))
+
+        assert (await anext(first)).data == 1
+        assert (await anext(second)).data == 1
+        assert (await anext(other)).data == 2
+        assert sorted(streams.started) == ["/devices/a", "/devices/b"]
+
+        first.close()
+        await asyncio.sleep(0)
+        assert watcher.paths == ["/devices/a", "/devices/b"]
+
+        second.close()
+        await asyncio.sleep(0)
+        assert watcher.paths == ["/devices/b"]
+        assert streams.cancelled == ["/devices/a"]
+
+    assert [event async for event in other] == []
+
+
+async def test_stream_end_and_error(streams: _FakeStreams) -> None:
+    async with _watcher() as watcher:
+        ended = watcher.subscribe("/a")
+        failed = watcher.subscribe("/b")
+
+        streams.queue("/a").put_nowait(_event(1))
+        streams.queue("/a").put_nowait(None)
+        streams.queue("/b").put_nowait(RuntimeError("cancelled"))
+
+        assert [event.data async for event in ended] == [1]
+
+        with pytest.raises(RuntimeError, match="cancelled"):
+            await anext(failed)
+
+        assert watcher.paths == []
+
+
+async def test_drop_oldest(streams: _FakeStreams) -> None:
+    async with _watcher(queue_size=2, overflow="drop_oldest") as watcher:
+        subscription = watcher.subscribe("/a")
+
+        for i in range(5):
+            streams.queue("/a").put_nowait(_event(i))
+
+        streams.queue("/a").put_nowait(None)
+
+        while "/a" in watcher.paths:
+            await asyncio.sleep(0)
+
+        assert [event.data async for event in subscription] == [3, 4]
+        assert subscription.dropped_count == 3
+
+
+async def test_block_waits_for_slow_subscriber(streams: _FakeStreams) -> None:
+    async with _watcher(queue_size=1, overflow="block") as watcher:
+        subscription = watcher.subscribe("/a")
+
+        for i in range(3):
+            streams.queue("/a").put_nowait(_event(i))
+
+        await asyncio.sleep(0.01)
+        # One event is queued, one is waiting to be queued, one is still unread
+        assert streams.queue("/a").qsize() == 1
+
+        assert [(await anext(subscription)).data for _ in range(3)] == [0, 1, 2]
+
+        subscription.close()
+        await asyncio.sleep(0)
+        assert watcher.paths == []
@@ -0,0 +1,54 @@
+import pytest
+
+from kiarina.lib.firebase_rtdb._schemas.sse_event import SSEEvent
+from kiarina.lib.firebase_rtdb._services.sse_parser import SSEParser
+
+_STREAM = (
+    "event: put\r\n"
+    'data: {"path": "/", "data": 1}\r\n'
+    "\r\n"
+    ": comment\n"
+    "event: keep-alive\n"
+    "data: null\n"
+    "\n"
+    "event: patch\n"
+    'data: {"path": "/a",\n'
+    'data: "data": {"b": 2}}\n'
+    "\n"
+)
+
+_EVENTS = [
+    SSEEvent(event="put", data='{"path": "/", "data": 1}'),
+    SSEEvent(event="keep-alive", data="null"),
+    SSEEvent(event="patch", data='{"path": "/a",\n"data": {"b": 2}}'),
+]
+
+
+def test_parse_whole_stream() -> None:
+    assert SSEParser().feed(_STREAM) == _EVENTS
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 16])
+def test_parse_chunked_stream(size: int) -> None:
+    parser = SSEParser()
+    events: list[SSEEvent] = []
+
+    for i in range(0, len(_STREAM), size):
+        events.extend(parser.feed(_STREAM[i : i + size]))
+
+    assert events == _EVENTS
+
+
+def test_event_without_terminator_is_held() -> None:
+    parser = SSEParser()
+
+    assert parser.feed("event: put\ndata: 1\n") == []
+    assert parser.feed("\n") == [SSEEvent(event="put", data="1")]
+
+
+def test_max_event_size() -> None:
+    parser = SSEParser(max_event_size=16)
+    parser.feed("event: put\ndata: 0123456789\n\n")
+
+    with pytest.raises(ValueError, match="max_event_size"):
+        parser.feed("event: put\ndata: 0123456789abcdef")
@@ -1,4 +1,5 @@
-from typing import Any
+from collections.abc import AsyncIterator, Callable, Sequence
+from typing import Any, Literal
 
 from redis.asyncio import Redis
 
@@ -8,16 +9,21 @@ from kiarina.lib.redisearch_schema import RedisearchSchema
 from ..._core.operations.count import count
 from ..._core.operations.create_index import create_index
 from ..._core.operations.delete import delete
+from ..._core.operations.delete_many import delete_many
 from ..._core.operations.drop_index import drop_index
 from ..._core.operations.exists_index import exists_index
 from ..._core.operations.find import find
 from ..._core.operations.get import get
 from ..._core.operations.get_info import get_info
 from ..._core.operations.get_key import get_key
+from ..._core.operations.get_many import get_many
+from ..._core.operations.iter_find import iter_find
+from ..._core.operations.iter_search import iter_search
 from ..._core.operations.migrate_index import migrate_index
 from ..._core.operations.reset_index import reset_index
 from ..._core.operations.search import search
 from ..._core.operations.set import set
+from ..._core.operations.set_many import set_many
 from ..._core.schemas.document import Document
 from ..._core.schemas.redisearch_context import RedisearchContext
 from ..._core.views.info_result import InfoResult
@@ -59,8 +65,15 @@ class RedisearchClient:
     async def reset_index(self) -> None:
         await reset_index("async", self.ctx)
 
-    async def migrate_index(self) -> None:
-        await migrate_index("async", self.ctx)
+    async def migrate_index(
+        self,
+        *,
+        strategy: Literal["recreate", "blue_green"] | None = None,
+        on_progress: Callable[[InfoResult], None] | None = None,
+    ) -> None:
+        await migrate_index(
+            "async", self.ctx, strategy=strategy, on_progress=on_progress
+        )
 
     async def get_info(self) -> InfoResult:
         return await get_info("async", self.ctx)
@@ -78,6 +91,25 @@ class RedisearchClient:
     async def get(self, id: str) -> Document | None:
         return await get("async", self.ctx, id)
 
+    async def set_many(
+        self,
+        mappings: Sequence[dict[str, Any]],
+        *,
+        ids: Sequence[str] | None = None,
+        batch_size: int | None = None,
+    ) -> None:
+        await set_many("async", self.ctx, mappings, ids=ids, batch_size=batch_size)
+
+    async def delete_many(
+        self, ids: Sequence[str], *, batch_size: int | None = None
+    ) -> None:
+        await delete_many("async", self.ctx, ids, batch_size=batch_size)
+
+    async def get_many(
+        self, ids: Sequence[str], *, batch_size: int | None = None
+    ) -> list[Document | None]:
+        return await get_many("async", self.ctx, ids, batch_size=batch_size)
+
     # --------------------------------------------------
     # Search operations
     # --------------------------------------------------
@@ -129,6 +161,44 @@ class RedisearchClient:
             return_fields=return_fields,
         )
 
+    def iter_find(
+        self,
+        *,
+        filter: RedisearchFilter | RedisearchFilterConditions | None = None,
+        sort_by: str | None = None,
+        sort_desc: bool = False,
+        page_size: int | None = None,
+        return_fields: list[str] | None = None,
+    ) -> AsyncIterator[Document]:
+        return iter_find(
+            "async",
+            self.ctx,
+            filter=filter,
+            sort_by=sort_by,
+            sort_desc=sort_desc,
+            page_size=page_size,
+            return_fields=return_fields,
+        )
+
+    def iter_search(
+        self,
+        *,
+        vector: list[float],
+        filter: RedisearchFilter | RedisearchFilterConditions | None = None,
+        page_size: int | None = None,
+        limit: int | None = None,
+        return_fields: list[str] | None = None,
+    ) -> AsyncIterator[Document]:
+        return iter_search(
+            "async",
+            self.ctx,
+            vector=vector,
+            filter=filter,
+            page_size=page_size,
+            limit=limit,
+            return_fields=return_fields,
+        )
+
     # --------------------------------------------------
     # Utilities
     # --------------------------------------------------
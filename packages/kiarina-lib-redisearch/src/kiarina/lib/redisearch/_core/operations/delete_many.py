@@ -0,0 +1,65 @@
+from collections.abc import Awaitable, Sequence
+from typing import Literal, overload
+
+from ..schemas.redisearch_context import RedisearchContext
+from .get_key import get_key
+
+
+@overload
+def delete_many(
+    mode: Literal["sync"],
+    ctx: RedisearchContext,
+    ids: Sequence[str],
+    *,
+    batch_size: int | None = None,
+) -> None: ...
+
+
+@overload
+def delete_many(
+    mode: Literal["async"],
+    ctx: RedisearchContext,
+    ids: Sequence[str],
+    *,
+    batch_size: int | None = None,
+) -> Awaitable[None]: ...
+
+
+def delete_many(
+    mode: Literal["sync", "async"],
+    ctx: RedisearchContext,
+    ids: Sequence[str],
+    *,
+    batch_size: int | None = None,
+) -> Awaitable[None] | None:
+    if batch_size is None:
+        batch_size = ctx.settings.batch_size
+
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+
+    keys = [get_key(ctx, id) for id in ids]
+
+    def _sync() -> None:
+        for start in range(0, len(keys), batch_size):
+            pipeline = ctx.redis.pipeline(transaction=False)
+
+            for key in keys[start : start + batch_size]:
+                pipeline.delete(key)
+
+            pipeline.execute()
+
+    async def _async() -> None:
+        for start in range(0, len(keys), batch_size):
+            pipeline = ctx.redis_async.pipeline(transaction=False)
+
+            for key in keys[start : start + batch_size]:
+                pipeline.delete(key)
+
+            await pipeline.execute()
+
+    if mode == "sync":
+        _sync()
+        return None
+    else:
+        return _async()
@@ -32,6 +32,8 @@ def get_info(
             num_docs=int(result.get("num_docs", 0)),
             num_terms=int(result.get("num_terms", 0)),
             num_records=int(result.get("num_records", 0)),
+            indexing=bool(int(result.get("indexing", 0))),
+            percent_indexed=float(result.get("percent_indexed", 1.0)),
             index_schema=_parse_schema(ctx.schema, result),
         )
 
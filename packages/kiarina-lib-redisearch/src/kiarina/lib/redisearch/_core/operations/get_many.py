@@ -0,0 +1,96 @@
+from collections.abc import Awaitable, Sequence
+from typing import Any, Literal, overload
+
+from ..schemas.document import Document
+from ..schemas.redisearch_context import RedisearchContext
+from ..utils.unmarshal_mappings import unmarshal_mappings
+from .get_key import get_key
+
+
+@overload
+def get_many(
+    mode: Literal["sync"],
+    ctx: RedisearchContext,
+    ids: Sequence[str],
+    *,
+    batch_size: int | None = None,
+) -> list[Document | None]: ...
+
+
+@overload
+def get_many(
+    mode: Literal["async"],
+    ctx: RedisearchContext,
+    ids: Sequence[str],
+    *,
+    batch_size: int | None = None,
+) -> Awaitable[list[Document | None]]: ...
+
+
+def get_many(
+    mode: Literal["sync", "async"],
+    ctx: RedisearchContext,
+    ids: Sequence[str],
+    *,
+    batch_size: int | None = None,
+) -> list[Document | None] | Awaitable[list[Document | None]]:
+    if batch_size is None:
+        batch_size = ctx.settings.batch_size
+
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+
+    keys = [get_key(ctx, id) for id in ids]
+
+    def _after(start: int, mappings: list[Any]) -> list[Document | None]:
+        documents: list[Document | None] = []
+
+        end = start + len(mappings)
+
+        for key, id, mapping in zip(
+            keys[start:end], ids[start:end], mappings, strict=True
+        ):
+            if not mapping:
+                documents.append(None)
+                continue
+
+            documents.append(
+                Document(
+                    key=key,
+                    id=id,
+                    mapping=unmarshal_mappings(schema=ctx.schema, mapping=mapping),
+                )
+            )
+
+        return documents
+
+    def _sync() -> list[Document | None]:
+        documents: list[Document | None] = []
+
+        for start in range(0, len(keys), batch_size):
+            pipeline = ctx.redis.pipeline(transaction=False)
+
+            for key in keys[start : start + batch_size]:
+                pipeline.hgetall(key)
+
+            documents.extend(_after(start, pipeline.execute()))
+
+        return documents
+
+    async def _async() -> list[Document | None]:
+        documents: list[Document | None] = []
+
+        for start in range(0, len(keys), batch_size):
+            pipeline = ctx.redis_async.pipeline(transaction=False)
+
+            for key in keys[start : start + batch_size]:
+                pipeline.hgetall(key)
+
+            documents.extend(_after(start, await pipeline.execute()))
+
+        return documents
+
+    if mode == "sync":
+        return _sync()
+    else:
+        return _async()
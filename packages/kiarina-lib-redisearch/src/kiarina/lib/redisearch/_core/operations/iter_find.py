@@ -0,0 +1,107 @@
+from collections.abc import AsyncIterator, Iterator
+from typing import Literal, overload
+
+from kiarina.lib.redisearch_filter import (
+    RedisearchFilter,
+    RedisearchFilterConditions,
+    create_redisearch_filter,
+)
+
+from ..schemas.document import Document
+from ..schemas.redisearch_context import RedisearchContext
+from .find import find
+
+
+@overload
+def iter_find(
+    mode: Literal["sync"],
+    ctx: RedisearchContext,
+    filter: RedisearchFilter | RedisearchFilterConditions | None = None,
+    sort_by: str | None = None,
+    sort_desc: bool = False,
+    page_size: int | None = None,
+    return_fields: list[str] | None = None,
+) -> Iterator[Document]: ...
+
+
+@overload
+def iter_find(
+    mode: Literal["async"],
+    ctx: RedisearchContext,
+    filter: RedisearchFilter | RedisearchFilterConditions | None = None,
+    sort_by: str | None = None,
+    sort_desc: bool = False,
+    page_size: int | None = None,
+    return_fields: list[str] | None = None,
+) -> AsyncIterator[Document]: ...
+
+
+def iter_find(
+    mode: Literal["sync", "async"],
+    ctx: RedisearchContext,
+    filter: RedisearchFilter | RedisearchFilterConditions | None = None,
+    sort_by: str | None = None,
+    sort_desc: bool = False,
+    page_size: int | None = None,
+    return_fields: list[str] | None = None,
+) -> Iterator[Document] | AsyncIterator[Document]:
+    if filter is not None:
+        filter = create_redisearch_filter(filter=filter, schema=ctx.schema)
+
+    if page_size is None:
+        page_size = ctx.settings.page_size
+
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+
+    # Each page is a bounded FT.SEARCH, so no count query is needed and only
+    # one page of documents is held at a time.
+    def _sync() -> Iterator[Document]:
+        offset = 0
+
+        while True:
+            result = find(
+                "sync",
+                ctx,
+                filter=filter,
+                sort_by=sort_by,
+                sort_desc=sort_desc,
+                offset=offset,
+                limit=page_size,
+                return_fields=return_fields,
+            )
+
+            yield from result.documents
+
+            offset += len(result.documents)
+
+            if len(result.documents) < page_size or offset >= result.total:
+                break
+
+    async def _async() -> AsyncIterator[Document]:
+        offset = 0
+
+        while True:
+            result = await find(
+                "async",
+                ctx,
+                filter=filter,
+                sort_by=sort_by,
+                sort_desc=sort_desc,
+                offset=offset,
+                limit=page_size,
+                return_fields=return_fields,
+            )
+
+            for document in result.documents:
+                yield document
+
+            offset += len(result.documents)
+
+            if len(result.documents) < page_size or offset >= result.total:
+                break
+
+    if mode == "sync":
+        return _sync()
+    else:
+        return _async()
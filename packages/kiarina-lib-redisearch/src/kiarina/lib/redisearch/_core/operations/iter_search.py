@@ -0,0 +1,117 @@
+from collections.abc import AsyncIterator, Iterator
+from typing import Literal, overload
+
+from kiarina.lib.redisearch_filter import (
+    RedisearchFilter,
+    RedisearchFilterConditions,
+    create_redisearch_filter,
+)
+
+from ..schemas.document import Document
+from ..schemas.redisearch_context import RedisearchContext
+from .search import search
+
+
+@overload
+def iter_search(
+    mode: Literal["sync"],
+    ctx: RedisearchContext,
+    vector: list[float],
+    filter: RedisearchFilter | RedisearchFilterConditions | None = None,
+    page_size: int | None = None,
+    limit: int | None = None,
+    return_fields: list[str] | None = None,
+) -> Iterator[Document]: ...
+
+
+@overload
+def iter_search(
+    mode: Literal["async"],
+    ctx: RedisearchContext,
+    vector: list[float],
+    filter: RedisearchFilter | RedisearchFilterConditions | None = None,
+    page_size: int | None = None,
+    limit: int | None = None,
+    return_fields: list[str] | None = None,
+) -> AsyncIterator[Document]: ...
+
+
+def iter_search(
+    mode: Literal["sync", "async"],
+    ctx: RedisearchContext,
+    vector: list[float],
+    filter: RedisearchFilter | RedisearchFilterConditions | None = None,
+    page_size: int | None = None,
+    limit: int | None = None,
+    return_fields: list[str] | None = None,
+) -> Iterator[Document] | AsyncIterator[Document]:
+    if filter is not None:
+        filter = create_redisearch_filter(filter=filter, schema=ctx.schema)
+
+    if page_size is None:
+        page_size = ctx.settings.page_size
+
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+
+    if limit is None:
+        limit = ctx.settings.iter_search_limit
+
+    if limit <= 0:
+        raise ValueError("limit must be positive")
+
+    # search() uses limit as the KNN size and pages within it, so each page
+    # asks for the nearest offset + page_size documents and keeps the tail.
+    # The total work grows quadratically with the documents read, hence the
+    # limit on how far the iteration may go.
+    def _sync() -> Iterator[Document]:
+        offset = 0
+
+        while offset < limit:
+            size = min(page_size, limit - offset)
+
+            result = search(
+                "sync",
+                ctx,
+                vector=vector,
+                filter=filter,
+                offset=offset,
+                limit=offset + size,
+                return_fields=list(return_fields or []),
+            )
+
+            yield from result.documents
+
+            offset += len(result.documents)
+
+            if len(result.documents) < size:
+                break
+
+    async def _async() -> AsyncIterator[Document]:
+        offset = 0
+
+        while offset < limit:
+            size = min(page_size, limit - offset)
+
+            result = await search(
+                "async",
+                ctx,
+                vector=vector,
+                filter=filter,
+                offset=offset,
+                limit=offset + size,
+                return_fields=list(return_fields or []),
+            )
+
+            for document in result.documents:
+                yield document
+
+            offset += len(result.documents)
+
+            if len(result.documents) < size:
+                break
+
+    if mode == "sync":
+        return _sync()
+    else:
+        return _async()
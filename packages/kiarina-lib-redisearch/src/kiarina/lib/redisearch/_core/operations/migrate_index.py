@@ -1,14 +1,18 @@
 import logging
-from collections.abc import Awaitable
+import re
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
 from typing import Any, Literal, overload
 
 from kiarina.lib.redisearch_schema import RedisearchSchema
 
 from ..schemas.redisearch_context import RedisearchContext
+from ..views.info_result import InfoResult
 from .create_index import create_index
 from .drop_index import drop_index
 from .exists_index import exists_index
 from .get_info import get_info
+from .wait_for_indexing import wait_for_indexing
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +21,9 @@ logger = logging.getLogger(__name__)
 def migrate_index(
     mode: Literal["sync"],
     ctx: RedisearchContext,
+    *,
+    strategy: Literal["recreate", "blue_green"] | None = None,
+    on_progress: Callable[[InfoResult], None] | None = None,
 ) -> bool: ...
 
 
@@ -24,16 +31,24 @@ def migrate_index(
 def migrate_index(
     mode: Literal["async"],
     ctx: RedisearchContext,
+    *,
+    strategy: Literal["recreate", "blue_green"] | None = None,
+    on_progress: Callable[[InfoResult], None] | None = None,
 ) -> Awaitable[bool]: ...
 
 
 def migrate_index(
     mode: Literal["sync", "async"],
     ctx: RedisearchContext,
+    *,
+    strategy: Literal["recreate", "blue_green"] | None = None,
+    on_progress: Callable[[InfoResult], None] | None = None,
 ) -> bool | Awaitable[bool]:
+    strategy = strategy or ctx.settings.migration_strategy
+    alias = ctx.settings.index_name
 
-    def _log_create_new_index() -> None:
-        logger.info("Createing new index '%s'", ctx.settings.index_name)
+    def _log_create_new_index(index_name: str = alias) -> None:
+        logger.info("Creating new index '%s'", index_name)
 
     def _log_no_schema_changes() -> None:
         logger.info("No schema changes detected, migration not needed.")
@@ -50,6 +65,25 @@ def migrate_index(
             ctx.settings.index_name,
         )
 
+    def _log_switch_alias(index_name: str) -> None:
+        logger.info("Switching alias '%s' to index '%s'", alias, index_name)
+
+    def _log_old_index_kept(index_name: str) -> None:
+        logger.warning(
+            "Previous index '%s' was kept because index deletion is protected",
+            index_name,
+        )
+
+    def _get_diffs(info_result: InfoResult) -> dict[str, tuple[Any, Any]]:
+        diffs = _check_schema_changes(current=info_result.index_schema, new=ctx.schema)
+
+        if not diffs:
+            _log_no_schema_changes()
+        else:
+            _log_migration_needed(diffs)
+
+        return diffs
+
     def _sync() -> bool:
         if not exists_index(mode="sync", ctx=ctx):
             _log_create_new_index()
@@ -57,14 +91,10 @@ def migrate_index(
             return True
 
         info_result = get_info(mode="sync", ctx=ctx)
-        diffs = _check_schema_changes(current=info_result.index_schema, new=ctx.schema)
 
-        if not diffs:
-            _log_no_schema_changes()
+        if not _get_diffs(info_result):
             return False
 
-        _log_migration_needed(diffs)
-
         _log_delete_index()
         drop_index(mode="sync", ctx=ctx, delete_documents=False)
 
@@ -79,14 +109,10 @@ def migrate_index(
             return True
 
         info_result = await get_info(mode="async", ctx=ctx)
-        diffs = _check_schema_changes(current=info_result.index_schema, new=ctx.schema)
 
-        if not diffs:
-            _log_no_schema_changes()
+        if not _get_diffs(info_result):
             return False
 
-        _log_migration_needed(diffs)
-
         _log_delete_index()
         await drop_index(mode="async", ctx=ctx, delete_documents=False)
 
@@ -94,12 +120,158 @@ def migrate_index(
         await create_index(mode="async", ctx=ctx)
         return True
 
+    # Blue/green: the configured index name becomes an alias of a versioned
+    # index, so queries keep hitting the live index until the new one is built.
+
+    def _sync_blue_green() -> bool:
+        live = (
+            get_info(mode="sync", ctx=ctx)
+            if exists_index(mode="sync", ctx=ctx)
+            else None
+        )
+
+        if live is not None and not _get_diffs(live):
+            return False
+
+        _check_replaceable(ctx, live)
+        new_ctx = _versioned_ctx(ctx, live)
+
+        if exists_index(mode="sync", ctx=new_ctx):
+            drop_index(mode="sync", ctx=new_ctx, delete_documents=False)
+
+        _log_create_new_index(new_ctx.settings.index_name)
+        create_index(mode="sync", ctx=new_ctx)
+
+        try:
+            wait_for_indexing(
+                mode="sync",
+                ctx=new_ctx,
+                timeout=ctx.settings.migration_timeout,
+                on_progress=on_progress,
+            )
+        except BaseException:
+            # A half-built index is never left behind, whatever interrupted it.
+            # This call created it, so deletion protection does not apply.
+            drop_index(
+                mode="sync", ctx=_unprotected_ctx(new_ctx), delete_documents=False
+            )
+            raise
+
+        # Index names take precedence over aliases, so a plain index keeps
+        # serving queries until it is dropped after the alias exists.
+        _log_switch_alias(new_ctx.settings.index_name)
+        ctx.redis.ft(new_ctx.settings.index_name).aliasupdate(alias)
+
+        if live is not None and live.index_name == alias:
+            drop_index(mode="sync", ctx=ctx, delete_documents=False)
+        elif live is not None:
+            old_ctx = _renamed_ctx(ctx, live.index_name)
+
+            if not drop_index(mode="sync", ctx=old_ctx, delete_documents=False):
+                _log_old_index_kept(live.index_name)
+
+        return True
+
+    async def _async_blue_green() -> bool:
+        live = (
+            await get_info(mode="async", ctx=ctx)
+            if await exists_index(mode="async", ctx=ctx)
+            else None
+        )
+
+        if live is not None and not _get_diffs(live):
+            return False
+
+        _check_replaceable(ctx, live)
+        new_ctx = _versioned_ctx(ctx, live)
+
+        if await exists_index(mode="async", ctx=new_ctx):
+            await drop_index(mode="async", ctx=new_ctx, delete_documents=False)
+
+        _log_create_new_index(new_ctx.settings.index_name)
+        await create_index(mode="async", ctx=new_ctx)
+
+        try:
+            await wait_for_indexing(
+                mode="async",
+                ctx=new_ctx,
+                timeout=ctx.settings.migration_timeout,
+                on_progress=on_progress,
+            )
+        except BaseException:
+            # A half-built index is never left behind, whatever interrupted it.
+            # This call created it, so deletion protection does not apply.
+            await drop_index(
+                mode="async", ctx=_unprotected_ctx(new_ctx), delete_documents=False
+            )
+            raise
+
+        # Index names take precedence over aliases, so a plain index keeps
+        # serving queries until it is dropped after the alias exists.
+        _log_switch_alias(new_ctx.settings.index_name)
+        await ctx.redis_async.ft(new_ctx.settings.index_name).aliasupdate(alias)
+
+        if live is not None and live.index_name == alias:
+            await drop_index(mode="async", ctx=ctx, delete_documents=False)
+        elif live is not None:
+            old_ctx = _renamed_ctx(ctx, live.index_name)
+
+            if not await drop_index(mode="async", ctx=old_ctx, delete_documents=False):
+                _log_old_index_kept(live.index_name)
+
+        return True
+
+    if strategy == "blue_green":
+        if mode == "sync":
+            return _sync_blue_green()
+        else:
+            return _async_blue_green()
+
     if mode == "sync":
         return _sync()
     else:
         return _async()
 
 
+def _check_replaceable(ctx: RedisearchContext, live: InfoResult | None) -> None:
+    # A plain index must be dropped before its name can be used as an alias
+    if (
+        live is not None
+        and live.index_name == ctx.settings.index_name
+        and ctx.settings.protect_index_deletion
+    ):
+        raise ValueError(
+            f"Index '{live.index_name}' cannot be replaced by an alias "
+            "while protect_index_deletion is enabled"
+        )
+
+
+def _versioned_ctx(
+    ctx: RedisearchContext, live: InfoResult | None
+) -> RedisearchContext:
+    alias = ctx.settings.index_name
+    version = 1
+
+    if live is not None and (
+        m := re.fullmatch(rf"{re.escape(alias)}_v(\d+)", live.index_name)
+    ):
+        version = int(m.group(1)) + 1
+
+    return _renamed_ctx(ctx, f"{alias}_v{version}")
+
+
+def _renamed_ctx(ctx: RedisearchContext, index_name: str) -> RedisearchContext:
+    return replace(
+        ctx, settings=ctx.settings.model_copy(update={"index_name": index_name})
+    )
+
+
+def _unprotected_ctx(ctx: RedisearchContext) -> RedisearchContext:
+    return replace(
+        ctx, settings=ctx.settings.model_copy(update={"protect_index_deletion": False})
+    )
+
+
 def _check_schema_changes(
     current: RedisearchSchema,
     new: RedisearchSchema,
@@ -0,0 +1,90 @@
+from collections.abc import Awaitable, Iterator, Sequence
+from typing import Any, Literal, overload
+
+from ..schemas.redisearch_context import RedisearchContext
+from ..utils.marshal_mappings_batch import marshal_mappings_batch
+from .get_key import get_key
+
+
+@overload
+def set_many(
+    mode: Literal["sync"],
+    ctx: RedisearchContext,
+    mappings: Sequence[dict[str, Any]],
+    *,
+    ids: Sequence[str] | None = None,
+    batch_size: int | None = None,
+) -> None: ...
+
+
+@overload
+def set_many(
+    mode: Literal["async"],
+    ctx: RedisearchContext,
+    mappings: Sequence[dict[str, Any]],
+    *,
+    ids: Sequence[str] | None = None,
+    batch_size: int | None = None,
+) -> Awaitable[None]: ...
+
+
+def set_many(
+    mode: Literal["sync", "async"],
+    ctx: RedisearchContext,
+    mappings: Sequence[dict[str, Any]],
+    *,
+    ids: Sequence[str] | None = None,
+    batch_size: int | None = None,
+) -> Awaitable[None] | None:
+    if ids is None:
+        if any("id" not in mapping for mapping in mappings):
+            raise ValueError(
+                'Either "ids" parameter or "id" field in every mapping must be provided.'
+            )
+
+        ids = [str(mapping.get("id")) for mapping in mappings]
+
+    elif len(ids) != len(mappings):
+        raise ValueError(
+            f"Length mismatch: {len(ids)} ids for {len(mappings)} mappings."
+        )
+
+    if batch_size is None:
+        batch_size = ctx.settings.batch_size
+
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+
+    keys = [get_key(ctx, id) for id in ids]
+
+    def _batches() -> Iterator[list[tuple[str, dict[str, Any]]]]:
+        # Marshaled one batch at a time so bulk loads stay bounded in memory
+        for start in range(0, len(keys), batch_size):
+            marshaled = marshal_mappings_batch(
+                schema=ctx.schema, mappings=mappings[start : start + batch_size]
+            )
+            yield list(zip(keys[start : start + batch_size], marshaled, strict=True))
+
+    def _sync() -> None:
+        for batch in _batches():
+            pipeline = ctx.redis.pipeline(transaction=False)
+
+            for key, mapping in batch:
+                pipeline.hset(key, mapping=mapping)
+
+            pipeline.execute()
+
+    async def _async() -> None:
+        for batch in _batches():
+            pipeline = ctx.redis_async.pipeline(transaction=False)
+
+            for key, mapping in batch:
+                pipeline.hset(key, mapping=mapping)
+
+            await pipeline.execute()
+
+    if mode == "sync":
+        _sync()
+        return None
+    else:
+        return _async()
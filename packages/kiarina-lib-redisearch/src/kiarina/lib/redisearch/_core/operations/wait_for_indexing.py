@@ -0,0 +1,84 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Literal, overload
+
+from ..schemas.redisearch_context import RedisearchContext
+from ..views.info_result import InfoResult
+from .get_info import get_info
+
+
+@overload
+def wait_for_indexing(
+    mode: Literal["sync"],
+    ctx: RedisearchContext,
+    *,
+    poll_interval: float | None = None,
+    timeout: float | None = None,
+    on_progress: Callable[[InfoResult], None] | None = None,
+) -> InfoResult: ...
+
+
+@overload
+def wait_for_indexing(
+    mode: Literal["async"],
+    ctx: RedisearchContext,
+    *,
+    poll_interval: float | None = None,
+    timeout: float | None = None,
+    on_progress: Callable[[InfoResult], None] | None = None,
+) -> Awaitable[InfoResult]: ...
+
+
+def wait_for_indexing(
+    mode: Literal["sync", "async"],
+    ctx: RedisearchContext,
+    *,
+    poll_interval: float | None = None,
+    timeout: float | None = None,
+    on_progress: Callable[[InfoResult], None] | None = None,
+) -> InfoResult | Awaitable[InfoResult]:
+    poll_interval = poll_interval or ctx.settings.migration_poll_interval
+
+    def _check(info_result: InfoResult, deadline: float | None) -> bool:
+        if on_progress is not None:
+            on_progress(info_result)
+
+        if not info_result.indexing:
+            return True
+
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError(
+                f"Index '{ctx.settings.index_name}' did not finish indexing "
+                f"within {timeout} seconds "
+                f"({info_result.percent_indexed:.1%} indexed)"
+            )
+
+        return False
+
+    def _sync() -> InfoResult:
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            info_result = get_info("sync", ctx)
+
+            if _check(info_result, deadline):
+                return info_result
+
+            time.sleep(poll_interval)
+
+    async def _async() -> InfoResult:
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            info_result = await get_info("async", ctx)
+
+            if _check(info_result, deadline):
+                return info_result
+
+            await asyncio.sleep(poll_interval)
+
+    if mode == "sync":
+        return _sync()
+    else:
+        return _async()
@@ -0,0 +1,57 @@
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+from kiarina.lib.redisearch_schema import RedisearchSchema
+
+from .marshal_mappings import marshal_mappings
+
+
+def marshal_mappings_batch(
+    *,
+    schema: RedisearchSchema,
+    mappings: Sequence[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    vectors: dict[str, list[bytes]] = {}
+
+    for field in schema.fields:
+        if field.type != "vector":
+            continue
+
+        if encoded := _encode_vectors(
+            [mapping.get(field.name) for mapping in mappings], field.dtype
+        ):
+            vectors[field.name] = encoded
+
+    marshaled_list: list[dict[str, Any]] = []
+
+    for i, mapping in enumerate(mappings):
+        marshaled = marshal_mappings(
+            schema=schema,
+            mapping={k: v for k, v in mapping.items() if k not in vectors},
+        )
+
+        for name, encoded in vectors.items():
+            marshaled[name] = encoded[i]
+
+        marshaled_list.append(marshaled)
+
+    return marshaled_list
+
+
+def _encode_vectors(values: list[Any], dtype: Any) -> list[bytes] | None:
+    # Returns None when the values cannot be stacked into one numeric matrix,
+    # leaving them to marshal_mappings so invalid values raise the same errors.
+    if not values or not all(isinstance(v, list) for v in values):
+        return None
+
+    try:
+        matrix = np.asarray(values)
+    except ValueError:
+        return None
+
+    if matrix.ndim != 2 or matrix.dtype.kind not in "iuf":
+        return None
+
+    return [row.tobytes() for row in matrix.astype(dtype)]
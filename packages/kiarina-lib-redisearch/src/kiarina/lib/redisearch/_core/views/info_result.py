@@ -22,6 +22,16 @@ class InfoResult(BaseModel):
         title="Record Count",
         description="Number of records in the index.",
     )
+    indexing: bool = Field(
+        default=False,
+        title="Indexing",
+        description="Whether RediSearch is still indexing existing documents.",
+    )
+    percent_indexed: float = Field(
+        default=1.0,
+        title="Percent Indexed",
+        description="Fraction of existing documents indexed, from 0.0 to 1.0.",
+    )
     index_schema: RedisearchSchema = Field(
         title="Index Schema",
         description="Schema reported by RediSearch.",
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic_settings_manager import SettingsManager
@@ -23,6 +25,45 @@ class RedisearchSettings(BaseSettings):
         title="Protect Index Deletion",
         description="Prevent the client from dropping the index.",
     )
+    batch_size: int = Field(
+        default=1000,
+        gt=0,
+        title="Batch Size",
+        description="Number of documents sent per pipeline by the *_many operations.",
+    )
+    page_size: int = Field(
+        default=1000,
+        gt=0,
+        title="Page Size",
+        description="Number of documents fetched per query by iter_find and iter_search.",
+    )
+    iter_search_limit: int = Field(
+        default=10000,
+        gt=0,
+        title="Iter Search Limit",
+        description="Maximum number of documents yielded by iter_search.",
+    )
+    migration_strategy: Literal["recreate", "blue_green"] = Field(
+        default="recreate",
+        title="Migration Strategy",
+        description=(
+            "How migrate_index applies schema changes. 'recreate' drops and "
+            "recreates the index in place. 'blue_green' builds a versioned index "
+            "and switches the index name, used as an alias, once indexing completes."
+        ),
+    )
+    migration_poll_interval: float = Field(
+        default=1.0,
+        gt=0,
+        title="Migration Poll Interval",
+        description="Seconds between indexing progress checks in a blue/green migration.",
+    )
+    migration_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        title="Migration Timeout",
+        description="Seconds to wait for a blue/green index build. None waits indefinitely.",
+    )
 
 
 settings_manager = SettingsManager(RedisearchSettings, multi=True)
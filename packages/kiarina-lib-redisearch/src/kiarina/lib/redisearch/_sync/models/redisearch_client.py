@@ -1,4 +1,5 @@
-from typing import Any
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any, Literal
 
 from redis import Redis
 
@@ -8,16 +9,21 @@ from kiarina.lib.redisearch_schema import RedisearchSchema
 from ..._core.operations.count import count
 from ..._core.operations.create_index import create_index
 from ..._core.operations.delete import delete
+from ..._core.operations.delete_many import delete_many
 from ..._core.operations.drop_index import drop_index
 from ..._core.operations.exists_index import exists_index
 from ..._core.operations.find import find
 from ..._core.operations.get import get
 from ..._core.operations.get_info import get_info
 from ..._core.operations.get_key import get_key
+from ..._core.operations.get_many import get_many
+from ..._core.operations.iter_find import iter_find
+from ..._core.operations.iter_search import iter_search
 from ..._core.operations.migrate_index import migrate_index
 from ..._core.operations.reset_index import reset_index
 from ..._core.operations.search import search
 from ..._core.operations.set import set
+from ..._core.operations.set_many import set_many
 from ..._core.schemas.document import Document
 from ..._core.schemas.redisearch_context import RedisearchContext
 from ..._core.views.info_result import InfoResult
@@ -59,8 +65,13 @@ class RedisearchClient:
     def reset_index(self) -> None:
         reset_index("sync", self.ctx)
 
-    def migrate_index(self) -> None:
-        migrate_index("sync", self.ctx)
+    def migrate_index(
+        self,
+        *,
+        strategy: Literal["recreate", "blue_green"] | None = None,
+        on_progress: Callable[[InfoResult], None] | None = None,
+    ) -> None:
+        migrate_index("sync", self.ctx, strategy=strategy, on_progress=on_progress)
 
     def get_info(self) -> InfoResult:
         return get_info("sync", self.ctx)
@@ -78,6 +89,23 @@ class RedisearchClient:
     def get(self, id: str) -> Document | None:
         return get("sync", self.ctx, id)
 
+    def set_many(
+        self,
+        mappings: Sequence[dict[str, Any]],
+        *,
+        ids: Sequence[str] | None = None,
+        batch_size: int | None = None,
+    ) -> None:
+        set_many("sync", self.ctx, mappings, ids=ids, batch_size=batch_size)
+
+    def delete_many(self, ids: Sequence[str], *, batch_size: int | None = None) -> None:
+        delete_many("sync", self.ctx, ids, batch_size=batch_size)
+
+    def get_many(
+        self, ids: Sequence[str], *, batch_size: int | None = None
+    ) -> list[Document | None]:
+        return get_many("sync", self.ctx, ids, batch_size=batch_size)
+
     # --------------------------------------------------
     # Search operations
     # --------------------------------------------------
@@ -129,6 +157,44 @@ class RedisearchClient:
             return_fields=return_fields,
         )
 
+    def iter_find(
+        self,
+        *,
+        filter: RedisearchFilter | RedisearchFilterConditions | None = None,
+        sort_by: str | None = None,
+        sort_desc: bool = False,
+        page_size: int | None = None,
+        return_fields: list[str] | None = None,
+    ) -> Iterator[Document]:
+        return iter_find(
+            "sync",
+            self.ctx,
+            filter=filter,
+            sort_by=sort_by,
+            sort_desc=sort_desc,
+            page_size=page_size,
+            return_fields=return_fields,
+        )
+
+    def iter_search(
+        self,
+        *,
+        vector: list[float],
+        filter: RedisearchFilter | RedisearchFilterConditions | None = None,
+        page_size: int | None = None,
+        limit: int | None = None,
+        return_fields: list[str] | None = None,
+    ) -> Iterator[Document]:
+        return iter_search(
+            "sync",
+            self.ctx,
+            vector=vector,
+            filter=filter,
+            page_size=page_size,
+            limit=limit,
+            return_fields=return_fields,
+        )
+
     # --------------------------------------------------
     # Utilities
     # --------------------------------------------------
@@ -0,0 +1,52 @@
+import pytest
+
+from kiarina.lib.redisearch.asyncio import RedisearchClient
+
+
+@pytest.fixture
+def fields() -> list[dict[str, object]]:
+    return [
+        {"type": "tag", "name": "category"},
+        {"type": "numeric", "name": "rank"},
+        {"type": "vector", "name": "embedding", "algorithm": "FLAT", "dims": 3},
+    ]
+
+
+async def test_get_set_delete_many(client: RedisearchClient) -> None:
+    await client.reset_index()
+
+    mappings = [
+        {"id": f"doc{i}", "category": "a", "rank": i, "embedding": [i, 0.5, 1.0]}
+        for i in range(5)
+    ]
+
+    await client.set_many(mappings, batch_size=2)
+    assert (await client.count()).total == 5
+
+    documents = await client.get_many(["doc0", "missing", "doc4"], batch_size=2)
+    assert documents[1] is None
+    assert documents[0] is not None
+    assert documents[0].id == "doc0"
+    assert documents[0].mapping["embedding"] == [0.0, 0.5, 1.0]
+    assert documents[2] is not None
+    assert documents[2].key == client.get_key("doc4")
+    assert documents[2].mapping["rank"] == 4
+
+    await client.delete_many(["doc0", "doc1", "doc2"], batch_size=2)
+    assert (await client.count()).total == 2
+    assert await client.get("doc2") is None
+
+
+async def test_set_many_with_ids(client: RedisearchClient) -> None:
+    await client.reset_index()
+
+    await client.set_many([{"category": "b"}, {"category": "c"}], ids=["x", "y"])
+
+    documents = await client.get_many(["x", "y"])
+    assert [d.mapping["category"] if d else None for d in documents] == ["b", "c"]
+
+    with pytest.raises(ValueError, match="Length mismatch"):
+        await client.set_many([{"category": "b"}], ids=["x", "y"])
+
+    with pytest.raises(ValueError, match='"id" field'):
+        await client.set_many([{"category": "b"}])
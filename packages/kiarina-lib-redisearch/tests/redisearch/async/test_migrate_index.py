@@ -1,3 +1,4 @@
+import pytest
 from redis.asyncio import Redis
 
 from kiarina.lib.redisearch.asyncio import RedisearchClient, RedisearchSettings
@@ -79,3 +80,73 @@ async def test_migrate(key_prefix: str, index_name: str, redis: Redis) -> None:
 
     # 6. Confirm that the document has not been deleted
     assert await client5.get("test_id") is not None
+
+
+async def test_migrate_blue_green(
+    key_prefix: str, index_name: str, redis: Redis
+) -> None:
+    fields: list[dict[str, object]] = [{"type": "tag", "name": "user_id"}]
+
+    def _create_client(protect_index_deletion: bool = False) -> RedisearchClient:
+        return RedisearchClient(
+            RedisearchSettings(
+                key_prefix=key_prefix,
+                index_name=index_name,
+                migration_strategy="blue_green",
+                migration_poll_interval=0.1,
+                protect_index_deletion=protect_index_deletion,
+            ),
+            schema=RedisearchSchema.from_field_dicts(fields),
+            redis=redis,
+        )
+
+    # 1. Replace a plain index with a versioned index behind an alias
+    client1 = _create_client()
+    await client1.drop_index()
+    await client1.create_index()
+    await client1.set({"user_id": "test_user_id"}, id="test_id")
+    await client1.migrate_index()
+    assert (await client1.get_info()).index_name == f"{index_name}_v1"
+
+    # 2. Add field and migrate to the next version
+    fields.append({"type": "numeric", "name": "timestamp", "sortable": True})
+    progress: list[float] = []
+
+    client2 = _create_client()
+    await client2.migrate_index(
+        on_progress=lambda info: progress.append(info.percent_indexed)
+    )
+
+    info_result2 = await client2.get_info()
+    assert info_result2.index_name == f"{index_name}_v2"
+    assert info_result2.index_schema == client2.ctx.schema
+    assert info_result2.num_docs == 1
+    assert progress[-1] == 1.0
+
+    # 3. No changes
+    client3 = _create_client()
+    await client3.migrate_index()
+    assert (await client3.get_info()).index_name == f"{index_name}_v2"
+    assert (await client3.count()).total == 1
+
+    # 4. A failed migration drops the new index, even with deletion protected,
+    #    and keeps the live one
+    fields.append({"type": "tag", "name": "category"})
+
+    def _fail(info: object) -> None:
+        raise RuntimeError("Stopped")
+
+    client4 = _create_client(protect_index_deletion=True)
+
+    with pytest.raises(RuntimeError, match="Stopped"):
+        await client4.migrate_index(on_progress=_fail)
+
+    new_client = RedisearchClient(
+        RedisearchSettings(key_prefix=key_prefix, index_name=f"{index_name}_v3"),
+        schema=RedisearchSchema.from_field_dicts(fields),
+        redis=redis,
+    )
+    assert not await new_client.exists_index()
+    assert (await client4.get_info()).index_name == f"{index_name}_v2"
+
+    await client3.drop_index(delete_documents=True)
@@ -52,3 +52,16 @@ def test_find(client: RedisearchClient) -> None:
     assert result.total == 3
     assert len(result.documents) == 1
     assert result.documents[0].id == "2"
+
+    # Iterate in pages
+    documents = list(client.iter_find(sort_by="timestamp", page_size=2))
+    assert [doc.id for doc in documents] == ["1", "2", "3"]
+
+    documents = list(
+        client.iter_find(filter=[["id", "in", ("1", "3")]], return_fields=["title"])
+    )
+    assert sorted(doc.id for doc in documents) == ["1", "3"]
+    assert all("title" in doc.mapping for doc in documents)
+
+    with pytest.raises(ValueError, match="page_size must be positive"):
+        client.iter_find(page_size=0)
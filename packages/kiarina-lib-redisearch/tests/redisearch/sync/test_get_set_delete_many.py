@@ -0,0 +1,61 @@
+import pytest
+
+from kiarina.lib.redisearch import RedisearchClient
+
+
+@pytest.fixture
+def fields() -> list[dict[str, object]]:
+    return [
+        {"type": "tag", "name": "category"},
+        {"type": "numeric", "name": "rank"},
+        {"type": "vector", "name": "embedding", "algorithm": "FLAT", "dims": 3},
+    ]
+
+
+def test_get_set_delete_many(client: RedisearchClient) -> None:
+    client.reset_index()
+
+    mappings = [
+        {"id": f"doc{i}", "category": "a", "rank": i, "embedding": [i, 0.5, 1.0]}
+        for i in range(5)
+    ]
+
+    client.set_many(mappings, batch_size=2)
+    assert client.count().total == 5
+
+    documents = client.get_many(["doc0", "missing", "doc4"], batch_size=2)
+    assert documents[1] is None
+    assert documents[0] is not None
+    assert documents[0].id == "doc0"
+    assert documents[0].mapping["embedding"] == [0.0, 0.5, 1.0]
+    assert documents[2] is not None
+    assert documents[2].key == client.get_key("doc4")
+    assert documents[2].mapping["rank"] == 4
+
+    client.delete_many(["doc0", "doc1", "doc2"], batch_size=2)
+    assert client.count().total == 2
+    assert client.get("doc2") is None
+
+    with pytest.raises(ValueError, match="batch_size must be positive"):
+        client.set_many(mappings, batch_size=0)
+
+    with pytest.raises(ValueError, match="batch_size must be positive"):
+        client.get_many(["doc3"], batch_size=0)
+
+    with pytest.raises(ValueError, match="batch_size must be positive"):
+        client.delete_many(["doc3"], batch_size=0)
+
+
+def test_set_many_with_ids(client: RedisearchClient) -> None:
+    client.reset_index()
+
+    client.set_many([{"category": "b"}, {"category": "c"}], ids=["x", "y"])
+
+    documents = client.get_many(["x", "y"])
+    assert [d.mapping["category"] if d else None for d in documents] == ["b", "c"]
+
+    with pytest.raises(ValueError, match="Length mismatch"):
+        client.set_many([{"category": "b"}], ids=["x", "y"])
+
+    with pytest.raises(ValueError, match='"id" field'):
+        client.set_many([{"category": "b"}])
@@ -99,3 +99,19 @@ def test_search(
     assert result.total == 2
     assert len(result.documents) == 1
     assert result.documents[0].id == "1"
+
+    # Iterate in pages
+    documents = list(client.iter_search(vector=data_query["embedding"], page_size=2))
+    assert [doc.id for doc in documents] == ["3", "1", "2"]
+
+    # Stop at the limit
+    documents = list(
+        client.iter_search(vector=data_query["embedding"], page_size=2, limit=1)
+    )
+    assert [doc.id for doc in documents] == ["3"]
+
+    with pytest.raises(ValueError, match="page_size must be positive"):
+        client.iter_search(vector=data_query["embedding"], page_size=0)
+
+    with pytest.raises(ValueError, match="limit must be positive"):
+        client.iter_search(vector=data_query["embedding"], limit=0)
@@ -0,0 +1,51 @@
+from typing import Any
+
+import pytest
+
+from kiarina.lib.redisearch._core.utils.marshal_mappings import marshal_mappings
+from kiarina.lib.redisearch._core.utils.marshal_mappings_batch import (
+    marshal_mappings_batch,
+)
+from kiarina.lib.redisearch_schema import RedisearchSchema
+
+schema = RedisearchSchema.from_field_dicts(
+    [
+        {"type": "tag", "name": "tags", "multiple": True},
+        {"type": "numeric", "name": "rank"},
+        {"type": "vector", "name": "embedding", "algorithm": "FLAT", "dims": 3},
+    ]
+)
+
+
+def test_marshal_mappings_batch() -> None:
+    mappings: list[dict[str, Any]] = [
+        {"tags": ["a", "b"], "rank": 1, "embedding": [0.1, 0.2, 0.3], "extra": "x"},
+        {"tags": "c", "rank": "2", "embedding": [1, 2, 3]},
+    ]
+
+    assert marshal_mappings_batch(schema=schema, mappings=mappings) == [
+        marshal_mappings(schema=schema, mapping=mapping) for mapping in mappings
+    ]
+
+
+def test_marshal_mappings_batch_fallback() -> None:
+    # Ragged or partially missing vectors are marshaled per document
+    mappings: list[dict[str, Any]] = [
+        {"embedding": [0.1, 0.2, 0.3]},
+        {"embedding": [0.1, 0.2]},
+        {"rank": 3},
+    ]
+
+    assert marshal_mappings_batch(schema=schema, mappings=mappings) == [
+        marshal_mappings(schema=schema, mapping=mapping) for mapping in mappings
+    ]
+
+
+def test_marshal_mappings_batch_invalid_vector() -> None:
+    mappings: list[dict[str, Any]] = [
+        {"embedding": [0.1, 0.2, 0.3]},
+        {"embedding": ["a", "b", "c"]},
+    ]
+
+    with pytest.raises(ValueError, match="requires a list of floats"):
+        marshal_mappings_batch(schema=schema, mappings=mappings)
@@ -1,5 +1,7 @@
 import logging
-from collections.abc import Callable
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 from typing import Any, Generic, TypeVar, cast
 
 from kiarina.utils.common import ImportPath, import_object, parse_config_string
@@ -27,6 +29,8 @@ class ComponentRegistry(Generic[T]):
         get_customs: Callable[[], dict[ComponentName, ImportPath]] | None = None,
         factory_wrapper: Callable[[ComponentFactory[T], ComponentName, Any], T]
         | None = None,
+        get_cache_key: Callable[[dict[str, Any]], Hashable | None] | None = None,
+        cache_max_size: int = 128,
     ) -> None:
         self._expected_type = cast(type[T], expected_type)
         self._component_label = component_label
@@ -37,6 +41,12 @@ class ComponentRegistry(Generic[T]):
         self._factory_wrapper = factory_wrapper
         self._registry: dict[ComponentName, ComponentFactory[T]] = {}
 
+        # Instances resolved from specifiers, reused while their key is the same
+        self._get_cache_key = get_cache_key
+        self._cache_max_size = cache_max_size
+        self._instances: OrderedDict[Hashable, T] = OrderedDict()
+        self._instances_lock = threading.Lock()
+
     def get_default(self) -> ComponentSpecifier | None:
         return self._get_default() if self._get_default else None
 
@@ -63,15 +73,47 @@ class ComponentRegistry(Generic[T]):
             )
 
         self._registry[component_name] = factory
+        self._forget_instances()
 
     def unregister(self, component_name: ComponentName) -> None:
         self._registry.pop(component_name, None)
+        self._forget_instances()
 
     def get(self, component_name: ComponentName) -> ComponentFactory[T] | None:
         return self._registry.get(component_name)
 
     def clear(self) -> None:
         self._registry.clear()
+        self._forget_instances()
+
+    def evict(
+        self,
+        component_input: ComponentInput[T] | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Close and forget the cached instance that `resolve` would return.
+
+        The caller must make sure that the instance is no longer in use.
+        """
+        if (key := self._get_instance_key(component_input, args, kwargs)) is None:
+            return
+
+        with self._instances_lock:
+            instance = self._instances.pop(key, None)
+
+        if instance is not None:
+            _close_instance(instance)
+
+    def clear_instances(self) -> None:
+        """
+        Close and forget all cached instances.
+
+        The caller must make sure that the instances are no longer in use.
+        """
+        for instance in self._forget_instances():
+            _close_instance(instance)
 
     def create(self, component_name: ComponentName, *args: Any, **kwargs: Any) -> T:
         factory = self._get_component_factory(component_name)
@@ -96,20 +138,75 @@ class ComponentRegistry(Generic[T]):
             return component_input
 
         if isinstance(component_input, str) or component_input is None:
-            component_name, specifier_kwargs = self._resolve_name_and_kwargs(
-                component_input
-            )
+            if (key := self._get_instance_key(component_input, args, kwargs)) is None:
+                return self._create_from_specifier(component_input, *args, **kwargs)
+
+            with self._instances_lock:
+                if (instance := self._instances.get(key)) is not None:
+                    self._instances.move_to_end(key)
+                    return instance
+
+            instance = self._create_from_specifier(component_input, *args, **kwargs)
+
+            with self._instances_lock:
+                # Another thread may have created the same instance meanwhile
+                if (cached := self._instances.get(key)) is not None:
+                    return cached
 
-            if specifier_kwargs:
-                kwargs.update(specifier_kwargs)
+                self._instances[key] = instance
 
-            return self.create(component_name, *args, **kwargs)
+                # Evicted instances may still be held by callers, so they are
+                # only forgotten, not closed
+                while len(self._instances) > self._cache_max_size:
+                    self._instances.popitem(last=False)
+
+            return instance
 
         raise ValueError(  # pragma: no cover
             f"Invalid {self._component_label} input: {component_input}. "
             f"Expected an instance of {self._expected_type.__name__} or a string specifier."
         )
 
+    def _forget_instances(self) -> list[T]:
+        with self._instances_lock:
+            instances = list(self._instances.values())
+            self._instances.clear()
+
+        return instances
+
+    def _create_from_specifier(
+        self, component_specifier: ComponentSpecifier | None, *args: Any, **kwargs: Any
+    ) -> T:
+        component_name, specifier_kwargs = self._resolve_name_and_kwargs(
+            component_specifier
+        )
+
+        if specifier_kwargs:
+            kwargs.update(specifier_kwargs)
+
+        return self.create(component_name, *args, **kwargs)
+
+    def _get_instance_key(
+        self,
+        component_input: ComponentInput[T] | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Hashable | None:
+        # Instances created with positional arguments are not cached
+        if self._get_cache_key is None or self._cache_max_size <= 0 or args:
+            return None
+
+        if component_input is None:
+            component_input = self.get_default()
+
+        if not isinstance(component_input, str):
+            return None
+
+        if (cache_key := self._get_cache_key(kwargs)) is None:
+            return None
+
+        return (component_input, cache_key)
+
     def _resolve_name_and_kwargs(
         self, component_specifier: ComponentSpecifier | None = None
     ) -> tuple[ComponentName, dict[str, Any]]:
@@ -151,3 +248,11 @@ class ComponentRegistry(Generic[T]):
             return cast(ComponentFactory[T], import_object(presets[component_name]))
 
         raise ValueError(f"{self._component_label} is not registered: {component_name}")
+
+
+def _close_instance(instance: object) -> None:
+    if callable(close := getattr(instance, "close", None)):
+        try:
+            close()
+        except Exception as e:
+            logger.warning(f"Failed to close {type(instance).__name__}: {e!s}")
@@ -97,3 +97,52 @@ def test_component_registry() -> None:
 
     registry.clear()
     assert registry.get("test3") is None
+
+
+class ClosableClass(MyClass):
+    def __init__(self, message: str = "") -> None:
+        super().__init__(message)
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_component_registry_instance_cache() -> None:
+    registry = ComponentRegistry[MyClass](
+        expected_type=MyClass,
+        get_default=lambda: "test1",
+        get_presets=lambda: {
+            "test1": f"{__name__}:ClosableClass",
+            "test2": f"{__name__}:ClosableClass",
+        },
+        get_cache_key=lambda kwargs: kwargs.get("message"),
+        cache_max_size=2,
+    )
+
+    instance = registry.resolve(message="a")
+    assert registry.resolve("test1", message="a") is instance
+    assert registry.resolve(message="b") is not instance
+    assert registry.resolve("test2", message="a") is not instance
+
+    # Evicted as the least recently used instance, but not closed
+    assert isinstance(instance, ClosableClass) and not instance.closed
+    assert registry.resolve(message="a") is not instance
+
+    # Not cached without a key
+    assert registry.resolve() is not registry.resolve()
+
+    instance = registry.resolve(message="c")
+    registry.evict(message="c")
+    assert isinstance(instance, ClosableClass) and instance.closed
+    assert registry.resolve(message="c") is not instance
+
+    instance = registry.resolve(message="c")
+    registry.clear_instances()
+    assert isinstance(instance, ClosableClass) and instance.closed
+
+    # Replacing a factory forgets the instances without closing them
+    instance = registry.resolve(message="c")
+    registry.register("test1", ClosableClass)
+    assert isinstance(instance, ClosableClass) and not instance.closed
+    assert registry.resolve(message="c") is not instance
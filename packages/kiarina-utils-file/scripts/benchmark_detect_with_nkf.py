@@ -0,0 +1,71 @@
+import random
+import shutil
+import time
+from collections.abc import Callable
+
+from kiarina.utils.encoding._operations.detect_with_nkf import (
+    _detect_with_nkf_process,
+    detect_with_nkf,
+)
+
+SAMPLE_COUNT = 2000
+
+
+def create_samples() -> list[bytes]:
+    random.seed(0)
+    texts = [
+        "".join(
+            chr(
+                random.choice(
+                    [
+                        random.randint(0x20, 0x7E),
+                        random.randint(0x3041, 0x3093),
+                        random.randint(0x30A1, 0x30F3),
+                        random.randint(0x4E00, 0x9FA0),
+                    ]
+                )
+            )
+            for _ in range(random.randint(50, 2000))
+        )
+        for _ in range(SAMPLE_COUNT)
+    ]
+    encodings = ["utf-8"] * 6 + ["ascii", "shift_jis", "euc-jp", "iso2022_jp"]
+
+    samples = []
+    for text in texts:
+        encoding = random.choice(encodings)
+        samples.append(text.encode(encoding, errors="ignore"))
+
+    return samples
+
+
+def benchmark(
+    name: str, detect: Callable[[bytes], str | None], samples: list[bytes]
+) -> None:
+    start = time.perf_counter()
+
+    for sample in samples:
+        detect(sample)
+
+    elapsed = time.perf_counter() - start
+    print(f"{name}: {len(samples) / elapsed:,.0f} samples/s ({elapsed:.2f}s)")
+
+
+def main() -> None:
+    if shutil.which("nkf") is None:
+        print("nkf command not found")
+        return
+
+    samples = create_samples()
+    benchmark("nkf process per sample", _detect_with_nkf_process, samples)
+    benchmark("heuristic with nkf fallback", detect_with_nkf, samples)
+
+    mismatches = sum(
+        detect_with_nkf(sample) != _detect_with_nkf_process(sample)
+        for sample in samples
+    )
+    print(f"verdict mismatches: {mismatches} / {len(samples)}")
+
+
+if __name__ == "__main__":
+    main()
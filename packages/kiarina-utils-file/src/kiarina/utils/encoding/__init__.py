@@ -7,6 +7,11 @@ if TYPE_CHECKING:
     from ._helpers.detect_encoding import detect_encoding
     from ._helpers.get_default_encoding import get_default_encoding
     from ._helpers.is_binary import is_binary
+    from ._services.detection_cache import (
+        DetectionCache,
+        DetectionCacheStats,
+        detection_cache,
+    )
     from ._settings import settings_manager
     from ._utils.normalize_newlines import normalize_newlines
 
@@ -17,6 +22,9 @@ __all__ = [
     "detect_encoding",
     "get_default_encoding",
     "is_binary",
+    "DetectionCache",
+    "DetectionCacheStats",
+    "detection_cache",
     "settings_manager",
     "normalize_newlines",
 ]
@@ -33,6 +41,9 @@ def __getattr__(name: str) -> object:
         "detect_encoding": "._helpers.detect_encoding",
         "get_default_encoding": "._helpers.get_default_encoding",
         "is_binary": "._helpers.is_binary",
+        "DetectionCache": "._services.detection_cache",
+        "DetectionCacheStats": "._services.detection_cache",
+        "detection_cache": "._services.detection_cache",
         "settings_manager": "._settings",
         "normalize_newlines": "._utils.normalize_newlines",
     }
@@ -2,6 +2,7 @@ from .._operations.detect_with_charset_normalizer import detect_with_charset_nor
 from .._operations.detect_with_fallback import detect_with_fallback
 from .._operations.detect_with_nkf import detect_with_nkf
 from .._operations.should_use_nkf import should_use_nkf
+from .._services.detection_cache import detection_cache
 from .._settings import settings_manager
 
 
@@ -18,6 +19,40 @@ def detect_encoding(
     if use_nkf is None:
         use_nkf = should_use_nkf()
 
+    # Resolved before keying the cache, so a settings change is not masked
+    settings = settings_manager.settings
+
+    if confidence_threshold is None:
+        confidence_threshold = settings.charset_normalizer_confidence_threshold
+
+    if fallback_encodings is None:
+        fallback_encodings = settings.fallback_encodings
+
+    return detection_cache.get_or_compute(
+        "encoding",
+        raw_data,
+        (
+            use_nkf,
+            confidence_threshold,
+            tuple(fallback_encodings),
+            settings.max_sample_size,
+        ),
+        lambda: _detect_encoding(
+            raw_data,
+            use_nkf=use_nkf,
+            confidence_threshold=confidence_threshold,
+            fallback_encodings=fallback_encodings,
+        ),
+    )
+
+
+def _detect_encoding(
+    raw_data: bytes,
+    *,
+    use_nkf: bool,
+    confidence_threshold: float,
+    fallback_encodings: list[str],
+) -> str | None:
     if use_nkf:
         if encoding := detect_with_nkf(raw_data):
             return encoding
@@ -0,0 +1,18 @@
+import codecs
+
+
+def detect_with_heuristic(raw_data: bytes, *, partial: bool = False) -> str | None:
+    if not raw_data:
+        return None
+
+    if raw_data.isascii():
+        # ESC introduces ISO-2022-JP sequences, which nkf distinguishes from ASCII
+        return None if b"\x1b" in raw_data else "ascii"
+
+    # A partial sample may end in the middle of a multibyte character
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(raw_data, final=not partial)
+    except UnicodeDecodeError:
+        return None
+
+    return "utf-8"
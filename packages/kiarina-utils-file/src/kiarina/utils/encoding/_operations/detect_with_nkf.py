@@ -3,6 +3,7 @@ import subprocess
 import threading
 
 from .._settings import settings_manager
+from .detect_with_heuristic import detect_with_heuristic
 
 logger = logging.getLogger(__name__)
 
@@ -12,8 +13,6 @@ _nkf_lock = threading.Lock()
 
 
 def detect_with_nkf(raw_data: bytes) -> str | None:
-    global _nkf_available
-
     with _nkf_lock:
         if _nkf_available is False:
             return None
@@ -31,6 +30,18 @@ def detect_with_nkf(raw_data: bytes) -> str | None:
     else:
         sample_data = raw_data
 
+    # Most text is ASCII or UTF-8, which is decided without forking nkf
+    if encoding := detect_with_heuristic(
+        sample_data, partial=len(sample_data) < len(raw_data)
+    ):
+        return encoding
+
+    return _detect_with_nkf_process(sample_data)
+
+
+def _detect_with_nkf_process(sample_data: bytes) -> str | None:
+    global _nkf_available
+
     try:
         result = subprocess.run(
             ["nkf", "-g"], input=sample_data, capture_output=True, text=False
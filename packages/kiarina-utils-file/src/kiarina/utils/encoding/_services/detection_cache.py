@@ -0,0 +1,91 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple, TypeVar, cast
+
+from .._settings import settings_manager
+
+T = TypeVar("T")
+
+
+class DetectionCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class DetectionCache:
+    """Thread-safe LRU cache of detection results keyed by content digest."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_compute(
+        self,
+        kind: str,
+        raw_data: bytes,
+        params: Hashable,
+        compute: Callable[[], T],
+    ) -> T:
+        settings = settings_manager.settings
+
+        if not settings.cache_enabled or settings.cache_max_entries <= 0:
+            return compute()
+
+        key = (kind, _digest(raw_data), params)
+        now = time.monotonic()
+
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                expires_at, value = entry
+
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return cast(T, value)
+
+                del self._entries[key]
+
+            self._misses += 1
+
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = (now + settings.cache_ttl_seconds, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > settings.cache_max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+        return value
+
+    def stats(self) -> DetectionCacheStats:
+        with self._lock:
+            return DetectionCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+def _digest(raw_data: bytes) -> bytes:
+    return hashlib.blake2b(raw_data, digest_size=16).digest()
+
+
+detection_cache = DetectionCache()
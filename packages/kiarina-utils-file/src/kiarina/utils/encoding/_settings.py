@@ -38,5 +38,25 @@ class EncodingSettings(BaseSettings):
         description="Minimum confidence accepted from Charset Normalizer.",
     )
 
+    cache_enabled: bool = Field(
+        default=True,
+        title="Detection cache",
+        description="Cache encoding and MIME type detection results by content digest.",
+    )
+
+    cache_max_entries: int = Field(
+        default=4096,
+        ge=0,
+        title="Detection cache size",
+        description="Maximum number of cached detection results.",
+    )
+
+    cache_ttl_seconds: float = Field(
+        default=3600.0,
+        gt=0,
+        title="Detection cache TTL",
+        description="Seconds a cached detection result stays valid.",
+    )
+
 
 settings_manager = SettingsManager(EncodingSettings)
@@ -5,8 +5,10 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ._core.models.file_blob import FileBlob
+    from ._core.models.lazy_file_blob import LazyFileBlob
     from ._core.types.markdown_content import MarkdownContent
     from ._sync.helpers.read_file import read_file
+    from ._sync.helpers.read_lazy_file import read_lazy_file
     from ._sync.helpers.read_markdown import read_markdown
     from ._sync.helpers.write_file import write_file
     from ._sync.utils.read_binary import read_binary
@@ -27,8 +29,10 @@ __version__ = version("kiarina-utils-file")
 
 __all__ = [
     "FileBlob",
+    "LazyFileBlob",
     "MarkdownContent",
     "read_file",
+    "read_lazy_file",
     "read_markdown",
     "write_file",
     "read_binary",
@@ -55,8 +59,10 @@ def __getattr__(name: str) -> object:
 
     module_map = {
         "FileBlob": "._core.models.file_blob",
+        "LazyFileBlob": "._core.models.lazy_file_blob",
         "MarkdownContent": "._core.types.markdown_content",
         "read_file": "._sync.helpers.read_file",
+        "read_lazy_file": "._sync.helpers.read_lazy_file",
         "read_markdown": "._sync.helpers.read_markdown",
         "write_file": "._sync.helpers.write_file",
         "read_binary": "._sync.utils.read_binary",
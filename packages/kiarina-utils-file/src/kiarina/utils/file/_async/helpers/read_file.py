@@ -10,6 +10,7 @@ async def read_file(
     file_path: str | os.PathLike[str],
     *,
     fallback_mime_type: str = "application/octet-stream",
+    use_lock: bool | None = None,
 ) -> FileBlob | None: ...
 
 
@@ -19,6 +20,7 @@ async def read_file(
     *,
     fallback_mime_type: str = "application/octet-stream",
     default: FileBlob,
+    use_lock: bool | None = None,
 ) -> FileBlob: ...
 
 
@@ -27,7 +29,12 @@ async def read_file(
     *,
     fallback_mime_type: str = "application/octet-stream",
     default: FileBlob | None = None,
+    use_lock: bool | None = None,
 ) -> FileBlob | None:
     return await _read_file(
-        "async", file_path, fallback_mime_type=fallback_mime_type, default=default
+        "async",
+        file_path,
+        fallback_mime_type=fallback_mime_type,
+        default=default,
+        use_lock=use_lock,
     )
@@ -0,0 +1,56 @@
+import asyncio
+import os
+from collections.abc import Sequence
+
+from ..._core.models.file_blob import FileBlob
+from ..._core.operations.read_file import read_file as _read_file
+from ..._core.utils.get_lock_file_path import get_lock_file_path
+from ..._settings import settings_manager
+
+
+async def read_files(
+    file_paths: Sequence[str | os.PathLike[str]],
+    *,
+    fallback_mime_type: str = "application/octet-stream",
+    use_lock: bool | None = None,
+    max_concurrency: int | None = None,
+) -> list[FileBlob | Exception | None]:
+    settings = settings_manager.settings
+
+    if max_concurrency is None:
+        max_concurrency = settings.max_concurrency
+
+    if use_lock is None:
+        use_lock = settings.read_lock_enabled
+
+    if use_lock:
+        # Resolve the lock directories for the whole batch in one thread hop
+        await asyncio.to_thread(_prepare_lock_file_paths, file_paths)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _read(file_path: str | os.PathLike[str]) -> FileBlob | Exception | None:
+        async with semaphore:
+            try:
+                # Read and detect the MIME type in one thread hop
+                return await asyncio.to_thread(
+                    _read_file,
+                    "sync",
+                    file_path,
+                    fallback_mime_type=fallback_mime_type,
+                    use_lock=use_lock,
+                )
+            except Exception as e:
+                return e
+
+    return await asyncio.gather(*(_read(file_path) for file_path in file_paths))
+
+
+def _prepare_lock_file_paths(file_paths: Sequence[str | os.PathLike[str]]) -> None:
+    for file_path in file_paths:
+        file_path = os.path.expanduser(os.path.expandvars(os.fspath(file_path)))
+
+        if os.path.lexists(file_path):
+            file_path = os.path.realpath(file_path)
+
+        get_lock_file_path(file_path)
@@ -7,7 +7,7 @@ from ..._core.types.markdown_content import MarkdownContent
 
 @overload
 async def read_markdown(
-    file_path: str | os.PathLike[str],
+    file_path: str | os.PathLike[str], *, use_lock: bool | None = None
 ) -> MarkdownContent | None: ...
 
 
@@ -16,6 +16,7 @@ async def read_markdown(
     file_path: str | os.PathLike[str],
     *,
     default: MarkdownContent,
+    use_lock: bool | None = None,
 ) -> MarkdownContent: ...
 
 
@@ -23,5 +24,6 @@ async def read_markdown(
     file_path: str | os.PathLike[str],
     *,
     default: MarkdownContent | None = None,
+    use_lock: bool | None = None,
 ) -> MarkdownContent | None:
-    return await _read_markdown("async", file_path, default=default)
+    return await _read_markdown("async", file_path, default=default, use_lock=use_lock)
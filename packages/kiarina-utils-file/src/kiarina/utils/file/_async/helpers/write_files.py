@@ -0,0 +1,40 @@
+import asyncio
+import os
+from collections.abc import Sequence
+
+from ..._core.models.file_blob import FileBlob
+from ..._core.operations.write_file import write_file as _write_file
+from ..._settings import settings_manager
+
+
+async def write_files(
+    file_blobs: Sequence[FileBlob],
+    file_paths: Sequence[str | os.PathLike[str] | None] | None = None,
+    *,
+    max_concurrency: int | None = None,
+) -> list[Exception | None]:
+    if file_paths is not None and len(file_paths) != len(file_blobs):
+        raise ValueError("file_paths must have the same length as file_blobs")
+
+    if max_concurrency is None:
+        max_concurrency = settings_manager.settings.max_concurrency
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _write(
+        file_blob: FileBlob, file_path: str | os.PathLike[str] | None
+    ) -> Exception | None:
+        async with semaphore:
+            try:
+                await asyncio.to_thread(_write_file, "sync", file_blob, file_path)
+            except Exception as e:
+                return e
+
+            return None
+
+    return await asyncio.gather(
+        *(
+            _write(file_blob, file_paths[i] if file_paths is not None else None)
+            for i, file_blob in enumerate(file_blobs)
+        )
+    )
@@ -5,16 +5,21 @@ from ..._core.utils.read_binary import read_binary as _read_binary
 
 
 @overload
-async def read_binary(file_path: str | os.PathLike[str]) -> bytes | None: ...
+async def read_binary(
+    file_path: str | os.PathLike[str], *, use_lock: bool | None = None
+) -> bytes | None: ...
 
 
 @overload
 async def read_binary(
-    file_path: str | os.PathLike[str], *, default: bytes
+    file_path: str | os.PathLike[str], *, default: bytes, use_lock: bool | None = None
 ) -> bytes: ...
 
 
 async def read_binary(
-    file_path: str | os.PathLike[str], *, default: bytes | None = None
+    file_path: str | os.PathLike[str],
+    *,
+    default: bytes | None = None,
+    use_lock: bool | None = None,
 ) -> bytes | None:
-    return await _read_binary("async", file_path, default=default)
+    return await _read_binary("async", file_path, default=default, use_lock=use_lock)
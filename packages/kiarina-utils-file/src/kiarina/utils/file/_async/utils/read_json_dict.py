@@ -6,17 +6,23 @@ from ..._core.utils.read_json_dict import read_json_dict as _read_json_dict
 
 @overload
 async def read_json_dict(
-    file_path: str | os.PathLike[str],
+    file_path: str | os.PathLike[str], *, use_lock: bool | None = None
 ) -> dict[str, Any] | None: ...
 
 
 @overload
 async def read_json_dict(
-    file_path: str | os.PathLike[str], *, default: dict[str, Any]
+    file_path: str | os.PathLike[str],
+    *,
+    default: dict[str, Any],
+    use_lock: bool | None = None,
 ) -> dict[str, Any]: ...
 
 
 async def read_json_dict(
-    file_path: str | os.PathLike[str], *, default: dict[str, Any] | None = None
+    file_path: str | os.PathLike[str],
+    *,
+    default: dict[str, Any] | None = None,
+    use_lock: bool | None = None,
 ) -> dict[str, Any] | None:
-    return await _read_json_dict("async", file_path, default=default)
+    return await _read_json_dict("async", file_path, default=default, use_lock=use_lock)
@@ -6,17 +6,23 @@ from ..._core.utils.read_json_list import read_json_list as _read_json_list
 
 @overload
 async def read_json_list(
-    file_path: str | os.PathLike[str],
+    file_path: str | os.PathLike[str], *, use_lock: bool | None = None
 ) -> list[Any] | None: ...
 
 
 @overload
 async def read_json_list(
-    file_path: str | os.PathLike[str], *, default: list[Any]
+    file_path: str | os.PathLike[str],
+    *,
+    default: list[Any],
+    use_lock: bool | None = None,
 ) -> list[Any]: ...
 
 
 async def read_json_list(
-    file_path: str | os.PathLike[str], *, default: list[Any] | None = None
+    file_path: str | os.PathLike[str],
+    *,
+    default: list[Any] | None = None,
+    use_lock: bool | None = None,
 ) -> list[Any] | None:
-    return await _read_json_list("async", file_path, default=default)
+    return await _read_json_list("async", file_path, default=default, use_lock=use_lock)
@@ -5,14 +5,21 @@ from ..._core.utils.read_text import read_text as _read_text
 
 
 @overload
-async def read_text(file_path: str | os.PathLike[str]) -> str | None: ...
+async def read_text(
+    file_path: str | os.PathLike[str], *, use_lock: bool | None = None
+) -> str | None: ...
 
 
 @overload
-async def read_text(file_path: str | os.PathLike[str], *, default: str) -> str: ...
+async def read_text(
+    file_path: str | os.PathLike[str], *, default: str, use_lock: bool | None = None
+) -> str: ...
 
 
 async def read_text(
-    file_path: str | os.PathLike[str], *, default: str | None = None
+    file_path: str | os.PathLike[str],
+    *,
+    default: str | None = None,
+    use_lock: bool | None = None,
 ) -> str | None:
-    return await _read_text("async", file_path, default=default)
+    return await _read_text("async", file_path, default=default, use_lock=use_lock)
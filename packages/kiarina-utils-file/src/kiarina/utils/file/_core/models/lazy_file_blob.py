@@ -0,0 +1,177 @@
+import base64
+import hashlib
+import os
+from collections.abc import Iterator
+from functools import cached_property
+
+from kiarina.utils.encoding import decode_binary_to_text, is_binary
+from kiarina.utils.ext import detect_extension, extract_extension
+from kiarina.utils.mime import MIMEBlob, settings_manager as mime_settings_manager
+
+from .file_blob import FileBlob
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+BINARY_SNIFF_SIZE = 64 * 1024
+
+
+class LazyFileBlob(FileBlob):
+    """File data read from disk on demand instead of being held in memory.
+
+    `hash_string` is computed incrementally and cached. `raw_data`, `raw_text`,
+    `raw_base64_str`, and `mime_blob` read the whole file on every access and are
+    not cached. Use `iter_chunks` and `iter_base64_chunks` to process the data in
+    bounded memory. The source file must not change while the blob is in use.
+    """
+
+    def __init__(
+        self,
+        file_path: str | os.PathLike[str],
+        *,
+        mime_type: str,
+        source_path: str | os.PathLike[str] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        if not mime_type:
+            raise ValueError("MIME type is required")
+
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        self._file_path: str = os.path.expanduser(
+            os.path.expandvars(os.fspath(file_path))
+        )
+
+        self._source_path: str = (
+            os.path.expanduser(os.path.expandvars(os.fspath(source_path)))
+            if source_path is not None
+            else self._file_path
+        )
+
+        self._mime_type: str = mime_type
+        self._chunk_size: int = chunk_size
+
+    def __str__(self) -> str:
+        return f"LazyFileBlob({self.file_path}, {self.mime_type}, {self.size} bytes)"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyFileBlob):
+            return (
+                self.file_path == other.file_path
+                and self.mime_type == other.mime_type
+                and self.hash_string == other.hash_string
+            )
+
+        return super().__eq__(other)
+
+    @property
+    def source_path(self) -> str:
+        return self._source_path
+
+    @property
+    def size(self) -> int:
+        return os.path.getsize(self.source_path)
+
+    @property
+    def mime_blob(self) -> MIMEBlob:
+        return MIMEBlob(self.mime_type, self.raw_data)
+
+    @property
+    def mime_type(self) -> str:
+        return self._mime_type
+
+    @property
+    def raw_data(self) -> bytes:
+        with open(self.source_path, "rb") as f:
+            return f.read()
+
+    @property
+    def raw_text(self) -> str:
+        raw_data = self.raw_data
+        return decode_binary_to_text(raw_data) if raw_data else ""
+
+    @property
+    def raw_base64_str(self) -> str:
+        return "".join(self.iter_base64_chunks())
+
+    @property
+    def raw_base64_url(self) -> str:
+        return "".join([f"data:{self.mime_type};base64,", *self.iter_base64_chunks()])
+
+    @cached_property
+    def hash_string(self) -> str:
+        hash_algorithm = mime_settings_manager.settings.hash_algorithm
+
+        if (h := getattr(hashlib, hash_algorithm, None)) is None:
+            raise ValueError(f"Unsupported hash algorithm: {hash_algorithm}")
+
+        hash_object = h()
+
+        for chunk in self.iter_chunks():
+            hash_object.update(chunk)
+
+        hash_string = hash_object.hexdigest()
+        assert isinstance(hash_string, str), "Hash string must be a string"
+        return hash_string
+
+    @cached_property
+    def ext(self) -> str:
+        if ext := extract_extension(self.file_path):
+            return ext
+
+        return detect_extension(self.mime_type, default=".bin")
+
+    def is_binary(self) -> bool:
+        # Judged from the head of the file so that large media is not read in full
+        with open(self.source_path, "rb") as f:
+            return is_binary(f.read(BINARY_SNIFF_SIZE))
+
+    def is_text(self) -> bool:
+        return not self.is_binary()
+
+    def iter_chunks(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        chunk_size = chunk_size or self._chunk_size
+
+        with open(self.source_path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+    def iter_base64_chunks(self, chunk_size: int | None = None) -> Iterator[str]:
+        # Multiples of 3 bytes encode without padding, so the chunks concatenate
+        chunk_size = max(3, (chunk_size or self._chunk_size) // 3 * 3)
+
+        with open(self.source_path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                yield base64.b64encode(chunk).decode("utf-8")
+
+    def replace(  # type: ignore[override]
+        self,
+        *,
+        file_path: str | os.PathLike[str] | None = None,
+        mime_blob: MIMEBlob | None = None,
+        mime_type: str | None = None,
+        raw_data: bytes | None = None,
+        raw_text: str | None = None,
+    ) -> FileBlob:
+        """Return a lazy blob over the same source, or a `FileBlob` when data is replaced."""
+        file_path = file_path or self.file_path
+
+        if mime_blob is None and raw_data is None and raw_text is None:
+            return self.__class__(
+                file_path,
+                mime_type=mime_type or self.mime_type,
+                source_path=self.source_path,
+                chunk_size=self._chunk_size,
+            )
+
+        if mime_blob is None:
+            return FileBlob(
+                file_path,
+                mime_type=mime_type or self.mime_type,
+                raw_data=raw_data,
+                raw_text=raw_text,
+            )
+
+        return FileBlob(file_path, mime_blob).replace(
+            mime_type=mime_type, raw_data=raw_data, raw_text=raw_text
+        )
@@ -15,6 +15,7 @@ def read_file(
     *,
     fallback_mime_type: str = "application/octet-stream",
     default: FileBlob | None = None,
+    use_lock: bool | None = None,
 ) -> FileBlob | None: ...
 
 
@@ -25,6 +26,7 @@ def read_file(
     *,
     fallback_mime_type: str = "application/octet-stream",
     default: FileBlob | None = None,
+    use_lock: bool | None = None,
 ) -> Awaitable[FileBlob | None]: ...
 
 
@@ -34,6 +36,7 @@ def read_file(
     *,
     fallback_mime_type: str = "application/octet-stream",
     default: FileBlob | None = None,
+    use_lock: bool | None = None,
 ) -> FileBlob | Awaitable[FileBlob | None] | None:
 
     def _after(raw_data: bytes | None) -> FileBlob | None:
@@ -49,11 +52,11 @@ def read_file(
         return FileBlob(file_path, mime_type=mime_type, raw_data=raw_data)
 
     def _sync() -> FileBlob | None:
-        raw_data = read_binary("sync", file_path)
+        raw_data = read_binary("sync", file_path, use_lock=use_lock)
         return _after(raw_data)
 
     async def _async() -> FileBlob | None:
-        raw_data = await read_binary("async", file_path)
+        raw_data = await read_binary("async", file_path, use_lock=use_lock)
         return _after(raw_data)
 
     if mode == "sync":
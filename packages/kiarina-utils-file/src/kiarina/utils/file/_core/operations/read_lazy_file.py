@@ -0,0 +1,69 @@
+import asyncio
+import os
+from collections.abc import Awaitable
+from typing import Literal, overload
+
+from kiarina.utils.mime import detect_mime_type
+
+from ..models.lazy_file_blob import DEFAULT_CHUNK_SIZE, LazyFileBlob
+
+
+@overload
+def read_lazy_file(
+    mode: Literal["sync"],
+    file_path: str | os.PathLike[str],
+    *,
+    fallback_mime_type: str = "application/octet-stream",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    default: LazyFileBlob | None = None,
+) -> LazyFileBlob | None: ...
+
+
+@overload
+def read_lazy_file(
+    mode: Literal["async"],
+    file_path: str | os.PathLike[str],
+    *,
+    fallback_mime_type: str = "application/octet-stream",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    default: LazyFileBlob | None = None,
+) -> Awaitable[LazyFileBlob | None]: ...
+
+
+def read_lazy_file(
+    mode: Literal["sync", "async"],
+    file_path: str | os.PathLike[str],
+    *,
+    fallback_mime_type: str = "application/octet-stream",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    default: LazyFileBlob | None = None,
+) -> LazyFileBlob | Awaitable[LazyFileBlob | None] | None:
+    file_path = os.path.expanduser(os.path.expandvars(os.fspath(file_path)))
+
+    if os.path.lexists(file_path):  # Check if path exists (including broken symlinks)
+        file_path = os.path.realpath(file_path)
+
+    def _sync() -> LazyFileBlob | None:
+        if not os.path.exists(file_path):
+            return default
+
+        if os.path.isdir(file_path):
+            raise IsADirectoryError(f"{file_path} is a directory")
+
+        # Only the head of the file is read to detect the MIME type
+        with open(file_path, "rb") as f:
+            mime_type = detect_mime_type(
+                file_name_hint=file_path,
+                stream=f if os.fstat(f.fileno()).st_size else None,
+                default=fallback_mime_type,
+            )
+
+        return LazyFileBlob(file_path, mime_type=mime_type, chunk_size=chunk_size)
+
+    async def _async() -> LazyFileBlob | None:
+        return await asyncio.to_thread(_sync)
+
+    if mode == "sync":
+        return _sync()
+    else:
+        return _async()
@@ -12,6 +12,7 @@ def read_markdown(
     file_path: str | os.PathLike[str],
     *,
     default: MarkdownContent | None = None,
+    use_lock: bool | None = None,
 ) -> MarkdownContent | None: ...
 
 
@@ -21,6 +22,7 @@ def read_markdown(
     file_path: str | os.PathLike[str],
     *,
     default: MarkdownContent | None = None,
+    use_lock: bool | None = None,
 ) -> Awaitable[MarkdownContent | None]: ...
 
 
@@ -29,6 +31,7 @@ def read_markdown(
     file_path: str | os.PathLike[str],
     *,
     default: MarkdownContent | None = None,
+    use_lock: bool | None = None,
 ) -> MarkdownContent | Awaitable[MarkdownContent | None] | None:
 
     def _parse_markdown(raw_text: str | None) -> MarkdownContent | None:
@@ -38,11 +41,11 @@ def read_markdown(
         return MarkdownContent.from_text(raw_text)
 
     def _sync() -> MarkdownContent | None:
-        raw_text = read_text("sync", file_path)
+        raw_text = read_text("sync", file_path, use_lock=use_lock)
         return _parse_markdown(raw_text)
 
     async def _async() -> MarkdownContent | None:
-        raw_text = await read_text("async", file_path)
+        raw_text = await read_text("async", file_path, use_lock=use_lock)
         return _parse_markdown(raw_text)
 
     if mode == "sync":
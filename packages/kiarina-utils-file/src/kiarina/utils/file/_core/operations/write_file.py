@@ -3,6 +3,7 @@ from collections.abc import Awaitable
 from typing import Literal, overload
 
 from ..models.file_blob import FileBlob
+from ..models.lazy_file_blob import LazyFileBlob
 from ..utils.write_binary import write_binary
 
 
@@ -30,11 +31,17 @@ def write_file(
     if file_path is None:
         file_path = file_blob.file_path
 
+    raw_data = (
+        file_blob.iter_chunks()
+        if isinstance(file_blob, LazyFileBlob)
+        else file_blob.raw_data
+    )
+
     def _sync() -> None:
-        write_binary("sync", file_path, file_blob.raw_data)
+        write_binary("sync", file_path, raw_data)
 
     async def _async() -> None:
-        await write_binary("async", file_path, file_blob.raw_data)
+        await write_binary("async", file_path, raw_data)
 
     if mode == "sync":
         _sync()
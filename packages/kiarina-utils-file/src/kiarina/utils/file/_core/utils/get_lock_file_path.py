@@ -5,6 +5,7 @@ import random
 import tempfile
 import time
 from contextlib import suppress
+from functools import lru_cache
 from unicodedata import normalize
 
 from filelock import FileLock, Timeout
@@ -13,12 +14,20 @@ from ..._settings import settings_manager
 
 
 def get_lock_file_path(file_path: str | os.PathLike[str]) -> str:
-    norm = _normalize_path(file_path)
-    digest = hashlib.sha256(norm.encode("utf-8", "surrogatepass")).hexdigest()
     base = _get_lock_base_dir()
 
     _maybe_cleanup_old_locks()
 
+    return _resolve_lock_file_path(_absolute_path(file_path), base)
+
+
+@lru_cache(maxsize=4096)
+def _resolve_lock_file_path(file_path: str, base: str) -> str:
+    # Memoized per absolute path, so symlink changes after the first call are
+    # not reflected. FileLock recreates shard directories removed by cleanup.
+    norm = _normalize_path(file_path)
+    digest = hashlib.sha256(norm.encode("utf-8", "surrogatepass")).hexdigest()
+
     subdir = os.path.join(base, digest[:2], digest[2:4])
     _ensure_dir(subdir)
     return os.path.join(subdir, f"{digest}.lock")
@@ -73,6 +82,13 @@ def _maybe_cleanup_old_locks() -> None:
             pass
 
 
+def _absolute_path(p: str | os.PathLike[str]) -> str:
+    try:
+        return os.path.abspath(os.path.expandvars(os.path.expanduser(os.fspath(p))))
+    except Exception:
+        return str(p)
+
+
 def _normalize_path(p: str | os.PathLike[str]) -> str:
     try:
         p = os.path.expandvars(os.path.expanduser(os.fspath(p)))
@@ -104,10 +120,15 @@ def _get_lock_base_dir() -> str:
     if not base:
         base = os.path.join(tempfile.gettempdir(), "kiarina-utils-file-locks")
 
-    _ensure_dir(base)
+    _ensure_base_dir(base)
     return base
 
 
+@lru_cache(maxsize=16)
+def _ensure_base_dir(d: str) -> None:
+    _ensure_dir(d)
+
+
 def _ensure_dir(d: str) -> None:
     try:
         os.makedirs(d, exist_ok=True)
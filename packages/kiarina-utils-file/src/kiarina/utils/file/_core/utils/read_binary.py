@@ -5,6 +5,7 @@ from typing import Literal, overload
 import aiofiles
 from filelock import AsyncFileLock, FileLock
 
+from ..._settings import settings_manager
 from .get_lock_file_path import get_lock_file_path
 
 
@@ -14,6 +15,7 @@ def read_binary(
     file_path: str | os.PathLike[str],
     *,
     default: bytes | None = None,
+    use_lock: bool | None = None,
 ) -> bytes | None: ...
 
 
@@ -23,6 +25,7 @@ def read_binary(
     file_path: str | os.PathLike[str],
     *,
     default: bytes | None = None,
+    use_lock: bool | None = None,
 ) -> Awaitable[bytes | None]: ...
 
 
@@ -31,13 +34,19 @@ def read_binary(
     file_path: str | os.PathLike[str],
     *,
     default: bytes | None = None,
+    use_lock: bool | None = None,
 ) -> bytes | Awaitable[bytes | None] | None:
     file_path = os.path.expanduser(os.path.expandvars(os.fspath(file_path)))
 
     if os.path.lexists(file_path):  # Check if path exists (including broken symlinks)
         file_path = os.path.realpath(file_path)
 
-    lock_file_path = get_lock_file_path(file_path)
+    if use_lock is None:
+        use_lock = settings_manager.settings.read_lock_enabled
+
+    # Writes publish via os.replace, so a lock-free read sees either the old or
+    # the new content, never a partial write.
+    lock_file_path = get_lock_file_path(file_path) if use_lock else None
 
     def _check_file_exists() -> bool:
         if not os.path.exists(file_path):
@@ -48,25 +57,33 @@ def read_binary(
 
         return True
 
-    def _sync() -> bytes | None:
-        lock = FileLock(lock_file_path)
+    def _read_sync() -> bytes | None:
+        if not _check_file_exists():
+            return default
 
-        with lock:
-            if not _check_file_exists():
-                return default
+        with open(file_path, "rb") as f:
+            return f.read()
 
-            with open(file_path, "rb") as f:
-                return f.read()
+    async def _read_async() -> bytes | None:
+        if not _check_file_exists():
+            return default
 
-    async def _async() -> bytes | None:
-        lock = AsyncFileLock(lock_file_path)
+        async with aiofiles.open(file_path, "rb") as f:
+            return await f.read()
 
-        async with lock:
-            if not _check_file_exists():
-                return default
+    def _sync() -> bytes | None:
+        if lock_file_path is None:
+            return _read_sync()
+
+        with FileLock(lock_file_path):
+            return _read_sync()
+
+    async def _async() -> bytes | None:
+        if lock_file_path is None:
+            return await _read_async()
 
-            async with aiofiles.open(file_path, "rb") as f:
-                return await f.read()
+        async with AsyncFileLock(lock_file_path):
+            return await _read_async()
 
     if mode == "sync":
         return _sync()
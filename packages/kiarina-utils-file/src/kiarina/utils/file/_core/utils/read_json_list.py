@@ -12,6 +12,7 @@ def read_json_list(
     file_path: str | os.PathLike[str],
     *,
     default: list[Any] | None = None,
+    use_lock: bool | None = None,
 ) -> list[Any] | None: ...
 
 
@@ -21,6 +22,7 @@ def read_json_list(
     file_path: str | os.PathLike[str],
     *,
     default: list[Any] | None = None,
+    use_lock: bool | None = None,
 ) -> Awaitable[list[Any] | None]: ...
 
 
@@ -29,6 +31,7 @@ def read_json_list(
     file_path: str | os.PathLike[str],
     *,
     default: list[Any] | None = None,
+    use_lock: bool | None = None,
 ) -> list[Any] | Awaitable[list[Any] | None] | None:
 
     def _after(raw_text: str | None) -> list[Any] | None:
@@ -43,11 +46,11 @@ def read_json_list(
         return data
 
     def _sync() -> list[Any] | None:
-        raw_text = read_text("sync", file_path)
+        raw_text = read_text("sync", file_path, use_lock=use_lock)
         return _after(raw_text)
 
     async def _async() -> list[Any] | None:
-        raw_text = await read_text("async", file_path)
+        raw_text = await read_text("async", file_path, use_lock=use_lock)
         return _after(raw_text)
 
     if mode == "sync":
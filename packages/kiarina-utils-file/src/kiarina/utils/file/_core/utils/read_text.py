@@ -13,6 +13,7 @@ def read_text(
     file_path: str | os.PathLike[str],
     *,
     default: str | None = None,
+    use_lock: bool | None = None,
 ) -> str | None: ...
 
 
@@ -22,6 +23,7 @@ def read_text(
     file_path: str | os.PathLike[str],
     *,
     default: str | None = None,
+    use_lock: bool | None = None,
 ) -> Awaitable[str | None]: ...
 
 
@@ -30,6 +32,7 @@ def read_text(
     file_path: str | os.PathLike[str],
     *,
     default: str | None = None,
+    use_lock: bool | None = None,
 ) -> str | Awaitable[str | None] | None:
 
     def _after(raw_data: bytes | None) -> str | None:
@@ -42,11 +45,11 @@ def read_text(
         return decode_binary_to_text(raw_data)
 
     def _sync() -> str | None:
-        raw_data = read_binary("sync", file_path)
+        raw_data = read_binary("sync", file_path, use_lock=use_lock)
         return _after(raw_data)
 
     async def _async() -> str | None:
-        raw_data = await read_binary("async", file_path)
+        raw_data = await read_binary("async", file_path, use_lock=use_lock)
         return _after(raw_data)
 
     if mode == "sync":
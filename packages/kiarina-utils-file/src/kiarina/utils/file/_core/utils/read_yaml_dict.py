@@ -13,6 +13,7 @@ def read_yaml_dict(
     file_path: str | os.PathLike[str],
     *,
     default: dict[str, Any] | None = None,
+    use_lock: bool | None = None,
 ) -> dict[str, Any] | None: ...
 
 
@@ -22,6 +23,7 @@ def read_yaml_dict(
     file_path: str | os.PathLike[str],
     *,
     default: dict[str, Any] | None = None,
+    use_lock: bool | None = None,
 ) -> Awaitable[dict[str, Any] | None]: ...
 
 
@@ -30,6 +32,7 @@ def read_yaml_dict(
     file_path: str | os.PathLike[str],
     *,
     default: dict[str, Any] | None = None,
+    use_lock: bool | None = None,
 ) -> dict[str, Any] | Awaitable[dict[str, Any] | None] | None:
 
     def _after(raw_text: str | None) -> dict[str, Any] | None:
@@ -56,11 +59,11 @@ def read_yaml_dict(
         return data
 
     def _sync() -> dict[str, Any] | None:
-        raw_text = read_text("sync", file_path)
+        raw_text = read_text("sync", file_path, use_lock=use_lock)
         return _after(raw_text)
 
     async def _async() -> dict[str, Any] | None:
-        raw_text = await read_text("async", file_path)
+        raw_text = await read_text("async", file_path, use_lock=use_lock)
         return _after(raw_text)
 
     if mode == "sync":
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import os
 import tempfile
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Iterable
 from typing import Literal, overload
 
 import aiofiles
@@ -15,18 +15,24 @@ logger = logging.getLogger(__name__)
 
 @overload
 def write_binary(
-    mode: Literal["sync"], file_path: str | os.PathLike[str], raw_data: bytes
+    mode: Literal["sync"],
+    file_path: str | os.PathLike[str],
+    raw_data: bytes | Iterable[bytes],
 ) -> None: ...
 
 
 @overload
 def write_binary(
-    mode: Literal["async"], file_path: str | os.PathLike[str], raw_data: bytes
+    mode: Literal["async"],
+    file_path: str | os.PathLike[str],
+    raw_data: bytes | Iterable[bytes],
 ) -> Awaitable[None]: ...
 
 
 def write_binary(
-    mode: Literal["sync", "async"], file_path: str | os.PathLike[str], raw_data: bytes
+    mode: Literal["sync", "async"],
+    file_path: str | os.PathLike[str],
+    raw_data: bytes | Iterable[bytes],
 ) -> Awaitable[None] | None:
     file_path = os.path.expanduser(os.path.expandvars(os.fspath(file_path)))
 
@@ -77,7 +83,12 @@ def write_binary(
         try:
             with lock:
                 with open(temp_file_path, "wb") as temp_file:
-                    temp_file.write(raw_data)
+                    if isinstance(raw_data, bytes):
+                        temp_file.write(raw_data)
+                    else:
+                        for chunk in raw_data:
+                            temp_file.write(chunk)
+
                     temp_file.flush()
                     os.fsync(temp_file.fileno())
 
@@ -95,7 +106,17 @@ def write_binary(
         try:
             async with lock:
                 async with aiofiles.open(temp_file_path, "wb") as temp_file:
-                    await temp_file.write(raw_data)
+                    if isinstance(raw_data, bytes):
+                        await temp_file.write(raw_data)
+                    else:
+                        # Chunks may come from blocking reads, so pull them in a thread
+                        chunks = iter(raw_data)
+
+                        while (
+                            chunk := await asyncio.to_thread(next, chunks, None)
+                        ) is not None:
+                            await temp_file.write(chunk)
+
                     await temp_file.flush()
                     await asyncio.to_thread(os.fsync, temp_file.fileno())
 
@@ -4,7 +4,7 @@ from pydantic_settings_manager import SettingsManager
 
 
 class FileSettings(BaseSettings):
-    """Settings for file locking."""
+    """Settings for file locking and batch operations."""
 
     model_config = SettingsConfigDict(env_prefix="KIARINA_UTILS_FILE_")
 
@@ -27,5 +27,21 @@ class FileSettings(BaseSettings):
         description="Maximum age for lock files in hours before cleanup",
     )
 
+    read_lock_enabled: bool = Field(
+        default=True,
+        title="Read lock",
+        description=(
+            "Acquire the file lock on reads. Disable to rely on the atomic replace "
+            "performed by writes."
+        ),
+    )
+
+    max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        title="Maximum concurrency",
+        description="Maximum number of files processed at once by batch operations.",
+    )
+
 
 settings_manager = SettingsManager(FileSettings)
@@ -0,0 +1,40 @@
+import os
+from typing import overload
+
+from ..._core.models.lazy_file_blob import DEFAULT_CHUNK_SIZE, LazyFileBlob
+from ..._core.operations.read_lazy_file import read_lazy_file as _read_lazy_file
+
+
+@overload
+def read_lazy_file(
+    file_path: str | os.PathLike[str],
+    *,
+    fallback_mime_type: str = "application/octet-stream",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> LazyFileBlob | None: ...
+
+
+@overload
+def read_lazy_file(
+    file_path: str | os.PathLike[str],
+    *,
+    fallback_mime_type: str = "application/octet-stream",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    default: LazyFileBlob,
+) -> LazyFileBlob: ...
+
+
+def read_lazy_file(
+    file_path: str | os.PathLike[str],
+    *,
+    fallback_mime_type: str = "application/octet-stream",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    default: LazyFileBlob | None = None,
+) -> LazyFileBlob | None:
+    return _read_lazy_file(
+        "sync",
+        file_path,
+        fallback_mime_type=fallback_mime_type,
+        chunk_size=chunk_size,
+        default=default,
+    )
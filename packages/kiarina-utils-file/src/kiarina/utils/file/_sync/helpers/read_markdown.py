@@ -7,7 +7,7 @@ from ..._core.types.markdown_content import MarkdownContent
 
 @overload
 def read_markdown(
-    file_path: str | os.PathLike[str],
+    file_path: str | os.PathLike[str], *, use_lock: bool | None = None
 ) -> MarkdownContent | None: ...
 
 
@@ -16,6 +16,7 @@ def read_markdown(
     file_path: str | os.PathLike[str],
     *,
     default: MarkdownContent,
+    use_lock: bool | None = None,
 ) -> MarkdownContent: ...
 
 
@@ -23,5 +24,6 @@ def read_markdown(
     file_path: str | os.PathLike[str],
     *,
     default: MarkdownContent | None = None,
+    use_lock: bool | None = None,
 ) -> MarkdownContent | None:
-    return _read_markdown("sync", file_path, default=default)
+    return _read_markdown("sync", file_path, default=default, use_lock=use_lock)
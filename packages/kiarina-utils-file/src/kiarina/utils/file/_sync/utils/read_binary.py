@@ -5,14 +5,21 @@ from ..._core.utils.read_binary import read_binary as _read_binary
 
 
 @overload
-def read_binary(file_path: str | os.PathLike[str]) -> bytes | None: ...
+def read_binary(
+    file_path: str | os.PathLike[str], *, use_lock: bool | None = None
+) -> bytes | None: ...
 
 
 @overload
-def read_binary(file_path: str | os.PathLike[str], *, default: bytes) -> bytes: ...
+def read_binary(
+    file_path: str | os.PathLike[str], *, default: bytes, use_lock: bool | None = None
+) -> bytes: ...
 
 
 def read_binary(
-    file_path: str | os.PathLike[str], *, default: bytes | None = None
+    file_path: str | os.PathLike[str],
+    *,
+    default: bytes | None = None,
+    use_lock: bool | None = None,
 ) -> bytes | None:
-    return _read_binary("sync", file_path, default=default)
+    return _read_binary("sync", file_path, default=default, use_lock=use_lock)
@@ -5,16 +5,24 @@ from ..._core.utils.read_json_dict import read_json_dict as _read_json_dict
 
 
 @overload
-def read_json_dict(file_path: str | os.PathLike[str]) -> dict[str, Any] | None: ...
+def read_json_dict(
+    file_path: str | os.PathLike[str], *, use_lock: bool | None = None
+) -> dict[str, Any] | None: ...
 
 
 @overload
 def read_json_dict(
-    file_path: str | os.PathLike[str], *, default: dict[str, Any]
+    file_path: str | os.PathLike[str],
+    *,
+    default: dict[str, Any],
+    use_lock: bool | None = None,
 ) -> dict[str, Any]: ...
 
 
 def read_json_dict(
-    file_path: str | os.PathLike[str], *, default: dict[str, Any] | None = None
+    file_path: str | os.PathLike[str],
+    *,
+    default: dict[str, Any] | None = None,
+    use_lock: bool | None = None,
 ) -> dict[str, Any] | None:
-    return _read_json_dict("sync", file_path, default=default)
+    return _read_json_dict("sync", file_path, default=default, use_lock=use_lock)
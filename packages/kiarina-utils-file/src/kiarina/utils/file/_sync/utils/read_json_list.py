@@ -5,16 +5,24 @@ from ..._core.utils.read_json_list import read_json_list as _read_json_list
 
 
 @overload
-def read_json_list(file_path: str | os.PathLike[str]) -> list[Any] | None: ...
+def read_json_list(
+    file_path: str | os.PathLike[str], *, use_lock: bool | None = None
+) -> list[Any] | None: ...
 
 
 @overload
 def read_json_list(
-    file_path: str | os.PathLike[str], *, default: list[Any]
+    file_path: str | os.PathLike[str],
+    *,
+    default: list[Any],
+    use_lock: bool | None = None,
 ) -> list[Any]: ...
 
 
 def read_json_list(
-    file_path: str | os.PathLike[str], *, default: list[Any] | None = None
+    file_path: str | os.PathLike[str],
+    *,
+    default: list[Any] | None = None,
+    use_lock: bool | None = None,
 ) -> list[Any] | None:
-    return _read_json_list("sync", file_path, default=default)
+    return _read_json_list("sync", file_path, default=default, use_lock=use_lock)
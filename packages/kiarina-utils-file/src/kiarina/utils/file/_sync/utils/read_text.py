@@ -5,14 +5,21 @@ from ..._core.utils.read_text import read_text as _read_text
 
 
 @overload
-def read_text(file_path: str | os.PathLike[str]) -> str | None: ...
+def read_text(
+    file_path: str | os.PathLike[str], *, use_lock: bool | None = None
+) -> str | None: ...
 
 
 @overload
-def read_text(file_path: str | os.PathLike[str], *, default: str) -> str: ...
+def read_text(
+    file_path: str | os.PathLike[str], *, default: str, use_lock: bool | None = None
+) -> str: ...
 
 
 def read_text(
-    file_path: str | os.PathLike[str], *, default: str | None = None
+    file_path: str | os.PathLike[str],
+    *,
+    default: str | None = None,
+    use_lock: bool | None = None,
 ) -> str | None:
-    return _read_text("sync", file_path, default=default)
+    return _read_text("sync", file_path, default=default, use_lock=use_lock)
@@ -3,8 +3,11 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ._async.helpers.read_file import read_file
+    from ._async.helpers.read_files import read_files
+    from ._async.helpers.read_lazy_file import read_lazy_file
     from ._async.helpers.read_markdown import read_markdown
     from ._async.helpers.write_file import write_file
+    from ._async.helpers.write_files import write_files
     from ._async.utils.read_binary import read_binary
     from ._async.utils.read_json_dict import read_json_dict
     from ._async.utils.read_json_list import read_json_list
@@ -19,12 +22,16 @@ if TYPE_CHECKING:
     from ._async.utils.write_yaml_dict import write_yaml_dict
     from ._async.utils.write_yaml_list import write_yaml_list
     from ._core.models.file_blob import FileBlob
+    from ._core.models.lazy_file_blob import LazyFileBlob
     from ._core.types.markdown_content import MarkdownContent
 
 __all__ = [
     "read_file",
+    "read_files",
+    "read_lazy_file",
     "read_markdown",
     "write_file",
+    "write_files",
     "read_binary",
     "read_json_dict",
     "read_json_list",
@@ -39,6 +46,7 @@ __all__ = [
     "write_yaml_dict",
     "write_yaml_list",
     "FileBlob",
+    "LazyFileBlob",
     "MarkdownContent",
 ]
 
@@ -49,8 +57,11 @@ def __getattr__(name: str) -> object:
 
     module_map = {
         "read_file": "._async.helpers.read_file",
+        "read_files": "._async.helpers.read_files",
+        "read_lazy_file": "._async.helpers.read_lazy_file",
         "read_markdown": "._async.helpers.read_markdown",
         "write_file": "._async.helpers.write_file",
+        "write_files": "._async.helpers.write_files",
         "read_binary": "._async.utils.read_binary",
         "read_json_dict": "._async.utils.read_json_dict",
         "read_json_list": "._async.utils.read_json_list",
@@ -65,6 +76,7 @@ def __getattr__(name: str) -> object:
         "write_yaml_dict": "._async.utils.write_yaml_dict",
         "write_yaml_list": "._async.utils.write_yaml_list",
         "FileBlob": "._core.models.file_blob",
+        "LazyFileBlob": "._core.models.lazy_file_blob",
         "MarkdownContent": "._core.types.markdown_content",
     }
 
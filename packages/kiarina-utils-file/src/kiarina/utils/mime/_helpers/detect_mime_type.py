@@ -2,6 +2,8 @@ import logging
 import os
 from typing import BinaryIO, overload
 
+from kiarina.utils.encoding import detection_cache
+
 from .._operations.detect_with_dictionary import detect_with_dictionary
 from .._operations.detect_with_mimetypes import detect_with_mimetypes
 from .._operations.detect_with_puremagic import detect_with_puremagic
@@ -63,12 +65,26 @@ def detect_mime_type(
             return apply_mime_alias(mime_type, mime_aliases=mime_aliases)
 
     if raw_data is not None or stream is not None:
-        if mime_type := detect_with_puremagic(
-            raw_data=raw_data,
-            stream=stream,
-            file_name_hint=file_name_hint,
-        ):
+        if mime_type := _detect_with_puremagic(raw_data, stream, file_name_hint):
             return apply_mime_alias(mime_type, mime_aliases=mime_aliases)
 
     logger.debug(f"No MIME type found for file: {file_name_hint}")
     return default
+
+
+def _detect_with_puremagic(
+    raw_data: bytes | None,
+    stream: BinaryIO | None,
+    file_name_hint: str | os.PathLike[str] | None,
+) -> str | None:
+    if raw_data is None or stream is not None:
+        return detect_with_puremagic(
+            raw_data=raw_data, stream=stream, file_name_hint=file_name_hint
+        )
+
+    return detection_cache.get_or_compute(
+        "mime",
+        raw_data,
+        os.fspath(file_name_hint) if file_name_hint is not None else None,
+        lambda: detect_with_puremagic(raw_data=raw_data, file_name_hint=file_name_hint),
+    )
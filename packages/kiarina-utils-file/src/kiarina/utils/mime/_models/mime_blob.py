@@ -94,6 +94,10 @@ class MIMEBlob:
         return f"{self.hash_string}{self.ext}"
 
     def is_binary(self) -> bool:
+        return self._is_binary
+
+    @cached_property
+    def _is_binary(self) -> bool:
         return is_binary(self.raw_data)
 
     def is_text(self) -> bool:
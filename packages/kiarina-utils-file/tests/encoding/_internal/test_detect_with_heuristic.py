@@ -0,0 +1,43 @@
+from unittest.mock import patch
+
+import pytest
+
+from kiarina.utils.encoding._operations.detect_with_heuristic import (
+    detect_with_heuristic,
+)
+from kiarina.utils.encoding._operations.detect_with_nkf import detect_with_nkf
+
+
+@pytest.mark.parametrize(
+    "raw_data, expected_encoding",
+    [
+        ("こんにちは世界".encode(), "utf-8"),
+        ("こんにちは世界🌍️".encode(), "utf-8"),
+        ("Hello ASCII".encode("ascii"), "ascii"),
+        ("こんにちは世界".encode("shift_jis"), None),
+        ("こんにちは世界".encode("euc-jp"), None),
+        ("こんにちは世界".encode("iso2022_jp"), None),
+        (b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", None),
+        (b"", None),
+    ],
+)
+def test_main(raw_data: bytes, expected_encoding: str | None) -> None:
+    assert detect_with_heuristic(raw_data) == expected_encoding
+
+
+def test_partial() -> None:
+    raw_data = "こんにちは".encode()[:-1]
+    assert detect_with_heuristic(raw_data) is None
+    assert detect_with_heuristic(raw_data, partial=True) == "utf-8"
+
+
+def test_detect_with_nkf_skips_process() -> None:
+    with patch(
+        "kiarina.utils.encoding._operations.detect_with_nkf._detect_with_nkf_process",
+        return_value="shift_jis",
+    ) as mock_process:
+        assert detect_with_nkf("こんにちは世界".encode()) == "utf-8"
+        mock_process.assert_not_called()
+
+        assert detect_with_nkf("こんにちは世界".encode("shift_jis")) == "shift_jis"
+        mock_process.assert_called_once()
@@ -0,0 +1,102 @@
+from unittest.mock import patch
+
+from kiarina.utils.encoding import detect_encoding, detection_cache, settings_manager
+from kiarina.utils.mime import MIMEBlob, detect_mime_type
+
+
+def test_detect_encoding_cached() -> None:
+    detection_cache.clear()
+    raw_data = "こんにちは世界".encode()
+
+    with patch(
+        "kiarina.utils.encoding._helpers.detect_encoding.detect_with_charset_normalizer",
+        return_value="utf-8",
+    ) as mock_detect:
+        assert detect_encoding(raw_data, use_nkf=False) == "utf-8"
+        assert detect_encoding(raw_data, use_nkf=False) == "utf-8"
+        mock_detect.assert_called_once()
+
+        # Different parameters are cached separately
+        assert (
+            detect_encoding(raw_data, use_nkf=False, fallback_encodings=[]) == "utf-8"
+        )
+        assert mock_detect.call_count == 2
+
+    stats = detection_cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 2
+    assert stats.size == 2
+
+
+def test_detect_encoding_cache_follows_settings() -> None:
+    detection_cache.clear()
+    raw_data = "こんにちは世界".encode()
+
+    try:
+        with patch(
+            "kiarina.utils.encoding._helpers.detect_encoding.detect_with_charset_normalizer",
+            return_value="utf-8",
+        ) as mock_detect:
+            detect_encoding(raw_data, use_nkf=False)
+
+            settings_manager.cli_args = {
+                "charset_normalizer_confidence_threshold": 0.99
+            }
+            detect_encoding(raw_data, use_nkf=False)
+
+            assert mock_detect.call_count == 2
+            assert mock_detect.call_args.kwargs["confidence_threshold"] == 0.99
+    finally:
+        settings_manager.cli_args = {}
+        detection_cache.clear()
+
+
+def test_mime_blob_is_binary_cached() -> None:
+    detection_cache.clear()
+    mime_blob = MIMEBlob("text/plain", raw_text="Hello")
+
+    assert mime_blob.is_text()
+    assert mime_blob.replace(mime_type="text/markdown").is_text()
+    assert mime_blob.is_text()
+
+    stats = detection_cache.stats()
+    assert stats.misses == 1
+    assert stats.hits == 1
+
+
+def test_detect_mime_type_cached() -> None:
+    detection_cache.clear()
+    raw_data = b"%PDF-1.4\n"
+
+    with patch(
+        "kiarina.utils.mime._helpers.detect_mime_type.detect_with_puremagic",
+        return_value="application/pdf",
+    ) as mock_detect:
+        assert detect_mime_type(raw_data=raw_data) == "application/pdf"
+        assert detect_mime_type(raw_data=raw_data) == "application/pdf"
+        mock_detect.assert_called_once()
+
+        assert detect_mime_type(raw_data=raw_data, file_name_hint="a") == (
+            "application/pdf"
+        )
+        assert mock_detect.call_count == 2
+
+
+def test_cache_eviction_and_disable() -> None:
+    detection_cache.clear()
+    settings_manager.cli_args = {"cache_max_entries": 2}
+
+    try:
+        for i in range(3):
+            detect_encoding(f"text {i}".encode(), use_nkf=False)
+
+        stats = detection_cache.stats()
+        assert stats.size == 2
+        assert stats.evictions == 1
+
+        settings_manager.cli_args = {"cache_enabled": False}
+        detect_encoding(b"text 0", use_nkf=False)
+        assert detection_cache.stats().misses == 3
+    finally:
+        settings_manager.cli_args = {}
+        detection_cache.clear()
@@ -0,0 +1,56 @@
+import os
+import tempfile
+
+import kiarina.utils.file.asyncio as kfa
+
+
+async def test_read_files() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_paths = [os.path.join(tmp_dir, f"file_{i}.txt") for i in range(20)]
+
+        for i, file_path in enumerate(file_paths):
+            await kfa.write_text(file_path, f"content {i}")
+
+        missing_path = os.path.join(tmp_dir, "missing.txt")
+        results = await kfa.read_files(
+            [*file_paths, missing_path, tmp_dir], max_concurrency=4
+        )
+
+        assert len(results) == 22
+
+        for i, result in enumerate(results[:20]):
+            assert isinstance(result, kfa.FileBlob)
+            assert result.mime_type == "text/plain"
+            assert result.raw_text == f"content {i}"
+
+        assert results[20] is None
+        assert isinstance(results[21], IsADirectoryError)
+
+        results = await kfa.read_files(file_paths[:3], use_lock=False)
+        assert [
+            result.raw_text for result in results if isinstance(result, kfa.FileBlob)
+        ] == ["content 0", "content 1", "content 2"]
+
+
+async def test_write_files() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_blobs = [
+            kfa.FileBlob(
+                os.path.join(tmp_dir, f"file_{i}.txt"),
+                mime_type="text/plain",
+                raw_text=f"content {i}",
+            )
+            for i in range(10)
+        ]
+
+        results = await kfa.write_files(file_blobs, max_concurrency=3)
+        assert results == [None] * 10
+
+        for i, file_blob in enumerate(file_blobs):
+            assert await kfa.read_text(file_blob.file_path) == f"content {i}"
+
+        copy_paths = [os.path.join(tmp_dir, "copy.txt"), tmp_dir]
+        results = await kfa.write_files(file_blobs[:2], copy_paths)
+        assert results[0] is None
+        assert isinstance(results[1], OSError)
+        assert await kfa.read_text(copy_paths[0]) == "content 0"
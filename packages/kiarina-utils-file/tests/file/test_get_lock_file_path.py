@@ -492,3 +492,39 @@ def test_cleanup_concurrent_protection() -> None:
                         _maybe_cleanup_old_locks()
                         # Should be called once
                         assert mock_cleanup.call_count <= 1
+
+
+def test_get_lock_file_path_memoized() -> None:
+    """Test that the lock path is resolved once per absolute path."""
+    from kiarina.utils.file._core.utils.get_lock_file_path import (
+        _resolve_lock_file_path,
+    )
+
+    path = "/tmp/memoized_test.txt"
+    lock1 = get_lock_file_path(path)
+
+    with patch(
+        "kiarina.utils.file._core.utils.get_lock_file_path._ensure_dir"
+    ) as mock_ensure_dir:
+        lock2 = get_lock_file_path(path)
+        mock_ensure_dir.assert_not_called()
+
+    assert lock1 == lock2
+    assert _resolve_lock_file_path.cache_info().hits > 0
+
+
+def test_get_lock_file_path_relative_paths() -> None:
+    """Test that relative paths are resolved against the current directory."""
+    with tempfile.TemporaryDirectory() as temp_dir1:
+        with tempfile.TemporaryDirectory() as temp_dir2:
+            cwd = os.getcwd()
+
+            try:
+                os.chdir(temp_dir1)
+                lock1 = get_lock_file_path("relative.txt")
+                os.chdir(temp_dir2)
+                lock2 = get_lock_file_path("relative.txt")
+            finally:
+                os.chdir(cwd)
+
+            assert lock1 != lock2
@@ -0,0 +1,131 @@
+import base64
+import hashlib
+import os
+import tempfile
+
+import pytest
+
+import kiarina.utils.file as kf
+import kiarina.utils.file.asyncio as kfa
+
+
+def test_read_lazy_file() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "test.bin")
+        raw_data = bytes(range(256)) * 100
+        kf.write_binary(file_path, raw_data)
+
+        lazy_blob = kf.read_lazy_file(file_path, chunk_size=1000)
+        assert isinstance(lazy_blob, kf.LazyFileBlob)
+        assert isinstance(lazy_blob, kf.FileBlob)
+        assert "_raw_data" not in lazy_blob.__dict__
+
+        assert lazy_blob.mime_type == "application/octet-stream"
+        assert lazy_blob.size == len(raw_data)
+        assert lazy_blob.hash_string == hashlib.sha256(raw_data).hexdigest()
+        assert lazy_blob.raw_base64_str == base64.b64encode(raw_data).decode()
+        assert lazy_blob.raw_data == raw_data
+        assert b"".join(lazy_blob.iter_chunks()) == raw_data
+        assert all(len(chunk) <= 1000 for chunk in lazy_blob.iter_chunks())
+        assert lazy_blob.is_binary()
+
+        file_blob = kf.read_file(file_path)
+        assert file_blob is not None
+        assert lazy_blob.hash_string == file_blob.hash_string
+        assert lazy_blob.raw_base64_url == file_blob.raw_base64_url
+        assert lazy_blob == file_blob
+
+        assert kf.read_lazy_file(os.path.join(tmp_dir, "none.bin")) is None
+
+        with pytest.raises(IsADirectoryError):
+            kf.read_lazy_file(tmp_dir)
+
+
+def test_lazy_file_blob_text() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "test.txt")
+        kf.write_text(file_path, "Hello, 世界")
+
+        lazy_blob = kf.read_lazy_file(
+            file_path, default=kf.LazyFileBlob("x", mime_type="text/plain")
+        )
+        assert lazy_blob.mime_type == "text/plain"
+        assert lazy_blob.raw_text == "Hello, 世界"
+        assert lazy_blob.ext == ".txt"
+        assert lazy_blob.is_text()
+
+
+def test_lazy_file_blob_sniffs_head(monkeypatch: pytest.MonkeyPatch) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "test.txt")
+        raw_data = b"a" * (128 * 1024) + bytes(range(256))
+        kf.write_binary(file_path, raw_data)
+
+        lazy_blob = kf.LazyFileBlob(file_path, mime_type="text/plain")
+
+        def _read_all(self: kf.LazyFileBlob) -> bytes:
+            raise AssertionError("The whole file must not be read")
+
+        monkeypatch.setattr(kf.LazyFileBlob, "raw_data", property(_read_all))
+
+        assert not lazy_blob.is_binary()
+        assert lazy_blob.is_text()
+        assert lazy_blob.raw_base64_url == (
+            "data:text/plain;base64," + base64.b64encode(raw_data).decode()
+        )
+
+
+def test_lazy_file_blob_replace() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "test.txt")
+        kf.write_text(file_path, "Hello")
+
+        lazy_blob = kf.LazyFileBlob(file_path, mime_type="text/plain")
+
+        moved_blob = lazy_blob.replace(file_path=os.path.join(tmp_dir, "moved.md"))
+        assert isinstance(moved_blob, kf.LazyFileBlob)
+        assert moved_blob.source_path == file_path
+        assert moved_blob.raw_text == "Hello"
+        assert moved_blob.ext == ".md"
+
+        replaced_blob = lazy_blob.replace(raw_text="World")
+        assert not isinstance(replaced_blob, kf.LazyFileBlob)
+        assert replaced_blob.file_path == file_path
+        assert replaced_blob.mime_type == "text/plain"
+        assert replaced_blob.raw_text == "World"
+
+
+def test_write_lazy_file() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "test.bin")
+        raw_data = os.urandom(10000)
+        kf.write_binary(file_path, raw_data)
+
+        lazy_blob = kf.read_lazy_file(file_path, chunk_size=1024)
+        assert lazy_blob is not None
+
+        copy_path = os.path.join(tmp_dir, "copy.bin")
+        kf.write_file(lazy_blob, copy_path)
+        assert kf.read_binary(copy_path) == raw_data
+
+
+async def test_read_lazy_file_async() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "test.bin")
+        raw_data = os.urandom(10000)
+        await kfa.write_binary(file_path, raw_data)
+
+        lazy_blob = await kfa.read_lazy_file(file_path, chunk_size=1024)
+        assert lazy_blob is not None
+        assert lazy_blob.hash_string == hashlib.sha256(raw_data).hexdigest()
+
+        copy_path = os.path.join(tmp_dir, "copy.bin")
+        await kfa.write_file(lazy_blob, copy_path)
+        assert await kfa.read_binary(copy_path) == raw_data
+
+        empty_path = os.path.join(tmp_dir, "empty.bin")
+        await kfa.write_binary(empty_path, b"")
+        empty_blob = await kfa.read_lazy_file(empty_path)
+        assert empty_blob is not None
+        assert empty_blob.raw_data == b""
+        assert empty_blob.raw_base64_str == ""
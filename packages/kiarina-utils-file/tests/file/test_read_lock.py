@@ -0,0 +1,57 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+import kiarina.utils.file as kf
+import kiarina.utils.file.asyncio as kfa
+from kiarina.utils.file._settings import settings_manager
+
+GET_LOCK_FILE_PATH = "kiarina.utils.file._core.utils.read_binary.get_lock_file_path"
+
+
+def test_read_without_lock() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "test.json")
+        kf.write_json_dict(file_path, {"key": "value"})
+
+        with patch(GET_LOCK_FILE_PATH) as mock_get_lock_file_path:
+            assert (
+                kf.read_binary(file_path, use_lock=False) == b'{\n  "key": "value"\n}'
+            )
+            assert kf.read_json_dict(file_path, use_lock=False) == {"key": "value"}
+            assert kf.read_binary(os.path.join(tmp_dir, "none"), use_lock=False) is None
+            mock_get_lock_file_path.assert_not_called()
+
+
+async def test_read_without_lock_async() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "test.txt")
+        await kfa.write_text(file_path, "Hello")
+
+        with patch(GET_LOCK_FILE_PATH) as mock_get_lock_file_path:
+            assert await kfa.read_text(file_path, use_lock=False) == "Hello"
+
+            file_blob = await kfa.read_file(file_path, use_lock=False)
+            assert file_blob is not None
+            assert file_blob.raw_text == "Hello"
+            mock_get_lock_file_path.assert_not_called()
+
+
+def test_read_lock_settings() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "test.txt")
+        kf.write_text(file_path, "Hello")
+
+        settings_manager.cli_args = {"read_lock_enabled": False}
+
+        try:
+            with patch(GET_LOCK_FILE_PATH) as mock_get_lock_file_path:
+                assert kf.read_text(file_path) == "Hello"
+                mock_get_lock_file_path.assert_not_called()
+
+                # An explicit use_lock takes precedence over the settings
+                mock_get_lock_file_path.return_value = os.path.join(tmp_dir, "a.lock")
+                assert kf.read_text(file_path, use_lock=True) == "Hello"
+                mock_get_lock_file_path.assert_called_once()
+        finally:
+            settings_manager.cli_args = {}